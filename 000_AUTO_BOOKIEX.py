@@ -43,14 +43,10 @@ def main():
         # Pocket ROI JSON targets the *latest* backtest_* folder by mtime. NBA LIVE runs
         # build_nba_model_pockets before backtest in 000_RUN_ALL_NBA, so a fresh backtest
         # from this run would not have pockets until we run the builders again here.
-        # Scripts exit 0 on FileNotFoundError when a league has no backtest yet.
+        # Both leagues build in parallel; a league with no backtest yet is skipped (exit 0).
         run_step(
-            [sys.executable, "eng/execution/build_nba_model_pockets.py"],
-            "POCKET ROI ARTIFACTS (NBA)",
-        )
-        run_step(
-            [sys.executable, "eng/execution/build_ncaam_model_pockets.py"],
-            "POCKET ROI ARTIFACTS (NCAAM)",
+            [sys.executable, "eng/pockets/run_pockets.py", "--league", "all"],
+            "POCKET ROI ARTIFACTS (NBA + NCAAM)",
         )
 
         # Step 2 — Push Daily Updates
@@ -0,0 +1,321 @@
+"""
+000_BOOKIEX_DAEMON.py
+
+Purpose
+-------
+Resident scheduler for BookieX. Replaces repeated cold 000_AUTO_BOOKIEX.py invocations
+with one long-lived process that keeps stage modules imported between cycles.
+
+Scope
+-----
+- Warm: interpreter, imported stage modules, and the per-league raw schedule
+  (LeagueWarmState), held for cadence and re-parsed only when the file changes.
+- Not warm: stage inputs. 041, 0051/0052 and the daily view are called through their
+  run_nba()/run_ncaam() entrypoints and read from disk, because the upstream stage in
+  the same fast cycle has just rewritten them (odds -> flattened -> joined -> state).
+  Feeding cached copies in would only save parses of files that are always stale.
+
+Cycles
+------
+- FAST (every cycle, per league):
+    odds refresh (031) -> flatten (032) -> odds join (041) -> models (0051/0052)
+    -> daily view -> pocket artifacts
+- FULL (own slower schedule): 000_RUN_ALL_NBA_NCAAM.py as a subprocess (ingestion,
+  features, canonical, backtests), then the schedule cache is refreshed from disk.
+
+Cadence
+-------
+Next cycle is chosen from the nearest upcoming tipoff in the warm schedules:
+  <= --near-tipoff-minutes  -> --fast-minutes
+  <= --active-window-hours  -> --medium-minutes
+  otherwise (overnight)     -> --slow-minutes
+
+Each cycle logs per-stage and total latency, and appends one JSON line to
+logs/daemon_cycles.jsonl (BOOKIEX_LOG_DIR overrides logs/).
+
+Usage
+-----
+  python 000_BOOKIEX_DAEMON.py
+  python 000_BOOKIEX_DAEMON.py --leagues nba --fast-minutes 3 --push
+  python 000_BOOKIEX_DAEMON.py --once            # single fast cycle, then exit
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.run_log import flush_logs, get_log_dir, install_signal_flush, log_error, log_info, set_silent
+from utils.warm_cache import WarmFileCache, file_signature
+
+CYCLE_LOG_PATH = get_log_dir() / "daemon_cycles.jsonl"
+COMBINED_RUNNER = PROJECT_ROOT / "000_RUN_ALL_NBA_NCAAM.py"
+PUSH_DAILY = PROJECT_ROOT / "tools" / "push_daily.py"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Long-lived BookieX scheduler with warm in-memory state")
+    parser.add_argument("--leagues", nargs="+", choices=["nba", "ncaam"], default=["nba", "ncaam"])
+    parser.add_argument("--fast-minutes", type=float, default=5.0, help="Cadence when a tipoff is near")
+    parser.add_argument("--medium-minutes", type=float, default=15.0, help="Cadence on a game day, away from tipoff")
+    parser.add_argument("--slow-minutes", type=float, default=60.0, help="Overnight / no-games cadence")
+    parser.add_argument("--near-tipoff-minutes", type=float, default=90.0)
+    parser.add_argument("--active-window-hours", type=float, default=6.0)
+    parser.add_argument("--full-every-hours", type=float, default=6.0, help="Full ingestion/backtest cadence (0 = never)")
+    parser.add_argument("--full-on-start", action="store_true", help="Run the full pipeline before the first fast cycle")
+    parser.add_argument("--odds-skip-if-recent", type=int, default=None, metavar="MINUTES",
+                        help="Passed to 031: reuse an odds snapshot newer than N minutes")
+    parser.add_argument("--push", action="store_true", help="Run tools/push_daily.py after each cycle")
+    parser.add_argument("--once", action="store_true", help="Run one fast cycle and exit")
+    parser.add_argument("--silent", action="store_true", help="Only print critical errors")
+    return parser.parse_args()
+
+
+# ============================================================
+# WARM STATE
+# ============================================================
+
+def _parse_utc(s) -> datetime | None:
+    if not s:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(s).strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+class LeagueWarmState:
+    """Per-league raw schedule held in memory for cadence; re-parsed only when rewritten."""
+
+    def __init__(self, league: str, cache: WarmFileCache) -> None:
+        from utils.io_helpers import get_schedule_raw_path
+
+        self.league = league
+        self.cache = cache
+        self.paths = {"schedule_raw": get_schedule_raw_path(league)}
+        self._tipoff_sig = None
+        self._tipoffs: list[datetime] = []
+
+    def warm(self) -> int:
+        """Touch every input so it is parsed (or confirmed current). Returns count of files held."""
+        return sum(1 for p in self.paths.values() if self.cache.get(p) is not None)
+
+    def upcoming_tipoffs(self) -> list[datetime]:
+        """Sorted tipoff datetimes from the raw schedule (game_time_utc); cached per schedule signature."""
+        path = self.paths["schedule_raw"]
+        sig = file_signature(path)
+        if sig != self._tipoff_sig:
+            rows = self.cache.get(path) or []
+            tips = [_parse_utc(r.get("game_time_utc")) for r in rows if isinstance(r, dict)]
+            self._tipoffs = sorted(t for t in tips if t is not None)
+            self._tipoff_sig = sig
+        return self._tipoffs
+
+    def minutes_to_next_tipoff(self, now: datetime) -> float | None:
+        import bisect
+        tips = self.upcoming_tipoffs()
+        i = bisect.bisect_right(tips, now)
+        if i >= len(tips):
+            return None
+        return (tips[i] - now).total_seconds() / 60.0
+
+
+# ============================================================
+# STAGES (in-process; modules stay imported between cycles)
+# ============================================================
+
+def _stage_odds(league: str, state: LeagueWarmState, args) -> None:
+    import eng.pipelines.shared.e_gen_031_get_betline as m
+    if league == "nba":
+        m.run_nba(skip_if_recent_minutes=args.odds_skip_if_recent)
+    else:
+        m.run_ncaam(skip_if_recent_minutes=args.odds_skip_if_recent)
+
+
+def _stage_flatten(league: str, state: LeagueWarmState, args) -> None:
+    import eng.pipelines.shared.e_gen_032_get_betline_flatten as m
+    m.run_nba() if league == "nba" else m.run_ncaam()
+
+
+def _stage_join(league: str, state: LeagueWarmState, args) -> None:
+    import eng.pipelines.shared.f_gen_041_add_betting_lines as m
+    m.run_nba() if league == "nba" else m.run_ncaam()
+
+
+def _stage_models(league: str, state: LeagueWarmState, args) -> None:
+    import eng.models.shared.model_gen_0051_runner as m51
+    import eng.models.shared.model_gen_0052_add_model as m52
+    if league == "nba":
+        m51.run_nba()
+        m52.run_nba()
+    else:
+        m51.run_ncaam()
+        m52.run_ncaam()
+
+
+def _stage_daily_view(league: str, state: LeagueWarmState, args) -> None:
+    import eng.daily.build_gen_daily_view as m
+    m.run_nba(None) if league == "nba" else m.run_ncaam(None)
+
+
+def _stage_pockets(league: str, state: LeagueWarmState, args) -> None:
+    from eng.pockets.pocket_engine import build_model_pocket_artifacts
+
+    try:
+        build_model_pocket_artifacts(league)
+    except FileNotFoundError as e:
+        # Same contract as the script entrypoints: no backtest yet is not a failure.
+        log_info(f"[{league}] pockets skipped: {e}")
+
+
+FAST_STAGES: list[tuple[str, Callable]] = [
+    ("odds", _stage_odds),
+    ("flatten", _stage_flatten),
+    ("join_041", _stage_join),
+    ("models_0051_0052", _stage_models),
+    ("daily_view", _stage_daily_view),
+    ("pockets", _stage_pockets),
+]
+
+
+def _run_timed(label: str, fn: Callable, *a) -> dict:
+    start = perf_counter()
+    status, error = "OK", None
+    try:
+        fn(*a)
+    except (Exception, SystemExit) as e:  # stages call sys.exit on hard failures
+        status, error = "FAIL", f"{type(e).__name__}: {e}"
+        log_error(f"{label} failed: {error}")
+    return {"stage": label, "status": status, "duration_sec": round(perf_counter() - start, 3), "error": error}
+
+
+def run_fast_cycle(states: dict[str, LeagueWarmState], args) -> list[dict]:
+    results = []
+    for league, state in states.items():
+        state.warm()
+        for name, fn in FAST_STAGES:
+            results.append(_run_timed(f"{league}:{name}", fn, league, state, args))
+    return results
+
+
+def run_full_cycle(args) -> dict:
+    """Full ingestion/backtest via the combined runner (module-level scripts; must run cold)."""
+    def _run():
+        env = os.environ.copy()
+        env["PYTHONPATH"] = str(PROJECT_ROOT) + os.pathsep + env.get("PYTHONPATH", "")
+        subprocess.run(
+            [sys.executable, str(COMBINED_RUNNER), "--mode", "LIVE"],
+            cwd=str(PROJECT_ROOT), check=True, env=env,
+        )
+    return _run_timed("full:RUN_ALL_NBA_NCAAM", _run)
+
+
+def run_push() -> dict:
+    def _run():
+        subprocess.run([sys.executable, str(PUSH_DAILY)], cwd=str(PROJECT_ROOT), check=True)
+    return _run_timed("push_daily", _run)
+
+
+# ============================================================
+# CADENCE + REPORTING
+# ============================================================
+
+def choose_interval_minutes(states: dict[str, LeagueWarmState], args, now: datetime) -> tuple[float, float | None]:
+    """(interval minutes, minutes to nearest tipoff across leagues or None)."""
+    mins = [m for m in (s.minutes_to_next_tipoff(now) for s in states.values()) if m is not None]
+    nearest = min(mins) if mins else None
+    if nearest is not None and nearest <= args.near_tipoff_minutes:
+        return args.fast_minutes, nearest
+    if nearest is not None and nearest <= args.active_window_hours * 60:
+        return args.medium_minutes, nearest
+    return args.slow_minutes, nearest
+
+
+def report_cycle(kind: str, results: list[dict], total_sec: float, cache: WarmFileCache, next_interval: float | None) -> None:
+    failed = [r["stage"] for r in results if r["status"] != "OK"]
+    slowest = sorted(results, key=lambda r: r["duration_sec"], reverse=True)[:3]
+    log_info(
+        f"CYCLE {kind}: {total_sec:.2f}s | stages={len(results)} failed={len(failed)} | "
+        f"cache loads={cache.loads} hits={cache.hits} | slowest: "
+        + ", ".join(f"{r['stage']} {r['duration_sec']:.2f}s" for r in slowest)
+    )
+    if failed:
+        log_info(f"  failed stages: {', '.join(failed)}")
+    entry = {
+        "ts_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "kind": kind,
+        "total_sec": round(total_sec, 3),
+        "next_interval_min": next_interval,
+        "stages": results,
+    }
+    CYCLE_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(CYCLE_LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+# ============================================================
+# MAIN LOOP
+# ============================================================
+
+def main() -> None:
+    args = parse_args()
+    set_silent(args.silent)
+    install_signal_flush()
+
+    cache = WarmFileCache()
+    states = {lg: LeagueWarmState(lg, cache) for lg in args.leagues}
+    held = sum(s.warm() for s in states.values())
+    log_info(f"BookieX daemon started | leagues={','.join(args.leagues)} | warm inputs={held}")
+
+    full_every_sec = args.full_every_hours * 3600
+    last_full = None
+    if args.full_on_start and not args.once:
+        start = perf_counter()
+        res = run_full_cycle(args)
+        cache.refresh()
+        report_cycle("FULL", [res], perf_counter() - start, cache, None)
+        last_full = time.monotonic()
+    elif full_every_sec > 0:
+        last_full = time.monotonic()
+
+    try:
+        while True:
+            kind = "FAST"
+            start = perf_counter()
+            results = []
+            if (not args.once and full_every_sec > 0 and last_full is not None
+                    and time.monotonic() - last_full >= full_every_sec):
+                kind = "FULL+FAST"
+                results.append(run_full_cycle(args))
+                cache.refresh()
+                last_full = time.monotonic()
+            results.extend(run_fast_cycle(states, args))
+            if args.push:
+                results.append(run_push())
+            interval, nearest = choose_interval_minutes(states, args, datetime.now(timezone.utc))
+            report_cycle(kind, results, perf_counter() - start, cache, None if args.once else interval)
+            if args.once:
+                break
+            tip = f"{nearest:.0f} min to next tipoff" if nearest is not None else "no upcoming tipoff"
+            log_info(f"Next cycle in {interval:.1f} min ({tip})")
+            flush_logs()
+            time.sleep(interval * 60)
+    except KeyboardInterrupt:
+        log_info("BookieX daemon stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,15 @@
 # Supports:
 #   --mode LIVE | LAB
 #   --analysis
+#   --http-mode live | record | replay | stub  (utils/http_client.py)
 # ============================================================
 
+import os
 import subprocess
 import sys
 import argparse
 from datetime import datetime
+from pathlib import Path
 
 
 # ------------------------------------------------------------
@@ -23,6 +26,12 @@ parser.add_argument("--mode", default="LIVE", choices=["LIVE", "LAB"])
 parser.add_argument("--analysis", action="store_true")
 parser.add_argument("--analysis-only", action="store_true")
 parser.add_argument("--quiet", action="store_true", help="Suppress banners and summary (for combined orchestrator)")
+parser.add_argument(
+    "--http-mode",
+    choices=["live", "record", "replay", "stub"],
+    default=None,
+    help="HTTP layer for ingestion steps (default: BOOKIEX_HTTP_MODE or live)",
+)
 
 args = parser.parse_args()
 
@@ -31,6 +40,9 @@ RUN_ANALYSIS = args.analysis
 ANALYSIS_ONLY = args.analysis_only
 QUIET = args.quiet
 
+if args.http_mode:
+    os.environ["BOOKIEX_HTTP_MODE"] = args.http_mode
+
 # ------------------------------------------------------------
 # SCRIPT LAYERS
 # ------------------------------------------------------------
@@ -92,10 +104,13 @@ BEST_EFFORT_EVALUATION = frozenset([
 
 EXECUTION = [
     "eng/execution/build_execution_overlay.py",
+    ("eng/clv/clv_engine.py", ["--league", "nba"]),
+    ("eng/similarity/similar_games.py", ["--league", "nba"]),
 ]
 
 DAILY_VIEW = [
     ("eng/daily/build_gen_daily_view.py", ["--league", "nba"]),
+    ("eng/pipelines/shared/g_gen_090_load_warehouse.py", ["--league", "nba"]),
 ]
 
 ANALYSIS = [
@@ -187,18 +202,18 @@ def run_inline_audit_after_step_nba(step_path: str) -> None:
         csv_path = json_path.parent / "nba_schedule.csv"
         r = audit_file_consistency(json_path, csv_path, "NBA Ingest (schedule)")
         if r["match_status"] != "match":
-            print(f"INTEGRITY CHECK: FAIL [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']}")
+            print(f"INTEGRITY CHECK: FAIL [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']} via={r['source']}")
             sys.exit(1)
-        print(f"INTEGRITY CHECK: PASS [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']}")
+        print(f"INTEGRITY CHECK: PASS [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']} via={r['source']}")
     elif "b_gen_004_ingest_boxscores.py" in step_path:
         from configs.leagues.league_nba import BOXSCORES_TEAM_CSV_PATH, BOXSCORES_TEAM_JSON_PATH
         json_path = BOXSCORES_TEAM_JSON_PATH
         csv_path = BOXSCORES_TEAM_CSV_PATH
         r = audit_file_consistency(json_path, csv_path, "NBA Boxscores")
         if r["match_status"] != "match":
-            print(f"INTEGRITY CHECK: FAIL [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']}")
+            print(f"INTEGRITY CHECK: FAIL [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']} via={r['source']}")
             sys.exit(1)
-        print(f"INTEGRITY CHECK: PASS [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']}")
+        print(f"INTEGRITY CHECK: PASS [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']} via={r['source']}")
     elif "d_gen_022_collapse_to_game_level.py" in step_path:
         from configs.leagues.league_nba import CANONICAL_CSV_PATH, GAME_LEVEL_CSV_PATH
         canonical_path = CANONICAL_CSV_PATH
@@ -207,9 +222,9 @@ def run_inline_audit_after_step_nba(step_path: str) -> None:
             canonical_path, game_level_path, "NBA Canonical (021 vs 022)", expected_derived_per_primary=0.5
         )
         if r["match_status"] != "match":
-            print(f"INTEGRITY CHECK: FAIL [{r['label']}] primary={r['primary_count']} derived={r['derived_count']}")
+            print(f"INTEGRITY CHECK: FAIL [{r['label']}] primary={r['primary_count']} derived={r['derived_count']} via={r['source']}")
             sys.exit(1)
-        print(f"INTEGRITY CHECK: PASS [{r['label']}] primary={r['primary_count']} derived={r['derived_count']}")
+        print(f"INTEGRITY CHECK: PASS [{r['label']}] primary={r['primary_count']} derived={r['derived_count']} via={r['source']}")
 
 
 def run(script_spec):
@@ -221,6 +236,10 @@ def run(script_spec):
         script = script_spec
         extra_args = []
         cmd = [sys.executable, script]
+    from utils.http_client import read_step_stats, step_stats_env
+    from utils.run_log import child_env, log_event
+
+    env, stats_path = step_stats_env(script, child_env(script, league="nba"))
     start = datetime.now()
 
     if not QUIET:
@@ -229,19 +248,31 @@ def run(script_spec):
         cmd,
         stdout=sys.stdout,
         stderr=sys.stderr,
-        text=True
+        text=True,
+        env=env,
     )
     code = process.wait()
 
     end = datetime.now()
     duration = round((end - start).total_seconds(), 2)
+    http_stats = read_step_stats(stats_path)
 
     status = "SUCCESS" if code == 0 else "FAILED"
+    log_event(
+        f"step {status.lower()}: {script}",
+        level="INFO" if code == 0 else "ERROR",
+        step=Path(script).stem,
+        league="nba",
+        counters={"http_calls": http_stats["calls"], "returncode": code},
+        durations={"elapsed_sec": duration, "network_sec": round(http_stats["network_sec"], 4)},
+    )
 
     execution_log.append({
         "script": script,
         "status": status,
-        "duration_sec": duration
+        "duration_sec": duration,
+        "network_sec": round(http_stats["network_sec"], 2),
+        "http_calls": http_stats["calls"],
     })
 
     if code != 0:
@@ -266,18 +297,23 @@ def print_summary():
     print("\n================ EXECUTION SUMMARY ================")
     print(f"MODE: {MODE}")
     print(f"ANALYSIS: {RUN_ANALYSIS}")
+    print(f"HTTP: {os.environ.get('BOOKIEX_HTTP_MODE') or 'live'}")
     print("---------------------------------------------------")
 
     for entry in execution_log:
+        net = entry.get("network_sec") or 0
         print(
             f"{entry['script']:<45} "
             f"{entry['status']:<8} "
             f"{entry['duration_sec']}s"
+            + (f"  (network {net}s / {entry['http_calls']} calls)" if entry.get("http_calls") else "")
         )
 
     total_time = sum(e["duration_sec"] for e in execution_log)
+    total_net = sum(e.get("network_sec") or 0 for e in execution_log)
     print("---------------------------------------------------")
     print(f"TOTAL EXECUTION TIME: {round(total_time,2)}s")
+    print(f"  network: {round(total_net,2)}s | compute: {round(total_time - total_net,2)}s")
     print("===================================================\n")
 
 
@@ -3,7 +3,8 @@
 
 Purpose
 -------
-Run both the NBA and NCAAM pipelines in sequence. Single Executive Summary at end.
+Run both the NBA and NCAAM pipelines in sequence (default) or in parallel
+(--concurrent). Single Executive Summary at end.
 
 Design goals
 ------------
@@ -11,11 +12,16 @@ Design goals
 - One block: OUTPUT LOCATIONS (final_game_view.json per league)
 - Odds date range + Model Pulse (active games count) in clean tables
 - No redundant STARTING headers between NBA and NCAAM
+- --concurrent: both leagues run side by side (they write disjoint data/nba and
+  data/ncaam trees; data/external/ is NBA-only). Each league's output is captured
+  to logs/run_all_{league}_{ts}.log and a write-set isolation check
+  (tools/verify_isolation.py) runs after both finish.
 
 Usage
 -----
   python 000_RUN_ALL_NBA_NCAAM.py
   python 000_RUN_ALL_NBA_NCAAM.py --start-date 20260301 --end-date 20260308
+  python 000_RUN_ALL_NBA_NCAAM.py --concurrent
 """
 
 import argparse
@@ -23,6 +29,7 @@ import json
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from time import perf_counter
@@ -32,6 +39,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 
 NBA_RUNNER = PROJECT_ROOT / "000_RUN_ALL_NBA.py"
 NCAAM_RUNNER = PROJECT_ROOT / "000_RUN_ALL_NCAAM.py"
+LOG_DIR = PROJECT_ROOT / "logs"
 
 
 def parse_args():
@@ -41,6 +49,7 @@ def parse_args():
     parser.add_argument("--analysis-only", action="store_true", help="Run analysis-only for both NBA and NCAAM")
     parser.add_argument("--start-date", dest="start_date", type=str, help="NCAAM schedule start YYYYMMDD")
     parser.add_argument("--end-date", dest="end_date", type=str, help="NCAAM schedule end YYYYMMDD")
+    parser.add_argument("--concurrent", action="store_true", help="Run NBA and NCAAM pipelines in parallel with per-league log capture")
     parser.add_argument("--watch", action="store_true", help="Run pipelines then start live monitor loop (Timing Agent EXECUTE alerts every 30 min)")
     return parser.parse_args()
 
@@ -65,6 +74,16 @@ def build_ncaam_command(args) -> list[str]:
     return cmd
 
 
+def _runner_env() -> dict:
+    from utils.run_log import get_context
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(PROJECT_ROOT) + os.pathsep + env.get("PYTHONPATH", "")
+    # Both league runners (and their steps) log under this run's run_id.
+    env["BOOKIEX_RUN_ID"] = get_context()["run_id"]
+    return env
+
+
 def run_step(label: str, cmd: list[str], silent: bool = False) -> float:
     if not silent:
         print("\n" + "=" * 90)
@@ -72,16 +91,90 @@ def run_step(label: str, cmd: list[str], silent: bool = False) -> float:
         print(f"COMMAND: {' '.join(cmd)}")
         print("=" * 90)
     start = perf_counter()
-    env = os.environ.copy()
-    root_str = str(PROJECT_ROOT)
-    env["PYTHONPATH"] = root_str + os.pathsep + env.get("PYTHONPATH", "")
-    subprocess.run(cmd, cwd=root_str, check=True, capture_output=silent, env=env)
+    subprocess.run(cmd, cwd=str(PROJECT_ROOT), check=True, capture_output=silent, env=_runner_env())
     elapsed = perf_counter() - start
     if not silent:
         print(f"SUCCESS: {label} | {elapsed:.2f}s")
     return elapsed
 
 
+def run_step_logged(label: str, cmd: list[str], log_path: Path) -> float:
+    """Run one league pipeline with stdout/stderr captured to log_path. Raises CalledProcessError on failure."""
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    start = perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log_f:
+        log_f.write(f"# {label}\n# COMMAND: {' '.join(cmd)}\n")
+        log_f.flush()
+        proc = subprocess.run(
+            cmd, cwd=str(PROJECT_ROOT), stdout=log_f, stderr=subprocess.STDOUT, env=_runner_env()
+        )
+    elapsed = perf_counter() - start
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    return elapsed
+
+
+def _log_tail(log_path: Path, n: int = 30) -> str:
+    try:
+        lines = log_path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return ""
+    return "\n".join(lines[-n:])
+
+
+def run_concurrent(args) -> list[dict]:
+    """
+    Run NBA and NCAAM pipelines in parallel. Returns execution_log entries (one per league
+    plus wall time). Raises RuntimeError if either league fails or the isolation check fails.
+    """
+    from tools.verify_isolation import check_isolation, check_write_isolation, snapshot_data_tree
+
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    jobs = [
+        ("NBA PIPELINE", build_nba_command(args), LOG_DIR / f"run_all_nba_{ts}.log"),
+        ("NCAAM PIPELINE", build_ncaam_command(args), LOG_DIR / f"run_all_ncaam_{ts}.log"),
+    ]
+
+    print("\n" + "=" * 90)
+    print("RUNNING: NBA + NCAAM PIPELINES (concurrent)")
+    for label, cmd, log_path in jobs:
+        print(f"  {label}: {' '.join(cmd)}")
+        print(f"    log -> {log_path}")
+    print("=" * 90)
+
+    before = snapshot_data_tree()
+    wall_start = perf_counter()
+    execution_log = []
+    failures = []
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = [(label, log_path, pool.submit(run_step_logged, label, cmd, log_path)) for label, cmd, log_path in jobs]
+        for label, log_path, fut in futures:
+            try:
+                elapsed = fut.result()
+                execution_log.append({"label": label, "duration_sec": elapsed})
+                print(f"SUCCESS: {label} | {elapsed:.2f}s")
+            except subprocess.CalledProcessError as e:
+                failures.append(label)
+                print(f"FAILED: {label} (exit {e.returncode}). Last lines of {log_path}:")
+                print(_log_tail(log_path))
+    wall = perf_counter() - wall_start
+    after = snapshot_data_tree()
+
+    if failures:
+        raise RuntimeError(f"Concurrent run failed: {', '.join(failures)}")
+
+    print(f"Concurrent wall time: {wall:.2f}s (sequential would be ~{sum(e['duration_sec'] for e in execution_log):.2f}s)")
+    ok_writes, violations = check_write_isolation(before, after)
+    if not ok_writes:
+        for v in violations:
+            print(f"  ISOLATION VIOLATION: {v}")
+        raise RuntimeError(f"Concurrent run broke league isolation ({len(violations)} path(s)).")
+    if not check_isolation():
+        print("WARNING: layout isolation audit reported missing paths (see above).")
+    execution_log.append({"label": "WALL (concurrent)", "duration_sec": wall})
+    return execution_log
+
+
 def run_data_integrity_audit():
     """NCAAM integrity checks; return list of result dicts."""
     from configs.leagues.league_ncaam import (
@@ -130,8 +223,24 @@ def _odds_summary_data():
     now = datetime.now(timezone.utc)
     out = {"nba": {"first": None, "last": None, "active": 0, "past": 0, "total": 0}, "ncaam": {"first": None, "last": None, "active": 0, "past": 0, "total": 0}}
 
-    # NBA: try data/nba/raw/odds_master_nba.json (list of snapshots) then data/external/odds_api_raw.json
+    # NBA: the snapshot log index (distinct games, no snapshot parsing) when present;
+    # else data/nba/raw/odds_master_nba.json (list of snapshots) then data/external/odds_api_raw.json
+    from utils.odds_snapshot_log import has_log, load_index
+
     nba_paths = [PROJECT_ROOT / "data" / "nba" / "raw" / "odds_master_nba.json", PROJECT_ROOT / "data" / "external" / "odds_api_raw.json"]
+    if has_log():
+        nba_paths = []
+        try:
+            keys = list((load_index().get("games") or {}).keys())
+            dts = [dt for dt in (_parse_commence(k.partition("|")[2]) for k in keys) if dt is not None]
+            out["nba"]["total"] = len(keys)
+            out["nba"]["active"] = sum(1 for dt in dts if dt > now)
+            out["nba"]["past"] = sum(1 for dt in dts if dt <= now)
+            if dts:
+                out["nba"]["first"] = min(dts).strftime("%Y-%m-%d %H:%M UTC")
+                out["nba"]["last"] = max(dts).strftime("%Y-%m-%d %H:%M UTC")
+        except Exception:
+            pass
     for nba_path in nba_paths:
         if not nba_path.exists():
             continue
@@ -268,15 +377,18 @@ def print_executive_summary(execution_log, audit_results):
     # Table: League | Step | Duration | Integrity
     print("\n  League | Step            | Duration  | Integrity")
     print("  -------+-----------------+-----------+----------")
-    for entry in execution_log:
-        league = "NBA" if "NBA" in entry["label"] else "NCAAM"
+    wall_entries = [e for e in execution_log if e["label"].startswith("WALL")]
+    league_entries = [e for e in execution_log if not e["label"].startswith("WALL")]
+    for entry in league_entries:
+        league = "NCAAM" if "NCAAM" in entry["label"] else "NBA"
         step = entry["label"]
         dur = f"{entry['duration_sec']:.1f}s"
         integrity = "-" if league == "NBA" else ncaam_integrity
         print(f"  {league:<6} | {step:<15} | {dur:>9} | {integrity}")
-    total = sum(e["duration_sec"] for e in execution_log)
+    # Concurrent runs overlap, so wall time (not the sum) is the real total.
+    total = wall_entries[-1]["duration_sec"] if wall_entries else sum(e["duration_sec"] for e in league_entries)
     print("  -------+-----------------+-----------+----------")
-    print(f"  {'Total':<6} |                 | {total:>8.1f}s |")
+    print(f"  {'Total':<6} | {'(wall)' if wall_entries else '':<15} | {total:>8.1f}s |")
 
     # Odds date range (clean table)
     odds = _odds_summary_data()
@@ -348,11 +460,16 @@ def run_all(args=None):
     print(f"NBA mode:     {args.mode}")
     print(f"NCAAM window: {args.start_date or 'default'} / {args.end_date or 'default'}")
 
-    t1 = run_step("NBA PIPELINE", build_nba_command(args))
-    execution_log.append({"label": "NBA PIPELINE", "duration_sec": t1})
+    print(f"Concurrent:   {bool(getattr(args, 'concurrent', False))}")
+
+    if getattr(args, "concurrent", False):
+        execution_log = run_concurrent(args)
+    else:
+        t1 = run_step("NBA PIPELINE", build_nba_command(args))
+        execution_log.append({"label": "NBA PIPELINE", "duration_sec": t1})
 
-    t2 = run_step("NCAAM PIPELINE", build_ncaam_command(args))
-    execution_log.append({"label": "NCAAM PIPELINE", "duration_sec": t2})
+        t2 = run_step("NCAAM PIPELINE", build_ncaam_command(args))
+        execution_log.append({"label": "NCAAM PIPELINE", "duration_sec": t2})
 
     audit_results = run_data_integrity_audit()
     print_executive_summary(execution_log, audit_results)
@@ -21,9 +21,13 @@ Default recent-window run:
 
 Historical schedule window:
     python 000_RUN_ALL_NCAAM.py --start-date 20260220 --end-date 20260228
+
+Offline replay of recorded HTTP (utils/http_client.py):
+    python 000_RUN_ALL_NCAAM.py --http-mode replay
 """
 
 import argparse
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -65,11 +69,15 @@ STEPS = [
     ("eng/analysis/analysis_039b_execution_overlay_performance.py", ["--league", "ncaam"]),
     ("eng/analysis/analysis_039b_execution_overlay_performance.py", ["--league", "ncaam", "--use-dynamic-sweetspots"]),
     "eng/execution/build_ncaam_model_pockets.py",
+    ("eng/clv/clv_engine.py", ["--league", "ncaam"]),
+    ("eng/similarity/similar_games.py", ["--league", "ncaam"]),
+    ("eng/pipelines/shared/g_gen_090_load_warehouse.py", ["--league", "ncaam"]),
 ]
 
 ANALYSIS = [
     ("eng/analysis/analysis_039b_execution_overlay_performance.py", ["--league", "ncaam"]),
     "eng/analysis/analysis_041_agent_attribution.py",
+    ("eng/analysis/analysis_040_clv_analysis.py", ["--league", "ncaam"]),
 ]
 
 
@@ -79,6 +87,12 @@ def parse_args():
     parser.add_argument("--end-date", dest="end_date", type=str, help="Schedule end date in YYYYMMDD")
     parser.add_argument("--analysis-only", action="store_true", help="Run only analysis scripts using existing artifacts (no ingestion/build)")
     parser.add_argument("--quiet", action="store_true", help="Suppress banners and step lines (for combined orchestrator)")
+    parser.add_argument(
+        "--http-mode",
+        choices=["live", "record", "replay", "stub"],
+        default=None,
+        help="HTTP layer for ingestion steps (default: BOOKIEX_HTTP_MODE or live)",
+    )
     return parser.parse_args()
 
 
@@ -126,25 +140,25 @@ def run_inline_audit_after_step(step_path: str) -> None:
     if "b_gen_001_ingest_schedule.py" in step_path:
         r = audit_file_consistency(SCHEDULE_RAW_JSON_PATH, SCHEDULE_RAW_PATH, "NCAAM Ingest (schedule)")
         if r["match_status"] != "match":
-            print(f"INTEGRITY CHECK: FAIL [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']}")
+            print(f"INTEGRITY CHECK: FAIL [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']} via={r['source']}")
             sys.exit(1)
-        print(f"INTEGRITY CHECK: PASS [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']}")
+        print(f"INTEGRITY CHECK: PASS [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']} via={r['source']}")
     elif "b_gen_004_ingest_boxscores.py" in step_path:
         box_json = INTERIM_DIR / "ncaam_boxscores_raw.json"
         box_csv = INTERIM_DIR / "ncaam_boxscores_raw.csv"
         r = audit_file_consistency(box_json, box_csv, "NCAAM Boxscores")
         if r["match_status"] != "match":
-            print(f"INTEGRITY CHECK: FAIL [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']}")
+            print(f"INTEGRITY CHECK: FAIL [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']} via={r['source']}")
             sys.exit(1)
-        print(f"INTEGRITY CHECK: PASS [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']}")
+        print(f"INTEGRITY CHECK: PASS [{r['label']}] JSON={r['json_count']} CSV={r['csv_count']} via={r['source']}")
     elif "d_gen_022_collapse_to_game_level.py" in step_path:
         r = audit_csv_consistency(
             CANONICAL_GAMES_PATH, GAME_LEVEL_PATH, "NCAAM Canonical (021 vs 022)", expected_derived_per_primary=1.0
         )
         if r["match_status"] != "match":
-            print(f"INTEGRITY CHECK: FAIL [{r['label']}] primary={r['primary_count']} derived={r['derived_count']}")
+            print(f"INTEGRITY CHECK: FAIL [{r['label']}] primary={r['primary_count']} derived={r['derived_count']} via={r['source']}")
             sys.exit(1)
-        print(f"INTEGRITY CHECK: PASS [{r['label']}] primary={r['primary_count']} derived={r['derived_count']}")
+        print(f"INTEGRITY CHECK: PASS [{r['label']}] primary={r['primary_count']} derived={r['derived_count']} via={r['source']}")
 
 
 def _is_best_effort_step(step_spec) -> bool:
@@ -158,7 +172,11 @@ def _is_best_effort_step(step_spec) -> bool:
     return False
 
 
-def run_step(step_spec, step_num: int, total_steps: int, args, quiet: bool = False) -> float:
+def run_step(step_spec, step_num: int, total_steps: int, args, quiet: bool = False) -> tuple[float, float]:
+    """Returns (elapsed_sec, network_sec)."""
+    from utils.http_client import read_step_stats, step_stats_env
+    from utils.run_log import child_env, log_event
+
     step_path = step_spec[0] if isinstance(step_spec, (list, tuple)) else step_spec
     cmd = build_step_command(step_spec, args)
     best_effort = _is_best_effort_step(step_spec)
@@ -169,36 +187,58 @@ def run_step(step_spec, step_num: int, total_steps: int, args, quiet: bool = Fal
         print(f"COMMAND: {' '.join(cmd)}")
         print("=" * 80)
 
+    env, stats_path = step_stats_env(step_path, child_env(step_path, league="ncaam"))
     start = perf_counter()
-
-    result = subprocess.run(
-        cmd,
-        cwd=str(PROJECT_ROOT),
-        check=not best_effort,
-    )
-
-    elapsed = perf_counter() - start
+    result = None
+
+    try:
+        result = subprocess.run(
+            cmd,
+            cwd=str(PROJECT_ROOT),
+            check=not best_effort,
+            env=env,
+        )
+    finally:
+        elapsed = perf_counter() - start
+        http_stats = read_step_stats(stats_path)
+        network = http_stats["network_sec"]
+        code = result.returncode if result is not None else 1
+        log_event(
+            f"step {'success' if code == 0 else 'failed'}: {step_path}",
+            level="INFO" if code == 0 else "ERROR",
+            step=Path(step_path).stem,
+            league="ncaam",
+            counters={"http_calls": http_stats["calls"], "returncode": code},
+            durations={"elapsed_sec": round(elapsed, 4), "network_sec": network},
+        )
 
     if best_effort and result.returncode != 0:
         if not quiet:
             print(f"WARNING: [{step_num}/{total_steps}] {step_path} exited with code {result.returncode}; continuing pipeline.")
     elif not quiet:
-        print(f"[{step_num}/{total_steps}] SUCCESS: {step_path} | {elapsed:.2f}s")
+        print(
+            f"[{step_num}/{total_steps}] SUCCESS: {step_path} | {elapsed:.2f}s"
+            + (f" (network {network:.2f}s)" if network else "")
+        )
     if any(x in step_path for x in (
         "b_gen_001_ingest_schedule.py",
         "b_gen_004_ingest_boxscores.py",
         "d_gen_022_collapse_to_game_level.py",
     )):
         run_inline_audit_after_step(step_path)
-    return elapsed
+    return elapsed, network
 
 
 def run_all(args) -> None:
     steps_to_run = ANALYSIS if getattr(args, "analysis_only", False) else STEPS
     total_steps = len(steps_to_run)
     total_elapsed = 0.0
+    total_network = 0.0
     quiet = getattr(args, "quiet", False)
 
+    if getattr(args, "http_mode", None):
+        os.environ["BOOKIEX_HTTP_MODE"] = args.http_mode
+
     if not quiet:
         print("\n" + "#" * 80)
         print("STARTING NCAA MVP PIPELINE")
@@ -213,14 +253,15 @@ def run_all(args) -> None:
         raise ValueError("Both --start-date and --end-date must be provided together")
 
     for idx, step in enumerate(steps_to_run, start=1):
-        elapsed = run_step(step, idx, total_steps, args, quiet=quiet)
+        elapsed, network = run_step(step, idx, total_steps, args, quiet=quiet)
         total_elapsed += elapsed
+        total_network += network
 
     if not quiet:
         print("\n" + "#" * 80)
         print("NCAA MVP PIPELINE COMPLETE")
         print("#" * 80)
-        print(f"Total elapsed: {total_elapsed:.2f}s")
+        print(f"Total elapsed: {total_elapsed:.2f}s (network {total_network:.2f}s | compute {total_elapsed - total_network:.2f}s)")
         print("Artifacts expected under:")
         print(f"  {PROJECT_ROOT / 'data' / 'ncaam'}")
 
@@ -5,7 +5,6 @@ Apply current Hybrid confidence logic
 to historical backtest games and measure win rate by tier.
 """
 
-import json
 import sys
 from pathlib import Path
 from collections import defaultdict
@@ -19,6 +18,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from utils.io_helpers import get_backtest_output_root
+from utils.json_codec import find_json, read_json
 
 # ============================================================
 # HYBRID CLASSIFIER (Embedded for Stability)
@@ -77,11 +77,6 @@ def classify_game(models):
 # UTILITIES
 # ============================================================
 
-def load_json(path):
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
-
-
 def _parlay_result(g: dict) -> str:
     return (g.get("selected_parlay_result") or g.get("parlay_result") or "").strip()
 
@@ -98,8 +93,8 @@ def get_latest_backtest_folder():
         if not folder.is_dir():
             continue
 
-        test_file = folder / "backtest_games.json"
-        if test_file.exists():
+        test_file = find_json(folder / "backtest_games.json")
+        if test_file is not None:
             valid_folders.append(folder)
 
     if not valid_folders:
@@ -118,8 +113,7 @@ def main():
     latest = get_latest_backtest_folder()
     print(f"Using backtest folder: {latest.name}")
 
-    games_path = latest / "backtest_games.json"
-    games = load_json(games_path)
+    games = read_json(latest / "backtest_games.json")
 
     tier_counts = defaultdict(int)
     tier_wins = defaultdict(int)
@@ -33,7 +33,7 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from utils.io_helpers import get_backtest_output_root
 from utils.decorators import get_ncaam_execution_overlay_from_edges
-from eng.execution.build_execution_overlay import compute_overlay_from_edges
+from eng.execution.overlay_kernel import compute_overlay_from_edges
 
 BET_PRICE = -110
 PAYOUT_MULTIPLIER = 100 / abs(BET_PRICE)  # ~0.9091
@@ -32,7 +32,11 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from utils.io_helpers import get_backtest_output_root
-from eng.execution.build_execution_overlay import compute_overlay_from_edges
+from eng.execution.overlay_kernel import (
+    NBA_FIXED_THRESHOLDS,
+    NCAAM_FIXED_THRESHOLDS,
+    compute_overlays,
+)
 
 BET_PRICE = -110
 PAYOUT_MULTIPLIER = 100 / abs(BET_PRICE)  # ~0.9091
@@ -69,13 +73,6 @@ BUCKET_EXPLANATIONS = {
 # League-specific total_avoid_below for dynamic Avoid explanation only (matches 039a GRID_CONFIG; artifact may have NBA value for both).
 AVOID_TOTAL_BELOW_FOR_EXPLANATION = {"nba": 225, "ncaam": 120}
 
-# NCAAM fixed baseline (aligned with 039a GRID_CONFIG["ncaam"]). Used only for 039b fixed reporting.
-NCAAM_FIXED_TOTAL_LO, NCAAM_FIXED_TOTAL_HI = 135, 165
-NCAAM_FIXED_TOTAL_AVOID_BELOW = 120
-NCAAM_FIXED_SPREAD_AVOID_EDGE = 6
-NCAAM_FIXED_SPREAD_AVOID_LINE = 12
-NCAAM_FIXED_TOTAL_AVOID_EDGE = 8
-
 # Fixed-mode explanations for NCAAM (total 135-165, total <120; not NBA 225-242).
 BUCKET_EXPLANATIONS_NCAAM = {
     "Dual Sweet Spot": "Spread edge 1-4 pts, total edge 1-4 pts, total 135-165, spread line <10",
@@ -87,31 +84,18 @@ BUCKET_EXPLANATIONS_NCAAM = {
 }
 
 
-def _compute_overlay_fixed_ncaam(spread_e, total_e, spread_line, vegas_total):
-    """Compute execution overlay dict for NCAAM fixed mode using same numeric rules as 039a baseline.
-    Returns dict with spread_sweet_spot, total_sweet_spot, dual_sweet_spot, spread_avoid, total_avoid; or None if any input missing."""
-    if spread_e is None or total_e is None or spread_line is None or vegas_total is None:
-        return None
-    abs_se = abs(float(spread_e))
-    abs_te = abs(float(total_e))
-    spread_line = abs(float(spread_line))
-    vegas_total = float(vegas_total)
-    spread_sweet = 1 <= abs_se <= 4 and spread_line < NCAAM_FIXED_SPREAD_AVOID_LINE
-    total_sweet = (
-        1 <= abs_te <= 4
-        and NCAAM_FIXED_TOTAL_LO <= vegas_total <= NCAAM_FIXED_TOTAL_HI
-        and spread_line < NCAAM_FIXED_SPREAD_AVOID_LINE
-    )
-    dual_sweet = spread_sweet and total_sweet and spread_line < 10
-    spread_avoid = abs_se > NCAAM_FIXED_SPREAD_AVOID_EDGE or spread_line >= NCAAM_FIXED_SPREAD_AVOID_LINE
-    total_avoid = abs_te > NCAAM_FIXED_TOTAL_AVOID_EDGE or vegas_total < NCAAM_FIXED_TOTAL_AVOID_BELOW
-    return {
-        "spread_sweet_spot": spread_sweet,
-        "total_sweet_spot": total_sweet,
-        "dual_sweet_spot": dual_sweet,
-        "spread_avoid": spread_avoid,
-        "total_avoid": total_avoid,
-    }
+def _annotate_fixed_overlays(games, league):
+    """Fixed-threshold overlay for every graded row without one, in one vectorized kernel pass."""
+    todo = [
+        g for g in games
+        if not g.get("execution_overlay")
+        and (g.get("selected_spread_result") or g.get("spread_result")) is not None
+        and (g.get("selected_total_result") or g.get("total_result")) is not None
+    ]
+    thresholds = NCAAM_FIXED_THRESHOLDS if league == "ncaam" else NBA_FIXED_THRESHOLDS
+    for g, overlay in zip(todo, compute_overlays([_row_numerics(g) for g in todo], thresholds)):
+        if overlay:
+            g["execution_overlay"] = overlay
 
 
 def _dynamic_bucket_explanation(bucket: str, chosen_thresholds: dict, league: str | None = None) -> str:
@@ -390,6 +374,9 @@ def main():
     })
     skipped_rows_dynamic = 0
 
+    if not use_dynamic:
+        _annotate_fixed_overlays(games, league)
+
     for g in games:
 
         spread_result = g.get("selected_spread_result") or g.get("spread_result")
@@ -408,27 +395,6 @@ def main():
             )
             if overlay:
                 g["execution_overlay"] = overlay
-        else:
-            if not g.get("execution_overlay"):
-                if league == "ncaam":
-                    spread_e, total_e, spread_line, vegas_total = _row_numerics(g)
-                    overlay = _compute_overlay_fixed_ncaam(spread_e, total_e, spread_line, vegas_total)
-                else:
-                    spread_e = g.get("selected_spread_edge") if g.get("selected_spread_edge") is not None else g.get("Spread Edge")
-                    total_e = g.get("selected_total_edge") if g.get("selected_total_edge") is not None else g.get("Total Edge")
-                    try:
-                        spread_e = float(spread_e) if spread_e is not None else None
-                    except (TypeError, ValueError):
-                        spread_e = None
-                    try:
-                        total_e = float(total_e) if total_e is not None else None
-                    except (TypeError, ValueError):
-                        total_e = None
-                    spread_home = g.get("market_spread_home") or g.get("spread_home") or g.get("spread_home_last")
-                    vegas_total = g.get("market_total") or g.get("total") or g.get("total_last")
-                    overlay = compute_overlay_from_edges(spread_e, total_e, spread_home, vegas_total)
-                if overlay:
-                    g["execution_overlay"] = overlay
 
         bucket = classify_overlay(g)
 
@@ -1,125 +1,104 @@
 """
 analysis_040_clv_analysis.py
 
-Proxy CLV analysis using existing BookieX fields.
+Closing-line value by execution bucket, read from the CLV engine artifact
+(eng/clv/clv_engine.py -> data/{league}/clv/clv_picks.json). CLV is measured
+against the closing consensus line, not the model projection:
 
-No pipeline changes required.
+Spread CLV = side_sign * (pick spread_home - closing spread_home), HOME +1 / AWAY -1
+Total CLV  = side_sign * (pick total - closing total),             UNDER +1 / OVER -1
 
-Spread CLV = Home Line Projection − spread_home_last
-Total CLV  = total_last − Total Projection
+Usage:
+  python eng/analysis/analysis_040_clv_analysis.py --league nba
+  python eng/analysis/analysis_040_clv_analysis.py --league ncaam --rebuild
 """
 
-from pathlib import Path
-import json
-from collections import defaultdict
-
-# ------------------------------------------------------------
-# Resolve project root
-# ------------------------------------------------------------
-
-from configs.leagues.league_nba import FINAL_VIEW_JSON_PATH
-DATA_PATH = FINAL_VIEW_JSON_PATH
-
-# ------------------------------------------------------------
-# Load data
-# ------------------------------------------------------------
-
-with open(DATA_PATH, "r", encoding="utf-8") as f:
-    data = json.load(f)
-
-games = data if isinstance(data, list) else data.get("games", [])
-
-spread_clv = defaultdict(list)
-total_clv = defaultdict(list)
-
-# ------------------------------------------------------------
-# Determine execution bucket
-# ------------------------------------------------------------
-
-def get_bucket(g):
-
-    overlay = g.get("execution_overlay")
-
-    if not overlay:
-        return None
-
-    if overlay.get("dual_sweet_spot"):
-        return "Dual Sweet Spot"
-
-    if overlay.get("spread_sweet_spot"):
-        return "Spread Sweet Spot"
-
-    if overlay.get("total_sweet_spot"):
-        return "Total Sweet Spot"
-
-    if overlay.get("spread_avoid") or overlay.get("total_avoid"):
-        return "Avoid"
-
-    return "Neutral"
-
-# ------------------------------------------------------------
-# Compute proxy CLV
-# ------------------------------------------------------------
+from __future__ import annotations
 
-for g in games:
-
-    bucket = get_bucket(g)
-
-    if bucket is None:
-        continue
-
-    model_spread = g.get("Home Line Projection")
-    market_spread = g.get("spread_home_last")
-
-    model_total = g.get("Total Projection")
-    market_total = g.get("total_last")
-
-    if model_spread is not None and market_spread is not None:
-        clv = model_spread - market_spread
-        spread_clv[bucket].append(clv)
-
-    if model_total is not None and market_total is not None:
-        clv = market_total - model_total
-        total_clv[bucket].append(clv)
-
-# ------------------------------------------------------------
-# Print results
-# ------------------------------------------------------------
-
-print("\n=== CLOSING LINE VALUE ANALYSIS (PROXY) ===\n")
-
-print(
-    f"{'Bucket':<20}"
-    f"{'Games':<8}"
-    f"{'Spread CLV':<12}"
-    f"{'Total CLV':<12}"
-)
-
-print("-" * 60)
-
-buckets = set(spread_clv.keys()) | set(total_clv.keys())
-
-for bucket in sorted(buckets):
-
-    s_vals = spread_clv.get(bucket, [])
-    t_vals = total_clv.get(bucket, [])
-
-    games = max(len(s_vals), len(t_vals))
+import argparse
+import sys
+from collections import defaultdict
+from pathlib import Path
 
-    s_avg = sum(s_vals) / len(s_vals) if s_vals else 0
-    t_avg = sum(t_vals) / len(t_vals) if t_vals else 0
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def bucket_table(rows: list[dict]) -> list[tuple]:
+    """(bucket, games, spread mean CLV, total mean CLV, beat-close %) for model picks."""
+    spread_clv = defaultdict(list)
+    total_clv = defaultdict(list)
+    games = defaultdict(set)
+    for r in rows:
+        bucket = r.get("execution_bucket")
+        if r.get("source") != "model" or bucket is None or r.get("clv") is None:
+            continue
+        (spread_clv if r["market"] == "spread" else total_clv)[bucket].append(r["clv"])
+        games[bucket].add(r.get("game_id"))
+    out = []
+    for bucket in sorted(games):
+        s_vals = spread_clv.get(bucket, [])
+        t_vals = total_clv.get(bucket, [])
+        both = s_vals + t_vals
+        out.append((
+            bucket,
+            len(games[bucket]),
+            sum(s_vals) / len(s_vals) if s_vals else 0,
+            sum(t_vals) / len(t_vals) if t_vals else 0,
+            100 * sum(1 for v in both if v > 0) / len(both) if both else 0,
+        ))
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Closing-line value by execution bucket.")
+    parser.add_argument("--league", choices=["nba", "ncaam"], default="nba")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild CLV artifacts from snapshots first")
+    args = parser.parse_args()
+
+    from eng.clv.clv_engine import load_clv_picks, run
+
+    report = run(args.league) if args.rebuild else load_clv_picks(args.league)
+    if report is None:
+        report = run(args.league)
+    rows = report.get("rows") or []
+
+    print(f"\n=== CLOSING LINE VALUE ANALYSIS ({args.league.upper()}) ===\n")
+    print(f"Built: {report.get('built_at_utc')} | Picks: {report.get('picks')} | Priced vs close: {report.get('priced')}\n")
 
     print(
-        f"{bucket:<20}"
-        f"{games:<8}"
-        f"{s_avg:<12.3f}"
-        f"{t_avg:<12.3f}"
+        f"{'Bucket':<20}"
+        f"{'Games':<8}"
+        f"{'Spread CLV':<12}"
+        f"{'Total CLV':<12}"
+        f"{'Beat Close%':<12}"
     )
-
-print()
-print("Interpretation:")
-print("Positive CLV = BookieX predicted where the market moved.")
-print("Negative CLV = market moved against the model.")
-print("This is a proxy CLV using current market lines.")
-print("True CLV requires storing bet-time vs closing lines.")
-print()
\ No newline at end of file
+    print("-" * 64)
+    for bucket, n_games, s_avg, t_avg, beat in bucket_table(rows):
+        print(
+            f"{bucket:<20}"
+            f"{n_games:<8}"
+            f"{s_avg:<12.3f}"
+            f"{t_avg:<12.3f}"
+            f"{beat:<12.1f}"
+        )
+
+    print()
+    print(f"{'Source':<8}{'Market':<8}{'Picks':<8}{'Mean':<10}{'Median':<10}{'Beat Close%':<12}")
+    print("-" * 56)
+    for s in report.get("summary") or []:
+        print(
+            f"{s['source']:<8}{s['market']:<8}{s['picks']:<8}"
+            f"{s['mean_clv']:<10.3f}{s['median_clv']:<10.3f}{s['beat_close_pct']:<12.1f}"
+        )
+
+    print()
+    print("Interpretation:")
+    print("Positive CLV = the pick was taken at a better number than the close.")
+    print("Negative CLV = the market closed against the pick.")
+    print()
+
+
+if __name__ == "__main__":
+    main()
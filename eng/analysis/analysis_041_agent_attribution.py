@@ -1,13 +1,19 @@
 """
 eng/analysis/analysis_041_agent_attribution.py
 
-Audit success of Live Monitor EXECUTE alerts: parse logs/active_alerts.log,
-cross-reference with final_game_view_ncaam.json for actual_margin/actual_total,
-simulate Flat ($100) vs Kelly bet sizing, compute Yield/ROI%, Success Rate,
-Max Drawdown; compare VALUE PEAK REACHED vs standard EXECUTE win rates.
+Audit success of Live Monitor EXECUTE alerts: read the alert ledger
+(logs/active_alerts.jsonl), join each alert to final_game_view_ncaam.json by
+game_id (matchup for legacy alerts without one), simulate Flat ($100) vs Kelly bet
+sizing, compute Yield/ROI%, Success Rate, Max Drawdown; compare VALUE PEAK REACHED
+vs standard EXECUTE win rates.
+
+Grading is incremental: grades are appended to logs/alert_grades.jsonl once an
+alert's game is final, and only alerts without a grade are looked up on later runs
+(the final view is not even loaded when nothing is pending).
 Output: console summary table + logs/attribution_report.json.
 
-Authority: logs/active_alerts.log, data/ncaam/view/final_game_view_ncaam.json,
+Authority: logs/active_alerts.jsonl (eng/execution/alert_ledger.py),
+           data/ncaam/view/final_game_view_ncaam.json,
            utils/risk_management.py, eng/backtest_gen_runner.py (grading).
 """
 
@@ -16,12 +22,19 @@ from __future__ import annotations
 import json
 import re
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from eng.execution.alert_ledger import (
+    append_grades,
+    iter_alerts,
+    load_grades,
+)
+
 ALERTS_LOG_PATH = PROJECT_ROOT / "logs" / "active_alerts.log"
 FINAL_VIEW_PATH = PROJECT_ROOT / "data" / "ncaam" / "view" / "final_game_view_ncaam.json"
 ATTRIBUTION_REPORT_PATH = PROJECT_ROOT / "logs" / "attribution_report.json"
@@ -39,56 +52,31 @@ def _safe_float(x):
         return None
 
 
-def parse_alert_line(line: str) -> dict | None:
+def load_alerts() -> list[dict]:
     """
-    Parse a line from active_alerts.log. Returns dict with timestamp, matchup, pick_str,
-    kelly_pct, kelly_dollars, value_peak_reached, or None if not EXECUTE.
+    EXECUTE alerts from the ledger, in write order. Keeps the keys of the old
+    text-log parser (timestamp, matchup, pick_str, kelly_pct, kelly_dollars,
+    value_peak_reached) and adds the typed ledger fields (alert_id, game_id,
+    game_date, spread_side, total_pick).
     """
-    line = (line or "").strip()
-    if "STATUS: EXECUTE" not in line:
-        return None
-    # [TIMESTAMP] [MATCHUP] - STATUS: EXECUTE - KELLY SIZE: [4.6]% ($458.27). ...
-    # or older: [TIMESTAMP] [NCAAM] [MATCHUP] - [...] - STATUS: EXECUTE.
-    ts_match = re.match(r"\[([^\]]+)\]\s+", line)
-    timestamp = ts_match.group(1) if ts_match else ""
-    value_peak = "VALUE PEAK REACHED" in line
-    matchup = ""
-    for bracket in re.finditer(r"\[([^\]]+)\]", line):
-        content = bracket.group(1).strip()
-        if " @ " in content and content != "NCAAM":
-            matchup = content
-            break
-    # KELLY SIZE: [4.6]% ($458.27)
-    kelly_pct = None
-    kelly_dollars = None
-    kelly_match = re.search(r"KELLY SIZE:\s*\[([^\]]+)\]%\s*\(\$([^)]+)\)", line)
-    if kelly_match:
-        kelly_pct = _safe_float(kelly_match.group(1))
-        kelly_dollars = _safe_float(kelly_match.group(2).replace(",", ""))
-    if kelly_dollars is None:
-        kelly_dollars = FLAT_BET_AMOUNT  # legacy alerts without Kelly
-    # Pick: [PICK] EDGE: or [PICK] - EDGE:
-    pick_match = re.search(r"\]\.\s*\[([^\]]+)\]\s+EDGE:", line) or re.search(r"\]\s+\[([^\]]+)\]\s+EDGE:", line)
-    pick_str = pick_match.group(1).strip() if pick_match else ""
-    return {
-        "timestamp": timestamp,
-        "matchup": matchup,
-        "pick_str": pick_str,
-        "kelly_pct": kelly_pct,
-        "kelly_dollars": kelly_dollars,
-        "value_peak_reached": value_peak,
-    }
-
-
-def load_alerts() -> list[dict]:
-    if not ALERTS_LOG_PATH.exists():
-        return []
     out = []
-    with open(ALERTS_LOG_PATH, "r", encoding="utf-8") as f:
-        for line in f:
-            rec = parse_alert_line(line)
-            if rec and rec.get("matchup"):
-                out.append(rec)
+    for rec in iter_alerts():
+        if not rec.get("matchup") and not rec.get("game_id"):
+            continue
+        frac = _safe_float(rec.get("kelly_fraction"))
+        out.append({
+            "alert_id": rec.get("alert_id"),
+            "game_id": rec.get("game_id"),
+            "game_date": rec.get("game_date"),
+            "timestamp": rec.get("ts") or "",
+            "matchup": rec.get("matchup") or "",
+            "pick_str": rec.get("pick") or "",
+            "spread_side": rec.get("spread_side"),
+            "total_pick": rec.get("total_pick"),
+            "kelly_pct": round(frac * 100, 1) if frac is not None else None,
+            "kelly_dollars": _safe_float(rec.get("kelly_amount")),
+            "value_peak_reached": bool(rec.get("value_peak")),
+        })
     return out
 
 
@@ -124,6 +112,32 @@ def build_game_index(games: list[dict]) -> dict[str, dict]:
     return index
 
 
+def build_game_id_index(games: list[dict]) -> dict[str, dict]:
+    """Key: game_id and canonical_game_id (both, when they differ). Value: game dict."""
+    index = {}
+    for g in games:
+        for key in ("canonical_game_id", "game_id"):
+            gid = str(g.get(key) or "").strip()
+            if gid:
+                index[gid] = g
+    return index
+
+
+def match_alert_game(alert: dict, id_index: dict[str, dict], matchup_index: dict[str, dict]) -> dict | None:
+    """Game for an alert: game_id join, else matchup "AWAY @ HOME" (legacy alerts)."""
+    gid = str(alert.get("game_id") or "").strip()
+    if gid and gid in id_index:
+        return id_index[gid]
+    parts = [p.strip() for p in (alert.get("matchup") or "").split("@")]
+    if len(parts) != 2:
+        return None
+    return matchup_index.get(matchup_key(parts[0], parts[1]))
+
+
+def is_final(game: dict) -> bool:
+    return _safe_float(game.get("home_score")) is not None and _safe_float(game.get("away_score")) is not None
+
+
 def parse_pick_string(pick_str: str, away_team: str, home_team: str) -> tuple[str, str]:
     """Extract Line Bet (spread) and Total Bet from pick string like 'Oregon (spread edge 4.47) | OVER (total edge 20.91)'."""
     line_bet = ""
@@ -202,7 +216,10 @@ def grade_alert_result(alert: dict, game: dict) -> tuple[str, str, str]:
     home_team = (game.get("home_team") or game.get("home_team_display") or "").strip()
     away_team = (game.get("away_team") or game.get("away_team_display") or "").strip()
 
-    line_bet, total_bet = parse_pick_string(alert.get("pick_str") or "", away_team, home_team)
+    line_bet = alert.get("spread_side") or ""
+    total_bet = alert.get("total_pick") or ""
+    if not line_bet and not total_bet:
+        line_bet, total_bet = parse_pick_string(alert.get("pick_str") or "", away_team, home_team)
     spread_result = grade_spread_pick(line_bet, home_team, away_team, market_spread, home_score or 0, away_score or 0) if line_bet else ""
     total_result = grade_total_pick(total_bet, market_total, home_score or 0, away_score or 0) if total_bet else ""
 
@@ -226,10 +243,47 @@ def profit_loss(result: str, stake: float, payout_ratio: float = PAYOUT_RATIO) -
     return 0.0  # PUSH
 
 
+def grade_pending_alerts(alerts: list[dict], games: list[dict] | None = None) -> tuple[dict[str, dict], int]:
+    """
+    Grade alerts that have no stored grade and whose game is now final; append the new
+    grades to the grades ledger. Returns (alert_id -> grade for every graded alert,
+    number graded this call). Ungradeable results (UNKNOWN) are retried next run.
+    """
+    grades = load_grades()
+    pending = [a for a in alerts if a.get("alert_id") and a["alert_id"] not in grades]
+    if not pending:
+        return grades, 0
+    if games is None:
+        games = load_final_view()
+    id_index = build_game_id_index(games)
+    matchup_index = build_game_index(games)
+    graded_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    new = []
+    for alert in pending:
+        game = match_alert_game(alert, id_index, matchup_index)
+        if not game or not is_final(game):
+            continue
+        spread_res, total_res, combined = grade_alert_result(alert, game)
+        if combined == "UNKNOWN":
+            continue
+        new.append({
+            "alert_id": alert["alert_id"],
+            "game_id": str(game.get("canonical_game_id") or game.get("game_id") or "") or None,
+            "graded_at": graded_at,
+            "spread_result": spread_res,
+            "total_result": total_res,
+            "combined": combined,
+            "home_score": _safe_float(game.get("home_score")),
+            "away_score": _safe_float(game.get("away_score")),
+        })
+    append_grades(new)
+    grades.update((g["alert_id"], g) for g in new)
+    return grades, len(new)
+
+
 def run_attribution() -> dict:
     alerts = load_alerts()
-    games = load_final_view()
-    game_index = build_game_index(games)
+    grades, newly_graded = grade_pending_alerts(alerts)
 
     flat_pl = []
     kelly_pl = []
@@ -240,20 +294,11 @@ def run_attribution() -> dict:
     standard_results = []
 
     for alert in alerts:
-        matchup = (alert.get("matchup") or "").strip()
-        if not matchup:
-            continue
-        # Normalize matchup to key (e.g. "OREGON @ GONZAGA")
-        parts = [p.strip() for p in matchup.split("@")]
-        if len(parts) != 2:
-            continue
-        key = matchup_key(parts[0], parts[1])
-        game = game_index.get(key)
-        if not game:
-            continue
-        spread_res, total_res, combined = grade_alert_result(alert, game)
-        if combined == "UNKNOWN":
+        grade = grades.get(alert.get("alert_id"))
+        if not grade:
             continue
+        matchup = (alert.get("matchup") or "").strip()
+        combined = grade["combined"]
 
         stake_flat = FLAT_BET_AMOUNT
         stake_kelly = alert.get("kelly_dollars") or FLAT_BET_AMOUNT
@@ -265,6 +310,8 @@ def run_attribution() -> dict:
         flat_stakes.append(stake_flat)
         kelly_stakes.append(stake_kelly)
         results.append({
+            "alert_id": alert.get("alert_id"),
+            "game_id": grade.get("game_id") or alert.get("game_id"),
             "matchup": matchup,
             "timestamp": alert.get("timestamp"),
             "combined_result": combined,
@@ -322,6 +369,7 @@ def run_attribution() -> dict:
             "total_execute_alerts": len(alerts),
             "matched_to_final_view": n,
             "unmatched": len(alerts) - n,
+            "newly_graded": newly_graded,
         },
         "strategy_a_flat": {
             "stake_per_bet": FLAT_BET_AMOUNT,
@@ -364,9 +412,10 @@ def print_summary_table(report: dict) -> None:
     print("\n" + "=" * 70)
     print("AGENT ATTRIBUTION REPORT (Live Monitor EXECUTE Alerts)")
     print("=" * 70)
-    print(f"  Total EXECUTE alerts parsed: {s.get('total_execute_alerts', 0)}")
+    print(f"  Total EXECUTE alerts:        {s.get('total_execute_alerts', 0)}")
     print(f"  Matched to final_game_view:  {s.get('matched_to_final_view', 0)}")
     print(f"  Unmatched:                   {s.get('unmatched', 0)}")
+    print(f"  Newly graded this run:       {s.get('newly_graded', 0)}")
     print()
     print("  Strategy A (Flat $100)  |  Strategy B (Kelly)")
     print("  ------------------------+------------------------")
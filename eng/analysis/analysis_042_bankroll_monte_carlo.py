@@ -0,0 +1,219 @@
+"""
+eng/analysis/analysis_042_bankroll_monte_carlo.py
+
+Bankroll Monte Carlo over a graded bet ledger: ruin probability, max drawdown
+distribution and growth rate across Kelly fractions and per-bet caps.
+
+Ledger sources:
+- backtest (default): latest data/{league}/backtests/backtest_*/backtest_games.json.
+  One bet per graded selected spread / total pick. Win probability = calibration
+  snapshot bucket win rate for |edge| (falls back to the ledger's own bucket rates).
+- alerts: EXECUTE records from logs/active_alerts.jsonl (eng/execution/alert_ledger.py
+  iter_alerts), graded like analysis_041. Win probability is recovered from the
+  recorded kelly_pct (quarter-Kelly at -110).
+
+Engine: utils/bankroll_simulator.py (NumPy, paths x bets arrays).
+Output: console table + logs/bankroll_simulation_{source}_{league}.json.
+
+Usage:
+  python eng/analysis/analysis_042_bankroll_monte_carlo.py --league nba
+  python eng/analysis/analysis_042_bankroll_monte_carlo.py --source alerts --paths 20000 --mode montecarlo
+  python eng/analysis/analysis_042_bankroll_monte_carlo.py --fractions 0.25 0.5 --caps 0.02 0.05 none
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from time import perf_counter
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.io_helpers import get_backtest_output_root
+
+LOG_DIR = PROJECT_ROOT / "logs"
+BREAKEVEN_P = 110 / 210
+LIVE_KELLY_FRACTION = 0.25  # eng/execution/live_monitor_agent.KELLY_FRACTION
+
+
+# ------------------------------------------------------------
+# LEDGERS
+# ------------------------------------------------------------
+
+def _safe_float(x):
+    if x is None or x == "":
+        return None
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return None
+
+
+def _latest_backtest_games(league: str) -> tuple[Path, list[dict]]:
+    root = get_backtest_output_root(league)
+    subdirs = [d for d in root.iterdir() if d.is_dir() and d.name.startswith("backtest_")] if root.exists() else []
+    if not subdirs:
+        raise FileNotFoundError(f"No backtest_* directories in {root}")
+    latest = max(subdirs, key=lambda d: d.stat().st_mtime)
+    with open(latest / "backtest_games.json", "r", encoding="utf-8") as f:
+        rows = json.load(f)
+    return latest, rows if isinstance(rows, list) else []
+
+
+def _calibration_bucket_rates(league: str) -> dict[str, dict]:
+    if league == "nba":
+        from configs.leagues.league_nba import CALIBRATION_SNAPSHOT_PATH
+    else:
+        from configs.leagues.league_ncaam import CALIBRATION_SNAPSHOT_PATH
+    if not CALIBRATION_SNAPSHOT_PATH.exists():
+        return {}
+    with open(CALIBRATION_SNAPSHOT_PATH, "r", encoding="utf-8") as f:
+        snap = json.load(f)
+    return {
+        "spread": snap.get("spread_bucket_win_rates") or {},
+        "total": snap.get("total_bucket_win_rates") or {},
+    }
+
+
+def backtest_ledger(league: str) -> tuple[list[dict], str]:
+    """Graded selected spread/total picks ordered by game date."""
+    from eng.calibration.calibration_sketch import bucket_label
+
+    folder, games = _latest_backtest_games(league)
+    rates = _calibration_bucket_rates(league)
+    bets = []
+    for g in sorted(games, key=lambda r: (str(r.get("game_date") or ""), str(r.get("game_id") or r.get("canonical_game_id") or ""))):
+        for market in ("spread", "total"):
+            res = str(g.get(f"selected_{market}_result") or "").upper()
+            edge = _safe_float(g.get(f"selected_{market}_edge"))
+            if res not in ("WIN", "LOSS", "PUSH") or edge is None:
+                continue
+            bets.append({
+                "market": market,
+                "bucket": bucket_label(abs(edge)),
+                "result": res,
+                "odds_american": -110,
+                "win_probability": (rates.get(market) or {}).get(bucket_label(abs(edge))),
+            })
+    # Fallback p: the ledger's own bucket rates (in-sample) where calibration has none.
+    counts: dict[tuple, list[int]] = {}
+    for b in bets:
+        c = counts.setdefault((b["market"], b["bucket"]), [0, 0])
+        if b["result"] != "PUSH":
+            c[0] += b["result"] == "WIN"
+            c[1] += 1
+    for b in bets:
+        if b["win_probability"] is None:
+            w, n = counts[(b["market"], b["bucket"])]
+            b["win_probability"] = w / n if n else BREAKEVEN_P
+    return bets, folder.name
+
+
+def alert_ledger() -> tuple[list[dict], str]:
+    """EXECUTE alerts graded against the NCAAM final view (analysis_041's incremental grades)."""
+    from eng.analysis.analysis_041_agent_attribution import (
+        ALERT_LEDGER_PATH,
+        grade_pending_alerts,
+        load_alerts,
+    )
+
+    alerts = load_alerts()
+    grades, _ = grade_pending_alerts(alerts)
+    b = 100 / 110
+    bets = []
+    for alert in alerts:
+        grade = grades.get(alert.get("alert_id"))
+        if not grade:
+            continue
+        # KELLY SIZE% = k * (p - q/b)  ->  p = (f/k + 1/b) / (1 + 1/b)
+        pct = alert.get("kelly_pct")
+        p = ((pct / 100.0) / LIVE_KELLY_FRACTION + 1 / b) / (1 + 1 / b) if pct is not None else None
+        bets.append({"result": grade["combined"], "odds_american": -110, "win_probability": p})
+    return bets, ALERT_LEDGER_PATH.name
+
+
+# ------------------------------------------------------------
+# REPORT
+# ------------------------------------------------------------
+
+def print_table(cells: list[dict]) -> None:
+    print("\n  Kelly | Cap    | Ruin%  | DD p50 | DD p95 | Growth/bet | Terminal p5 / p50 / p95")
+    print("  ------+--------+--------+--------+--------+------------+------------------------")
+    for c in cells:
+        if not c.get("paths"):
+            continue
+        cap = "none" if c["cap"] is None else f"{c['cap']:.3f}"
+        dd = c["max_drawdown"]
+        t = c["terminal_multiple"]
+        print(
+            f"  {c['kelly_fraction']:<5.2f} | {cap:<6} | {c['ruin_probability'] * 100:>6.2f} | "
+            f"{dd['p50'] * 100:>5.1f}% | {dd['p95'] * 100:>5.1f}% | {c['log_growth_per_bet']['mean']:>10.6f} | "
+            f"{t['p5']:.2f} / {t['p50']:.2f} / {t['p95']:.2f}"
+        )
+
+
+def _parse_cap(s: str):
+    return None if s.strip().lower() in ("none", "0", "") else float(s)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Monte Carlo bankroll simulation over a graded bet ledger.")
+    p.add_argument("--league", choices=["nba", "ncaam"], default="nba")
+    p.add_argument("--source", choices=["backtest", "alerts"], default="backtest")
+    p.add_argument("--mode", choices=["bootstrap", "montecarlo"], default="bootstrap")
+    p.add_argument("--paths", type=int, default=10_000)
+    p.add_argument("--fractions", type=float, nargs="+", default=[0.1, 0.25, 0.5, 1.0])
+    p.add_argument("--caps", type=str, nargs="+", default=["0.02", "0.05", "none"])
+    p.add_argument("--ruin-level", type=float, default=0.25, help="Ruin = bankroll <= this x start")
+    p.add_argument("--seed", type=int, default=7)
+    args = p.parse_args()
+
+    from utils.bankroll_simulator import BetLedger, simulate_grid
+
+    if args.source == "backtest":
+        bets, source_name = backtest_ledger(args.league)
+    else:
+        bets, source_name = alert_ledger()
+    ledger = BetLedger.from_records(bets)
+    if not len(ledger):
+        print(f"No graded bets in {args.source} ledger ({source_name}).")
+        return
+
+    start = perf_counter()
+    cells = simulate_grid(
+        ledger,
+        kelly_fractions=args.fractions,
+        caps=[_parse_cap(c) for c in args.caps],
+        paths=args.paths,
+        mode=args.mode,
+        ruin_level=args.ruin_level,
+        seed=args.seed,
+    )
+    elapsed = perf_counter() - start
+
+    print(f"Source: {args.source} ({source_name}) | League: {args.league} | Bets: {len(ledger)}")
+    print(f"Mode: {args.mode} | Paths: {args.paths} | Cells: {len(cells)} | Elapsed: {elapsed:.2f}s")
+    print_table(cells)
+
+    report = {
+        "source": args.source,
+        "source_name": source_name,
+        "league": args.league if args.source == "backtest" else "ncaam",
+        "bets": len(ledger),
+        "observed_win_rate": round(float((ledger.outcome > 0).sum() / max(1, (ledger.outcome != 0).sum())), 4),
+        "elapsed_sec": round(elapsed, 3),
+        "cells": cells,
+    }
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    out_path = LOG_DIR / f"bankroll_simulation_{args.source}_{report['league']}.json"
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nReport: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
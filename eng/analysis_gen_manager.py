@@ -25,6 +25,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from utils.io_helpers import get_backtest_output_root
+from utils.json_codec import find_json, read_json
 
 # Edge buckets for Win Probability Curve (min edge in bucket)
 EDGE_BUCKETS = [0.0, 2.5, 5.0, 7.5, 10.0, 15.0, 25.0]
@@ -43,8 +44,8 @@ def _get_latest_backtest_path(league: str) -> Path | None:
         return None
     dirs.sort(key=lambda p: p.name, reverse=True)
     for d in dirs:
-        p = d / "backtest_games.json"
-        if p.exists():
+        p = find_json(d / "backtest_games.json")
+        if p is not None:
             return p
     return None
 
@@ -52,10 +53,9 @@ def _get_latest_backtest_path(league: str) -> Path | None:
 def load_backtest_games(league: str, path: Path | None = None) -> list[dict]:
     if path is None:
         path = _get_latest_backtest_path(league)
-    if path is None or not path.exists():
+    if path is None or find_json(path) is None:
         raise FileNotFoundError(f"No backtest file found for league={league}. Run backtest_gen_runner first.")
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(path)
     return data if isinstance(data, list) else []
 
 
@@ -0,0 +1,176 @@
+"""
+slate_arbitration.py
+
+Batched arbitration for a whole NBA slate (model_gen_0052 post-processing).
+
+Builds columns once per slate, then writes them onto each game. Policy stays in the
+existing per-game functions (shared with the analysis scripts); only the vote tally
+is computed here:
+- vote shares / weighted scores / tiers per side (spread, total)
+- confidence tier, cluster alignment, disagreement flag, reference edge
+  (confidence_engine.classify_game)
+- actionability gate (confidence_gate.apply_confidence_gate)
+- primary model source (arbitration_cluster)
+- agent stub overrides (agent_stub.agent_stub_overrides)
+
+Per-game output is identical to the row-by-row path: same values, same
+rounding, and keys written to each game in the same order.
+
+Pure logic. No file IO.
+"""
+
+from eng.agent_stub import agent_stub_overrides
+from eng.arbitration.confidence_engine import classify_game
+from eng.arbitration.confidence_gate import apply_confidence_gate
+from eng.decision_explainer import build_decision_explanation
+
+BASELINE_MODEL = "Joel_Baseline_v1"
+
+# (min tier_score, level, label, icon); first match wins, else LOW.
+TIER_BANDS = (
+    (200, "HIGH", "Strong Conviction Consensus", "🟢"),
+    (75, "MEDIUM", "Moderate Agreement", "🟡"),
+)
+TIER_FLOOR = ("LOW", "Weak Consensus Edge", "🟠")
+
+GATE_FIELDS = ("Line Bet", "Total Bet", "Spread Edge", "Total Edge", "Parlay Edge Score")
+OVERRIDE_FIELDS = ("Total Bet", "Spread Edge", "Total Edge")
+
+SIDES = (
+    ("spread", "spread_pick", "spread_edge", ("HOME", "AWAY")),
+    ("total", "total_pick", "total_edge", ("OVER", "UNDER")),
+)
+
+
+# ---------------------------------------------------------
+# Vote columns
+# ---------------------------------------------------------
+
+def _side_summary(n: int, top: int, weighted_score) -> dict | None:
+    if not n:
+        return None
+    directional_pct = top / n
+    tier_score = directional_pct * weighted_score
+    for floor, level, label, icon in TIER_BANDS:
+        if tier_score >= floor:
+            break
+    else:
+        level, label, icon = TIER_FLOOR
+    return {
+        "directional_pct": round(directional_pct, 3),
+        "weighted_score": round(weighted_score, 3),
+        "tier_score": round(tier_score, 3),
+        "tier_level": level,
+        "tier_label": label,
+        "tier_icon": icon,
+        "disagreement_flag": directional_pct < 1.0,
+    }
+
+
+def vote_columns(models_col: list[dict]) -> list[dict]:
+    """arbitration dict per game: {"spread": summary|None, "total": summary|None}."""
+    out = []
+    for models in models_col:
+        row = {}
+        for side, pick_key, edge_key, (a, b) in SIDES:
+            count_a = count_b = 0
+            weighted = 0
+            for model in models.values():
+                pick = model.get(pick_key)
+                edge = model.get(edge_key)
+                if edge is None:
+                    continue
+                if pick == a:
+                    count_a += 1
+                elif pick == b:
+                    count_b += 1
+                else:
+                    continue
+                weighted += abs(edge)
+            row[side] = _side_summary(count_a + count_b, max(count_a, count_b), weighted)
+        out.append(row)
+    return out
+
+
+# ---------------------------------------------------------
+# Confidence / gate / override columns (existing per-game policy functions)
+# ---------------------------------------------------------
+
+def confidence_columns(models_col: list[dict]) -> tuple[list, list, list, list]:
+    """(tier, alignment, disagreement_flag, reference_edge) columns via confidence_engine.classify_game."""
+    tiers, alignments, flags, refs = [], [], [], []
+    for models in models_col:
+        tier, alignment, flag, ref = classify_game(models)
+        tiers.append(tier)
+        alignments.append(alignment)
+        flags.append(flag)
+        refs.append(ref)
+    return tiers, alignments, flags, refs
+
+
+def gate_columns(games: list[dict]) -> tuple[list, list]:
+    """(actionability, confidence_reason) columns via confidence_gate.apply_confidence_gate."""
+    actions, reasons = [], []
+    for g in games:
+        # Gate a scratch copy so the game's keys are still written in the per-game order below.
+        gated = apply_confidence_gate({k: g.get(k) for k in GATE_FIELDS})
+        actions.append(gated["actionability"])
+        reasons.append(gated["confidence_reason"])
+    return actions, reasons
+
+
+def primary_source_column(models_col: list[dict], alignments: list, refs: list) -> list[str]:
+    out = []
+    for models, alignment, ref in zip(models_col, alignments, refs):
+        if alignment == "CLUSTER_A" and ref is not None and abs(ref) >= 2:
+            out.append("CLUSTER_A")
+            continue
+        baseline_edge = models.get(BASELINE_MODEL, {}).get("spread_edge")
+        out.append(BASELINE_MODEL if baseline_edge is not None and abs(baseline_edge) >= 2 else "NONE")
+    return out
+
+
+def override_columns(games: list[dict], actions: list) -> tuple[list, list, list]:
+    """(agent_override_pick, reason, confidence_delta) columns via agent_stub.agent_stub_overrides."""
+    picks, reasons, deltas = [], [], []
+    for g, action in zip(games, actions):
+        o = agent_stub_overrides({**{k: g.get(k) for k in OVERRIDE_FIELDS}, "actionability": action})
+        picks.append(o["agent_override_pick"])
+        reasons.append(o["agent_override_reason"])
+        deltas.append(o["agent_override_confidence_delta"])
+    return picks, reasons, deltas
+
+
+# ---------------------------------------------------------
+# Slate entry point
+# ---------------------------------------------------------
+
+def apply_slate_arbitration(games: list[dict]) -> list[dict]:
+    """
+    Compute all arbitration columns for the slate, then write them onto each game
+    (in place) in the order the per-game path used. Expects the Joel display fields
+    (Line Bet, Total Bet, Spread Edge, Total Edge, Parlay Edge Score,
+    selection_authority) to be set. Returns games.
+    """
+    models_col = [g.get("models", {}) for g in games]
+    arbitration = vote_columns(models_col)
+    tiers, alignments, flags, refs = confidence_columns(models_col)
+    actions, reasons = gate_columns(games)
+    sources = primary_source_column(models_col, alignments, refs)
+    o_picks, o_reasons, o_deltas = override_columns(games, actions)
+
+    for i, g in enumerate(games):
+        g["arbitration"] = arbitration[i]
+        g["confidence_tier"] = tiers[i]
+        g["cluster_alignment"] = alignments[i]
+        g["disagreement_flag"] = flags[i]
+        g["actionability"] = actions[i]
+        g["confidence_reason"] = reasons[i]
+        g["arbitration_cluster"] = sources[i]
+        result = build_decision_explanation(g)
+        g["Explanation"] = result["decision_explanation"]
+        g["Decision Factors"] = result["decision_factors"]
+        g["agent_override_pick"] = o_picks[i]
+        g["agent_override_reason"] = o_reasons[i]
+        g["agent_override_confidence_delta"] = o_deltas[i]
+    return games
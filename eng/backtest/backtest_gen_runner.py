@@ -16,7 +16,6 @@ from __future__ import annotations
 
 import argparse
 import csv
-import json
 import sys
 from collections import defaultdict
 from datetime import datetime, timezone
@@ -32,6 +31,7 @@ from eng.backtest.backtest_grader import (
     grade_spread_bet,
     grade_total_bet,
 )
+from utils.json_codec import read_json, write_json
 
 # -----------------------------------------------------------------------------
 # Config: paths and selection authority
@@ -76,8 +76,7 @@ def load_games(league: str) -> list[dict]:
     if not path.exists():
         raise FileNotFoundError(f"Multi-model input not found: {path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(path)
 
     if isinstance(data, dict) and "games" in data:
         games = data.get("games", [])
@@ -456,10 +455,8 @@ def write_outputs(
     run_ts: str = "",
 ) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
-    with open(out_dir / "backtest_games.json", "w", encoding="utf-8") as f:
-        json.dump(backtest_rows, f, indent=2)
-    with open(out_dir / "backtest_summary.json", "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    write_json(out_dir / "backtest_games.json", backtest_rows, artifact="backtest")
+    write_json(out_dir / "backtest_summary.json", summary, artifact="summary")
     if csv_rows:
         fieldnames = list(csv_rows[0].keys())
         csv_name = f"backtest_games_{league}_{run_ts}.csv" if (league and run_ts) else "backtest_games.csv"
@@ -500,6 +497,10 @@ def run(league: str) -> Path:
     csv_filename = f"backtest_games_{league}_{run_ts}.csv"
     write_outputs(out_dir, backtest_rows, summary, csv_rows, league=league, run_ts=run_ts)
 
+    # Per-run calibration sketch (mergeable across runs/time ranges) while rows are in memory.
+    from eng.calibration.calibration_sketch import write_run_sketch
+    sketch_path = write_run_sketch(out_dir, backtest_rows, league)
+
     print(f"League:              {league}")
     print(f"Selection authority: {engine.selection_authority}")
     print(f"Input:               {get_input_path(league)}")
@@ -510,6 +511,7 @@ def run(league: str) -> Path:
     print(f"Summary JSON:        {out_dir / 'backtest_summary.json'}")
     print(f"Detail CSV:          {out_dir / csv_filename}")
     print(f"Detail CSV rows:     {len(csv_rows)}")
+    print(f"Calibration sketch:  {sketch_path}")
 
     return out_dir
 
@@ -0,0 +1,526 @@
+"""
+eng/backtest/param_sweep.py
+
+Parameter sweep over NBA model constants without re-running the pipeline.
+
+Targets (defaults are read from the code, so the first leaderboard row for the
+default set is what production currently does):
+- injury:  InjuryModel.SPREAD_WEIGHT / TOTAL_WEIGHT
+- blend:   MarketBlendModel.VEGAS_WEIGHT (MODEL_WEIGHT = 1 - VEGAS_WEIGHT)
+- fatigue: c_calc_012 REST_DAY_PENALTY[0..2] / B2B_PENALTY / B2B2B_PENALTY / OT_5_MIN_PENALTY
+           plus FatiguePlusModel.SPREAD_WEIGHT (fatigue scores re-derived per set)
+
+The season frame (Joel baseline projections, lines, finals, injury/fatigue inputs)
+is loaded once from the multi-model file (0051 output) into column arrays. Each
+worker evaluates a batch of parameter sets at once as a (sets x games) array:
+model kernel -> picks -> grading with backtest_grader rules (spread: margin +
+spread_home vs 0; total: actual vs line; PUSH picks grade PUSH) -> ROI at -110.
+
+Outputs (data/nba/backtests/sweep_{target}_{timestamp}/):
+  leaderboard.json, leaderboard.csv (one row per parameter set, ranked)
+Directory prefix is sweep_ so pocket builders (backtest_*) do not pick it up.
+
+Usage:
+  python eng/backtest/param_sweep.py --target injury
+  python eng/backtest/param_sweep.py --target fatigue --mode random --samples 2000 --workers 8
+  python eng/backtest/param_sweep.py --target all --min-bets 200 --top 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from eng.backtest.backtest_gen_runner import (
+    KELLY_PAYOUT_RATIO,
+    _is_final_game,
+    _normalize_scores,
+    _safe_float,
+    get_output_root,
+    load_games,
+)
+from utils.json_codec import write_json
+
+SWEEP_VERSION = "PARAM_SWEEP_V1"
+BASELINE_MODEL = "Joel_Baseline_v1"
+BATCH_SIZE = 256
+
+# Grid axes per target. Random mode samples uniformly within each axis' [min, max].
+GRIDS = {
+    "injury": {
+        "spread_weight": (0.0, 0.5, 1.0, 1.25, 1.5, 1.75, 2.0, 2.5, 3.0),
+        "total_weight": (0.0, 0.25, 0.5, 0.75, 1.0, 1.5),
+    },
+    "blend": {
+        "vegas_weight": tuple(round(0.05 * i, 2) for i in range(21)),
+    },
+    "fatigue": {
+        "rest_0": (0.5, 1.0, 1.5),
+        "rest_1": (0.2, 0.4, 0.6),
+        "rest_2": (0.0, 0.15, 0.3),
+        "b2b": (0.3, 0.6, 0.9),
+        "b2b2b": (0.5, 1.0, 1.5),
+        "ot_5min": (0.0, 0.35, 0.7),
+        "spread_weight": (1.0, 1.75, 2.5),
+    },
+}
+
+MODEL_BY_TARGET = {
+    "injury": "InjuryModel_v2",
+    "blend": "MarketBlend_v1",
+    "fatigue": "FatiguePlus_v3",
+}
+
+
+def default_params(target: str) -> dict:
+    """Current production constants for a target (same keys as GRIDS[target])."""
+    if target == "injury":
+        from eng.models.nba.injury_model import InjuryModel
+        return {"spread_weight": InjuryModel.SPREAD_WEIGHT, "total_weight": InjuryModel.TOTAL_WEIGHT}
+    if target == "blend":
+        from eng.models.nba.market_blend_model import MarketBlendModel
+        return {"vegas_weight": MarketBlendModel.VEGAS_WEIGHT}
+    if target == "fatigue":
+        from eng.models.nba.fatigue_plus_model import FatiguePlusModel
+        from eng.pipelines.nba import c_calc_012_compute_fatigue_score as fatigue
+        return {
+            "rest_0": fatigue.REST_DAY_PENALTY[0],
+            "rest_1": fatigue.REST_DAY_PENALTY[1],
+            "rest_2": fatigue.REST_DAY_PENALTY[2],
+            "b2b": fatigue.B2B_PENALTY,
+            "b2b2b": fatigue.B2B2B_PENALTY,
+            "ot_5min": fatigue.OT_5_MIN_PENALTY,
+            "spread_weight": FatiguePlusModel.SPREAD_WEIGHT,
+        }
+    raise ValueError(f"Unknown sweep target: {target!r}. Use one of {', '.join(GRIDS)}.")
+
+
+# -----------------------------------------------------------------------------
+# Season frame (loaded once)
+# -----------------------------------------------------------------------------
+
+
+def _flag(value) -> float:
+    if isinstance(value, str):
+        return 1.0 if value.strip().lower() in ("1", "true", "yes") else 0.0
+    return 1.0 if value else 0.0
+
+
+def build_frame(games: list[dict]) -> dict:
+    """
+    Column arrays for gradeable games (final, non-placeholder scores, baseline projections).
+    Missing lines stay NaN; those games simply produce no bet for that market.
+    """
+    cols = {k: [] for k in (
+        "home_score", "away_score", "spread", "total", "base_margin", "base_total",
+        "injury_diff", "home_rest", "away_rest", "home_b2b", "away_b2b",
+        "home_b2b2b", "away_b2b2b", "ot_minutes", "has_fatigue_inputs",
+        "home_fatigue", "away_fatigue",
+    )}
+    stored = {name: {"spread": [], "total": []} for name in MODEL_BY_TARGET.values()}
+
+    for g in games:
+        if not _is_final_game(g):
+            continue
+        home, away, spread, total = _normalize_scores(g)
+        if home is None or away is None or (home == 0 and away == 0):
+            continue
+        models = g.get("models") or {}
+        baseline = models.get(BASELINE_MODEL) or {}
+        base_margin = _safe_float(baseline.get("home_line_proj"))
+        base_total = _safe_float(baseline.get("total_projection"))
+        if base_margin is None or base_total is None:
+            continue
+
+        nan = float("nan")
+        cols["home_score"].append(home)
+        cols["away_score"].append(away)
+        cols["spread"].append(nan if spread is None else spread)
+        cols["total"].append(nan if total is None else total)
+        cols["base_margin"].append(base_margin)
+        cols["base_total"].append(base_total)
+        cols["injury_diff"].append(
+            (_safe_float(g.get("home_injury_impact")) or 0.0) - (_safe_float(g.get("away_injury_impact")) or 0.0)
+        )
+        for side in ("home", "away"):
+            rest = _safe_float(g.get(f"{side}_rest_days"))
+            cols[f"{side}_rest"].append(-1.0 if rest is None else rest)
+            cols[f"{side}_b2b"].append(_flag(g.get(f"{side}_back_to_back")))
+            cols[f"{side}_b2b2b"].append(_flag(g.get(f"{side}_back_to_back_to_back")))
+            cols[f"{side}_fatigue"].append(_safe_float(g.get(f"{side}_fatigue_score")) or 0.0)
+        cols["ot_minutes"].append(_safe_float(g.get("ot_minutes")) or 0.0)
+        cols["has_fatigue_inputs"].append("home_back_to_back" in g and "away_back_to_back" in g)
+
+        for name in stored:
+            m = models.get(name) or {}
+            stored[name]["spread"].append(m.get("spread_pick"))
+            stored[name]["total"].append(m.get("total_pick"))
+
+    frame = {k: np.asarray(v, dtype=bool if k == "has_fatigue_inputs" else float) for k, v in cols.items()}
+    frame["n"] = len(cols["home_score"])
+    frame["stored_picks"] = stored
+    return frame
+
+
+# -----------------------------------------------------------------------------
+# Vectorized kernels: params (K,) columns x games (N,) -> (K, N)
+# -----------------------------------------------------------------------------
+
+
+def _col(batch: list[dict], key: str) -> np.ndarray:
+    return np.asarray([p[key] for p in batch], dtype=float)[:, None]
+
+
+def _fatigue_scores(frame: dict, batch: list[dict], side: str) -> np.ndarray:
+    """c_calc_012.compute_team_fatigue for every (set, game); stored score where inputs are absent."""
+    rest = frame[f"{side}_rest"]
+    score = (
+        _col(batch, "rest_0") * (rest == 0)
+        + _col(batch, "rest_1") * (rest == 1)
+        + _col(batch, "rest_2") * (rest == 2)
+        + _col(batch, "b2b") * frame[f"{side}_b2b"]
+        + _col(batch, "b2b2b") * frame[f"{side}_b2b2b"]
+        + _col(batch, "ot_5min") * (frame["ot_minutes"] / 5)
+    )
+    return np.where(frame["has_fatigue_inputs"], np.round(score, 3), frame[f"{side}_fatigue"])
+
+
+def project(target: str, frame: dict, batch: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+    """(home_line_proj, total_projection) arrays of shape (K, N) for the target model."""
+    base_margin = frame["base_margin"]
+    base_total = frame["base_total"]
+
+    if target == "injury":
+        diff = frame["injury_diff"]
+        margin = base_margin + _col(batch, "spread_weight") * diff
+        total = base_total - _col(batch, "total_weight") * np.abs(diff)
+        return margin, total
+
+    if target == "blend":
+        spread, market_total = frame["spread"], frame["total"]
+        vegas_home = (market_total + spread) / 2
+        vegas_away = market_total - vegas_home
+        model_home = (base_total + base_margin) / 2
+        model_away = base_total - model_home
+        w_vegas = _col(batch, "vegas_weight")
+        w_model = 1.0 - w_vegas
+        blended_home = w_vegas * vegas_home + w_model * model_home
+        blended_away = w_vegas * vegas_away + w_model * model_away
+        return blended_away - blended_home, blended_home + blended_away
+
+    if target == "fatigue":
+        from eng.models.nba.fatigue_plus_model import FatiguePlusModel
+
+        home = _fatigue_scores(frame, batch, "home")
+        away = _fatigue_scores(frame, batch, "away")
+        diff = np.round(home - away, 3)
+        margin = base_margin + _col(batch, "spread_weight") * diff
+        total = (
+            base_total
+            - FatiguePlusModel.TOTAL_DIRECTIONAL_WEIGHT * np.abs(diff)
+            - FatiguePlusModel.TOTAL_PACE_WEIGHT * (home + away)
+        )
+        return margin, total
+
+    raise ValueError(f"Unknown sweep target: {target!r}. Use one of {', '.join(GRIDS)}.")
+
+
+# -----------------------------------------------------------------------------
+# Vectorized grading (backtest_grader rules)
+# -----------------------------------------------------------------------------
+
+
+def _tally(bet: np.ndarray, win: np.ndarray, push: np.ndarray) -> dict:
+    wins = (bet & win & ~push).sum(axis=1)
+    pushes = (bet & push).sum(axis=1)
+    losses = bet.sum(axis=1) - wins - pushes
+    return {"wins": wins, "losses": losses, "pushes": pushes}
+
+
+def grade(frame: dict, margin: np.ndarray, total_proj: np.ndarray, min_spread_edge: float, min_total_edge: float) -> dict:
+    """Per-set spread/total W/L/P counts. A bet exists where the line is known and |edge| >= min edge."""
+    spread, market_total = frame["spread"], frame["total"]
+    actual_margin = frame["home_score"] - frame["away_score"]
+    actual_total = frame["home_score"] + frame["away_score"]
+
+    # Spread: HOME if proj < line, AWAY if proj > line, PUSH pick when equal (grades PUSH).
+    s_edge = margin - spread
+    s_bet = ~np.isnan(s_edge) & (np.abs(s_edge) >= min_spread_edge)
+    adjusted = actual_margin + spread
+    s_push = (s_edge == 0) | (adjusted == 0)
+    s_win = ((s_edge < 0) & (adjusted > 0)) | ((s_edge > 0) & (adjusted < 0))
+
+    # Total: OVER if proj > line, UNDER if proj < line, PUSH pick when equal.
+    t_edge = total_proj - market_total
+    t_bet = ~np.isnan(t_edge) & (np.abs(t_edge) >= min_total_edge)
+    t_push = (t_edge == 0) | (actual_total == market_total)
+    t_win = ((t_edge > 0) & (actual_total > market_total)) | ((t_edge < 0) & (actual_total < market_total))
+
+    return {"spread": _tally(s_bet, s_win, s_push), "total": _tally(t_bet, t_win, t_push)}
+
+
+def _market_metrics(t: dict, i: int) -> dict:
+    w, l, p = int(t["wins"][i]), int(t["losses"][i]), int(t["pushes"][i])
+    units = w * KELLY_PAYOUT_RATIO - l
+    return {
+        "bets": w + l + p,
+        "wins": w,
+        "losses": l,
+        "pushes": p,
+        "win_rate": round(w / (w + l), 4) if (w + l) else None,
+        "units": round(units, 3),
+        "roi": round(units / (w + l + p), 4) if (w + l + p) else None,
+    }
+
+
+def evaluate_batch(target: str, frame: dict, batch: list[dict], min_spread_edge: float, min_total_edge: float) -> list[dict]:
+    margin, total_proj = project(target, frame, batch)
+    tallies = grade(frame, margin, total_proj, min_spread_edge, min_total_edge)
+    out = []
+    for i, params in enumerate(batch):
+        spread = _market_metrics(tallies["spread"], i)
+        total = _market_metrics(tallies["total"], i)
+        bets = spread["bets"] + total["bets"]
+        units = spread["units"] + total["units"]
+        out.append({
+            "params": params,
+            "spread": spread,
+            "total": total,
+            "combined_bets": bets,
+            "combined_units": round(units, 3),
+            "combined_roi": round(units / bets, 4) if bets else None,
+        })
+    return out
+
+
+# -----------------------------------------------------------------------------
+# Process pool (frame shipped once per worker)
+# -----------------------------------------------------------------------------
+
+_WORKER_FRAME: dict | None = None
+
+
+def _init_worker(frame: dict) -> None:
+    global _WORKER_FRAME
+    _WORKER_FRAME = frame
+
+
+def _worker_batch(target: str, batch: list[dict], min_spread_edge: float, min_total_edge: float) -> list[dict]:
+    return evaluate_batch(target, _WORKER_FRAME, batch, min_spread_edge, min_total_edge)
+
+
+# -----------------------------------------------------------------------------
+# Search space
+# -----------------------------------------------------------------------------
+
+
+def grid_sets(target: str) -> list[dict]:
+    axes = GRIDS[target]
+    keys = list(axes)
+    return [dict(zip(keys, values)) for values in itertools.product(*(axes[k] for k in keys))]
+
+
+def random_sets(target: str, samples: int, seed: int | None) -> list[dict]:
+    rng = random.Random(seed)
+    axes = GRIDS[target]
+    return [
+        {k: round(rng.uniform(min(v), max(v)), 4) for k, v in axes.items()}
+        for _ in range(samples)
+    ]
+
+
+def baseline_agreement(target: str, frame: dict) -> dict:
+    """Share of games where the kernel at default params reproduces the stored model picks."""
+    margin, total_proj = project(target, frame, [default_params(target)])
+    stored = frame["stored_picks"][MODEL_BY_TARGET[target]]
+    s_pick = np.where(margin[0] < frame["spread"], "HOME", np.where(margin[0] > frame["spread"], "AWAY", "PUSH"))
+    t_pick = np.where(total_proj[0] > frame["total"], "OVER", np.where(total_proj[0] < frame["total"], "UNDER", "PUSH"))
+    out = {}
+    for market, picks in (("spread", s_pick), ("total", t_pick)):
+        pairs = [(str(a), b) for a, b in zip(picks, stored[market]) if b]
+        out[market] = round(sum(1 for a, b in pairs if a == b) / len(pairs), 4) if pairs else None
+    return out
+
+
+# -----------------------------------------------------------------------------
+# Run
+# -----------------------------------------------------------------------------
+
+
+def sweep(
+    target: str,
+    frame: dict,
+    *,
+    mode: str = "grid",
+    samples: int = 500,
+    seed: int | None = None,
+    workers: int | None = None,
+    min_spread_edge: float = 0.0,
+    min_total_edge: float = 0.0,
+) -> list[dict]:
+    """Evaluate every parameter set for target; default set always included and flagged."""
+    defaults = default_params(target)
+    sets = grid_sets(target) if mode == "grid" else random_sets(target, samples, seed)
+    sets = [defaults] + [p for p in sets if p != defaults]
+    batches = [sets[i:i + BATCH_SIZE] for i in range(0, len(sets), BATCH_SIZE)]
+
+    workers = min(workers or os.cpu_count() or 1, len(batches))
+    results: list[dict] = []
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(frame,)) as pool:
+            futures = [pool.submit(_worker_batch, target, b, min_spread_edge, min_total_edge) for b in batches]
+            for fut in futures:
+                results.extend(fut.result())
+    else:
+        for b in batches:
+            results.extend(evaluate_batch(target, frame, b, min_spread_edge, min_total_edge))
+
+    for r in results:
+        r["is_default"] = r["params"] == defaults
+    return results
+
+
+def rank(results: list[dict], rank_by: str, min_bets: int) -> list[dict]:
+    def key(r: dict) -> float:
+        if rank_by == "combined_roi":
+            v = r["combined_roi"] if r["combined_bets"] >= min_bets else None
+        else:
+            market, metric = rank_by.split("_", 1)
+            v = r[market][metric] if r[market]["bets"] >= min_bets else None
+        return float("-inf") if v is None else v
+
+    ranked = sorted(results, key=key, reverse=True)
+    for i, r in enumerate(ranked, 1):
+        r["rank"] = i
+    return ranked
+
+
+def leaderboard_csv_rows(target: str, ranked: list[dict]) -> list[dict]:
+    rows = []
+    for r in ranked:
+        row = {"rank": r["rank"], "target": target, "is_default": r["is_default"]}
+        row.update({f"param_{k}": v for k, v in r["params"].items()})
+        for market in ("spread", "total"):
+            row.update({f"{market}_{k}": v for k, v in r[market].items()})
+        row.update({k: r[k] for k in ("combined_bets", "combined_units", "combined_roi")})
+        rows.append(row)
+    return rows
+
+
+def run(
+    targets: list[str],
+    *,
+    mode: str = "grid",
+    samples: int = 500,
+    seed: int | None = None,
+    workers: int | None = None,
+    min_spread_edge: float = 0.0,
+    min_total_edge: float = 0.0,
+    min_bets: int = 100,
+    rank_by: str = "combined_roi",
+    top: int = 10,
+) -> list[Path]:
+    from utils.io_helpers import save_csv_rows
+
+    frame = build_frame(load_games("nba"))
+    if not frame["n"]:
+        raise ValueError("No gradeable NBA games in the multi-model file")
+    run_ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    out_dirs = []
+
+    for target in targets:
+        results = sweep(
+            target, frame, mode=mode, samples=samples, seed=seed, workers=workers,
+            min_spread_edge=min_spread_edge, min_total_edge=min_total_edge,
+        )
+        ranked = rank(results, rank_by, min_bets)
+        agreement = baseline_agreement(target, frame)
+
+        out_dir = get_output_root("nba") / f"sweep_{target}_{run_ts}"
+        out_dir.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "sweep_version": SWEEP_VERSION,
+            "target": target,
+            "model": MODEL_BY_TARGET[target],
+            "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+            "mode": mode,
+            "games": frame["n"],
+            "parameter_sets": len(ranked),
+            "rank_by": rank_by,
+            "min_bets": min_bets,
+            "min_spread_edge": min_spread_edge,
+            "min_total_edge": min_total_edge,
+            "default_params": default_params(target),
+            "default_pick_agreement": agreement,
+            "leaderboard": ranked,
+        }
+        write_json(out_dir / "leaderboard.json", payload, artifact="summary")
+        save_csv_rows(out_dir / "leaderboard.csv", leaderboard_csv_rows(target, ranked))
+        out_dirs.append(out_dir)
+
+        default_row = next(r for r in ranked if r["is_default"])
+        print(f"\n=== {target.upper()} ({MODEL_BY_TARGET[target]}) | {len(ranked)} sets | {frame['n']} games ===")
+        print(f"Default pick agreement: spread={agreement['spread']} total={agreement['total']}")
+        print(f"{'Rank':<6}{'Spread W%':<11}{'Spread ROI':<12}{'Total W%':<10}{'Total ROI':<11}{'ROI':<9}Params")
+        print("-" * 90)
+        for r in ranked[:top] + ([default_row] if default_row["rank"] > top else []):
+            print(
+                f"{r['rank']:<6}"
+                f"{str(r['spread']['win_rate']):<11}{str(r['spread']['roi']):<12}"
+                f"{str(r['total']['win_rate']):<10}{str(r['total']['roi']):<11}"
+                f"{str(r['combined_roi']):<9}"
+                f"{r['params']}{'  <- default' if r['is_default'] else ''}"
+            )
+        print(f"Output dir: {out_dir}")
+    return out_dirs
+
+
+def _parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Parameter sweep over NBA model constants (grid / random search).")
+    p.add_argument("--target", choices=[*GRIDS, "all"], default="all")
+    p.add_argument("--mode", choices=["grid", "random"], default="grid")
+    p.add_argument("--samples", type=int, default=500, help="Random mode: parameter sets per target")
+    p.add_argument("--seed", type=int, default=None, help="Random mode: RNG seed")
+    p.add_argument("--workers", type=int, default=None, help="Process pool size (default: cpu count)")
+    p.add_argument("--min-spread-edge", type=float, default=0.0, help="Only bet spreads with |edge| >= this")
+    p.add_argument("--min-total-edge", type=float, default=0.0, help="Only bet totals with |edge| >= this")
+    p.add_argument("--min-bets", type=int, default=100, help="Sets with fewer bets rank last")
+    p.add_argument(
+        "--rank-by",
+        choices=["combined_roi", "spread_roi", "total_roi", "spread_win_rate", "total_win_rate"],
+        default="combined_roi",
+    )
+    p.add_argument("--top", type=int, default=10, help="Leaderboard rows to print per target")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    run(
+        list(GRIDS) if args.target == "all" else [args.target],
+        mode=args.mode,
+        samples=args.samples,
+        seed=args.seed,
+        workers=args.workers,
+        min_spread_edge=args.min_spread_edge,
+        min_total_edge=args.min_total_edge,
+        min_bets=args.min_bets,
+        rank_by=args.rank_by,
+        top=args.top,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,594 @@
+"""
+eng/backtest/walk_forward.py
+
+Walk-forward (as-of-date) backtest engine for NBA and NCAAM.
+
+backtest_gen_runner grades the current multi-model file, whose features were built
+with the full season in hand. This engine replays the season day by day instead:
+
+- One chronological pass over game state (041 output). For each date, every game
+  gets features computed from FeatureState *before* that date's results are folded
+  in: rolling averages, last-5 momentum, rest/back-to-back fatigue (previous game's
+  OT, not this game's) and, for NBA, injury impact weighted by as-of player minutes.
+- Market lines come from odds_history as of pre-tip (last snapshot captured before
+  commence time; game-day end when commence is unknown).
+- Model runs + grading (BacktestEngine, same registry as 0051) are fanned out over
+  date chunks with a process pool; feature state never crosses process boundaries.
+- FeatureState is persisted after the last fully-final date (never past --end), with
+  the graded rows up to that date, so later runs with --resume only replay new dates.
+  Runs with --start do not persist: dates before it are folded in but not graded.
+
+Outputs (data/{league}/backtests/walkforward_{timestamp}/):
+  backtest_games.json, backtest_summary.json, backtest_games_{league}_{ts}.csv
+  (same schema as backtest_gen_runner) and walk_forward_daily.json (per-date picks/grades).
+Directory prefix is walkforward_ so pocket builders (backtest_*) do not pick it up.
+
+Usage:
+  python eng/backtest/walk_forward.py --league nba
+  python eng/backtest/walk_forward.py --league ncaam --workers 4 --resume
+  python eng/backtest/walk_forward.py --league nba --start 2025-11-01 --end 2026-01-31
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from eng.backtest.backtest_gen_runner import (
+    BacktestEngine,
+    _is_final_game,
+    _normalize_scores,
+    _safe_float,
+    build_backtest_rows,
+    build_csv_rows,
+    build_summary,
+    get_output_root,
+    write_outputs,
+)
+from utils.json_codec import find_json, read_json, write_json
+
+STATE_VERSION = "WALK_FORWARD_STATE_V1"
+LAST_N = 5
+
+
+# -----------------------------------------------------------------------------
+# Paths and model registry
+# -----------------------------------------------------------------------------
+
+
+def get_state_dir(league: str) -> Path:
+    """Persisted walk-forward state: data/{league}/backtests/walk_forward_state/."""
+    return get_output_root(league) / "walk_forward_state"
+
+
+def get_model_registry(league: str) -> list:
+    """Same registries as model_gen_0051_runner (NBA models live under eng/models/nba)."""
+    if league == "nba":
+        from eng.models.nba.joel_baseline_model import JoelBaselineModel
+        from eng.models.nba.fatigue_plus_model import FatiguePlusModel
+        from eng.models.nba.injury_model import InjuryModel
+        from eng.models.nba.market_pressure_model import MarketPressureModel
+        from eng.models.nba.market_blend_model import MarketBlendModel
+        from eng.models.nba.momentum_5game_model import Momentum5GameModel
+        from eng.models.shared.monkey_darts_model import MonkeyDartsModel
+        return [
+            JoelBaselineModel,
+            FatiguePlusModel,
+            InjuryModel,
+            MarketPressureModel,
+            MarketBlendModel,
+            Momentum5GameModel,
+            MonkeyDartsModel,
+        ]
+    from eng.models.ncaam.ncaam_avg_score_model import NCAAMAvgScoreModel
+    from eng.models.ncaam.ncaam_momentum5_model import NCAAMMomentum5Model
+    from eng.models.ncaam.ncaam_market_pressure_model import NCAAMMarketPressureModel
+    return [NCAAMAvgScoreModel, NCAAMMomentum5Model, NCAAMMarketPressureModel]
+
+
+# -----------------------------------------------------------------------------
+# Game accessors (league-specific keys)
+# -----------------------------------------------------------------------------
+
+
+def _game_id(game: dict) -> str:
+    return str(game.get("canonical_game_id") or game.get("game_id") or "").strip()
+
+
+def _game_day(game: dict) -> str:
+    return str(game.get("nba_game_day_local") or game.get("game_date") or "")[:10]
+
+
+def _team_key(game: dict, side: str) -> str:
+    return str(
+        game.get(f"{side}_team_id") or game.get(f"{side}_team_display") or game.get(f"{side}_team") or ""
+    ).strip()
+
+
+def _parse_utc(ts: Any) -> Optional[datetime]:
+    if not ts:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(ts).strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def pretip_odds(game: dict) -> tuple[Optional[dict], str]:
+    """
+    Last odds_history snapshot captured before tipoff. Returns (snapshot or None, cutoff source).
+    Cutoff: odds_commence_time_utc when known, else end of the game day (UTC).
+    """
+    commence = _parse_utc(game.get("odds_commence_time_utc") or game.get("commence_time_utc"))
+    source = "commence"
+    if commence is None:
+        day = _game_day(game)
+        commence = _parse_utc(f"{day}T23:59:59+00:00") if day else None
+        source = "game_day_end"
+    if commence is None:
+        return None, "none"
+    best, best_ts = None, None
+    for snap in game.get("odds_history") or []:
+        if not isinstance(snap, dict):
+            continue
+        ts = _parse_utc(snap.get("captured_at_utc"))
+        if ts is None or ts >= commence:
+            continue
+        if snap.get("market_spread_home") in (None, "") and snap.get("market_total") in (None, ""):
+            continue
+        if best_ts is None or ts >= best_ts:
+            best, best_ts = snap, ts
+    return best, source
+
+
+# -----------------------------------------------------------------------------
+# Incremental feature state
+# -----------------------------------------------------------------------------
+
+
+class FeatureState:
+    """
+    Team/player accumulators advanced only by finalized games, one date at a time.
+    NBA rolling averages are split by (team, side) like c_calc_014; NCAAM uses team totals.
+    JSON-serializable via to_dict()/from_dict().
+    """
+
+    def __init__(self, league: str):
+        self.league = league
+        self.as_of: Optional[str] = None
+        self.rolling: dict[str, list[float]] = {}         # key -> [points_for, points_against, games]
+        self.last5: dict[str, deque] = {}                 # team -> deque[(pf, pa)]
+        self.last_day: dict[str, str] = {}                # team -> last game day played
+        self.last_rest: dict[str, Optional[int]] = {}     # team -> rest days before last game
+        self.last_ot: dict[str, int] = {}                 # team -> ot minutes of last game
+        self.player_minutes: dict[str, deque] = {}        # player_id -> deque[minutes]
+
+    def _rolling_key(self, team: str, side: str) -> str:
+        return f"{team}|{side}" if self.league == "nba" else team
+
+    # ---- features -----------------------------------------------------------
+
+    def features_for(self, game: dict, injury_rows: dict | None = None) -> dict:
+        day = _game_day(game)
+        out: dict[str, Any] = {}
+        for side in ("home", "away"):
+            team = _team_key(game, side)
+            acc = self.rolling.get(self._rolling_key(team, side))
+            if acc and acc[2] > 0:
+                out[f"{side}_avg_points_for"] = acc[0] / acc[2]
+                out[f"{side}_avg_points_against"] = acc[1] / acc[2]
+            else:
+                out[f"{side}_avg_points_for"] = None
+                out[f"{side}_avg_points_against"] = None
+            out[f"{side}_games_in_history"] = int(acc[2]) if acc else 0
+
+            hist = self.last5.get(team) or ()
+            out[f"{side}_last5_games_in_history"] = len(hist)
+            if len(hist) == LAST_N:
+                pf = sum(x[0] for x in hist) / LAST_N
+                pa = sum(x[1] for x in hist) / LAST_N
+                out[f"{side}_last5_points_for"] = round(pf, 3)
+                out[f"{side}_last5_points_against"] = round(pa, 3)
+                out[f"{side}_last5_avg_margin"] = round(pf - pa, 3)
+                out[f"{side}_last5_win_pct"] = round(sum(1 for x in hist if x[0] > x[1]) / LAST_N, 3)
+            else:
+                for k in ("points_for", "points_against", "avg_margin", "win_pct"):
+                    out[f"{side}_last5_{k}"] = None
+
+            if self.league == "nba":
+                out.update(self._fatigue_features(side, team, day))
+                if injury_rows is not None:
+                    out.update(self._injury_features(side, game, injury_rows))
+
+        if self.league == "nba":
+            out["fatigue_diff_home_minus_away"] = round(
+                (out.get("home_fatigue_score") or 0.0) - (out.get("away_fatigue_score") or 0.0), 3
+            )
+        return out
+
+    def _fatigue_features(self, side: str, team: str, day: str) -> dict:
+        from eng.pipelines.nba.c_calc_012_compute_fatigue_score import compute_team_fatigue
+
+        rest = None
+        prev = self.last_day.get(team)
+        if prev and day:
+            rest = max((date.fromisoformat(day) - date.fromisoformat(prev)).days - 1, 0)
+        b2b = rest == 0
+        b2b2b = b2b and self.last_rest.get(team) == 0
+        return {
+            f"{side}_rest_days": rest,
+            f"{side}_back_to_back": b2b,
+            f"{side}_back_to_back_to_back": b2b2b,
+            f"{side}_fatigue_score": compute_team_fatigue(rest, b2b, b2b2b, self.last_ot.get(team, 0)),
+        }
+
+    def _injury_features(self, side: str, game: dict, injury_rows: dict) -> dict:
+        from eng.pipelines.nba.c_calc_020_build_team_injury_impact import STATUS_WEIGHTS
+
+        rows = injury_rows.get((_game_day(game), game.get(f"{side}_team"))) or []
+        impact, num_out, num_q = 0.0, 0, 0
+        for r in rows:
+            status = str(r.get("status") or "").upper()
+            mins = self.player_minutes.get(str(r.get("player_id") or ""))
+            non_zero = [m for m in (mins or ()) if m > 0]
+            avg_minutes = sum(non_zero) / len(non_zero) if non_zero else 0.0
+            impact += STATUS_WEIGHTS.get(status, 0.0) * (avg_minutes / 30.0)
+            num_out += status == "OUT"
+            num_q += status == "QUESTIONABLE"
+        return {
+            f"{side}_injury_impact": round(impact, 4),
+            f"{side}_num_out": num_out,
+            f"{side}_num_questionable": num_q,
+        }
+
+    # ---- updates ------------------------------------------------------------
+
+    def update(self, game: dict, player_rows: list[dict] | None = None) -> None:
+        """Fold one finalized game into the state."""
+        home, away, _, _ = _normalize_scores(game)
+        if home is None or away is None or (home == 0 and away == 0):
+            return
+        day = _game_day(game)
+        ot = int(_safe_float(game.get("ot_minutes")) or 0)
+        for side, pf, pa in (("home", home, away), ("away", away, home)):
+            team = _team_key(game, side)
+            acc = self.rolling.setdefault(self._rolling_key(team, side), [0.0, 0.0, 0])
+            acc[0] += pf
+            acc[1] += pa
+            acc[2] += 1
+            self.last5.setdefault(team, deque(maxlen=LAST_N)).append((pf, pa))
+            prev = self.last_day.get(team)
+            self.last_rest[team] = (
+                max((date.fromisoformat(day) - date.fromisoformat(prev)).days - 1, 0) if prev and day else None
+            )
+            self.last_day[team] = day
+            self.last_ot[team] = ot
+        if player_rows:
+            from eng.pipelines.nba.c_calc_020_build_team_injury_impact import parse_minutes_iso
+            for r in player_rows:
+                pid = str(r.get("player_id") or "")
+                if pid:
+                    self.player_minutes.setdefault(pid, deque(maxlen=LAST_N)).append(
+                        parse_minutes_iso(r.get("minutes") or "")
+                    )
+
+    # ---- persistence --------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "version": STATE_VERSION,
+            "league": self.league,
+            "as_of": self.as_of,
+            "rolling": self.rolling,
+            "last5": {k: list(v) for k, v in self.last5.items()},
+            "last_day": self.last_day,
+            "last_rest": self.last_rest,
+            "last_ot": self.last_ot,
+            "player_minutes": {k: list(v) for k, v in self.player_minutes.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "FeatureState":
+        if d.get("version") != STATE_VERSION:
+            raise ValueError(f"Unsupported walk-forward state version: {d.get('version')!r}")
+        st = cls(d["league"])
+        st.as_of = d.get("as_of")
+        st.rolling = {k: list(v) for k, v in (d.get("rolling") or {}).items()}
+        st.last5 = {k: deque((tuple(x) for x in v), maxlen=LAST_N) for k, v in (d.get("last5") or {}).items()}
+        st.last_day = dict(d.get("last_day") or {})
+        st.last_rest = dict(d.get("last_rest") or {})
+        st.last_ot = dict(d.get("last_ot") or {})
+        st.player_minutes = {
+            k: deque(v, maxlen=LAST_N) for k, v in (d.get("player_minutes") or {}).items()
+        }
+        return st
+
+
+def save_state(league: str, state: FeatureState, graded_rows: list[dict]) -> Path:
+    state_dir = get_state_dir(league)
+    state_dir.mkdir(parents=True, exist_ok=True)
+    write_json(state_dir / "feature_state.json", state.to_dict(), artifact="state")
+    # graded_rows.jsonl under the default state_rows codec
+    write_json(state_dir / "graded_rows.json", graded_rows, artifact="state_rows")
+    return state_dir
+
+
+def load_state(league: str) -> tuple[Optional[FeatureState], list[dict]]:
+    state_dir = get_state_dir(league)
+    state_path = find_json(state_dir / "feature_state.json")
+    rows_path = find_json(state_dir / "graded_rows.json")
+    if state_path is None or rows_path is None:
+        return None, []
+    state = FeatureState.from_dict(read_json(state_path))
+    rows = read_json(rows_path)
+    return state, rows if isinstance(rows, list) else []
+
+
+# -----------------------------------------------------------------------------
+# NBA side inputs (injury archive, player minutes)
+# -----------------------------------------------------------------------------
+
+
+def _load_nba_side_inputs() -> tuple[dict, dict]:
+    """(injuries keyed by (snapshot_date, team_name), player box rows keyed by game_id). Empty if absent."""
+    from configs.leagues.league_nba import DERIVED_DIR
+
+    injuries: dict[tuple, list] = defaultdict(list)
+    players_by_game: dict[str, list] = defaultdict(list)
+    inj_path = DERIVED_DIR / "nba_injuries_history.json"
+    box_path = DERIVED_DIR / "nba_boxscores_player.json"
+    name_to_pid: dict[str, str] = {}
+    if box_path.exists():
+        for r in read_json(box_path):
+            players_by_game[str(r.get("game_id") or "")].append(r)
+            if r.get("player_name"):
+                name_to_pid[r["player_name"]] = str(r.get("player_id") or "")
+    if inj_path.exists():
+        for r in read_json(inj_path):
+            row = dict(r)
+            row["player_id"] = name_to_pid.get(r.get("player_name"))
+            injuries[(str(r.get("snapshot_date") or "")[:10], r.get("team_name"))].append(row)
+    return dict(injuries), dict(players_by_game)
+
+
+# -----------------------------------------------------------------------------
+# Pass 1: as-of feature rows (sequential, O(games))
+# -----------------------------------------------------------------------------
+
+
+def build_asof_rows(
+    league: str,
+    games: list[dict],
+    state: FeatureState,
+    *,
+    start: str | None = None,
+    end: str | None = None,
+) -> tuple[dict[str, list[dict]], FeatureState, list[dict]]:
+    """
+    Replay games after state.as_of. Returns ({date: [as-of game rows]}, state, skipped).
+    State advances date by date and its as_of stops at the last date whose games are all final,
+    so the persisted state never contains partial days. Replay stops after end: the state must
+    not move past dates that were never graded, or --resume would skip them.
+    """
+    injuries, players_by_game = _load_nba_side_inputs() if league == "nba" else ({}, {})
+    by_date: dict[str, list[dict]] = defaultdict(list)
+    for g in games:
+        d = _game_day(g)
+        if d and (state.as_of is None or d > state.as_of):
+            by_date[d].append(g)
+
+    out: dict[str, list[dict]] = {}
+    skipped: list[dict] = []
+    advancing = True
+    for d in sorted(by_date):
+        if end is not None and d > end:
+            break
+        day_games = sorted(by_date[d], key=_game_id)
+        in_window = start is None or d >= start
+        if in_window:
+            rows = []
+            for g in day_games:
+                snap, cutoff = pretip_odds(g)
+                if snap is None:
+                    skipped.append({"game_id": _game_id(g), "reason": "No pre-tip odds"})
+                    continue
+                row = dict(g)
+                row.pop("odds_history", None)
+                row.update(state.features_for(g, injuries if league == "nba" else None))
+                spread = snap.get("market_spread_home")
+                total = snap.get("market_total")
+                row["spread_home_last"] = row["market_spread_home"] = spread
+                row["total_last"] = row["market_total"] = total
+                row["walk_forward_as_of"] = state.as_of
+                row["pretip_captured_at_utc"] = snap.get("captured_at_utc")
+                row["pretip_cutoff_source"] = cutoff
+                rows.append(row)
+            if rows:
+                out[d] = rows
+        all_final = all(_is_final_game(g) for g in day_games)
+        if not all_final:
+            advancing = False
+        # Once a date has unfinished games the state stops advancing: later dates still get
+        # leak-free features from the last complete date.
+        if advancing:
+            for g in day_games:
+                state.update(g, players_by_game.get(_game_id(g)))
+            state.as_of = d
+    return out, state, skipped
+
+
+# -----------------------------------------------------------------------------
+# Pass 2: models + grading per date chunk (process pool)
+# -----------------------------------------------------------------------------
+
+
+def _coerce_lines(game: dict) -> dict:
+    for k in ("spread_home_last", "total_last", "market_spread_home", "market_total"):
+        game[k] = _safe_float(game.get(k))
+    return game
+
+
+def grade_chunk(league: str, rows: list[dict]) -> tuple[list[dict], list[dict], list[dict]]:
+    """Run the league model registry over as-of rows and grade. Returns (graded, skipped, ungraded picks)."""
+    from eng.models.shared.model_gen_0051_runner import run_models
+
+    registry = get_model_registry(league)
+    games = run_models([_coerce_lines(dict(r)) for r in rows], registry, sort_key=_game_id)
+    engine = BacktestEngine(league)
+    graded, skipped = build_backtest_rows(games, league, engine)
+    graded_ids = {_game_id(r) for r in graded}
+    pending = [g for g in games if _game_id(g) not in graded_ids]
+    return graded, skipped, pending
+
+
+def _chunks(dates: list[str], n: int) -> list[list[str]]:
+    if n <= 1 or len(dates) <= 1:
+        return [dates] if dates else []
+    size = -(-len(dates) // n)
+    return [dates[i:i + size] for i in range(0, len(dates), size)]
+
+
+def build_daily_summary(graded: list[dict], pending: list[dict], authority: str) -> list[dict]:
+    days: dict[str, dict] = {}
+    for r in graded:
+        d = days.setdefault(_game_day(r), defaultdict(int))
+        d["graded"] += 1
+        for market in ("spread", "total"):
+            res = str(r.get(f"selected_{market}_result") or "").upper()
+            if res in ("WIN", "LOSS", "PUSH"):
+                d[f"{market}_{res.lower()}"] += 1
+    for g in pending:
+        days.setdefault(_game_day(g), defaultdict(int))["pending"] += 1
+    out = []
+    for d in sorted(days):
+        row = {"date": d, "selection_authority": authority, **days[d]}
+        for market in ("spread", "total"):
+            w, l = row.get(f"{market}_win", 0), row.get(f"{market}_loss", 0)
+            row[f"{market}_win_rate"] = round(w / (w + l), 4) if (w + l) else None
+        out.append(row)
+    return out
+
+
+# -----------------------------------------------------------------------------
+# Run
+# -----------------------------------------------------------------------------
+
+
+def run(
+    league: str,
+    *,
+    workers: int | None = None,
+    resume: bool = False,
+    start: str | None = None,
+    end: str | None = None,
+) -> Path:
+    """Walk-forward replay + grading. Returns output directory."""
+    from utils.io_helpers import load_game_state
+
+    league = (league or "nba").strip().lower()
+    if league not in ("nba", "ncaam"):
+        raise ValueError("--league must be nba or ncaam")
+    engine = BacktestEngine(league)
+
+    state, prior_rows = (load_state(league) if resume else (None, []))
+    if state is None:
+        state, prior_rows = FeatureState(league), []
+    resumed_from = state.as_of
+
+    games = load_game_state(league)
+    asof_by_date, state, skipped = build_asof_rows(league, games, state, start=start, end=end)
+
+    dates = sorted(asof_by_date)
+    workers = workers or min(os.cpu_count() or 1, 8)
+    chunks = _chunks(dates, workers)
+    graded: list[dict] = []
+    pending: list[dict] = []
+    if len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = [
+                pool.submit(grade_chunk, league, [r for d in chunk for r in asof_by_date[d]])
+                for chunk in chunks
+            ]
+            for fut in futures:
+                g, s, p = fut.result()
+                graded.extend(g)
+                skipped.extend(s)
+                pending.extend(p)
+    elif chunks:
+        graded, s, pending = grade_chunk(league, [r for d in chunks[0] for r in asof_by_date[d]])
+        skipped.extend(s)
+
+    # Persist state + rows up to the last fully-final date (resume point). Not with --start:
+    # the state has advanced over earlier dates that were never graded.
+    all_graded = prior_rows + graded
+    if state.as_of and start is None:
+        save_state(league, state, [r for r in all_graded if _game_day(r) <= state.as_of])
+
+    all_graded.sort(key=lambda r: (_game_day(r), _game_id(r)))
+    summary = build_summary(all_graded, skipped, league, engine.selection_authority)
+    summary["walk_forward"] = {
+        "resumed_from": resumed_from,
+        "state_as_of": state.as_of,
+        "replayed_dates": len(dates),
+        "workers": len(chunks),
+        "pending_games": len(pending),
+        "window": {"start": start, "end": end},
+    }
+    csv_rows = build_csv_rows(
+        all_graded,
+        engine.selection_authority,
+        league=league,
+        build_timestamp=summary["generated_at_utc"],
+    )
+
+    run_ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    out_dir = get_output_root(league) / f"walkforward_{run_ts}"
+    write_outputs(out_dir, all_graded, summary, csv_rows, league=league, run_ts=run_ts)
+    daily = build_daily_summary(all_graded, pending, engine.selection_authority)
+    write_json(
+        out_dir / "walk_forward_daily.json",
+        {"league": league, "days": daily, "pending_picks": pending},
+        artifact="summary",
+        default=str,
+    )
+
+    print(f"League:              {league}")
+    print(f"Selection authority: {engine.selection_authority}")
+    print(f"Resumed from:        {resumed_from or '-'}")
+    print(f"State as of:         {state.as_of or '-'}")
+    print(f"Replayed dates:      {len(dates)} ({len(chunks)} chunk(s))")
+    print(f"Graded games:        {len(all_graded)} ({len(graded)} new)")
+    print(f"Pending picks:       {len(pending)}")
+    print(f"Skipped games:       {len(skipped)}")
+    print(f"Output dir:          {out_dir}")
+    return out_dir
+
+
+def _parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Walk-forward (as-of-date) backtest (NBA / NCAAM).")
+    p.add_argument("--league", choices=["nba", "ncaam"], default="nba")
+    p.add_argument("--workers", type=int, default=None, help="Process pool size for model/grade chunks")
+    p.add_argument("--resume", action="store_true", help="Continue from persisted feature state")
+    p.add_argument("--start", type=str, default=None, help="First date to emit picks (YYYY-MM-DD)")
+    p.add_argument("--end", type=str, default=None, help="Last date to emit picks (YYYY-MM-DD)")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    run(args.league, workers=args.workers, resume=args.resume, start=args.start, end=args.end)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,12 @@ Purpose:
 Freeze backtest statistics into a deterministic calibration snapshot (Confidence Tiers).
 
 Rules:
-- Reads latest backtest_games.json for the given league from data/{league}/backtests/backtest_*/.
+- Default: latest backtest_* run for the given league (data/{league}/backtests/backtest_*/);
+  percentiles are exact (np.percentile 'linear') over that run's games.
+- --days N / --since / --until: merge persisted per-run calibration sketches
+  (eng/calibration/calibration_sketch.py) across all backtest_* runs instead of rescanning
+  game files; the newest run wins for any date covered by several runs. Range percentiles
+  come from merged t-digests and are approximate once a range outgrows the digest compression.
 - Supports --league nba | ncaam.
 - No model recalculation; deterministic output.
 """
@@ -13,9 +18,8 @@ Rules:
 import argparse
 import json
 import sys
-import numpy as np
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
@@ -67,33 +71,13 @@ def get_latest_backtest_file(league: str):
     return file_path, latest_dir.name
 
 
-def bucket_label(value):
-    if value < 1:
-        return "0-1"
-    elif value < 2:
-        return "1-2"
-    elif value < 4:
-        return "2-4"
-    elif value < 8:
-        return "4-8"
-    else:
-        return "8+"
-
-
-def win_rate(results):
-    return float(np.mean(results)) if results else None
-
-
-def calculate_percentiles(edge_values: list[float]) -> dict[str, float]:
-    """Explicitly generate p10, p25, p50, p75, p90. Uses 0.0 when empty so keys always exist."""
-    keys = ("p10", "p25", "p50", "p75", "p90")
-    percentiles_q = (10, 25, 50, 75, 90)
-    if not edge_values:
-        return {k: 0.0 for k in keys}
-    return {
-        k: float(np.percentile(edge_values, q))
-        for k, q in zip(keys, percentiles_q)
-    }
+def list_backtest_dirs(league: str) -> list[Path]:
+    """All backtest_* dirs for league, oldest -> newest by mtime."""
+    backtest_root = get_backtest_output_root(league)
+    if not backtest_root.exists():
+        return []
+    subdirs = [d for d in backtest_root.iterdir() if d.is_dir() and d.name.startswith("backtest_")]
+    return sorted(subdirs, key=lambda d: d.stat().st_mtime)
 
 
 def normalize_game_for_calibration(g: dict, league: str) -> dict:
@@ -116,110 +100,67 @@ def normalize_game_for_calibration(g: dict, league: str) -> dict:
 # MAIN
 # ------------------------------------------------------------
 
-def build_snapshot(league: str = "nba"):
+def build_snapshot(
+    league: str = "nba",
+    *,
+    days: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+):
+
+    from eng.calibration.calibration_sketch import (
+        CalibrationSketch,
+        exact_percentiles,
+        latest_game_date,
+        load_or_build_run_sketch,
+        merge_range,
+    )
 
     league = (league or "nba").strip().lower()
     if league not in ("nba", "ncaam"):
         raise ValueError("--league must be nba or ncaam")
 
-    backtest_path, folder_name = get_latest_backtest_file(league)
-
-    with backtest_path.open("r", encoding="utf-8") as f:
-        raw_games = json.load(f)
-
-    games = [normalize_game_for_calibration(g, league) for g in raw_games]
-
-    # --------------------------------------------------------
-    # EDGE DISTRIBUTION
-    # --------------------------------------------------------
-
-    spread_edges = [abs(float(g["Spread Edge"])) for g in games if g.get("Spread Edge") is not None]
-    total_edges = [abs(float(g["Total Edge"])) for g in games if g.get("Total Edge") is not None]
-
-    spread_percentiles = calculate_percentiles(spread_edges)
-    total_percentiles = calculate_percentiles(total_edges)
-
-    # --------------------------------------------------------
-    # PERFORMANCE BY BUCKET
-    # --------------------------------------------------------
-
-    spread_buckets = {}
-    total_buckets = {}
-
-    for g in games:
-
-        spread_edge = g.get("Spread Edge")
-        if spread_edge is not None:
-            bucket = bucket_label(abs(float(spread_edge)))
-            spread_buckets.setdefault(bucket, []).append(g.get("spread_result") == "WIN")
-
-        total_edge = g.get("Total Edge")
-        if total_edge is not None:
-            bucket = bucket_label(abs(float(total_edge)))
-            total_buckets.setdefault(bucket, []).append(g.get("total_result") == "WIN")
-
-    spread_bucket_win_rates = {
-        bucket: win_rate(results)
-        for bucket, results in spread_buckets.items()
-    }
-
-    total_bucket_win_rates = {
-        bucket: win_rate(results)
-        for bucket, results in total_buckets.items()
-    }
-
-    # --------------------------------------------------------
-    # BIAS METRICS
-    # --------------------------------------------------------
-
-    over_results = []
-    under_results = []
-    fav_results = []
-    dog_results = []
-
-    for g in games:
-
-        # OVER / UNDER
-        if g.get("Total Bet") == "OVER":
-            over_results.append(g.get("total_result") == "WIN")
-
-        if g.get("Total Bet") == "UNDER":
-            under_results.append(g.get("total_result") == "WIN")
-
-        # FAVORITE / DOG
-        if g.get("Line Bet") and g.get("spread_home") is not None:
-            home_is_fav = g["spread_home"] < 0
-            bet_on_home = g["Line Bet"] == "HOME"
-
-            is_favorite_pick = (home_is_fav and bet_on_home) or (not home_is_fav and not bet_on_home)
-
-            if is_favorite_pick:
-                fav_results.append(g.get("spread_result") == "WIN")
-            else:
-                dog_results.append(g.get("spread_result") == "WIN")
-
-    bias_baseline = {
-        "over_win_rate": win_rate(over_results),
-        "under_win_rate": win_rate(under_results),
-        "favorite_win_rate": win_rate(fav_results),
-        "dog_win_rate": win_rate(dog_results)
-    }
-
-    # --------------------------------------------------------
-    # BUILD SNAPSHOT
-    # --------------------------------------------------------
+    ranged = days is not None or since is not None or until is not None
+    if ranged:
+        runs = [rs for rs in (load_or_build_run_sketch(d, league) for d in list_backtest_dirs(league)) if rs]
+        if not runs:
+            raise RuntimeError(f"No backtest_* runs with sketches for league={league}.")
+        if days is not None:
+            last = until or latest_game_date(runs)
+            if last:
+                since = (date.fromisoformat(last) - timedelta(days=days - 1)).isoformat()
+                until = last
+        merged, used = merge_range(runs, since=since, until=until)
+        folder_name = used[-1] if used else runs[-1].run_name
+        # Range: percentiles from the merged t-digests; win-rate counters are exact.
+        fields = merged.to_snapshot_fields()
+    else:
+        from utils.json_codec import read_json
+
+        backtest_path, folder_name = get_latest_backtest_file(league)
+        raw_games = read_json(backtest_path)
+        games = [normalize_game_for_calibration(g, league) for g in raw_games]
+        sketch = CalibrationSketch()
+        for g in games:
+            sketch.add(g)
+        # Single run: no merge needed, so percentiles come from the raw edges (exact).
+        fields = sketch.to_snapshot_fields()
+        fields["spread_edge_percentiles"] = exact_percentiles(
+            [abs(float(g["Spread Edge"])) for g in games if g.get("Spread Edge") is not None]
+        )
+        fields["total_edge_percentiles"] = exact_percentiles(
+            [abs(float(g["Total Edge"])) for g in games if g.get("Total Edge") is not None]
+        )
 
     snapshot = {
         "calibration_version": CALIBRATION_VERSION,
         "snapshot_date": datetime.now().strftime("%Y-%m-%d"),
         "backtest_folder_used": folder_name,
-        "total_games_used": len(games),
-        "spread_edge_percentiles": spread_percentiles,
-        "total_edge_percentiles": total_percentiles,
-        "spread_bucket_win_rates": spread_bucket_win_rates,
-        "total_bucket_win_rates": total_bucket_win_rates,
-        "bias_baseline": bias_baseline
+        **fields,
     }
+    if ranged:
+        snapshot["calibration_range"] = {"since": since, "until": until, "days": days}
+        snapshot["backtest_folders_used"] = used
 
     output_path = _get_calibration_output_path(league)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -237,11 +178,14 @@ def build_snapshot(league: str = "nba"):
         json.dump(snapshot, f, indent=2)
 
     print(f"Calibration snapshot written: {output_path}")
-    print(f"League: {league} | Backtest folder: {folder_name} | Games: {len(games)}")
+    print(f"League: {league} | Backtest folder: {folder_name} | Games: {snapshot['total_games_used']}")
 
 
 if __name__ == "__main__":
     p = argparse.ArgumentParser(description="Build calibration snapshot from latest league backtest.")
     p.add_argument("--league", choices=["nba", "ncaam"], default="nba", help="League (default: nba)")
+    p.add_argument("--days", type=int, default=None, help="Merge sketches for the last N game days across runs")
+    p.add_argument("--since", type=str, default=None, help="Range start YYYY-MM-DD (merge across runs)")
+    p.add_argument("--until", type=str, default=None, help="Range end YYYY-MM-DD (merge across runs)")
     args = p.parse_args()
-    build_snapshot(league=args.league)
\ No newline at end of file
+    build_snapshot(league=args.league, days=args.days, since=args.since, until=args.until)
\ No newline at end of file
@@ -0,0 +1,406 @@
+"""
+eng/calibration/calibration_sketch.py
+
+Mergeable streaming summaries for calibration snapshots.
+
+Purpose:
+- Replace "load latest backtest_games.json -> Python lists -> np.percentile" with
+  summaries that are built once per backtest run and merged for any time range.
+- Edge distributions: TDigest (merging t-digest, k1 scale). Exact while a digest holds
+  fewer points than its compression, so small ranges match np.percentile (linear).
+  Single-run snapshots do not need a merge and use exact_percentiles() on the raw edges.
+- Bucket / bias win rates: integer counters [wins, n]; merge = addition.
+
+Rules:
+- Sketches are partitioned by game date. A range calibration (last 30 days, season,
+  three seasons) merges the day partitions in range; when several runs cover the same
+  date, the newest run's partition wins, so overlapping backtests are never double counted.
+- Persisted per run as {backtest_dir}/calibration_sketch.json (deterministic, pure stdlib).
+
+Usage:
+  from eng.calibration.calibration_sketch import write_run_sketch, load_or_build_run_sketch, merge_range
+  write_run_sketch(out_dir, backtest_rows, league)            # backtest runner, rows in memory
+  runs = [load_or_build_run_sketch(d, league) for d in dirs]  # oldest -> newest
+  merged, used = merge_range(runs, since="2026-01-01")
+  snapshot_fields = merged.to_snapshot_fields()
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import Iterable, Optional
+
+SKETCH_VERSION = "CALIBRATION_SKETCH_V1"
+SKETCH_FILENAME = "calibration_sketch.json"
+DEFAULT_COMPRESSION = 200
+PERCENTILE_KEYS = (("p10", 10), ("p25", 25), ("p50", 50), ("p75", 75), ("p90", 90))
+BUCKET_EDGES = ((1, "0-1"), (2, "1-2"), (4, "2-4"), (8, "4-8"))
+
+
+def exact_percentiles(values: list[float]) -> dict[str, float]:
+    """p10..p90 over the raw values (numpy 'linear'); 0.0 when empty so keys always exist."""
+    if not values:
+        return {k: 0.0 for k, _ in PERCENTILE_KEYS}
+    xs = sorted(float(v) for v in values)
+    n = len(xs)
+    out = {}
+    for k, q in PERCENTILE_KEYS:
+        pos = q / 100.0 * (n - 1)
+        lo = int(math.floor(pos))
+        hi = min(lo + 1, n - 1)
+        out[k] = xs[lo] + (xs[hi] - xs[lo]) * (pos - lo)
+    return out
+
+
+def bucket_label(value: float) -> str:
+    for upper, label in BUCKET_EDGES:
+        if value < upper:
+            return label
+    return "8+"
+
+
+# ------------------------------------------------------------
+# T-DIGEST
+# ------------------------------------------------------------
+
+class TDigest:
+    """Merging t-digest. Centroids are [mean, weight]; merge(other) is associative up to compression."""
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.centroids: list[list[float]] = []
+        self._buffer: list[float] = []
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, x: float, w: float = 1.0) -> None:
+        x = float(x)
+        self.min = x if self.min is None else min(self.min, x)
+        self.max = x if self.max is None else max(self.max, x)
+        self.count += w
+        if w == 1.0:
+            self._buffer.append(x)
+        else:
+            self.centroids.append([x, float(w)])
+        if len(self._buffer) >= self.compression * 5:
+            self._compress()
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        other._flush()
+        self._flush()
+        if other.count:
+            self.centroids.extend([c[0], c[1]] for c in other.centroids)
+            self.count += other.count
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+            self._compress()
+        return self
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._compress()
+
+    def _compress(self) -> None:
+        pts = self.centroids + [[x, 1.0] for x in self._buffer]
+        self._buffer = []
+        pts.sort(key=lambda c: c[0])
+        total = sum(c[1] for c in pts)
+        if total <= self.compression:
+            self.centroids = pts
+            return
+        # k1 scale: k(q) = delta/(2*pi) * asin(2q - 1); each centroid spans <= 1 unit of k.
+        delta = self.compression
+
+        def k(q: float) -> float:
+            return delta / (2 * math.pi) * math.asin(max(-1.0, min(1.0, 2 * q - 1)))
+
+        out: list[list[float]] = []
+        cur_mean, cur_w = pts[0]
+        q0 = 0.0
+        k_lo = k(q0)
+        for mean, w in pts[1:]:
+            q_next = (q0 + cur_w + w) / total
+            if k(q_next) - k_lo <= 1.0:
+                cur_mean += (mean - cur_mean) * w / (cur_w + w)
+                cur_w += w
+            else:
+                out.append([cur_mean, cur_w])
+                q0 += cur_w
+                k_lo = k(q0 / total)
+                cur_mean, cur_w = mean, w
+        out.append([cur_mean, cur_w])
+        self.centroids = out
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q in [0, 1]. Exact numpy 'linear' percentile while every centroid has weight 1."""
+        self._flush()
+        cs = self.centroids
+        if not cs:
+            return None
+        n = len(cs)
+        if all(c[1] == 1.0 for c in cs):
+            pos = q * (n - 1)
+            lo = int(math.floor(pos))
+            hi = min(lo + 1, n - 1)
+            return cs[lo][0] + (cs[hi][0] - cs[lo][0]) * (pos - lo)
+        target = q * self.count
+        cum = 0.0
+        prev_mid, prev_mean = 0.0, self.min
+        for mean, w in cs:
+            mid = cum + w / 2.0
+            if target <= mid:
+                if mid == prev_mid:
+                    return mean
+                frac = (target - prev_mid) / (mid - prev_mid)
+                return prev_mean + (mean - prev_mean) * frac
+            prev_mid, prev_mean = mid, mean
+            cum += w
+        return self.max
+
+    def to_dict(self) -> dict:
+        self._flush()
+        return {
+            "compression": self.compression,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "centroids": [[round(m, 10), w] for m, w in self.centroids],
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "TDigest":
+        t = cls(int(d.get("compression") or DEFAULT_COMPRESSION))
+        t.centroids = [[float(m), float(w)] for m, w in d.get("centroids") or []]
+        t.count = d.get("count") or 0
+        t.min = d.get("min")
+        t.max = d.get("max")
+        return t
+
+
+# ------------------------------------------------------------
+# CALIBRATION SKETCH (one time slice)
+# ------------------------------------------------------------
+
+def _counter() -> list[int]:
+    return [0, 0]
+
+
+class CalibrationSketch:
+    """Edge digests + win-rate counters for a set of graded games."""
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        self.games = 0
+        self.spread_edges = TDigest(compression)
+        self.total_edges = TDigest(compression)
+        self.spread_buckets: dict[str, list[int]] = {}
+        self.total_buckets: dict[str, list[int]] = {}
+        self.bias: dict[str, list[int]] = {}
+
+    @staticmethod
+    def _bump(counters: dict, key: str, win: bool) -> None:
+        c = counters.setdefault(key, _counter())
+        c[0] += 1 if win else 0
+        c[1] += 1
+
+    def add(self, g: dict) -> None:
+        """g: record from build_calibration_snapshot.normalize_game_for_calibration."""
+        self.games += 1
+        se = g.get("Spread Edge")
+        if se is not None:
+            v = abs(float(se))
+            self.spread_edges.add(v)
+            self._bump(self.spread_buckets, bucket_label(v), g.get("spread_result") == "WIN")
+        te = g.get("Total Edge")
+        if te is not None:
+            v = abs(float(te))
+            self.total_edges.add(v)
+            self._bump(self.total_buckets, bucket_label(v), g.get("total_result") == "WIN")
+        if g.get("Total Bet") == "OVER":
+            self._bump(self.bias, "over", g.get("total_result") == "WIN")
+        if g.get("Total Bet") == "UNDER":
+            self._bump(self.bias, "under", g.get("total_result") == "WIN")
+        if g.get("Line Bet") and g.get("spread_home") is not None:
+            home_is_fav = g["spread_home"] < 0
+            bet_on_home = g["Line Bet"] == "HOME"
+            fav = (home_is_fav and bet_on_home) or (not home_is_fav and not bet_on_home)
+            self._bump(self.bias, "favorite" if fav else "dog", g.get("spread_result") == "WIN")
+
+    def merge(self, other: "CalibrationSketch") -> "CalibrationSketch":
+        self.games += other.games
+        self.spread_edges.merge(TDigest.from_dict(other.spread_edges.to_dict()))
+        self.total_edges.merge(TDigest.from_dict(other.total_edges.to_dict()))
+        for mine, theirs in (
+            (self.spread_buckets, other.spread_buckets),
+            (self.total_buckets, other.total_buckets),
+            (self.bias, other.bias),
+        ):
+            for k, (w, n) in theirs.items():
+                c = mine.setdefault(k, _counter())
+                c[0] += w
+                c[1] += n
+        return self
+
+    @staticmethod
+    def _rates(counters: dict) -> dict:
+        return {k: (w / n if n else None) for k, (w, n) in counters.items()}
+
+    @staticmethod
+    def _percentiles(digest: TDigest) -> dict[str, float]:
+        if not digest.count:
+            return {k: 0.0 for k, _ in PERCENTILE_KEYS}
+        return {k: float(digest.quantile(q / 100.0)) for k, q in PERCENTILE_KEYS}
+
+    def to_snapshot_fields(self) -> dict:
+        """Fields matching CALIBRATION_SNAPSHOT_V1 (percentiles, bucket win rates, bias baseline)."""
+        rates = self._rates(self.bias)
+        return {
+            "total_games_used": self.games,
+            "spread_edge_percentiles": self._percentiles(self.spread_edges),
+            "total_edge_percentiles": self._percentiles(self.total_edges),
+            "spread_bucket_win_rates": self._rates(self.spread_buckets),
+            "total_bucket_win_rates": self._rates(self.total_buckets),
+            "bias_baseline": {
+                "over_win_rate": rates.get("over"),
+                "under_win_rate": rates.get("under"),
+                "favorite_win_rate": rates.get("favorite"),
+                "dog_win_rate": rates.get("dog"),
+            },
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "games": self.games,
+            "spread_edges": self.spread_edges.to_dict(),
+            "total_edges": self.total_edges.to_dict(),
+            "spread_buckets": self.spread_buckets,
+            "total_buckets": self.total_buckets,
+            "bias": self.bias,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "CalibrationSketch":
+        s = cls()
+        s.games = int(d.get("games") or 0)
+        s.spread_edges = TDigest.from_dict(d.get("spread_edges") or {})
+        s.total_edges = TDigest.from_dict(d.get("total_edges") or {})
+        s.spread_buckets = {k: list(v) for k, v in (d.get("spread_buckets") or {}).items()}
+        s.total_buckets = {k: list(v) for k, v in (d.get("total_buckets") or {}).items()}
+        s.bias = {k: list(v) for k, v in (d.get("bias") or {}).items()}
+        return s
+
+
+# ------------------------------------------------------------
+# RUN SKETCH (per backtest run, partitioned by game date)
+# ------------------------------------------------------------
+
+def _game_date(g: dict) -> str:
+    return str(g.get("game_date") or g.get("nba_game_day_local") or "")[:10] or "unknown"
+
+
+class RunSketch:
+    """Day-partitioned CalibrationSketch for one backtest run."""
+
+    def __init__(self, league: str, run_name: str, days: dict[str, CalibrationSketch] | None = None):
+        self.league = league
+        self.run_name = run_name
+        self.days: dict[str, CalibrationSketch] = days or {}
+
+    @classmethod
+    def from_backtest_rows(cls, rows: Iterable[dict], league: str, run_name: str) -> "RunSketch":
+        from eng.calibration.build_calibration_snapshot import normalize_game_for_calibration
+
+        rs = cls(league, run_name)
+        for g in rows:
+            day = _game_date(g)
+            rs.days.setdefault(day, CalibrationSketch()).add(normalize_game_for_calibration(g, league))
+        return rs
+
+    def to_dict(self) -> dict:
+        return {
+            "sketch_version": SKETCH_VERSION,
+            "league": self.league,
+            "run_name": self.run_name,
+            "days": {d: s.to_dict() for d, s in sorted(self.days.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "RunSketch":
+        if d.get("sketch_version") != SKETCH_VERSION:
+            raise ValueError(f"Unsupported calibration sketch version: {d.get('sketch_version')!r}")
+        return cls(
+            d.get("league") or "",
+            d.get("run_name") or "",
+            {day: CalibrationSketch.from_dict(s) for day, s in (d.get("days") or {}).items()},
+        )
+
+
+def write_run_sketch(backtest_dir: Path, rows: list[dict], league: str) -> Path:
+    """Build from in-memory backtest rows and persist next to backtest_games.json."""
+    rs = RunSketch.from_backtest_rows(rows, league, Path(backtest_dir).name)
+    path = Path(backtest_dir) / SKETCH_FILENAME
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(rs.to_dict(), f, sort_keys=True)
+    return path
+
+
+def load_or_build_run_sketch(backtest_dir: Path, league: str) -> Optional[RunSketch]:
+    """
+    Load persisted sketch; build (one scan) and persist it for runs that predate sketches.
+    The run dir's mtime is restored afterwards so backfilling a sketch does not make an old
+    run look like the latest one (runs are ordered by mtime).
+    """
+    import os
+
+    backtest_dir = Path(backtest_dir)
+    path = backtest_dir / SKETCH_FILENAME
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            return RunSketch.from_dict(json.load(f))
+    from utils.json_codec import find_json, read_json
+
+    games_path = find_json(backtest_dir / "backtest_games.json")
+    if games_path is None:
+        return None
+    rows = read_json(games_path)
+    st = backtest_dir.stat()
+    write_run_sketch(backtest_dir, rows if isinstance(rows, list) else [], league)
+    os.utime(backtest_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+    with open(path, "r", encoding="utf-8") as f:
+        return RunSketch.from_dict(json.load(f))
+
+
+def merge_range(
+    runs: list[RunSketch],
+    *,
+    since: str | None = None,
+    until: str | None = None,
+) -> tuple[CalibrationSketch, list[str]]:
+    """
+    Merge day partitions in [since, until]. runs must be ordered oldest -> newest; for each
+    date the newest run covering it wins. Returns (merged sketch, run names contributing).
+    """
+    latest_for_day: dict[str, tuple[str, CalibrationSketch]] = {}
+    for rs in runs:
+        for day, sk in rs.days.items():
+            if since and day < since:
+                continue
+            if until and day > until:
+                continue
+            latest_for_day[day] = (rs.run_name, sk)
+    merged = CalibrationSketch()
+    used: list[str] = []
+    for day in sorted(latest_for_day):
+        name, sk = latest_for_day[day]
+        merged.merge(sk)
+        if name not in used:
+            used.append(name)
+    return merged, used
+
+
+def latest_game_date(runs: list[RunSketch]) -> Optional[str]:
+    days = [d for rs in runs for d in rs.days if d != "unknown"]
+    return max(days) if days else None
+
@@ -9,30 +9,40 @@ Rules:
 - No ingestion
 - No writes
 - Deterministic formatting
+
+Startup: stdlib only at module top (json, sys, pathlib). io_helpers / league config
+are imported inside the loader, and the latest slate comes from the daily dir's
+daily_view_index.json (written by build_daily_view) instead of a glob.
+tools/diagnostics/check_import_budget.py keeps cold start under budget.
 """
 
 import json
 import sys
 from pathlib import Path
-from datetime import datetime
-
-from utils.io_helpers import get_daily_view_output_dir
 
-DAILY_DIR = get_daily_view_output_dir("nba")
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 
 # ------------------------------------------------------------
 # Loader
 # ------------------------------------------------------------
 
+def _daily_dir():
+    from utils.io_helpers import get_daily_view_output_dir
+    return get_daily_view_output_dir("nba")
+
+
 def load_daily_view(date_str=None):
+    daily_dir = _daily_dir()
     if date_str:
-        file_path = DAILY_DIR / f"daily_view_{date_str}_v1.json"
+        file_path = daily_dir / f"daily_view_{date_str}_v1.json"
     else:
-        files = sorted(DAILY_DIR.glob("daily_view_*_v1.json"))
-        if not files:
+        from utils.io_helpers import latest_daily_view_path
+        file_path = latest_daily_view_path(daily_dir)
+        if file_path is None:
             sys.exit("No DAILY_VIEW files found.")
-        file_path = files[-1]
 
     if not file_path.exists():
         sys.exit(f"File not found: {file_path}")
@@ -187,11 +197,23 @@ def show_changes(games):
 # Main Router
 # ------------------------------------------------------------
 
+COMMANDS = {
+    "action": show_action,
+    "ignore": show_ignore,
+    "why": show_why,
+    "disagreement": show_disagreement,
+    "changes": show_changes,
+}
+
+
 def main():
     if len(sys.argv) < 2:
         sys.exit("Usage: python bookiex_cli.py [action|ignore|why|disagreement|changes]")
 
     command = sys.argv[1].lower()
+    if command not in COMMANDS:
+        sys.exit("Invalid command.")
+
     date_str = None
 
     if "--date" in sys.argv:
@@ -199,19 +221,7 @@ def main():
         date_str = sys.argv[idx + 1]
 
     games = load_daily_view(date_str)
-
-    if command == "action":
-        show_action(games)
-    elif command == "ignore":
-        show_ignore(games)
-    elif command == "why":
-        show_why(games)
-    elif command == "disagreement":
-        show_disagreement(games)
-    elif command == "changes":
-        show_changes(games)
-    else:
-        sys.exit("Invalid command.")
+    COMMANDS[command](games)
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+# eng/clv: closing-line value engine (open / pre-tip / close lines, CLV per pick)
@@ -0,0 +1,525 @@
+"""
+eng/clv/clv_engine.py
+
+Closing-line value (CLV) engine for NBA and NCAAM.
+
+Purpose
+-------
+- One pass over the odds snapshot archive builds a per-game line history:
+  consensus (median across books) home spread and total per snapshot, keeping only
+  snapshots captured before tipoff. Games without archived snapshots fall back to
+  their game-state odds_history (one entry per pipeline run).
+- From each history: opening line (first snapshot), pre-tip line (last snapshot at
+  least PRETIP_LEAD_MIN before tipoff) and closing line (last snapshot before tipoff),
+  indexed by game_id and persisted with the compact series.
+- True CLV for every model pick (final view Line Bet / Total Bet) and every EXECUTE
+  alert, priced from the same consensus series as the close via line_at(): alerts at
+  the alert timestamp, model picks at the pre-tip point (tipoff - PRETIP_LEAD_MIN).
+  The final view's own line fields are not used: f_gen_041 refreshes them every run
+  from a single book's newest (possibly in-play) snapshot. CLV is computed as arrays:
+      clv = side_sign * (pick_line - close_line)
+  side_sign: HOME +1, AWAY -1 (home-spread points); UNDER +1, OVER -1 (total points).
+  Positive CLV = the pick beat the close.
+
+Snapshot archive:
+  NBA:   data/external/odds_snapshots/ (utils.odds_snapshot_log; one {captured_at_utc, data} per line)
+  NCAAM: data/ncaam/market/raw/ncaam_odds_raw_*.json (+ ncaam_odds_latest.json)
+
+Outputs (utils.io_helpers.get_clv_dir(league)):
+  clv_lines.json  game_id -> open / pretip / close + series [[epoch, spread_home, total], ...]
+  clv_picks.json  one row per priced pick + summary by source x market
+
+Usage
+-----
+  python eng/clv/clv_engine.py --league nba
+  python eng/clv/clv_engine.py --league ncaam --silent
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import median
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.datetime_bridge import iso_to_epoch
+from utils.io_helpers import get_clv_dir, get_final_view_json_path, load_game_state
+from utils.run_log import log_info, set_silent
+
+CLV_LINES_VERSION = "CLV_LINES_V1"
+CLV_PICKS_VERSION = "CLV_PICKS_V1"
+PRETIP_LEAD_MIN = 60
+
+SPREAD_SIGN = {"HOME": 1, "AWAY": -1}
+TOTAL_SIGN = {"UNDER": 1, "OVER": -1}
+
+
+def _safe_float(x):
+    if x is None or x == "":
+        return None
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return None
+
+
+def _first_float(row: dict, *keys):
+    for key in keys:
+        v = _safe_float(row.get(key))
+        if v is not None:
+            return v
+    return None
+
+
+def _epoch_to_iso(epoch: int | None) -> str | None:
+    if epoch is None:
+        return None
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _game_id(game: dict, league: str) -> str:
+    if league == "ncaam":
+        return str(game.get("canonical_game_id") or game.get("game_id") or "").strip()
+    return str(game.get("game_id") or "").strip()
+
+
+# -----------------------------------------------------------------------------
+# SNAPSHOT ARCHIVE -> PER-EVENT SERIES (one pass)
+# -----------------------------------------------------------------------------
+
+def iter_snapshots(league: str):
+    """Yield raw Odds API snapshots ({captured_at_utc, data: [events]}) for the league."""
+    league = (league or "").strip().lower()
+    if league == "nba":
+        from utils.odds_snapshot_log import iter_snapshots as iter_nba_snapshots
+
+        yield from iter_nba_snapshots()
+        return
+    if league == "ncaam":
+        from configs.leagues.league_ncaam import MARKET_RAW_DIR, ODDS_RAW_LATEST_PATH
+
+        paths = sorted(MARKET_RAW_DIR.glob("ncaam_odds_raw_*.json")) if MARKET_RAW_DIR.exists() else []
+        if ODDS_RAW_LATEST_PATH.exists():
+            paths.append(ODDS_RAW_LATEST_PATH)
+        for path in paths:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    snap = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if isinstance(snap, dict):
+                yield snap
+        return
+    raise ValueError(f"Unknown league: {league!r}. Use 'nba' or 'ncaam'.")
+
+
+def _consensus_lines(event: dict) -> tuple[float | None, float | None]:
+    """Median home spread and median total (Over point) across the event's bookmakers."""
+    home = event.get("home_team")
+    spreads, totals = [], []
+    for book in event.get("bookmakers") or []:
+        for market in book.get("markets") or []:
+            key = market.get("key")
+            for o in market.get("outcomes") or []:
+                point = _safe_float(o.get("point"))
+                if point is None:
+                    continue
+                if key == "spreads" and o.get("name") == home:
+                    spreads.append(point)
+                elif key == "totals" and str(o.get("name") or "").lower() == "over":
+                    totals.append(point)
+    return (median(spreads) if spreads else None, median(totals) if totals else None)
+
+
+def extract_event_series(snapshots) -> dict[str, dict]:
+    """
+    Single pass over snapshots -> event_id -> {home_team, away_team, commence_utc,
+    commence_epoch, points: {epoch: (spread_home, total)}}. Only snapshots captured
+    before commence are kept; a repeated captured_at keeps the last one seen.
+    """
+    events: dict[str, dict] = {}
+    for snap in snapshots:
+        captured = iso_to_epoch(snap.get("captured_at_utc"))
+        if captured is None:
+            continue
+        for event in snap.get("data") or []:
+            eid = str(event.get("id") or "").strip()
+            commence = event.get("commence_time")
+            commence_epoch = iso_to_epoch(commence)
+            if not eid or commence_epoch is None or captured >= commence_epoch:
+                continue
+            spread, total = _consensus_lines(event)
+            if spread is None and total is None:
+                continue
+            rec = events.get(eid)
+            if rec is None:
+                rec = events[eid] = {
+                    "home_team": event.get("home_team"),
+                    "away_team": event.get("away_team"),
+                    "commence_utc": commence,
+                    "commence_epoch": commence_epoch,
+                    "points": {},
+                }
+            rec["points"][captured] = (spread, total)
+    return events
+
+
+def _history_points(game: dict, commence_epoch: int | None) -> dict[int, tuple]:
+    """Game-state odds_history -> {epoch: (spread_home, total)} before commence."""
+    points = {}
+    for snap in game.get("odds_history") or []:
+        if not isinstance(snap, dict):
+            continue
+        ts = iso_to_epoch(snap.get("captured_at_utc"))
+        if ts is None or (commence_epoch is not None and ts >= commence_epoch):
+            continue
+        spread = _first_float(snap, "market_spread_home", "spread_home_last")
+        total = _first_float(snap, "market_total", "total_last")
+        if spread is None and total is None:
+            continue
+        points[ts] = (spread, total)
+    return points
+
+
+# -----------------------------------------------------------------------------
+# LINE INDEX (game_id -> open / pretip / close + series)
+# -----------------------------------------------------------------------------
+
+def _first_with(series: list, col: int, reverse: bool = False, max_epoch: int | None = None):
+    rows = reversed(series) if reverse else series
+    for row in rows:
+        if max_epoch is not None and row[0] > max_epoch:
+            continue
+        if row[col] is not None:
+            return row[0], row[col]
+    return None, None
+
+
+def _line_point(series: list, max_epoch: int | None = None, reverse: bool = False) -> dict:
+    s_ts, spread = _first_with(series, 1, reverse, max_epoch)
+    t_ts, total = _first_with(series, 2, reverse, max_epoch)
+    return {
+        "spread_home": spread,
+        "spread_captured_at_utc": _epoch_to_iso(s_ts),
+        "total": total,
+        "total_captured_at_utc": _epoch_to_iso(t_ts),
+    }
+
+
+def build_line_index(league: str, games: list[dict] | None = None) -> dict:
+    """Line history per game_id from the snapshot archive (one pass) + game-state odds_history."""
+    league = (league or "").strip().lower()
+    if games is None:
+        try:
+            games = load_game_state(league)
+        except FileNotFoundError:
+            games = []
+
+    snapshot_count = 0
+
+    def counted(it):
+        nonlocal snapshot_count
+        for snap in it:
+            snapshot_count += 1
+            yield snap
+
+    events = extract_event_series(counted(iter_snapshots(league)))
+    by_teams = {
+        (rec["home_team"], rec["away_team"], rec["commence_epoch"]): eid for eid, rec in events.items()
+    }
+
+    out: dict[str, dict] = {}
+    for g in games:
+        gid = _game_id(g, league)
+        if not gid:
+            continue
+        commence_epoch = iso_to_epoch(g.get("odds_commence_time_utc") or g.get("commence_time_utc"))
+        eid = str(g.get("odds_id") or g.get("odds_game_id") or "").strip()
+        if eid not in events:
+            eid = by_teams.get((g.get("home_team"), g.get("away_team"), commence_epoch)) or by_teams.get(
+                (g.get("home_team_raw"), g.get("away_team_raw"), commence_epoch)
+            )
+        if eid:
+            rec = events[eid]
+            points, source = rec["points"], "snapshot_archive"
+            commence_epoch = rec["commence_epoch"]
+        else:
+            points, source = _history_points(g, commence_epoch), "odds_history"
+        if not points:
+            continue
+        series = [[ts, s, t] for ts, (s, t) in sorted(points.items())]
+        pretip_cutoff = commence_epoch - PRETIP_LEAD_MIN * 60 if commence_epoch is not None else None
+        out[gid] = {
+            "game_id": gid,
+            "game_date": str(g.get("game_date") or g.get("nba_game_day_local") or "")[:10],
+            "home_team": g.get("home_team") or g.get("home_team_display"),
+            "away_team": g.get("away_team") or g.get("away_team_display"),
+            "odds_event_id": eid or None,
+            "commence_utc": _epoch_to_iso(commence_epoch),
+            "line_source": source,
+            "snapshots": len(series),
+            "open": _line_point(series),
+            "pretip": _line_point(series, max_epoch=pretip_cutoff, reverse=True) if pretip_cutoff is not None else None,
+            "close": _line_point(series, reverse=True),
+            "series": series,
+        }
+    return {
+        "clv_lines_version": CLV_LINES_VERSION,
+        "league": league,
+        "built_at_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "snapshot_count": snapshot_count,
+        "archive_events": len(events),
+        "games": out,
+    }
+
+
+def line_at(entry: dict, epoch: int | None, market: str) -> float | None:
+    """Line in effect at epoch (last series point at or before it) for 'spread' or 'total'."""
+    series = entry.get("series") or []
+    if not series or epoch is None:
+        return None
+    col = 1 if market == "spread" else 2
+    i = bisect_right([row[0] for row in series], epoch)
+    for row in reversed(series[:i]):
+        if row[col] is not None:
+            return row[col]
+    return None
+
+
+# -----------------------------------------------------------------------------
+# PICKS
+# -----------------------------------------------------------------------------
+
+def execution_bucket(g: dict) -> str | None:
+    """Execution overlay bucket (same labels as analysis_039 / 040)."""
+    overlay = g.get("execution_overlay")
+    if not overlay:
+        return None
+    if overlay.get("dual_sweet_spot"):
+        return "Dual Sweet Spot"
+    if overlay.get("spread_sweet_spot"):
+        return "Spread Sweet Spot"
+    if overlay.get("total_sweet_spot"):
+        return "Total Sweet Spot"
+    if overlay.get("spread_avoid") or overlay.get("total_avoid"):
+        return "Avoid"
+    return "Neutral"
+
+
+def model_picks(final_rows: list[dict], league: str) -> list[dict]:
+    """
+    One pick per final-view Line Bet / Total Bet. pick_utc is left unset: compute_clv
+    prices model picks at the game's pre-tip point, when the daily slate is acted on.
+    """
+    picks = []
+    for g in final_rows:
+        gid = _game_id(g, league)
+        bucket = execution_bucket(g)
+        side = str(g.get("Line Bet") or "").strip().upper()
+        if side in SPREAD_SIGN:
+            picks.append({
+                "source": "model", "game_id": gid, "market": "spread", "side": side,
+                "pick_utc": None, "edge": _safe_float(g.get("Spread Edge")), "execution_bucket": bucket,
+            })
+        side = str(g.get("Total Bet") or "").strip().upper()
+        if side in TOTAL_SIGN:
+            picks.append({
+                "source": "model", "game_id": gid, "market": "total", "side": side,
+                "pick_utc": None, "edge": _safe_float(g.get("Total Edge")), "execution_bucket": bucket,
+            })
+    return picks
+
+
+def _pretip_epoch(entry: dict) -> int | None:
+    commence = iso_to_epoch(entry.get("commence_utc"))
+    return commence - PRETIP_LEAD_MIN * 60 if commence is not None else None
+
+
+def alert_picks(final_rows: list[dict]) -> list[dict]:
+    """EXECUTE alerts (logs/active_alerts.jsonl, NCAAM) -> picks priced at the alert timestamp."""
+    from eng.analysis.analysis_041_agent_attribution import (
+        build_game_id_index,
+        build_game_index,
+        load_alerts,
+        match_alert_game,
+        parse_pick_string,
+    )
+
+    id_index = build_game_id_index(final_rows)
+    matchup_index = build_game_index(final_rows)
+    picks = []
+    for alert in load_alerts():
+        game = match_alert_game(alert, id_index, matchup_index)
+        if not game:
+            continue
+        line_bet = alert.get("spread_side") or ""
+        total_bet = alert.get("total_pick") or ""
+        if not line_bet and not total_bet:
+            home = (game.get("home_team") or game.get("home_team_display") or "").strip()
+            away = (game.get("away_team") or game.get("away_team_display") or "").strip()
+            line_bet, total_bet = parse_pick_string(alert.get("pick_str") or "", away, home)
+        base = {
+            "source": "alert", "game_id": _game_id(game, "ncaam"),
+            "pick_utc": alert.get("timestamp"), "edge": None,
+            "execution_bucket": execution_bucket(game), "value_peak_reached": alert.get("value_peak_reached"),
+        }
+        if line_bet in SPREAD_SIGN:
+            picks.append({**base, "market": "spread", "side": line_bet})
+        if total_bet in TOTAL_SIGN:
+            picks.append({**base, "market": "total", "side": total_bet})
+    return picks
+
+
+def compute_clv(picks: list[dict], lines: dict) -> list[dict]:
+    """
+    Attach pick/open/close lines and CLV to each pick (in place; returns picks). Every pick
+    is priced from the consensus series with line_at() at pick_utc; picks without one
+    (model picks) use the pre-tip point. CLV math runs over NumPy arrays.
+    """
+    import numpy as np
+
+    games = lines.get("games") or {}
+    n = len(picks)
+    pick_line = np.full(n, np.nan)
+    open_line = np.full(n, np.nan)
+    close_line = np.full(n, np.nan)
+    sign = np.zeros(n)
+    for i, p in enumerate(picks):
+        entry = games.get(p.get("game_id"))
+        market = p["market"]
+        p["pick_line"] = None
+        sign[i] = (SPREAD_SIGN if market == "spread" else TOTAL_SIGN)[p["side"]]
+        if entry is None:
+            continue
+        key = "spread_home" if market == "spread" else "total"
+        pick_epoch = iso_to_epoch(p.get("pick_utc"))
+        if pick_epoch is None:
+            pick_epoch = _pretip_epoch(entry)
+            p["pick_utc"] = _epoch_to_iso(pick_epoch)
+        line = line_at(entry, pick_epoch, market)
+        p["pick_line"] = line
+        for arr, value in ((pick_line, line), (open_line, entry["open"][key]), (close_line, entry["close"][key])):
+            if value is not None:
+                arr[i] = value
+
+    clv = sign * (pick_line - close_line)
+    move = close_line - open_line
+    for i, p in enumerate(picks):
+        p["open_line"] = None if np.isnan(open_line[i]) else float(open_line[i])
+        p["close_line"] = None if np.isnan(close_line[i]) else float(close_line[i])
+        p["line_move"] = None if np.isnan(move[i]) else round(float(move[i]), 3)
+        p["clv"] = None if np.isnan(clv[i]) else round(float(clv[i]), 3)
+        p["beat_close"] = None if p["clv"] is None else p["clv"] > 0
+    return picks
+
+
+def summarize_clv(picks: list[dict], by: tuple[str, ...] = ("source", "market")) -> list[dict]:
+    import numpy as np
+
+    groups: dict[tuple, list[float]] = defaultdict(list)
+    for p in picks:
+        if p.get("clv") is not None:
+            groups[tuple(p.get(k) for k in by)].append(p["clv"])
+    out = []
+    for key in sorted(groups, key=lambda k: tuple("" if v is None else str(v) for v in k)):
+        vals = np.asarray(groups[key])
+        out.append({
+            **dict(zip(by, key)),
+            "picks": int(vals.size),
+            "mean_clv": round(float(vals.mean()), 3),
+            "median_clv": round(float(np.median(vals)), 3),
+            "beat_close_pct": round(float((vals > 0).mean() * 100), 1),
+            "push_close_pct": round(float((vals == 0).mean() * 100), 1),
+        })
+    return out
+
+
+# -----------------------------------------------------------------------------
+# PERSISTENCE
+# -----------------------------------------------------------------------------
+
+def _write_json(path: Path, payload: dict) -> None:
+    import os
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp, path)
+
+
+def load_clv_lines(league: str) -> dict | None:
+    path = get_clv_dir(league) / "clv_lines.json"
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_clv_picks(league: str) -> dict | None:
+    path = get_clv_dir(league) / "clv_picks.json"
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def run(league: str) -> dict:
+    league = (league or "").strip().lower()
+    lines = build_line_index(league)
+    out_dir = get_clv_dir(league)
+    _write_json(out_dir / "clv_lines.json", lines)
+
+    final_path = get_final_view_json_path(league)
+    final_rows = []
+    if final_path.exists():
+        with open(final_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        final_rows = data if isinstance(data, list) else data.get("games", [])
+    picks = model_picks(final_rows, league)
+    if league == "ncaam":
+        picks.extend(alert_picks(final_rows))
+    compute_clv(picks, lines)
+
+    report = {
+        "clv_picks_version": CLV_PICKS_VERSION,
+        "league": league,
+        "built_at_utc": lines["built_at_utc"],
+        "lines_games": len(lines["games"]),
+        "picks": len(picks),
+        "priced": sum(1 for p in picks if p["clv"] is not None),
+        "summary": summarize_clv(picks),
+        "rows": picks,
+    }
+    _write_json(out_dir / "clv_picks.json", report)
+
+    log_info(f"CLV ({league}): snapshots={lines['snapshot_count']} archive_events={lines['archive_events']} games_with_lines={len(lines['games'])}")
+    log_info(f"CLV ({league}): picks={report['picks']} priced={report['priced']}")
+    for row in report["summary"]:
+        log_info(
+            f"  {row['source']:<6} {row['market']:<6} n={row['picks']:<5} mean={row['mean_clv']:+.3f} "
+            f"median={row['median_clv']:+.3f} beat_close={row['beat_close_pct']:.1f}%"
+        )
+    log_info(f"Output -> {out_dir}")
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build open/pre-tip/close line index and true CLV per pick.")
+    parser.add_argument("--league", required=True, choices=["nba", "ncaam"])
+    parser.add_argument("--silent", action="store_true", help="Only print critical errors")
+    args = parser.parse_args()
+    set_silent(args.silent)
+    run(args.league)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,12 +14,18 @@ Rules:
 - No ingestion.
 - No threshold changes.
 - Deterministic output.
+
+Outputs (data/nba/daily): daily_view_{date}_v1.json + daily_view_{date}_v1.csv,
+overwritten in place. JSON carries content_hash (games + versions, no timestamps).
+
+Batch: build_daily_views_batch() groups the final view by date once and builds every
+recent/upcoming slate, skipping slates whose content_hash is unchanged.
 """
 
 import json
 import hashlib
 from pathlib import Path
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import sys
 import csv
 
@@ -57,10 +63,11 @@ def utc_timestamp_str():
 # ------------------------------------------------------------
 
 def load_json(path: Path):
+    from utils.json_codec import read_json
+
     if not path.exists():
         raise FileNotFoundError(f"Missing required file: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return read_json(path)
 
 
 def compute_sha256(path: Path):
@@ -203,54 +210,8 @@ def flatten_for_csv(structured_games):
     return rows
 
 
-def build_daily_view():
-
-    model_data = load_json(_model_artifact_path())
-    calibration = load_json(_calibration_path())
-
-    # Handle multi-model payload wrapper
-    if isinstance(model_data, dict) and "games" in model_data:
-        model_data = model_data["games"]
-
-    # --------------------------------------------------------
-    # Determine target date
-    # --------------------------------------------------------
-
-    if len(sys.argv) > 1:
-        target_date = sys.argv[1]
-    else:
-        today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-        available_dates = sorted(
-            g["game_date"][:10]
-            for g in model_data
-            if g.get("game_date")
-            and g["game_date"][:10] >= today_str
-        )
-
-        if not available_dates:
-            print("No upcoming games available.")
-            return
-
-        target_date = available_dates[0]
-
-    # --------------------------------------------------------
-    # Filter to selected date
-    # --------------------------------------------------------
-
-    today_games = []
-
-    for g in model_data:
-        raw_date = g.get("game_date")
-        if not raw_date:
-            continue
-
-        normalized_date = raw_date[:10]
-
-        if normalized_date == target_date:
-            today_games.append(g)
-
-    today_games = sorted(today_games, key=lambda x: x["game_id"])
+def build_structured_games(day_games, calibration):
+    """Structured DAILY_VIEW_V1 game entries for one slate (games already sorted by game_id)."""
 
     structured_games = []
 
@@ -258,7 +219,7 @@ def build_daily_view():
     # Build structured output
     # --------------------------------------------------------
 
-    for g in today_games:
+    for g in day_games:
 
         spread_edge = g.get("Spread Edge")
         total_edge = g.get("Total Edge")
@@ -433,7 +394,87 @@ def build_daily_view():
             },
         })
 
-    artifact_hash = compute_sha256(_model_artifact_path())
+    return structured_games
+
+# ------------------------------------------------------------
+# WRITE (per slate)
+# ------------------------------------------------------------
+
+def slate_content_hash(target_date, structured_games):
+    """
+    SHA-256 of the slate content (schema versions, date, games).
+    Excludes build_timestamp_utc and the source artifact hash so a rebuild
+    with identical games hashes identically.
+    """
+    blob = json.dumps(
+        {
+            "schema_version": SCHEMA_VERSION,
+            "model_version": MODEL_VERSION,
+            "calibration_version": CALIBRATION_VERSION,
+            "date": target_date,
+            "games": structured_games,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def existing_content_hash(path: Path):
+    """content_hash recorded in an existing daily view JSON (any codec variant), or None."""
+    from utils.json_codec import find_json, read_json
+
+    found = find_json(path)
+    if found is None:
+        return None
+    try:
+        return (read_json(found) or {}).get("content_hash")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def write_csv(structured_games, csv_output_path: Path):
+    csv_rows = flatten_for_csv(structured_games)
+
+    if not csv_rows:
+        return 0
+
+    # Collect union of all keys across rows
+    all_fields = set()
+    for r in csv_rows:
+        all_fields.update(r.keys())
+
+    fieldnames = sorted(all_fields)
+
+    with csv_output_path.open("w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(csv_rows)
+
+    return len(csv_rows)
+
+
+def write_daily_view(target_date, structured_games, artifact_hash, skip_unchanged=False, verbose=True):
+    """
+    Write daily_view_{date}_v1.json and daily_view_{date}_v1.csv (stable names;
+    each run overwrites the same pair instead of adding a timestamped CSV).
+
+    skip_unchanged: leave both files untouched when the existing JSON already
+    carries the same content_hash. Returns True when files were written.
+    """
+    output_dir = _output_dir()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    output_path = output_dir / f"daily_view_{target_date}_v1.json"
+    csv_output_path = output_dir / f"daily_view_{target_date}_v1.csv"
+
+    content_hash = slate_content_hash(target_date, structured_games)
+
+    if skip_unchanged and existing_content_hash(output_path) == content_hash:
+        if verbose:
+            print(f"Daily View unchanged: {output_path}")
+        return False
 
     build_timestamp_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
@@ -442,50 +483,125 @@ def build_daily_view():
         "model_version": MODEL_VERSION,
         "calibration_version": CALIBRATION_VERSION,
         "generated_from_artifact_hash": artifact_hash,
+        "content_hash": content_hash,
         "date": target_date,
         "build_timestamp_utc": build_timestamp_utc,
         "games": structured_games
     }
 
-    _output_dir().mkdir(parents=True, exist_ok=True)
+    from utils.io_helpers import record_daily_view
+    from utils.json_codec import write_json
+    written = write_json(output_path, final_output, artifact="daily_view")
+    record_daily_view(written, target_date)
+
+    # --------------------------------------------------------
+    # WRITE FULL EXPOSURE CSV
+    # --------------------------------------------------------
+
+    rows_written = write_csv(structured_games, csv_output_path)
+
+    if verbose:
+        print(f"Daily View written: {output_path}")
+        print(f"Games included: {len(structured_games)}")
+        if rows_written:
+            print(f"Daily View CSV written: {csv_output_path}")
+            print(f"Rows written: {rows_written}")
+        else:
+            print("No rows written to CSV.")
+
+    return True
+
+
+# ------------------------------------------------------------
+# MAIN BUILD FUNCTION
+# ------------------------------------------------------------
+
+def load_inputs():
+    model_data = load_json(_model_artifact_path())
+    calibration = load_json(_calibration_path())
+
+    # Handle multi-model payload wrapper
+    if isinstance(model_data, dict) and "games" in model_data:
+        model_data = model_data["games"]
+
+    return model_data, calibration
 
-    output_path = _output_dir() / f"daily_view_{target_date}_v1.json"
 
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(final_output, f, indent=2)
+def group_games_by_date(model_data):
+    """Single pass: {YYYY-MM-DD: [games sorted by game_id]}."""
+    by_date = {}
+    for g in model_data:
+        raw_date = g.get("game_date")
+        if not raw_date:
+            continue
+        by_date.setdefault(raw_date[:10], []).append(g)
+
+    for games in by_date.values():
+        games.sort(key=lambda x: x["game_id"])
+
+    return by_date
+
 
-    print(f"Daily View written: {output_path}")
-    print(f"Games included: {len(structured_games)}")
+def build_daily_view():
+
+    model_data, calibration = load_inputs()
+    by_date = group_games_by_date(model_data)
 
     # --------------------------------------------------------
-    # WRITE FULL EXPOSURE CSV
+    # Determine target date
     # --------------------------------------------------------
 
-    csv_rows = flatten_for_csv(structured_games)
+    if len(sys.argv) > 1:
+        target_date = sys.argv[1]
+    else:
+        today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        available_dates = sorted(d for d in by_date if d >= today_str)
 
-    csv_output_path = _output_dir() / f"daily_view_{target_date}_v1_{timestamp}.csv"
+        if not available_dates:
+            print("No upcoming games available.")
+            return
 
-    if csv_rows:
+        target_date = available_dates[0]
 
-        # Collect union of all keys across rows
-        all_fields = set()
-        for r in csv_rows:
-            all_fields.update(r.keys())
+    structured_games = build_structured_games(by_date.get(target_date, []), calibration)
 
-        fieldnames = sorted(all_fields)
+    write_daily_view(target_date, structured_games, compute_sha256(_model_artifact_path()))
 
-        with csv_output_path.open("w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(csv_rows)
 
-        print(f"Daily View CSV written: {csv_output_path}")
-        print(f"Rows written: {len(csv_rows)}")
+def build_daily_views_batch(days_back=3, days_ahead=7, dates=None, skip_unchanged=True):
+    """
+    Build every slate in [today - days_back, today + days_ahead] (UTC dates, same
+    rule as build_daily_view) from one load of the final view and calibration.
+    dates: explicit list of YYYY-MM-DD overriding the window.
 
+    Returns {"written": [...], "unchanged": [...]}.
+    """
+    model_data, calibration = load_inputs()
+    by_date = group_games_by_date(model_data)
+    artifact_hash = compute_sha256(_model_artifact_path())
+
+    if dates:
+        target_dates = sorted(set(dates))
     else:
-        print("No rows written to CSV.")
+        today = datetime.now(timezone.utc).date()
+        lo = (today - timedelta(days=days_back)).isoformat()
+        hi = (today + timedelta(days=days_ahead)).isoformat()
+        target_dates = sorted(d for d in by_date if lo <= d <= hi)
+
+    written, unchanged = [], []
+    for target_date in target_dates:
+        structured_games = build_structured_games(by_date.get(target_date, []), calibration)
+        if write_daily_view(target_date, structured_games, artifact_hash, skip_unchanged=skip_unchanged, verbose=False):
+            written.append(target_date)
+        else:
+            unchanged.append(target_date)
+
+    print(f"Daily View batch: {len(target_dates)} slate(s) | written {len(written)} | unchanged {len(unchanged)}")
+    for d in written:
+        print(f"  written:   daily_view_{d}_v1.json ({len(by_date.get(d, []))} games)")
+    return {"written": written, "unchanged": unchanged}
+
 
 if __name__ == "__main__":
-    build_daily_view()
\ No newline at end of file
+    build_daily_view()
@@ -15,14 +15,18 @@ Behavior
   If none qualify, falls back to the latest game_date in the input so a file
   still writes when the artifact has no future rows (e.g. slate ended).
 - Includes all games for the selected date, even if no picks exist yet
-- Writes dashboard-safe JSON/CSV artifacts
+- Writes dashboard-safe JSON/CSV artifacts (stable names, overwritten in place;
+  JSON carries content_hash over the slate content, timestamps excluded)
+- run_batch(): groups games by date once and builds every recent/upcoming slate,
+  skipping slates whose content_hash is unchanged
 - Preserves NBA dashboard compatibility patterns without changing NBA format
 """
 
 import csv
+import hashlib
 import json
 import sys
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -31,6 +35,8 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from configs.leagues.league_ncaam import DAILY_DIR, MODEL_DIR, ensure_ncaam_dirs
 from utils.datetime_bridge import get_default_target_slate_date
+from utils.io_helpers import record_daily_view
+from utils.json_codec import find_json, read_json, write_json as write_artifact_json
 
 from eng.backtest.backtest_grader import grade_spread_bet, grade_total_bet
 
@@ -49,8 +55,7 @@ def load_payload() -> dict:
     if not INPUT_PATH.exists():
         raise FileNotFoundError(f"Missing multi-model JSON file: {INPUT_PATH}")
 
-    with open(INPUT_PATH, "r", encoding="utf-8") as f:
-        payload = json.load(f)
+    payload = read_json(INPUT_PATH)
 
     # final_game_view_ncaam.json is sometimes emitted as a list of rows.
     if isinstance(payload, list):
@@ -129,13 +134,57 @@ def has_usable_signal(model_row: dict) -> bool:
 
 
 def get_output_paths(target_date: str):
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    csv_path = DAILY_DIR / f"daily_view_ncaam_{target_date}_v1_{timestamp}.csv"
-    # Same path each run: 5 AM and 5 PM runs overwrite this file (fresh content + build_timestamp).
+    # Same paths each run: 5 AM and 5 PM runs overwrite these files (fresh content + build_timestamp).
+    csv_path = DAILY_DIR / f"daily_view_ncaam_{target_date}_v1.csv"
     json_path = DAILY_DIR / f"daily_view_ncaam_{target_date}_v1.json"
     return csv_path, json_path
 
 
+def slate_content_hash(target_date: str, json_rows: list[dict]) -> str:
+    """
+    SHA-256 of the slate content. Per-row temporal_integrity.build_timestamp_utc is
+    excluded; call before odds_snapshot_last_utc is back-filled with the build time.
+    """
+    stripped = []
+    for row in json_rows:
+        ti = {k: v for k, v in (row.get("temporal_integrity") or {}).items() if k != "build_timestamp_utc"}
+        stripped.append({**row, "temporal_integrity": ti})
+
+    blob = json.dumps(
+        {
+            "schema_version": SCHEMA_VERSION,
+            "model_version": MODEL_VERSION,
+            "selection_authority": SELECTION_AUTHORITY,
+            "date": target_date,
+            "games": stripped,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def existing_content_hash(json_path: Path):
+    found = find_json(json_path)
+    if found is None:
+        return None
+    try:
+        return (read_json(found) or {}).get("content_hash")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def group_games_by_date(games: list[dict]) -> dict[str, list[dict]]:
+    """Single pass over the multi-model rows: {game_date: [games]}."""
+    by_date: dict[str, list[dict]] = {}
+    for g in games:
+        d = safe_text(g.get("game_date")).strip()
+        if d:
+            by_date.setdefault(d, []).append(g)
+    return by_date
+
+
 def compute_confidence_tier(model: dict) -> str:
     spread_edge = safe_float(model.get("spread_edge"))
     total_edge = safe_float(model.get("total_edge"))
@@ -544,20 +593,44 @@ def write_csv(rows: list[dict], out_path: Path) -> None:
 
 
 def write_json(payload: dict, out_path: Path) -> None:
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    written = write_artifact_json(out_path, payload, artifact="daily_view")
+    record_daily_view(written)
 
 
 # =====================================================
 # MAIN
 # =====================================================
 
+def build_slate(target_date: str, target_games: list[dict]) -> tuple[dict, list[dict], list[dict]]:
+    """(json_payload, json_rows, csv_rows) for one slate; payload carries content_hash."""
+    json_rows = build_daily_rows(target_games)
+    csv_rows = build_csv_rows(json_rows)
+    content_hash = slate_content_hash(target_date, json_rows)
+
+    build_ts = datetime.now(timezone.utc).isoformat()
+    for row in json_rows:
+        ms = row.get("market_state") or {}
+        if not (ms.get("odds_snapshot_last_utc") or "").strip():
+            row.setdefault("market_state", {})["odds_snapshot_last_utc"] = build_ts
+
+    json_payload = {
+        "schema_version": SCHEMA_VERSION,
+        "model_version": MODEL_VERSION,
+        "selection_authority": SELECTION_AUTHORITY,
+        "content_hash": content_hash,
+        "date": target_date,
+        "build_timestamp_utc": build_ts,
+        "games": json_rows,
+    }
+    return json_payload, json_rows, csv_rows
+
+
 def run() -> None:
     ensure_ncaam_dirs()
 
     input_payload = load_payload()
     games = input_payload.get("games", [])
+    by_date = group_games_by_date(games)
 
     # --------------------------------------------------------
     # Determine target date
@@ -567,12 +640,7 @@ def run() -> None:
     else:
         today_str = get_default_target_slate_date()
 
-        all_dates = sorted({
-            d for d in (
-                safe_text(g.get("game_date")).strip()
-                for g in games
-            ) if d
-        })
+        all_dates = sorted(by_date)
 
         available_dates = [d for d in all_dates if d >= today_str]
 
@@ -590,28 +658,9 @@ def run() -> None:
 
     csv_path, json_path = get_output_paths(target_date)
 
-    target_games = [
-        g for g in games
-        if safe_text(g.get("game_date")).strip() == target_date
-    ]
-
-    json_rows = build_daily_rows(target_games)
-    csv_rows = build_csv_rows(json_rows)
+    target_games = by_date.get(target_date, [])
 
-    build_ts = datetime.now(timezone.utc).isoformat()
-    for row in json_rows:
-        ms = row.get("market_state") or {}
-        if not (ms.get("odds_snapshot_last_utc") or "").strip():
-            row.setdefault("market_state", {})["odds_snapshot_last_utc"] = build_ts
-
-    json_payload = {
-        "schema_version": SCHEMA_VERSION,
-        "model_version": MODEL_VERSION,
-        "selection_authority": SELECTION_AUTHORITY,
-        "date": target_date,
-        "build_timestamp_utc": build_ts,
-        "games": json_rows,
-    }
+    json_payload, json_rows, csv_rows = build_slate(target_date, target_games)
 
     if not json_rows:
         print(f"No daily rows found for target date: {target_date}")
@@ -645,5 +694,50 @@ def run() -> None:
     print(f"Rows with any picks:         {signal_row_count}")
 
 
+def run_batch(
+    days_back: int = 3,
+    days_ahead: int = 7,
+    dates: list[str] | None = None,
+    skip_unchanged: bool = True,
+) -> dict:
+    """
+    Build every slate in [slate today - days_back, slate today + days_ahead]
+    (America/Chicago slate day) from one load of the multi-model JSON.
+    Slates whose content_hash matches the existing JSON are not rewritten.
+
+    Returns {"written": [...], "unchanged": [...]}.
+    """
+    ensure_ncaam_dirs()
+
+    games = load_payload().get("games", [])
+    by_date = group_games_by_date(games)
+
+    if dates:
+        target_dates = sorted(set(dates))
+    else:
+        today = date.fromisoformat(get_default_target_slate_date())
+        lo = (today - timedelta(days=days_back)).isoformat()
+        hi = (today + timedelta(days=days_ahead)).isoformat()
+        target_dates = [d for d in sorted(by_date) if lo <= d <= hi]
+
+    written, unchanged = [], []
+    for target_date in target_dates:
+        csv_path, json_path = get_output_paths(target_date)
+        json_payload, _, csv_rows = build_slate(target_date, by_date.get(target_date, []))
+
+        if skip_unchanged and existing_content_hash(json_path) == json_payload["content_hash"]:
+            unchanged.append(target_date)
+            continue
+
+        write_csv(csv_rows, csv_path)
+        write_json(json_payload, json_path)
+        written.append(target_date)
+
+    print(f"NCAAM daily view batch: {len(target_dates)} slate(s) | written {len(written)} | unchanged {len(unchanged)}")
+    for d in written:
+        print(f"  written:   daily_view_ncaam_{d}_v1.json ({len(by_date.get(d, []))} games)")
+    return {"written": written, "unchanged": unchanged}
+
+
 if __name__ == "__main__":
     run()
\ No newline at end of file
@@ -10,6 +10,10 @@ Usage:
   python eng/daily/build_gen_daily_view.py --league nba
   python eng/daily/build_gen_daily_view.py --league ncaam
   python eng/daily/build_gen_daily_view.py --league ncaam 2026-03-08
+  python eng/daily/build_gen_daily_view.py --league nba --batch --days-back 3 --days-ahead 7
+
+--batch builds every slate in the window from one load of the final view and
+rewrites only slates whose content_hash changed (--force rewrites all).
 """
 
 from __future__ import annotations
@@ -54,14 +58,39 @@ def run_ncaam(date_arg: str | None) -> None:
     ncaam_daily.run()
 
 
+def run_batch(league: str, days_back: int, days_ahead: int, date_arg: str | None, force: bool) -> dict:
+    dates = [date_arg] if date_arg else None
+    if league == "nba":
+        import eng.daily.build_daily_view as nba_daily
+
+        return nba_daily.build_daily_views_batch(
+            days_back=days_back, days_ahead=days_ahead, dates=dates, skip_unchanged=not force
+        )
+
+    from utils.io_helpers import get_model_runner_output_json_path, get_daily_view_output_dir
+    import eng.daily.build_daily_view_ncaam as ncaam_daily
+
+    ncaam_daily.INPUT_PATH = get_model_runner_output_json_path("ncaam")
+    ncaam_daily.DAILY_DIR = get_daily_view_output_dir("ncaam")
+    return ncaam_daily.run_batch(
+        days_back=days_back, days_ahead=days_ahead, dates=dates, skip_unchanged=not force
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Build daily view for dashboard (NBA or NCAAM)")
     parser.add_argument("--league", required=True, choices=["nba", "ncaam"])
     parser.add_argument("date", nargs="?", help="Optional date (e.g. 2026-03-08); else earliest upcoming")
+    parser.add_argument("--batch", action="store_true", help="Build all recent/upcoming slates; write only changed ones")
+    parser.add_argument("--days-back", type=int, default=3, help="Batch window: slates up to N days before today")
+    parser.add_argument("--days-ahead", type=int, default=7, help="Batch window: slates up to N days after today")
+    parser.add_argument("--force", action="store_true", help="Batch: rewrite slates even when content_hash is unchanged")
     parser.add_argument("--silent", action="store_true", help="Only print critical errors")
     args = parser.parse_args()
     set_silent(args.silent)
-    if args.league == "nba":
+    if args.batch:
+        run_batch(args.league, args.days_back, args.days_ahead, args.date, args.force)
+    elif args.league == "nba":
         run_nba(args.date)
     else:
         run_ncaam(args.date)
@@ -0,0 +1,219 @@
+"""
+eng/execution/alert_ledger.py
+
+Append-only ledger of Live Monitor EXECUTE alerts (logs/active_alerts.jsonl).
+
+One JSON line per alert with typed fields, written by live_monitor_agent next to
+the human-readable logs/active_alerts.log line:
+  alert_id, ts, league, game_id, game_date, matchup, away_team, home_team,
+  pick (display string), spread_pick / spread_side (HOME|AWAY), total_pick (OVER|UNDER),
+  spread_edge, total_edge, kelly_fraction, kelly_amount (whole game),
+  kelly_legs ({"spread": $, "total": $}), value_peak, reason.
+
+Grades (logs/alert_grades.jsonl) are append-only too: analysis_041 grades an alert
+once its game is final and never again, so each attribution run only grades
+newly-finalized alerts.
+
+Legacy: when the ledger does not exist yet, alerts in active_alerts.log are imported
+once (parse_legacy_line, the old regex parser) so history is not lost.
+
+Usage:
+  from eng.execution.alert_ledger import append_alerts, iter_alerts
+  append_alerts([record, ...])
+  for rec in iter_alerts(): ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Iterable, Iterator
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+LEDGER_PATH = PROJECT_ROOT / "logs" / "active_alerts.jsonl"
+GRADES_PATH = PROJECT_ROOT / "logs" / "alert_grades.jsonl"
+LEGACY_LOG_PATH = PROJECT_ROOT / "logs" / "active_alerts.log"
+
+LEGACY_FLAT_AMOUNT = 100.0  # legacy text alerts without a Kelly size
+
+
+def _safe_float(x) -> float | None:
+    if x is None or x == "":
+        return None
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return None
+
+
+def make_alert_id(ts: str, game_id: str, matchup: str = "") -> str:
+    """Stable id: one EXECUTE alert per game per monitor cycle."""
+    key = f"{ts}|{game_id or matchup.strip().upper()}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def spread_side(line_bet: str, away_team: str, home_team: str) -> str:
+    """Team name from "Line Bet" -> HOME / AWAY ("" when it matches neither)."""
+    pick = (line_bet or "").strip().upper()
+    if not pick:
+        return ""
+    if pick in ("HOME", "AWAY"):
+        return pick
+    if pick == (home_team or "").strip().upper():
+        return "HOME"
+    if pick == (away_team or "").strip().upper():
+        return "AWAY"
+    return ""
+
+
+# ------------------------------------------------------------
+# Legacy text log
+# ------------------------------------------------------------
+
+def parse_legacy_line(line: str) -> dict | None:
+    """
+    Parse a line from active_alerts.log. Returns dict with timestamp, matchup, pick_str,
+    kelly_pct, kelly_dollars, value_peak_reached, or None if not EXECUTE.
+    """
+    line = (line or "").strip()
+    if "STATUS: EXECUTE" not in line:
+        return None
+    # [TIMESTAMP] [MATCHUP] - STATUS: EXECUTE - KELLY SIZE: [4.6]% ($458.27). ...
+    # or older: [TIMESTAMP] [NCAAM] [MATCHUP] - [...] - STATUS: EXECUTE.
+    ts_match = re.match(r"\[([^\]]+)\]\s+", line)
+    timestamp = ts_match.group(1) if ts_match else ""
+    value_peak = "VALUE PEAK REACHED" in line
+    matchup = ""
+    for bracket in re.finditer(r"\[([^\]]+)\]", line):
+        content = bracket.group(1).strip()
+        if " @ " in content and content != "NCAAM":
+            matchup = content
+            break
+    # KELLY SIZE: [4.6]% ($458.27)
+    kelly_pct = None
+    kelly_dollars = None
+    kelly_match = re.search(r"KELLY SIZE:\s*\[([^\]]+)\]%\s*\(\$([^)]+)\)", line)
+    if kelly_match:
+        kelly_pct = _safe_float(kelly_match.group(1))
+        kelly_dollars = _safe_float(kelly_match.group(2).replace(",", ""))
+    if kelly_dollars is None:
+        kelly_dollars = LEGACY_FLAT_AMOUNT
+    # Pick: ...($458.27). [PICK] EDGE: or [PICK] - EDGE:
+    pick_match = re.search(r"[\])]\.\s*\[([^\]]+)\]\s+EDGE:", line) or re.search(r"\]\s+\[([^\]]+)\]\s+EDGE:", line)
+    pick_str = pick_match.group(1).strip() if pick_match else ""
+    return {
+        "timestamp": timestamp,
+        "matchup": matchup,
+        "pick_str": pick_str,
+        "kelly_pct": kelly_pct,
+        "kelly_dollars": kelly_dollars,
+        "value_peak_reached": value_peak,
+    }
+
+
+def _legacy_record(parsed: dict) -> dict:
+    matchup = parsed.get("matchup") or ""
+    away, _, home = (p.strip() for p in matchup.partition("@"))
+    pct = parsed.get("kelly_pct")
+    return {
+        "alert_id": make_alert_id(parsed.get("timestamp") or "", "", matchup),
+        "ts": parsed.get("timestamp") or "",
+        "league": "ncaam",
+        "game_id": None,
+        "game_date": (parsed.get("timestamp") or "")[:10] or None,
+        "matchup": matchup,
+        "away_team": away,
+        "home_team": home,
+        "pick": parsed.get("pick_str") or "",
+        "spread_pick": None,
+        "spread_side": None,
+        "total_pick": None,
+        "spread_edge": None,
+        "total_edge": None,
+        "kelly_fraction": pct / 100.0 if pct is not None else None,
+        "kelly_amount": parsed.get("kelly_dollars"),
+        "value_peak": bool(parsed.get("value_peak_reached")),
+        "reason": None,
+        "source": "legacy_log",
+    }
+
+
+def import_legacy_log(log_path: Path = LEGACY_LOG_PATH, ledger_path: Path = LEDGER_PATH) -> int:
+    """Seed a missing ledger from active_alerts.log. Returns records imported (0 if the ledger exists)."""
+    if ledger_path.exists() or not log_path.exists():
+        return 0
+    records = []
+    with open(log_path, "r", encoding="utf-8") as f:
+        for line in f:
+            parsed = parse_legacy_line(line)
+            if parsed and parsed.get("matchup"):
+                records.append(_legacy_record(parsed))
+    _append_lines(ledger_path, records)
+    return len(records)
+
+
+# ------------------------------------------------------------
+# Ledger
+# ------------------------------------------------------------
+
+def _append_lines(path: Path, records: Iterable[dict]) -> None:
+    payload = "".join(json.dumps(r, default=str) + "\n" for r in records)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(payload)
+
+
+def append_alerts(records: list[dict], ledger_path: Path = LEDGER_PATH) -> int:
+    """Append alert records (one write). Imports the legacy text log first if the ledger is new."""
+    if not records:
+        return 0
+    if ledger_path == LEDGER_PATH:
+        import_legacy_log()
+    _append_lines(ledger_path, records)
+    return len(records)
+
+
+def iter_alerts(ledger_path: Path = LEDGER_PATH) -> Iterator[dict]:
+    """Yield ledger records in write order (a torn last line from a crashed writer is skipped)."""
+    if ledger_path == LEDGER_PATH:
+        import_legacy_log()
+    if not ledger_path.exists():
+        return
+    with open(ledger_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(rec, dict):
+                yield rec
+
+
+# ------------------------------------------------------------
+# Grades
+# ------------------------------------------------------------
+
+def load_grades(grades_path: Path = GRADES_PATH) -> dict[str, dict]:
+    """alert_id -> grade record (last one wins if an alert was re-graded by hand)."""
+    if not grades_path.exists():
+        return {}
+    out = {}
+    with open(grades_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(rec, dict) and rec.get("alert_id"):
+                out[rec["alert_id"]] = rec
+    return out
+
+
+def append_grades(grades: list[dict], grades_path: Path = GRADES_PATH) -> int:
+    if not grades:
+        return 0
+    _append_lines(grades_path, grades)
+    return len(grades)
@@ -4,7 +4,8 @@ build_execution_overlay.py — NBA-only.
 Invoked by: 000_RUN_ALL_NBA.py (EXECUTION step).
 
 Purpose:
-Annotate final_game_view.json with execution overlay flags.
+Annotate final_game_view.json with execution overlay flags
+(bands + flags for every game in one pass via overlay_kernel.py).
 
 Rules:
 - No model recomputation.
@@ -13,7 +14,6 @@ Rules:
 - Deterministic.
 """
 
-import json
 import sys
 from pathlib import Path
 
@@ -21,7 +21,12 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from eng.execution.overlay_kernel import (
+    compute_overlay_from_edges,
+    compute_overlays,
+)
 from utils.io_helpers import get_final_view_json_path
+from utils.json_codec import read_json, write_json as write_artifact_json
 
 # ------------------------------------------------------------
 # CONFIG (NBA final view - domain isolation: data/nba/view)
@@ -37,106 +42,34 @@ MODEL_ARTIFACT_PATH = get_final_view_json_path("nba")
 def load_json(path: Path):
     if not path.exists():
         raise FileNotFoundError(f"Missing required file: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return read_json(path)
 
 
 def write_json(path: Path, payload):
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
-
-
-def determine_band(edge_value):
-    abs_edge = abs(edge_value)
-
-    if abs_edge < 1:
-        return "0-1"
-    elif abs_edge < 2:
-        return "1-2"
-    elif abs_edge < 4:
-        return "2-4"
-    elif abs_edge < 6:
-        return "4-6"
-    elif abs_edge < 8:
-        return "6-8"
-    else:
-        return "8+"
+    write_artifact_json(path, payload, artifact="final_view")
 
 
 # ------------------------------------------------------------
-# CORE OVERLAY LOGIC
+# CORE OVERLAY LOGIC (rules live in overlay_kernel.py)
 # ------------------------------------------------------------
 
-def compute_overlay_for_game(game):
-
+def _authority_numerics(game):
+    """(spread_edge, total_edge, spread_home, total) for the selection authority, or Nones."""
     authority = game.get("selection_authority")
     models = game.get("models") or {}
-
     if not authority or authority not in models:
-        return None  # cannot evaluate
-
-    model_blob = models[authority]
-
-    spread_edge = model_blob.get("spread_edge")
-    total_edge = model_blob.get("total_edge")
-
-    if spread_edge is None or total_edge is None:
-        return None
-
-    spread_home = game.get("spread_home")
-    vegas_total = game.get("total")
-
-    if spread_home is None or vegas_total is None:
-        return None
-
-    abs_spread_edge = abs(spread_edge)
-    abs_total_edge = abs(total_edge)
-    abs_spread = abs(spread_home)
-
-    # ------------------------------------------------------------
-    # SWEET SPOT RULES
-    # ------------------------------------------------------------
-
-    spread_sweet_spot = (
-        1 <= abs_spread_edge <= 4
-        and abs_spread < 12
+        return None, None, None, None
+    model_blob = models[authority] or {}
+    return (
+        model_blob.get("spread_edge"),
+        model_blob.get("total_edge"),
+        game.get("spread_home"),
+        game.get("total"),
     )
 
-    total_sweet_spot = (
-        1 <= abs_total_edge <= 4
-        and 225 <= vegas_total <= 242
-        and abs_spread < 12
-    )
-
-    dual_sweet_spot = (
-        spread_sweet_spot
-        and total_sweet_spot
-        and abs_spread < 10
-    )
-
-    # ------------------------------------------------------------
-    # AVOID RULES
-    # ------------------------------------------------------------
-
-    spread_avoid = (
-        abs_spread_edge > 6
-        or abs_spread >= 12
-    )
 
-    total_avoid = (
-        abs_total_edge > 8
-        or vegas_total < 225
-    )
-
-    return {
-        "spread_band": determine_band(spread_edge),
-        "total_band": determine_band(total_edge),
-        "spread_sweet_spot": spread_sweet_spot,
-        "total_sweet_spot": total_sweet_spot,
-        "dual_sweet_spot": dual_sweet_spot,
-        "spread_avoid": spread_avoid,
-        "total_avoid": total_avoid,
-    }
+def compute_overlay_for_game(game):
+    return compute_overlay_from_edges(*_authority_numerics(game))
 
 
 # ------------------------------------------------------------
@@ -152,11 +85,12 @@ def build_execution_overlay():
     else:
         games = data
 
-    updated_count = 0
+    # One vectorized pass over every game (bands + all flags).
+    overlays = compute_overlays([_authority_numerics(g) for g in games])
 
-    for g in games:
+    updated_count = 0
 
-        overlay = compute_overlay_for_game(g)
+    for g, overlay in zip(games, overlays):
 
         if overlay:
             g["execution_overlay"] = overlay
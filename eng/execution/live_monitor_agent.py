@@ -9,6 +9,8 @@ or can be triggered via cron.
 - Uses eng/execution/timing_agent.timing_recommendation() on odds_history.
 - Generates alert ONLY when status is EXECUTE.
 - Writes logs/active_alerts.log: [TIMESTAMP] [LEAGUE] [MATCHUP] - [PICK] - EDGE: [X] - REASON: [SWEET SPOT TEXT] - STATUS: EXECUTE.
+- Appends the same alerts as typed records to logs/active_alerts.jsonl (eng/execution/alert_ledger.py);
+  the ledger, not the text log, is what analysis_041 grades.
 - Optional: "VALUE PEAK REACHED" when a pick moves from HOLD/WAIT to EXECUTE.
 
 Authority: eng/execution/timing_agent.py, data/ncaam/view/final_game_view_ncaam_active.json,
@@ -187,6 +189,16 @@ def pick_summary(game: dict) -> str:
     return " | ".join(parts) if parts else (line or total or "—")
 
 
+def _alert_markets(game: dict) -> list[str]:
+    """Markets the alert plays (the legs of pick_summary): "spread" and/or "total"."""
+    markets = []
+    if (game.get("Line Bet") or "").strip() and _safe_float(game.get("Spread Edge")) is not None:
+        markets.append("spread")
+    if (game.get("Total Bet") or "").strip() and _safe_float(game.get("Total Edge")) is not None:
+        markets.append("total")
+    return markets or ["spread"]
+
+
 def matchup_string(game: dict) -> str:
     away = (game.get("away_team") or game.get("away_team_display") or "").strip()
     home = (game.get("home_team") or game.get("home_team_display") or "").strip()
@@ -216,6 +228,7 @@ def run_one_cycle() -> int:
     Load active view, filter by edge > 10 and 60%+ Sweet Spot, run timing_agent;
     write alerts only for EXECUTE. Returns number of alerts written.
     """
+    from eng.execution.alert_ledger import append_alerts, make_alert_id, spread_side
     from eng.execution.timing_agent import timing_recommendation
 
     report = load_bias_report()
@@ -243,18 +256,45 @@ def run_one_cycle() -> int:
     previous_state = load_monitor_state()
     new_state = dict(previous_state)
     alerts = []
+    records = []
     now = datetime.now(timezone.utc)
     ts = now.strftime("%Y-%m-%dT%H:%M:%SZ")
 
+    executing = []
     for game in candidates:
         rec = timing_recommendation(game)
         status = (rec.get("status") or "").strip()
         gid = (game.get("game_id") or game.get("canonical_game_id") or "").strip()
         new_state[gid] = status
-
-        if status != "EXECUTE":
-            continue
-
+        if status == "EXECUTE":
+            executing.append((gid, game))
+
+    # Kelly: p from bias_report Sweet Spot win_rate; default -110. All EXECUTE games of the
+    # cycle are sized together so simultaneous alerts cannot over-allocate the bankroll; a
+    # game with both a spread and a total pick is two correlated legs on one game_id.
+    from utils.risk_management import allocate_slate_kelly
+    bets = []
+    for row, (gid, game) in enumerate(executing):
+        win_rate_p = game_sweet_spot_win_rate(game, scenario_to_wr, scenario_names_60)
+        odds = _safe_float(game.get("market_odds_american") or game.get("odds_american"))
+        for market in _alert_markets(game):
+            bets.append({
+                "win_probability": 0.55 if win_rate_p is None else win_rate_p,
+                "market_odds": DEFAULT_MARKET_ODDS_AMERICAN if odds is None else odds,
+                "game_id": gid or f"#{row}",
+                "row": row,
+                "market": market,
+            })
+    allocation = allocate_slate_kelly(bets, bankroll, kelly_fraction=KELLY_FRACTION)
+    game_fractions = [0.0] * len(executing)
+    game_amounts = [0.0] * len(executing)
+    leg_amounts: list[dict] = [{} for _ in executing]
+    for bet, frac, amount in zip(bets, allocation["fractions"], allocation["amounts"]):
+        game_fractions[bet["row"]] += frac
+        game_amounts[bet["row"]] += amount
+        leg_amounts[bet["row"]][bet["market"]] = amount
+
+    for (gid, game), kelly_frac, kelly_amount, legs in zip(executing, game_fractions, game_amounts, leg_amounts):
         reason = (game.get("agent_reasoning") or "").strip()
         if not reason:
             reason = "(Sweet Spot)"
@@ -271,29 +311,44 @@ def run_one_cycle() -> int:
         prev = previous_state.get(gid, "")
         value_peak = " VALUE PEAK REACHED" if prev in ("HOLD/WAIT", "HOLD") else ""
 
-        # Kelly: p from bias_report Sweet Spot win_rate; default -110
-        win_rate_p = game_sweet_spot_win_rate(game, scenario_to_wr, scenario_names_60)
-        market_odds = _safe_float(
-            game.get("market_odds_american") or game.get("odds_american")
-        ) or DEFAULT_MARKET_ODDS_AMERICAN
-        from utils.risk_management import calculate_kelly_bet
-        kelly_frac, kelly_amount = calculate_kelly_bet(
-            win_probability=win_rate_p if win_rate_p is not None else 0.55,
-            market_odds=market_odds,
-            bankroll=bankroll,
-            kelly_fraction=KELLY_FRACTION,
-        )
         kelly_pct = f"{kelly_frac * 100:.1f}" if kelly_frac is not None else "0"
         kelly_dollars = f"${kelly_amount:.2f}" if kelly_amount is not None else "$0.00"
 
         line = f"[{ts}] [{matchup}] - STATUS: EXECUTE - KELLY SIZE: [{kelly_pct}]% ({kelly_dollars}). [{pick}] EDGE: [{edge_str}] REASON: [{reason_flat}].{value_peak}"
         alerts.append(line)
 
+        line_bet = (game.get("Line Bet") or "").strip()
+        total_bet = (game.get("Total Bet") or "").strip().upper()
+        away = (game.get("away_team") or game.get("away_team_display") or "").strip()
+        home = (game.get("home_team") or game.get("home_team_display") or "").strip()
+        records.append({
+            "alert_id": make_alert_id(ts, gid, matchup),
+            "ts": ts,
+            "league": "ncaam",
+            "game_id": gid or None,
+            "game_date": (game.get("game_date") or "")[:10] or None,
+            "matchup": matchup,
+            "away_team": away,
+            "home_team": home,
+            "pick": pick,
+            "spread_pick": line_bet if se is not None and line_bet else None,
+            "spread_side": spread_side(line_bet, away, home) if se is not None and line_bet else None,
+            "total_pick": total_bet if te is not None and total_bet in ("OVER", "UNDER") else None,
+            "spread_edge": se,
+            "total_edge": te,
+            "kelly_fraction": round(kelly_frac, 5),
+            "kelly_amount": round(kelly_amount, 2),
+            "kelly_legs": legs,
+            "value_peak": bool(value_peak),
+            "reason": reason_flat,
+        })
+
     save_monitor_state(new_state)
 
     if not alerts:
         return 0
 
+    append_alerts(records)
     ALERTS_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
     with open(ALERTS_LOG_PATH, "a", encoding="utf-8") as f:
         for line in alerts:
@@ -0,0 +1,191 @@
+"""
+overlay_kernel.py
+
+Edge-band classification and execution overlay flags, scalar and vectorized.
+
+Shared by build_execution_overlay.py (annotates final_game_view), the pocket
+engine (eng/pockets/pocket_engine.py bands) and analysis_039 / 039b. Bands use
+right-open bins on |edge| (np.digitize semantics):
+
+  [0,1) "0-1" | [1,2) "1-2" | [2,4) "2-4" | [4,6) "4-6" | [6,8) "6-8" | [8,inf) "8+"
+
+Overlay rules (fixed NBA thresholds; NCAAM fixed swaps the total window):
+- spread_sweet_spot: 1 <= |spread edge| <= 4 and |spread line| < 12
+- total_sweet_spot:  1 <= |total edge| <= 4 and total in window and |spread line| < 12
+- dual_sweet_spot:   both sweet spots and |spread line| < 10
+- spread_avoid:      |spread edge| > 6 or |spread line| >= 12
+- total_avoid:       |total edge| > 8 or total < avoid floor
+
+numpy is imported lazily; determine_band / compute_overlay_from_edges are pure Python.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+BAND_EDGES = (1.0, 2.0, 4.0, 6.0, 8.0)
+BAND_LABELS = ("0-1", "1-2", "2-4", "4-6", "6-8", "8+")
+
+
+@dataclass(frozen=True)
+class OverlayThresholds:
+    edge_min: float = 1.0
+    edge_max: float = 4.0
+    sweet_spread_line_below: float = 12.0
+    dual_spread_line_below: float = 10.0
+    total_min: float = 225.0
+    total_max: float = 242.0
+    spread_avoid_edge_above: float = 6.0
+    spread_avoid_line_at_or_above: float = 12.0
+    total_avoid_edge_above: float = 8.0
+    total_avoid_below: float = 225.0
+
+
+NBA_FIXED_THRESHOLDS = OverlayThresholds()
+# NCAAM fixed baseline (aligned with 039a GRID_CONFIG["ncaam"]); also 039b fixed reporting.
+NCAAM_FIXED_THRESHOLDS = OverlayThresholds(total_min=135.0, total_max=165.0, total_avoid_below=120.0)
+
+OVERLAY_FLAGS = ("spread_sweet_spot", "total_sweet_spot", "dual_sweet_spot", "spread_avoid", "total_avoid")
+
+
+def _as_float(v: Any) -> Optional[float]:
+    if v is None or v == "":
+        return None
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
+
+
+# ------------------------------------------------------------
+# Scalar
+# ------------------------------------------------------------
+
+def determine_band(edge_value) -> str:
+    return BAND_LABELS[bisect_right(BAND_EDGES, abs(edge_value))]
+
+
+def compute_overlay_from_edges(
+    spread_edge,
+    total_edge,
+    spread_line,
+    vegas_total,
+    thresholds: OverlayThresholds = NBA_FIXED_THRESHOLDS,
+) -> Optional[dict]:
+    """Overlay dict (bands + flags) for one game, or None if any input is missing / non-numeric."""
+    se, te, sl, vt = (_as_float(v) for v in (spread_edge, total_edge, spread_line, vegas_total))
+    if se is None or te is None or sl is None or vt is None:
+        return None
+    t = thresholds
+    abs_se, abs_te, abs_sl = abs(se), abs(te), abs(sl)
+    spread_sweet = t.edge_min <= abs_se <= t.edge_max and abs_sl < t.sweet_spread_line_below
+    total_sweet = (
+        t.edge_min <= abs_te <= t.edge_max
+        and t.total_min <= vt <= t.total_max
+        and abs_sl < t.sweet_spread_line_below
+    )
+    return {
+        "spread_band": determine_band(se),
+        "total_band": determine_band(te),
+        "spread_sweet_spot": spread_sweet,
+        "total_sweet_spot": total_sweet,
+        "dual_sweet_spot": spread_sweet and total_sweet and abs_sl < t.dual_spread_line_below,
+        "spread_avoid": abs_se > t.spread_avoid_edge_above or abs_sl >= t.spread_avoid_line_at_or_above,
+        "total_avoid": abs_te > t.total_avoid_edge_above or vt < t.total_avoid_below,
+    }
+
+
+# ------------------------------------------------------------
+# Vectorized
+# ------------------------------------------------------------
+
+def _float_array(values: Sequence[Any]):
+    import numpy as np
+
+    return np.array([np.nan if (x := _as_float(v)) is None else x for v in values], dtype=float)
+
+
+def band_index(edges):
+    """Band index (0..5 into BAND_LABELS) per edge; NaN edges map to -1."""
+    import numpy as np
+
+    arr = np.abs(np.asarray(edges, dtype=float))
+    idx = np.digitize(arr, BAND_EDGES)
+    return np.where(np.isnan(arr), -1, idx)
+
+
+def classify_bands(edges) -> list[Optional[str]]:
+    """Band label per edge (None where the edge is missing)."""
+    return [BAND_LABELS[i] if i >= 0 else None for i in band_index(_float_array(edges)).tolist()]
+
+
+def compute_overlay_arrays(
+    spread_edge: Sequence[Any],
+    total_edge: Sequence[Any],
+    spread_line: Sequence[Any],
+    vegas_total: Sequence[Any],
+    thresholds: OverlayThresholds = NBA_FIXED_THRESHOLDS,
+) -> dict[str, Any]:
+    """
+    All overlay flags for N games at once. Inputs are equal-length sequences (None / "" allowed).
+    Returns numpy arrays: valid (all four inputs numeric), spread_band / total_band indices and
+    one bool array per OVERLAY_FLAGS entry (False where not valid).
+    """
+    import numpy as np
+
+    se, te, sl, vt = (_float_array(v) for v in (spread_edge, total_edge, spread_line, vegas_total))
+    valid = ~(np.isnan(se) | np.isnan(te) | np.isnan(sl) | np.isnan(vt))
+    abs_se, abs_te, abs_sl = np.abs(se), np.abs(te), np.abs(sl)
+    t = thresholds
+    with np.errstate(invalid="ignore"):
+        spread_sweet = (abs_se >= t.edge_min) & (abs_se <= t.edge_max) & (abs_sl < t.sweet_spread_line_below)
+        total_sweet = (
+            (abs_te >= t.edge_min) & (abs_te <= t.edge_max)
+            & (vt >= t.total_min) & (vt <= t.total_max)
+            & (abs_sl < t.sweet_spread_line_below)
+        )
+        flags = {
+            "spread_sweet_spot": spread_sweet,
+            "total_sweet_spot": total_sweet,
+            "dual_sweet_spot": spread_sweet & total_sweet & (abs_sl < t.dual_spread_line_below),
+            "spread_avoid": (abs_se > t.spread_avoid_edge_above) | (abs_sl >= t.spread_avoid_line_at_or_above),
+            "total_avoid": (abs_te > t.total_avoid_edge_above) | (vt < t.total_avoid_below),
+        }
+    return {
+        "valid": valid,
+        "spread_band": band_index(se),
+        "total_band": band_index(te),
+        **{k: v & valid for k, v in flags.items()},
+    }
+
+
+def overlay_dicts(arrays: dict[str, Any]) -> list[Optional[dict]]:
+    """compute_overlay_arrays output -> per-game overlay dicts (None where not valid)."""
+    valid = arrays["valid"].tolist()
+    spread_band = arrays["spread_band"].tolist()
+    total_band = arrays["total_band"].tolist()
+    flag_lists = {k: arrays[k].tolist() for k in OVERLAY_FLAGS}
+    out: list[Optional[dict]] = []
+    for i, ok in enumerate(valid):
+        if not ok:
+            out.append(None)
+            continue
+        out.append({
+            "spread_band": BAND_LABELS[spread_band[i]],
+            "total_band": BAND_LABELS[total_band[i]],
+            **{k: bool(flag_lists[k][i]) for k in OVERLAY_FLAGS},
+        })
+    return out
+
+
+def compute_overlays(
+    numerics: Sequence[tuple[Any, Any, Any, Any]],
+    thresholds: OverlayThresholds = NBA_FIXED_THRESHOLDS,
+) -> list[Optional[dict]]:
+    """(spread_edge, total_edge, spread_line, vegas_total) per game -> overlay dict or None per game."""
+    if not numerics:
+        return []
+    cols = list(zip(*numerics))
+    return overlay_dicts(compute_overlay_arrays(cols[0], cols[1], cols[2], cols[3], thresholds))
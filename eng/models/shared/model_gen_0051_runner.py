@@ -21,7 +21,6 @@ from __future__ import annotations
 
 import argparse
 import csv
-import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -97,16 +96,15 @@ def run_models(games: list[dict], model_registry: list, sort_key) -> list[dict]:
 
 def write_output(league: str, games_output: list[dict], version: str) -> None:
     from utils.io_helpers import get_model_runner_output_json_path
+    from utils.json_codec import write_json
 
     path = get_model_runner_output_json_path(league)
-    path.parent.mkdir(parents=True, exist_ok=True)
     payload = {
         "version": version,
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "games": games_output,
     }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, sort_keys=True)
+    write_json(path, payload, artifact="model_runner")
 
 
 def write_csv(league: str, games_output: list[dict], game_id_key: str, csv_extra_keys: list[str]) -> None:
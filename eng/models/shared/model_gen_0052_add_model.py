@@ -52,6 +52,9 @@ def safe_float(value):
         return None
 
 
+CHICAGO_TZ = ZoneInfo("America/Chicago")
+
+
 # Column order for final-view CSV: shared with NBA (preferred keys first, then sorted remainder).
 FINAL_VIEW_CSV_PREFERRED_ORDER = [
     "game_id", "game_date", "home_team", "away_team",
@@ -61,6 +64,17 @@ FINAL_VIEW_CSV_PREFERRED_ORDER = [
 ]
 
 
+def utc_to_cst(ts):
+    """ISO UTC timestamp -> America/Chicago ISO string; None when missing/unparseable."""
+    if not ts:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
+        return dt.astimezone(CHICAGO_TZ).isoformat()
+    except Exception:
+        return None
+
+
 def write_final_view_csv(rows: list[dict], out_path: Path) -> None:
     """Write final game rows to CSV: union of all keys, NBA-aligned column order."""
     if not rows:
@@ -88,74 +102,13 @@ def run_nba() -> None:
         get_final_view_json_path,
         get_final_view_csv_path,
     )
-    from eng.decision_explainer import build_decision_explanation
     from eng.eval_sanity import summarize_actions
-    from eng.agent_stub import agent_stub_overrides
-    from eng.arbitration.confidence_engine import classify_game
-    from eng.arbitration.confidence_gate import apply_confidence_gate
+    from eng.arbitration.slate_arbitration import apply_slate_arbitration
 
     IN_JSON = get_model_runner_output_json_path("nba")
     OUT_JSON = get_final_view_json_path("nba")
     OUT_CSV = get_final_view_csv_path("nba")
 
-    def utc_to_cst(ts):
-        if not ts:
-            return None
-        try:
-            dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
-            return dt.astimezone(ZoneInfo("America/Chicago")).isoformat()
-        except Exception:
-            return None
-
-    def compute_arbitration(models_dict):
-        spread_votes, spread_weights = [], []
-        total_votes, total_weights = [], []
-        for model in models_dict.values():
-            pick = model.get("spread_pick")
-            edge = model.get("spread_edge")
-            if pick in ("HOME", "AWAY") and edge is not None:
-                spread_votes.append(pick)
-                spread_weights.append(abs(edge))
-            ou = model.get("total_pick")
-            total_edge = model.get("total_edge")
-            if ou in ("OVER", "UNDER") and total_edge is not None:
-                total_votes.append(ou)
-                total_weights.append(abs(total_edge))
-
-        def compute_side(votes, weights):
-            if not votes:
-                return None
-            total_models = len(votes)
-            most_common = max(set(votes), key=votes.count)
-            directional_pct = votes.count(most_common) / total_models
-            weighted_score = sum(weights)
-            tier_score = directional_pct * weighted_score
-            disagreement_flag = directional_pct < 1.0
-            if tier_score >= 200:
-                tier_level, tier_label, tier_icon = "HIGH", "Strong Conviction Consensus", "🟢"
-            elif tier_score >= 75:
-                tier_level, tier_label, tier_icon = "MEDIUM", "Moderate Agreement", "🟡"
-            else:
-                tier_level, tier_label, tier_icon = "LOW", "Weak Consensus Edge", "🟠"
-            return {
-                "directional_pct": round(directional_pct, 3),
-                "weighted_score": round(weighted_score, 3),
-                "tier_score": round(tier_score, 3),
-                "tier_level": tier_level,
-                "tier_label": tier_label,
-                "tier_icon": tier_icon,
-                "disagreement_flag": disagreement_flag,
-            }
-        return {"spread": compute_side(spread_votes, spread_weights), "total": compute_side(total_votes, total_weights)}
-
-    def determine_primary_model_source(models_dict, alignment, reference_edge):
-        if alignment == "CLUSTER_A" and reference_edge is not None and abs(reference_edge) >= 2:
-            return "CLUSTER_A"
-        joel_edge = models_dict.get("Joel_Baseline_v1", {}).get("spread_edge")
-        if joel_edge is not None and abs(joel_edge) >= 2:
-            return "Joel_Baseline_v1"
-        return "NONE"
-
     if not IN_JSON.exists():
         raise FileNotFoundError(f"Missing multi-model JSON: {IN_JSON}")
     with open(IN_JSON, "r", encoding="utf-8") as f:
@@ -184,17 +137,9 @@ def run_nba() -> None:
         g["Parlay Edge Score"] = joel.get("parlay_edge_score")
         g["selection_authority"] = "Joel_Baseline_v1"
         g["Line Result"] = None
-        g["arbitration"] = compute_arbitration(g.get("models", {}))
-        tier, alignment, flag, reference_edge = classify_game(g.get("models", {}))
-        g["confidence_tier"] = tier
-        g["cluster_alignment"] = alignment
-        g["disagreement_flag"] = flag
-        g = apply_confidence_gate(g)
-        g["arbitration_cluster"] = determine_primary_model_source(g.get("models", {}), alignment, reference_edge)
-        result = build_decision_explanation(g)
-        g["Explanation"] = result["decision_explanation"]
-        g["Decision Factors"] = result["decision_factors"]
-        g = agent_stub_overrides(g)
+
+    # Arbitration, confidence gate, explanation and agent overrides for the whole slate.
+    apply_slate_arbitration(games)
 
     OUT_JSON.parent.mkdir(parents=True, exist_ok=True)
     with open(OUT_JSON, "w", encoding="utf-8") as f:
@@ -229,15 +174,6 @@ def run_ncaam() -> None:
     OUTPUT_CSV = get_final_view_csv_path("ncaam")
     SELECTION_AUTHORITY = "ncaam_avg_score_model"
 
-    def utc_to_cst(ts):
-        if not ts:
-            return None
-        try:
-            dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
-            return dt.astimezone(ZoneInfo("America/Chicago")).isoformat()
-        except Exception:
-            return None
-
     def line_from_last_or_market(g: dict, last_key: str, market_key: str) -> str:
         v = g.get(last_key)
         if v not in (None, ""):
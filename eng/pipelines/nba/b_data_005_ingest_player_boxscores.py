@@ -17,6 +17,7 @@ import time
 from datetime import datetime, timedelta, timezone
 
 from configs.leagues.league_nba import DERIVED_DIR, SCHEDULE_JOINED_PATH
+from utils.http_client import http_get
 
 # =============================
 # PATHS
@@ -81,7 +82,7 @@ def load_existing_rows() -> list[dict]:
 def fetch_boxscore(game_id: str) -> dict | None:
     url = NBA_BOX_URL.format(game_id=game_id)
     try:
-        r = requests.get(
+        r = http_get(
             url,
             headers=HEADERS,
             timeout=(5, 10)  # connect timeout, read timeout
@@ -5,13 +5,13 @@ Append-only historical injury archive.
 Deterministic. No overwrite.
 """
 
-import requests
 import json
 import csv
 from pathlib import Path
 from datetime import datetime, timezone
 
 from configs.leagues.league_nba import DERIVED_DIR
+from utils.http_client import http_get
 
 OUT_DIR = DERIVED_DIR
 HISTORY_JSON = DERIVED_DIR / "nba_injuries_history.json"
@@ -32,7 +32,7 @@ HEADERS = {
 # =============================
 
 def fetch_injuries():
-    r = requests.get(ESPN_INJURY_URL, headers=HEADERS, timeout=(5, 10))
+    r = http_get(ESPN_INJURY_URL, headers=HEADERS, timeout=(5, 10))
     r.raise_for_status()
     return r.json()
 
@@ -17,10 +17,8 @@ Forward-only: reads only external APIs; writes only schedule raw JSON + legacy C
 from __future__ import annotations
 
 import argparse
-import csv
 import json
 import sys
-import requests
 from pathlib import Path
 from datetime import datetime, timedelta, UTC
 
@@ -28,7 +26,8 @@ _PROJECT_ROOT = Path(__file__).resolve().parents[3]
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
-from utils.io_helpers import get_schedule_raw_path, save_schedule_raw
+from utils.io_helpers import get_schedule_raw_path, save_csv_rows, save_schedule_raw
+from utils.http_client import http_get
 from utils.run_log import set_silent, log_info, log_error
 
 
@@ -70,16 +69,12 @@ def _nba_write_legacy_csv(rows: list[dict]) -> None:
     path = get_schedule_raw_path("nba").parent / "nba_schedule.csv"
     if not rows:
         return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=rows[0].keys())
-        w.writeheader()
-        w.writerows(rows)
+    save_csv_rows(path, rows)
     log_info(f"Legacy audit CSV: {path}")
 
 
 def run_nba() -> None:
-    resp = requests.get(NBA_SCHEDULE_URL, headers=NBA_HEADERS, timeout=30)
+    resp = http_get(NBA_SCHEDULE_URL, headers=NBA_HEADERS, timeout=30)
     resp.raise_for_status()
     raw = resp.json()
     normalized = _nba_normalize(raw)
@@ -234,11 +229,7 @@ def _ncaam_write_legacy_csv(rows: list[dict]) -> None:
     from configs.leagues.league_ncaam import SCHEDULE_RAW_PATH
     if not rows:
         return
-    SCHEDULE_RAW_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(SCHEDULE_RAW_PATH, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=rows[0].keys(), extrasaction="ignore")
-        w.writeheader()
-        w.writerows(rows)
+    save_csv_rows(SCHEDULE_RAW_PATH, rows, extrasaction="ignore")
     log_info(f"Legacy audit CSV: {SCHEDULE_RAW_PATH}")
 
 
@@ -251,7 +242,7 @@ def run_ncaam(start_date: str, end_date: str) -> None:
     all_payloads = []
 
     for date_str in date_list:
-        resp = requests.get(NCAAM_SCOREBOARD_URL, params={"dates": date_str, "groups": 50, "limit": 500}, timeout=30)
+        resp = http_get(NCAAM_SCOREBOARD_URL, params={"dates": date_str, "groups": 50, "limit": 500}, timeout=30)
         resp.raise_for_status()
         payload = resp.json()
         all_payloads.append({"requested_date": date_str, "payload": payload})
@@ -24,7 +24,6 @@ from __future__ import annotations
 import argparse
 import csv
 import json
-import requests
 import sys
 from pathlib import Path
 from datetime import date
@@ -39,7 +38,9 @@ from utils.io_helpers import (
     get_boxscore_path,
     load_previous_boxscores_by_id,
     save_boxscores,
+    save_csv_rows,
 )
+from utils.http_client import http_get
 from utils.run_log import set_silent, log_info, log_error
 
 
@@ -80,11 +81,7 @@ def write_legacy_csv(rows: list[dict], csv_path: Path) -> None:
     # Exclude keys that are not CSV-friendly (e.g. nested lists)
     exclude = {"odds_history"}
     fieldnames = [k for k in rows[0].keys() if k not in exclude]
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(rows)
+    save_csv_rows(csv_path, rows, fieldnames=fieldnames, extrasaction="ignore")
 
 
 # =============================================================================
@@ -130,7 +127,7 @@ def _nba_extract_ot_info(box: dict) -> tuple[bool, int]:
 def _nba_fetch_boxscore(game_id: str) -> dict | None:
     url = NBA_BOXSCORE_URL.format(game_id=game_id)
     try:
-        resp = requests.get(url, headers=NBA_HEADERS, timeout=(5, 8))
+        resp = http_get(url, headers=NBA_HEADERS, timeout=(5, 8))
         if resp.status_code != 200:
             return None
         return resp.json()
@@ -259,7 +256,7 @@ def _ncaam_is_boxscore_final(row: dict) -> bool:
 
 def _ncaam_fetch_boxscore(event_id: str) -> dict | None:
     try:
-        r = requests.get(NCAAM_ESPN_URL.format(event_id), timeout=10)
+        r = http_get(NCAAM_ESPN_URL.format(event_id), timeout=10)
         r.raise_for_status()
         return r.json()
     except Exception as e:
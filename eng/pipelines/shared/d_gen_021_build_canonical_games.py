@@ -22,7 +22,6 @@ Output paths unchanged so model runners (0051) do not break.
 from __future__ import annotations
 
 import argparse
-import csv
 import json
 import sys
 from pathlib import Path
@@ -37,6 +36,8 @@ from utils.io_helpers import (
     load_boxscores,
     get_canonical_games_csv_path,
     get_canonical_games_json_path,
+    save_csv_rows,
+    save_json_rows,
 )
 from utils.run_log import set_silent, log_info
 
@@ -215,14 +216,9 @@ def run_nba() -> None:
     json_path = get_canonical_games_json_path("nba")
     csv_path.parent.mkdir(parents=True, exist_ok=True)
     if json_path:
-        json_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(canonical, f, indent=2)
+        save_json_rows(json_path, canonical)
     if canonical:
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=canonical[0].keys())
-            w.writeheader()
-            w.writerows(canonical)
+        save_csv_rows(csv_path, canonical)
 
     log_info(f"Canonical rows: {len(canonical)}")
     log_info(f"CSV  -> {csv_path}")
@@ -475,11 +471,7 @@ def run_ncaam() -> None:
         seen.add(cid)
 
     csv_path = get_canonical_games_csv_path("ncaam")
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=canonical_rows[0].keys())
-        w.writeheader()
-        w.writerows(canonical_rows)
+    save_csv_rows(csv_path, canonical_rows)
 
     with_boxscore = sum(
         1 for r in canonical_rows
@@ -35,6 +35,8 @@ from utils.io_helpers import (
     get_canonical_games_json_path,
     get_game_level_csv_path,
     get_game_level_json_path,
+    save_csv_rows,
+    save_json_rows,
 )
 from utils.run_log import set_silent, log_info
 
@@ -47,18 +49,11 @@ def write_game_level(league: str, rows: list[dict]) -> None:
     """Write game-level rows to JSON (if league has it) and CSV."""
     if not rows:
         return
-    csv_path = get_game_level_csv_path(league)
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=rows[0].keys(), extrasaction="ignore")
-        w.writeheader()
-        w.writerows(rows)
+    save_csv_rows(get_game_level_csv_path(league), rows, extrasaction="ignore")
 
     json_path = get_game_level_json_path(league)
     if json_path:
-        json_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(rows, f, indent=2)
+        save_json_rows(json_path, rows)
 
 
 # =============================================================================
@@ -3,10 +3,12 @@ e_gen_031_get_betline.py
 
 Unified market retrieval: fetch current betting lines from The Odds API for NBA or NCAAM.
 
-- Checks existing data (NBA: data/external/odds_api_raw.json; NCAAM: market/raw) before
+- Checks existing data (NBA: data/external/odds_snapshots/ log; NCAAM: market/raw) before
   making API calls. Token Guard: if we already have odds for a game_id and commence_time
   has passed, we do NOT call the API for that game.
 - Optional --skip-if-recent N: skip fetch if we have a snapshot from the last N minutes.
+- NBA snapshots are appended to the segmented log (utils/odds_snapshot_log.py): one line
+  per fetch plus a small index, instead of rewriting odds_api_raw.json every time.
 - Optional --backfill-ncaam: use paid key to fetch historical odds for canonical games
   that are missing lines (writes same format as normal run for 032/041 compatibility).
 
@@ -16,7 +18,7 @@ Usage:
   python e_gen_031_get_betline.py --league ncaam --skip-if-recent 60
   python e_gen_031_get_betline.py --league ncaam --backfill-ncaam
 
-Environment: ODDS_API_KEY required.
+Environment: ODDS_API_KEY required (except BOOKIEX_HTTP_MODE=replay/stub; see utils/http_client.py).
 """
 
 from __future__ import annotations
@@ -26,7 +28,6 @@ import json
 import os
 import re
 import sys
-import requests
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -36,6 +37,9 @@ if str(_PROJECT_ROOT) not in sys.path:
 
 from dotenv import load_dotenv
 
+from utils.http_client import is_offline
+from utils.odds_client import get_odds_client
+from utils.odds_snapshot_log import SNAPSHOT_LOG_DIR, append_snapshot, latest_snapshot, past_game_keys
 from utils.run_log import set_silent, log_info
 
 # =====================================================
@@ -46,13 +50,8 @@ PROJECT_ROOT = _PROJECT_ROOT
 env_path = PROJECT_ROOT / ".env"
 load_dotenv(dotenv_path=env_path)
 
-BASE_URL = "https://api.the-odds-api.com/v4/sports"
-MARKETS = "spreads,totals,h2h"
-REGIONS = "us"
-ODDS_FORMAT = "american"
-
 API_KEY = os.getenv("ODDS_API_KEY")
-if not API_KEY:
+if not API_KEY and not is_offline():
     raise RuntimeError("Missing required environment variable: ODDS_API_KEY")
 
 
@@ -74,36 +73,14 @@ def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def load_existing_nba(project_root: Path) -> tuple[list, set[tuple[str, str]]]:
+def load_existing_nba(project_root: Path) -> tuple[dict | None, set[tuple[str, str]]]:
     """
-    Load existing NBA odds from data/external/odds_api_raw.json.
-    Returns (list of snapshots, set of (game_id, commence_time) for games we have with commence in the past).
+    Existing NBA odds from the snapshot log index (utils/odds_snapshot_log.py; imports the
+    legacy data/external/odds_api_raw.json on first use).
+    Returns (latest snapshot or None, set of (game_id, commence_time) for games we have with
+    commence in the past). Reads the index plus one snapshot line, not the whole history.
     """
-    path = project_root / "data" / "external" / "odds_api_raw.json"
-    if not path.exists():
-        return [], set()
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError:
-        return [], set()
-    if not isinstance(data, list):
-        return [], set()
-    now = _now_utc()
-    past_set = set()
-    for snap in data:
-        games = snap.get("data") if isinstance(snap, dict) else []
-        if not isinstance(games, list):
-            continue
-        for g in games:
-            gid = (g.get("id") or "").strip() if isinstance(g, dict) else ""
-            ct = g.get("commence_time")
-            if not gid:
-                continue
-            ct_dt = _parse_commence(ct)
-            if ct_dt is not None and ct_dt < now:
-                past_set.add((gid, str(ct) if ct else ""))
-    return data, past_set
+    return latest_snapshot(), past_game_keys(_now_utc())
 
 
 def load_existing_ncaam(project_root: Path) -> tuple[list[dict], set[tuple[str, str]]]:
@@ -181,58 +158,23 @@ def _print_first_last_odds_dates(league_label: str, games: list) -> None:
 # =====================================================
 
 def fetch_current_odds(sport_key: str) -> list:
-    url = f"{BASE_URL}/{sport_key}/odds"
-    params = {
-        "apiKey": API_KEY,
-        "markets": MARKETS,
-        "regions": REGIONS,
-        "oddsFormat": ODDS_FORMAT,
-    }
-    if sport_key == "basketball_ncaab":
-        params["dateFormat"] = "iso"
-    response = requests.get(url, params=params, timeout=30)
-    response.raise_for_status()
-    return response.json()
-
-
-def fetch_event_odds(sport_key: str, event_id: str) -> dict | None:
-    """Fetch odds for a single event (for backfill). Uses 1 request per event."""
-    url = f"{BASE_URL}/{sport_key}/events/{event_id}/odds"
-    params = {
-        "apiKey": API_KEY,
-        "markets": MARKETS,
-        "regions": REGIONS,
-        "oddsFormat": ODDS_FORMAT,
-    }
-    if sport_key == "basketball_ncaab":
-        params["dateFormat"] = "iso"
-    try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
-    except Exception:
-        return None
+    return get_odds_client().current_odds(sport_key).payload
+
+
+def fetch_event_odds(sport_key: str, event_id: str, commence_time: str | None = None) -> dict | None:
+    """Fetch odds for a single event (for backfill). Uses 1 request per event unless cached."""
+    return get_odds_client().event_odds(sport_key, event_id, commence_time)
 
 
 def fetch_events_list(sport_key: str) -> list:
     """Get list of events (ids, commence_time, home_team, away_team) for matching."""
-    url = f"{BASE_URL}/{sport_key}/events"
-    params = {"apiKey": API_KEY}
-    if sport_key == "basketball_ncaab":
-        params["dateFormat"] = "iso"
-    try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json() if isinstance(response.json(), list) else []
-    except Exception:
-        return []
+    return get_odds_client().events_list(sport_key)
 
 
 # =====================================================
 # NBA: append raw JSON + flatten CSV
 # =====================================================
 
-NBA_JSON_OUT = Path("data/external/odds_api_raw.json")
 NBA_CSV_OUT = Path("data/external/odds_api_current.csv")
 
 
@@ -269,14 +211,12 @@ def _nba_flatten_odds(raw_data: list, captured_at: str | None = None) -> list:
 
 def run_nba(skip_if_recent_minutes: int | None = None) -> None:
     sport_key = "basketball_nba"
-    json_path = PROJECT_ROOT / NBA_JSON_OUT
     csv_path = PROJECT_ROOT / NBA_CSV_OUT
-    json_path.parent.mkdir(parents=True, exist_ok=True)
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
 
-    existing_snapshots, past_set = load_existing_nba(PROJECT_ROOT)
+    latest, past_set = load_existing_nba(PROJECT_ROOT)
 
-    if skip_if_recent_minutes is not None and skip_if_recent_minutes > 0 and existing_snapshots:
-        latest = existing_snapshots[-1]
+    if skip_if_recent_minutes is not None and skip_if_recent_minutes > 0 and latest:
         cap = latest.get("captured_at_utc")
         if cap:
             try:
@@ -298,17 +238,17 @@ def run_nba(skip_if_recent_minutes: int | None = None) -> None:
                 pass
 
     log_info("Fetching NBA odds from The Odds API...")
-    raw_data = fetch_current_odds(sport_key)
-    captured_at = datetime.now(timezone.utc).isoformat()
+    resp = get_odds_client().current_odds(sport_key)
+    raw_data = resp.payload or []
+    captured_at = resp.fetched_at_utc
     snapshot = {
         "captured_at_utc": captured_at,
         "sport": sport_key,
         "source": "the_odds_api",
         "data": raw_data,
     }
-    existing_snapshots.append(snapshot)
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(existing_snapshots, f, indent=2)
+    if not append_snapshot(snapshot):
+        log_info(f"Odds cache hit ({captured_at}); snapshot already in ledger.")
 
     rows = _nba_flatten_odds(raw_data, captured_at)
     if rows:
@@ -319,7 +259,7 @@ def run_nba(skip_if_recent_minutes: int | None = None) -> None:
 
     log_info(f"Retrieved {len(raw_data)} games")
     _print_first_last_odds_dates("NBA", raw_data)
-    log_info(f"JSON -> {json_path}")
+    log_info(f"JSON -> {SNAPSHOT_LOG_DIR} (append-only snapshot log)")
     log_info(f"CSV  -> {csv_path}")
     log_info(f"Rows -> {len(rows)}")
 
@@ -355,8 +295,11 @@ def run_ncaam(skip_if_recent_minutes: int | None = None) -> None:
                 pass
 
     log_info("Fetching NCAAM odds from The Odds API...")
-    raw_data = fetch_current_odds(sport_key)
-    captured_at = datetime.now(timezone.utc).isoformat()
+    resp = get_odds_client().current_odds(sport_key)
+    raw_data = resp.payload or []
+    captured_at = resp.fetched_at_utc
+    if resp.from_cache:
+        log_info(f"Odds cache hit ({captured_at}).")
     snapshot = {
         "captured_at_utc": captured_at,
         "sport": sport_key,
@@ -370,14 +313,17 @@ def run_ncaam(skip_if_recent_minutes: int | None = None) -> None:
     ODDS_RAW_LATEST_PATH.parent.mkdir(parents=True, exist_ok=True)
     with open(ODDS_RAW_LATEST_PATH, "w", encoding="utf-8") as f:
         json.dump(snapshot, f, indent=2)
-    ts_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(ts_path, "w", encoding="utf-8") as f:
-        json.dump(snapshot, f, indent=2)
+    # A cached response is already on disk as an earlier timestamped snapshot.
+    if not resp.from_cache:
+        ts_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(ts_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=2)
 
     log_info(f"Retrieved {len(raw_data)} games")
     _print_first_last_odds_dates("NCAAM", raw_data)
     log_info(f"Latest JSON -> {ODDS_RAW_LATEST_PATH}")
-    log_info(f"Timestamped  -> {ts_path}")
+    if not resp.from_cache:
+        log_info(f"Timestamped  -> {ts_path}")
 
 
 # =====================================================
@@ -428,6 +374,7 @@ def run_backfill_ncaam() -> None:
                 have_event_ids.add(eid)
 
     events = fetch_events_list(sport_key)
+    commence_by_id = {(ev.get("id") or "").strip(): ev.get("commence_time") for ev in events}
     # Build key -> event_id: (norm_date, norm_home, norm_away) -> event_id
     event_key_to_id = {}
     for ev in events:
@@ -452,11 +399,7 @@ def run_backfill_ncaam() -> None:
             continue
         if eid in have_event_ids:
             continue
-        commence = None
-        for ev in events:
-            if (ev.get("id") or "").strip() == eid:
-                commence = ev.get("commence_time")
-                break
+        commence = commence_by_id.get(eid)
         if token_guard_skip(eid, commence, past_set):
             continue
         missing.append((eid, commence, row.get("canonical_game_id")))
@@ -466,15 +409,18 @@ def run_backfill_ncaam() -> None:
         return
 
     log_info(f"Backfilling odds for {len(missing)} NCAAM games (token guard applied)...")
+    client = get_odds_client()
+    odds_by_id = client.fetch_event_odds_many(sport_key, [(eid, ct) for eid, ct, _ in missing])
     backfill_games = []
     for event_id, commence_time, cgid in missing:
-        odds = fetch_event_odds(sport_key, event_id)
+        odds = odds_by_id.get(event_id)
         if not odds:
             continue
         backfill_games.append(odds)
         have_event_ids.add(event_id)
         if commence_time:
             past_set.add((event_id, str(commence_time)))
+    log_info(client.summary())
 
     if not backfill_games:
         log_info("No odds returned from API for missing games.")
@@ -3,7 +3,8 @@ e_gen_032_get_betline_flatten.py
 
 Unified flattening of raw odds into downstream format.
 
-- NBA: reads data/external/odds_api_raw.json (list of snapshots), groups by game,
+- NBA: streams snapshots from the odds snapshot log (utils/odds_snapshot_log.py; legacy
+  data/external/odds_api_raw.json when no log exists yet), groups by game,
   builds one row per game with last/consensus spreads, totals, moneylines; writes
   data/nba/derived/nba_betlines_flattened.json and .csv.
 - NCAAM: reads latest raw snapshot from config path, flattens to one row per
@@ -19,7 +20,6 @@ import csv
 import json
 import sys
 from collections import defaultdict
-from datetime import datetime
 from pathlib import Path
 from statistics import mean
 
@@ -28,6 +28,7 @@ if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
 from configs.leagues.league_nba import DERIVED_DIR
+from utils.datetime_bridge import iso_to_epoch
 from utils.run_log import set_silent, log_info
 
 # =====================================================
@@ -45,8 +46,12 @@ NBA_BOOK_PRIORITY = [
 NBA_VALID_MARKETS = {"spreads", "totals", "h2h"}
 
 
-def _nba_parse_utc(ts: str) -> datetime:
-    return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+def _nba_snapshot_epoch(ts: str) -> int:
+    """Snapshot timestamp as epoch seconds (memoized; one parse per distinct captured_at)."""
+    epoch = iso_to_epoch(ts)
+    if epoch is None:
+        raise ValueError(f"Invalid odds snapshot timestamp: {ts!r}")
+    return epoch
 
 
 def _nba_avg(vals) -> float | None:
@@ -57,20 +62,20 @@ def _nba_latest_per_bookmaker(game_rows: list) -> list:
     latest = {}
     for r in game_rows:
         key = (r["bookmaker_key"], r["market"], r["outcome"])
-        ts = _nba_parse_utc(r["odds_snapshot_utc"])
-        if key not in latest or ts > _nba_parse_utc(latest[key]["odds_snapshot_utc"]):
-            latest[key] = r
-    return list(latest.values())
+        ts = _nba_snapshot_epoch(r["odds_snapshot_utc"])
+        if key not in latest or ts > latest[key][0]:
+            latest[key] = (ts, r)
+    return [r for _, r in latest.values()]
 
 
 def _nba_earliest_per_bookmaker(game_rows: list) -> list:
     earliest = {}
     for r in game_rows:
         key = (r["bookmaker_key"], r["market"], r["outcome"])
-        ts = _nba_parse_utc(r["odds_snapshot_utc"])
-        if key not in earliest or ts < _nba_parse_utc(earliest[key]["odds_snapshot_utc"]):
-            earliest[key] = r
-    return list(earliest.values())
+        ts = _nba_snapshot_epoch(r["odds_snapshot_utc"])
+        if key not in earliest or ts < earliest[key][0]:
+            earliest[key] = (ts, r)
+    return [r for _, r in earliest.values()]
 
 
 def _nba_pick_last(game_rows: list, market: str, outcome: str) -> float | None:
@@ -86,7 +91,7 @@ def _nba_pick_last(game_rows: list, market: str, outcome: str) -> float | None:
         return None
     candidates.sort(
         key=lambda r: (
-            _nba_parse_utc(r["odds_snapshot_utc"]),
+            _nba_snapshot_epoch(r["odds_snapshot_utc"]),
             -NBA_BOOK_PRIORITY.index(r["bookmaker_key"])
             if r["bookmaker_key"] in NBA_BOOK_PRIORITY else -999,
         ),
@@ -111,14 +116,13 @@ def _nba_consensus(rows: list, market: str, outcome: str) -> float | None:
 def run_nba() -> None:
     from utils.datetime_bridge import derive_game_day_local
 
-    if not NBA_ODDS_JSON.exists():
-        raise FileNotFoundError(f"Missing raw odds: {NBA_ODDS_JSON}")
+    from utils.odds_snapshot_log import has_log, iter_snapshots
 
-    with open(NBA_ODDS_JSON, "r", encoding="utf-8") as f:
-        snapshots = json.load(f)
+    if not has_log() and not NBA_ODDS_JSON.exists():
+        raise FileNotFoundError(f"Missing raw odds: {NBA_ODDS_JSON}")
 
     rows = []
-    for snap in snapshots:
+    for snap in iter_snapshots():
         captured = snap.get("captured_at_utc")
         if not captured:
             continue
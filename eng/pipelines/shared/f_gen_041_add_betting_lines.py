@@ -31,6 +31,7 @@ _PROJECT_ROOT = Path(__file__).resolve().parents[3]
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
+from utils.datetime_bridge import iso_to_epoch
 from utils.io_helpers import (
     get_canonical_games_csv_path,
     get_game_state_path,
@@ -39,9 +40,10 @@ from utils.io_helpers import (
 )
 from utils.mapping_helpers import (
     NCAAM_ALIAS_MAP,
-    _get_market_commence_dt,
+    _get_market_commence_epoch,
     _ncaam_row_has_odds,
     _window_ncaam,
+    build_market_index,
     build_ncaam_team_normalization_key,
     find_best_market_match,
     normalize_ncaam_team_for_match,
@@ -141,12 +143,10 @@ def _nba_paths():
         ODDS_MASTER_PATH,
         BETLINES_FLATTENED_JSON_PATH,
     )
-    from pathlib import Path
-    legacy_external = Path("data/external")
     return {
         "games_in": GAME_LEVEL_JSON_PATH,
         "odds_in": BETLINES_FLATTENED_JSON_PATH if BETLINES_FLATTENED_JSON_PATH.exists() else DERIVED_DIR / "nba_betlines_flattened.json",
-        "odds_master": ODDS_MASTER_PATH if ODDS_MASTER_PATH.exists() else legacy_external / "odds_api_raw.json",
+        "odds_master": ODDS_MASTER_PATH,
         "csv_out": VIEW_DIR / "nba_games_game_level_with_odds.csv",
     }
 
@@ -190,8 +190,12 @@ def _nba_snapshot(odds_row: dict) -> dict:
     }
 
 
-def _nba_parse_utc(ts: str) -> datetime:
-    return datetime.fromisoformat((ts or "").replace("Z", "+00:00"))
+def _nba_snapshot_epoch(ts: str) -> int:
+    """Snapshot timestamp as epoch seconds (memoized; one parse per distinct captured_at)."""
+    epoch = iso_to_epoch(ts)
+    if epoch is None:
+        raise ValueError(f"Invalid odds snapshot timestamp: {ts!r}")
+    return epoch
 
 def _nba_pick_last(game_rows: list, market: str, outcome: str) -> float | None:
     candidates = [
@@ -203,7 +207,7 @@ def _nba_pick_last(game_rows: list, market: str, outcome: str) -> float | None:
         return None
     candidates.sort(
         key=lambda r: (
-            _nba_parse_utc(r.get("odds_snapshot_utc") or ""),
+            _nba_snapshot_epoch(r.get("odds_snapshot_utc") or ""),
             -NBA_BOOK_PRIORITY.index(r["bookmaker_key"]) if r.get("bookmaker_key") in NBA_BOOK_PRIORITY else -999,
         ),
         reverse=True,
@@ -224,13 +228,13 @@ def _nba_latest_per_bookmaker(game_rows: list) -> list:
     latest = {}
     for r in game_rows:
         key = (r.get("bookmaker_key"), r.get("market"), r.get("outcome"))
-        ts = _nba_parse_utc(r.get("odds_snapshot_utc") or "")
-        if key not in latest or ts > _nba_parse_utc(latest[key].get("odds_snapshot_utc") or ""):
-            latest[key] = r
-    return list(latest.values())
+        ts = _nba_snapshot_epoch(r.get("odds_snapshot_utc") or "")
+        if key not in latest or ts > latest[key][0]:
+            latest[key] = (ts, r)
+    return [r for _, r in latest.values()]
 
-def _nba_flatten_master(snapshots: list) -> list[dict]:
-    """Flatten odds_api_raw.json (list of snapshots) to one row per game. Same schema as 032 output."""
+def _nba_flatten_master(snapshots) -> list[dict]:
+    """Flatten raw odds snapshots (master list or snapshot log) to one row per game. Same schema as 032 output."""
     from utils.datetime_bridge import derive_game_day_local
     rows = []
     for snap in snapshots:
@@ -288,9 +292,14 @@ def _nba_game_day_to_dt(s: str) -> datetime | None:
     except ValueError:
         return None
 
-def _nba_find_best_odds_for_game(game: dict, odds_rows: list[dict], window_hours: int = 24) -> dict | None:
+def _nba_find_best_odds_for_game(
+    game: dict,
+    odds_rows: list[dict],
+    window_hours: int = 24,
+    market_index: dict | None = None,
+) -> dict | None:
     """Find odds row with same home/away and commence within ±window_hours of game's nba_game_day_local."""
-    return find_best_market_match(game, odds_rows, "nba", window_hours)
+    return find_best_market_match(game, odds_rows, "nba", window_hours, market_index=market_index)
 
 def _nba_build_odds_index(odds_rows: list[dict]) -> dict[tuple, dict]:
     return {
@@ -305,6 +314,7 @@ def _nba_build_odds_index(odds_rows: list[dict]) -> dict[tuple, dict]:
 def _nba_build_odds_index_fuzzy(games: list[dict], odds_rows: list[dict], window_hours: int = 24) -> dict[tuple, dict]:
     """Build (home_team, away_team, nba_game_day_local) -> best odds row using ±window_hours for UTC/local drift."""
     index = {}
+    market_index = build_market_index(odds_rows, "nba")
     for g in games:
         key = (
             (g.get("home_team") or "").strip(),
@@ -313,7 +323,7 @@ def _nba_build_odds_index_fuzzy(games: list[dict], odds_rows: list[dict], window
         )
         if not key[0] or not key[1] or not key[2]:
             continue
-        row = _nba_find_best_odds_for_game(g, odds_rows, window_hours)
+        row = _nba_find_best_odds_for_game(g, odds_rows, window_hours, market_index=market_index)
         if row and key not in index:
             index[key] = row
     return index
@@ -357,6 +367,12 @@ def run_nba() -> None:
             raw = json.load(f)
         odds_rows = _nba_flatten_master(raw) if isinstance(raw, list) else []
         log_info(f"Loaded NBA odds from master: {paths['odds_master']} ({len(odds_rows)} flattened rows)")
+    else:
+        from utils.odds_snapshot_log import SNAPSHOT_LOG_DIR, iter_snapshots
+
+        odds_rows = _nba_flatten_master(iter_snapshots())
+        if odds_rows:
+            log_info(f"Loaded NBA odds from snapshot log: {SNAPSHOT_LOG_DIR} ({len(odds_rows)} flattened rows)")
 
     previous_by_id = load_previous_game_state_by_id("nba", "game_id")
     # ±24h fuzzy join for UTC/local drift
@@ -582,18 +598,24 @@ def _ncaam_collapse_odds_rows(odds_rows: list[dict], team_lookup: list[dict]) ->
     return out
 
 
-def _ncaam_find_best_odds_for_game(game: dict, collapsed_rows: list[dict], window_hours: int = 24) -> dict | None:
+def _ncaam_find_best_odds_for_game(
+    game: dict,
+    collapsed_rows: list[dict],
+    window_hours: int = 24,
+    market_index: dict | None = None,
+) -> dict | None:
     """
     Find best odds row for game. Uses shared find_best_market_match with NCAAM window:
     game_date (often local) vs commence_time (UTC) — e.g. 11 PM Monday local matches
     early Tuesday UTC (window: game_date midnight UTC -12h to +36h).
     """
-    return find_best_market_match(game, collapsed_rows, "ncaam", window_hours)
+    return find_best_market_match(game, collapsed_rows, "ncaam", window_hours, market_index=market_index)
 
 
 def _ncaam_build_event_lookup(collapsed_rows: list[dict], base_rows: list[dict]) -> dict[tuple[str, str, str], dict]:
     """Build (game_date, home_team_id, away_team_id) -> odds row using ±24h fuzzy date match per game."""
     lookup = {}
+    market_index = build_market_index(collapsed_rows, "ncaam")
     for game in base_rows:
         key = (
             (game.get("game_date") or "").strip()[:10],
@@ -602,7 +624,7 @@ def _ncaam_build_event_lookup(collapsed_rows: list[dict], base_rows: list[dict])
         )
         if not key[0] or not key[1] or not key[2]:
             continue
-        row = _ncaam_find_best_odds_for_game(game, collapsed_rows)
+        row = _ncaam_find_best_odds_for_game(game, collapsed_rows, market_index=market_index)
         if row and key not in lookup:
             lookup[key] = row
     return lookup
@@ -624,6 +646,16 @@ def _ncaam_one_sided_fallback(
     fallback_miss_ids: set[str] = set()
     out_index = dict(odds_index)
 
+    # Normalize once: (commence_epoch, home_id, away_id, row) for rows with odds.
+    timed_rows = []
+    for row in collapsed_rows:
+        if not _ncaam_row_has_odds(row):
+            continue
+        comm = _get_market_commence_epoch(row, "ncaam")
+        if comm is None:
+            continue
+        timed_rows.append((comm, (row.get("home_team_id") or "").strip(), (row.get("away_team_id") or "").strip(), row))
+
     for game in base_rows:
         game_date = (game.get("game_date") or "").strip()[:10]
         home_id = (game.get("home_team_id") or "").strip()
@@ -651,18 +683,9 @@ def _ncaam_one_sided_fallback(
             continue
 
         candidates = []
-        for row in collapsed_rows:
-            if not _ncaam_row_has_odds(row):
-                continue
-            m_h = (row.get("home_team_id") or "").strip()
-            m_a = (row.get("away_team_id") or "").strip()
+        for comm, m_h, m_a, row in timed_rows:
             if m_h != known_id and m_a != known_id:
                 continue
-            comm = _get_market_commence_dt(row, "ncaam")
-            if not comm:
-                continue
-            if comm.tzinfo:
-                comm = comm.replace(tzinfo=None)
             if not (low <= comm <= high):
                 continue
             candidates.append(row)
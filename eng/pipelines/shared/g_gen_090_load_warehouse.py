@@ -0,0 +1,57 @@
+"""
+g_gen_090_load_warehouse.py
+
+Incrementally load pipeline artifacts into the league's SQLite warehouse
+(utils/warehouse.py, data/{league}/warehouse/bookiex.sqlite): game state + odds
+history, 0051 model outputs, backtest grades and pockets.
+
+Only artifacts whose size/mtime changed since the previous load are re-read, and
+each backtest run is loaded once, so a daily run costs roughly one game-state parse.
+
+Usage:
+  python g_gen_090_load_warehouse.py --league nba
+  python g_gen_090_load_warehouse.py --league ncaam --full
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from utils.io_helpers import get_warehouse_path
+from utils.run_log import log_event, log_info, set_silent
+from utils.warehouse import load_league
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load artifacts into the SQLite warehouse (NBA or NCAAM)")
+    parser.add_argument("--league", required=True, choices=["nba", "ncaam"])
+    parser.add_argument("--full", action="store_true", help="Reload every source, not only changed ones")
+    parser.add_argument("--silent", action="store_true", help="Only print critical errors")
+    args = parser.parse_args()
+    set_silent(args.silent)
+
+    t0 = time.perf_counter()
+    loaded = load_league(args.league, full=args.full)
+    elapsed = time.perf_counter() - t0
+    log_event(
+        f"[{args.league}] warehouse load",
+        counters=loaded,
+        durations={"load_sec": round(elapsed, 3)},
+    )
+    log_info(f"Warehouse:      {get_warehouse_path(args.league)}")
+    if not loaded:
+        log_info("Sources loaded: none changed")
+    for kind, n in loaded.items():
+        log_info(f"Loaded {kind:<15} {n} rows")
+    log_info(f"Elapsed:        {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
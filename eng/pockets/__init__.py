@@ -0,0 +1 @@
+# eng/pockets: league-agnostic model pocket engine (NBA + NCAAM adapters)
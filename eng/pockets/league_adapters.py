@@ -0,0 +1,83 @@
+"""
+league_adapters.py
+
+Per-league settings for the shared pocket engine (eng/pockets/pocket_engine.py).
+
+Everything that used to differ between build_nba_model_pockets.py and
+build_ncaam_model_pockets.py lives here: excluded models, the daily view
+filename convention, and which keys identify a game in the daily view.
+Artifact names are always "{league}_{name}.json".
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class PocketLeagueAdapter:
+    league: str
+    excluded_models: frozenset[str]
+    # daily_view_{YYYY-MM-DD}_v1.json (NBA) vs daily_view_ncaam_{YYYY-MM-DD}_v1.json (NCAAM)
+    daily_view_glob: str
+    daily_view_date_part: int
+    # Fallback keys on the daily game row after identity.game_id
+    daily_id_keys: tuple[str, ...]
+
+    @property
+    def label(self) -> str:
+        return self.league.upper()
+
+    def artifact_name(self, name: str) -> str:
+        """Logical artifact key, e.g. artifact_name("model_pockets") -> "nba_model_pockets"."""
+        return f"{self.league}_{name}"
+
+    def artifact_file(self, name: str) -> str:
+        return f"{self.artifact_name(name)}.json"
+
+    def daily_date_key(self, filename: str) -> str | None:
+        parts = filename.split("_")
+        if len(parts) < self.daily_view_date_part + 2:
+            return None
+        return parts[self.daily_view_date_part]
+
+    def daily_game_id(self, g: dict[str, Any]) -> str:
+        ident = g.get("identity") if isinstance(g.get("identity"), dict) else {}
+        gid = ident.get("game_id")
+        for key in self.daily_id_keys:
+            if gid:
+                break
+            gid = g.get(key)
+        return str(gid or "").strip()
+
+
+NBA_ADAPTER = PocketLeagueAdapter(
+    league="nba",
+    excluded_models=frozenset({"MonkeyDarts_v2"}),
+    daily_view_glob="daily_view_*_v1.json",
+    daily_view_date_part=2,
+    daily_id_keys=("game_id",),
+)
+
+NCAAM_ADAPTER = PocketLeagueAdapter(
+    league="ncaam",
+    excluded_models=frozenset(),
+    daily_view_glob="daily_view_ncaam_*_v1.json",
+    daily_view_date_part=3,
+    daily_id_keys=("game_id", "canonical_game_id", "espn_game_id"),
+)
+
+ADAPTERS: dict[str, PocketLeagueAdapter] = {
+    NBA_ADAPTER.league: NBA_ADAPTER,
+    NCAAM_ADAPTER.league: NCAAM_ADAPTER,
+}
+
+
+def get_adapter(league: str | PocketLeagueAdapter) -> PocketLeagueAdapter:
+    if isinstance(league, PocketLeagueAdapter):
+        return league
+    adapter = ADAPTERS.get(str(league).strip().lower())
+    if adapter is None:
+        raise ValueError(f"Unknown league: {league!r}. Use 'nba' or 'ncaam'.")
+    return adapter
@@ -0,0 +1,347 @@
+"""
+pocket_history.py
+
+Walk-forward pocket leaderboard validation across every historical backtest
+(backtest_* and walkforward_* folders with a backtest_games.json, plain or archived
+as backtest_games.json.gz / .zst by tools/archive_backtests.py).
+
+pocket_validation.py scores the latest backtest with pockets built from that same
+backtest (in-sample). Here each backtest is replayed forward: every --step-days the
+single/combo pockets are rebuilt from games dated strictly before the refit date,
+and the games in the following window are scored with those as-of states. The
+tercile / pass / cold-warning sections (pocket_validation.validation_sections) are
+then computed on those forward-only rows.
+
+Backtests are processed in a process pool. Each result is cached under
+data/{league}/pocket_history/cache/ keyed by the sha256 of backtest_games.json plus
+the replay settings, so reruns only process new (or rewritten) folders.
+
+Outputs (data/{league}/pocket_history/):
+- pocket_history.json (settings, per-backtest headline rows, consistency summary)
+- pocket_history.csv (headline rows)
+
+Usage:
+  python eng/pockets/pocket_history.py --league nba
+  python eng/pockets/pocket_history.py --league ncaam --step-days 14 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import sys
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from eng.pockets.league_adapters import PocketLeagueAdapter, get_adapter
+from utils.io_helpers import get_backtest_output_root, get_pocket_history_dir, save_csv_rows
+from utils.json_codec import find_json, read_json, write_json
+from utils.run_log import log_info, set_silent
+
+CACHE_VERSION = 1
+DEFAULT_STEP_DAYS = 7
+# Games required before the first refit (pockets need history to leave "insufficient").
+DEFAULT_MIN_HISTORY = 150
+BACKTEST_PREFIXES = ("backtest_", "walkforward_")
+
+
+# ------------------------------------------------------------
+# Discovery + cache
+# ------------------------------------------------------------
+
+def list_backtest_dirs(league: str) -> list[Path]:
+    root = get_backtest_output_root(league)
+    if not root.exists():
+        return []
+    dirs = [
+        d for d in root.iterdir()
+        if d.is_dir() and d.name.startswith(BACKTEST_PREFIXES) and _games_path(d) is not None
+    ]
+    return sorted(dirs, key=lambda d: d.name)
+
+
+def _games_path(backtest_dir: Path) -> Optional[Path]:
+    """backtest_games.json, or its compressed form in archived runs."""
+    return find_json(backtest_dir / "backtest_games.json")
+
+
+def _file_sha256(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _cache_key(games_hash: str, adapter: PocketLeagueAdapter, step_days: int, min_history: int) -> str:
+    settings = f"v{CACHE_VERSION}|{step_days}|{min_history}|{','.join(sorted(adapter.excluded_models))}"
+    return hashlib.sha256(f"{games_hash}|{settings}".encode("utf-8")).hexdigest()[:32]
+
+
+def _cache_path(league: str, key: str) -> Path:
+    return get_pocket_history_dir(league) / "cache" / f"{key}.json"
+
+
+def _load_cached(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    try:
+        doc = read_json(path)
+    except (OSError, ValueError):
+        return None
+    return doc if isinstance(doc, dict) else None
+
+
+# ------------------------------------------------------------
+# Walk-forward replay (one backtest)
+# ------------------------------------------------------------
+
+def _game_day(game: dict) -> str:
+    return str(game.get("nba_game_day_local") or game.get("game_date") or "")[:10]
+
+
+def _refit_dates(days: list[str], first_idx: int, step_days: int) -> list[str]:
+    """Calendar refit points from days[first_idx], one per step_days window that contains games."""
+    out: list[str] = []
+    nxt: Optional[date] = None
+    for d in days[first_idx:]:
+        cur = date.fromisoformat(d)
+        if nxt is None or cur >= nxt:
+            out.append(d)
+            nxt = cur + timedelta(days=step_days)
+    return out
+
+
+def walk_forward_backtest(
+    games: list[dict],
+    league: str | PocketLeagueAdapter,
+    *,
+    step_days: int = DEFAULT_STEP_DAYS,
+    min_history: int = DEFAULT_MIN_HISTORY,
+) -> dict[str, Any]:
+    """
+    Replay one backtest forward. Returns window count, forward game count / date span and
+    validation_sections() over forward-scored rows.
+    """
+    from eng.pockets.pocket_engine import _collect_models, _combo_pocket_rows, _single_pocket_rows
+    from eng.pockets.pocket_validation import _combo_by_key_from_rows, enrich_games, validation_sections
+
+    adapter = get_adapter(league)
+    excluded = adapter.excluded_models
+    dated = sorted(
+        ((_game_day(g), g) for g in games if isinstance(g, dict) and _game_day(g)),
+        key=lambda t: t[0],
+    )
+    day_keys = [d for d, _ in dated]
+    days = sorted(set(day_keys))
+
+    first_idx = next(
+        (i for i, d in enumerate(days) if bisect_left(day_keys, d) >= min_history),
+        None,
+    )
+    enriched: list[dict] = []
+    windows = 0
+    forward_days: list[str] = []
+    if first_idx is not None:
+        refits = _refit_dates(days, first_idx, step_days)
+        for i, refit in enumerate(refits):
+            lo = bisect_left(day_keys, refit)
+            hi = bisect_left(day_keys, refits[i + 1]) if i + 1 < len(refits) else len(dated)
+            prior = [g for _, g in dated[:lo]]
+            window = [g for _, g in dated[lo:hi]]
+            if not window:
+                continue
+            _, state_lookup = _single_pocket_rows(prior, excluded)
+            combo_rows = _combo_pocket_rows(prior, _collect_models(prior, excluded), state_lookup)
+            rows = enrich_games(window, state_lookup, _combo_by_key_from_rows(combo_rows), excluded)
+            enriched.extend(rows)
+            windows += 1
+            forward_days.extend(day_keys[lo:hi])
+
+    return {
+        "n_backtest_rows": len(games),
+        "windows": windows,
+        "n_forward_games": len(enriched),
+        "first_forward_date": min(forward_days) if forward_days else None,
+        "last_forward_date": max(forward_days) if forward_days else None,
+        "sections": validation_sections(enriched) if enriched else None,
+    }
+
+
+def _process_backtest(
+    league: str,
+    games_path: str,
+    step_days: int,
+    min_history: int,
+) -> dict[str, Any]:
+    """Worker entrypoint (top-level so it pickles)."""
+    games = read_json(games_path)
+    if not isinstance(games, list):
+        games = []
+    return walk_forward_backtest(games, league, step_days=step_days, min_history=min_history)
+
+
+# ------------------------------------------------------------
+# Cross-backtest summary
+# ------------------------------------------------------------
+
+def _roi(sections: dict | None, section: str, key: str) -> Optional[float]:
+    blob = ((sections or {}).get(section) or {}).get(key) or {}
+    return blob.get("roi") if isinstance(blob, dict) else None
+
+
+def headline_row(result: dict) -> dict[str, Any]:
+    s = result.get("sections")
+    return {
+        "backtest_dir": result.get("backtest_dir"),
+        "games_sha256": result.get("games_sha256"),
+        "windows": result.get("windows"),
+        "n_forward_games": result.get("n_forward_games"),
+        "first_forward_date": result.get("first_forward_date"),
+        "last_forward_date": result.get("last_forward_date"),
+        "pair_top_tercile_roi": _roi(s, "pair_spread_top_vs_all", "top_tercile_pair_spread_combo"),
+        "pair_all_roi": _roi(s, "pair_spread_top_vs_all", "all_with_pair_spread_combo"),
+        "triple_top_tercile_roi": _roi(s, "triple_spread_top_vs_all", "top_tercile_triple_spread_combo"),
+        "triple_all_roi": _roi(s, "triple_spread_top_vs_all", "all_with_triple_spread_combo"),
+        "strong_cluster_auth_roi": _roi(s, "spread_cluster_strong_vs_weak", "strong_spread_cluster_authority_spread"),
+        "weak_cluster_auth_roi": _roi(s, "spread_cluster_strong_vs_weak", "weak_spread_cluster_authority_spread"),
+        "pass_auth_roi": _roi(s, "pass_vs_non_pass", "pass_candidates_authority_spread"),
+        "non_pass_auth_roi": _roi(s, "pass_vs_non_pass", "non_pass_authority_spread"),
+        "high_warning_auth_roi": _roi(s, "cold_warning_high_vs_low", "high_warning_authority_spread"),
+        "low_warning_auth_roi": _roi(s, "cold_warning_high_vs_low", "low_warning_authority_spread"),
+    }
+
+
+# (label, column that should be higher if rankings are predictive, comparison column)
+CONSISTENCY_CHECKS = (
+    ("pair_top_beats_all", "pair_top_tercile_roi", "pair_all_roi"),
+    ("triple_top_beats_all", "triple_top_tercile_roi", "triple_all_roi"),
+    ("strong_cluster_beats_weak", "strong_cluster_auth_roi", "weak_cluster_auth_roi"),
+    ("non_pass_beats_pass", "non_pass_auth_roi", "pass_auth_roi"),
+    ("low_warning_beats_high", "low_warning_auth_roi", "high_warning_auth_roi"),
+)
+
+
+def consistency_summary(rows: list[dict]) -> dict[str, dict[str, Any]]:
+    """Share of backtests where the ranked side beat its comparison (forward ROI)."""
+    out: dict[str, dict[str, Any]] = {}
+    for label, hi_col, lo_col in CONSISTENCY_CHECKS:
+        pairs = [(r[hi_col], r[lo_col]) for r in rows if r.get(hi_col) is not None and r.get(lo_col) is not None]
+        wins = sum(1 for a, b in pairs if a > b)
+        diffs = sorted(a - b for a, b in pairs)
+        out[label] = {
+            "backtests": len(pairs),
+            "wins": wins,
+            "win_share": round(wins / len(pairs), 4) if pairs else None,
+            "median_roi_diff": round(diffs[len(diffs) // 2], 4) if diffs else None,
+        }
+    return out
+
+
+# ------------------------------------------------------------
+# Runner
+# ------------------------------------------------------------
+
+def run(
+    league: str,
+    *,
+    step_days: int = DEFAULT_STEP_DAYS,
+    min_history: int = DEFAULT_MIN_HISTORY,
+    workers: Optional[int] = None,
+) -> dict[str, Any]:
+    adapter = get_adapter(league)
+    dirs = list_backtest_dirs(adapter.league)
+
+    results: dict[str, dict] = {}
+    todo: list[tuple[Path, str, Path]] = []
+    games_paths = {d.name: _games_path(d) for d in dirs}
+    for d in dirs:
+        games_hash = _file_sha256(games_paths[d.name])
+        cpath = _cache_path(adapter.league, _cache_key(games_hash, adapter, step_days, min_history))
+        cached = _load_cached(cpath)
+        if cached is not None:
+            results[d.name] = {**cached, "backtest_dir": d.name}
+        else:
+            todo.append((d, games_hash, cpath))
+
+    log_info(f"[{adapter.league}] pocket history: {len(dirs)} backtests, {len(results)} cached, {len(todo)} to process")
+
+    def _store(d: Path, games_hash: str, cpath: Path, res: dict) -> None:
+        res = {**res, "backtest_dir": d.name, "games_sha256": games_hash}
+        write_json(cpath, res, artifact="cache")
+        results[d.name] = res
+
+    args = [(adapter.league, str(games_paths[d.name]), step_days, min_history) for d, _, _ in todo]
+    workers = min(workers or os.cpu_count() or 1, len(todo)) if todo else 0
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_process_backtest, *a) for a in args]
+            for (d, games_hash, cpath), fut in zip(todo, futures):
+                _store(d, games_hash, cpath, fut.result())
+                log_info(f"[{adapter.league}]   {d.name}")
+    else:
+        for (d, games_hash, cpath), a in zip(todo, args):
+            _store(d, games_hash, cpath, _process_backtest(*a))
+            log_info(f"[{adapter.league}]   {d.name}")
+
+    rows = [headline_row(results[d.name]) for d in dirs if d.name in results]
+    report = {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "league": adapter.league,
+        "settings": {
+            "step_days": step_days,
+            "min_history": min_history,
+            "excluded_models": sorted(adapter.excluded_models),
+            "cache_version": CACHE_VERSION,
+        },
+        "methodology": (
+            "Per backtest: pockets rebuilt every step_days from games dated before the refit date; "
+            "games in the following window scored with those as-of states (no lookahead). "
+            "Sections match pocket_leaderboard_validation on forward rows only."
+        ),
+        "backtests": len(rows),
+        "processed": len(todo),
+        "consistency": consistency_summary(rows),
+        "rows": rows,
+    }
+
+    out_dir = get_pocket_history_dir(adapter.league)
+    write_json(out_dir / "pocket_history.json", report, artifact="pocket")
+    if rows:
+        save_csv_rows(out_dir / "pocket_history.csv", rows)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Walk-forward pocket validation across historical backtests.")
+    parser.add_argument("--league", choices=["nba", "ncaam"], default="nba")
+    parser.add_argument("--step-days", type=int, default=DEFAULT_STEP_DAYS, help="Days between pocket refits")
+    parser.add_argument("--min-history", type=int, default=DEFAULT_MIN_HISTORY, help="Games before the first refit")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+    parser.add_argument("--silent", action="store_true")
+    args = parser.parse_args()
+    set_silent(args.silent)
+
+    report = run(args.league, step_days=args.step_days, min_history=args.min_history, workers=args.workers)
+
+    print(f"\n=== POCKET HISTORY ({args.league.upper()}) ===")
+    print(f"Backtests: {report['backtests']} | processed this run: {report['processed']}\n")
+    print(f"{'Check':<28}{'Backtests':<11}{'Wins':<7}{'Share':<8}{'Median ROI diff':<16}")
+    print("-" * 70)
+    for label, c in report["consistency"].items():
+        share = "—" if c["win_share"] is None else f"{c['win_share']:.2f}"
+        med = "—" if c["median_roi_diff"] is None else f"{c['median_roi_diff']:+.4f}"
+        print(f"{label:<28}{c['backtests']:<11}{c['wins']:<7}{share:<8}{med:<16}")
+    print(f"\nWrote {get_pocket_history_dir(args.league) / 'pocket_history.json'}")
+
+
+if __name__ == "__main__":
+    main()
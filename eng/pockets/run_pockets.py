@@ -0,0 +1,65 @@
+"""
+run_pockets.py
+
+Build pocket artifacts (eng/pockets/pocket_engine.py) for one or both leagues.
+With --league all the leagues run in parallel worker processes; each loads its
+inputs once and writes all artifacts plus validation in a single pass.
+
+A league without a backtest yet is skipped (exit 0), same contract as the old
+build_{league}_model_pockets.py entrypoints.
+
+Usage:
+  python eng/pockets/run_pockets.py --league all
+  python eng/pockets/run_pockets.py --league ncaam
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+LEAGUES = ("nba", "ncaam")
+
+
+def run_league(league: str) -> tuple[str, dict[str, str] | None, str | None]:
+    """(league, {artifact: path} or None, skip reason). Top-level so it pickles into workers."""
+    from eng.pockets.pocket_engine import build_model_pocket_artifacts
+
+    try:
+        written = build_model_pocket_artifacts(league)
+    except FileNotFoundError as e:
+        return league, None, str(e)
+    return league, {k: str(v) for k, v in written.items()}, None
+
+
+def run(leagues: list[str]) -> dict[str, dict[str, str] | None]:
+    if len(leagues) > 1:
+        with ProcessPoolExecutor(max_workers=len(leagues)) as pool:
+            results = list(pool.map(run_league, leagues))
+    else:
+        results = [run_league(lg) for lg in leagues]
+
+    out: dict[str, dict[str, str] | None] = {}
+    for league, written, skipped in results:
+        if skipped is not None:
+            print(f"Skipping {league.upper()} model pockets: {skipped}", file=sys.stderr)
+        out[league] = written
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build model pocket artifacts.")
+    parser.add_argument("--league", choices=["nba", "ncaam", "all"], default="all")
+    args = parser.parse_args()
+    leagues = list(LEAGUES) if args.league == "all" else [args.league]
+    run(leagues)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# eng/similarity: k-NN "similar games" index over game-state features
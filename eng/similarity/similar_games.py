@@ -0,0 +1,370 @@
+"""
+eng/similarity/similar_games.py
+
+Nearest-neighbour "similar games" index for NBA and NCAAM.
+
+Purpose
+-------
+- Feature vector per finalized game from game state: market spread/total, season and
+  last-5 scoring, and (NBA) rest, fatigue, injury impact and 3PT%.
+- Raw vectors + outcomes (ATS side, O/U side, margin, total) are persisted; a rebuild
+  only extracts games not already in the index (incremental), then re-derives the
+  normalization stats over all rows (O(rows x features), no re-parse).
+- Queries standardize the raw matrix once per process (z-score, missing -> column mean)
+  and run brute-force k-NN as one BLAS matrix product: squared distance
+  |q|^2 + |x|^2 - 2 q.x, top-k by argpartition. Only games dated before the query
+  game are eligible, so neighbours never leak the query's own result.
+
+Outputs (utils.io_helpers.get_similarity_dir(league)):
+  similar_games_index.npz   raw feature matrix, game ids/dates/teams, outcomes
+  similar_games_meta.json   version, feature list, row count, build time
+  similar_games_slate.json  k neighbours + cover/over summary per not-yet-final game
+
+Usage
+-----
+  python eng/similarity/similar_games.py --league nba
+  python eng/similarity/similar_games.py --league ncaam --rebuild --silent
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.io_helpers import get_similarity_dir, load_game_state
+from utils.run_log import log_info, set_silent
+
+INDEX_VERSION = "SIMILAR_GAMES_V1"
+DEFAULT_K = 10
+
+# (feature name, game-state keys tried in order, weight). Weight scales the z-score.
+_LINE_FEATURES = (
+    ("spread_home", ("spread_home_last", "market_spread_home", "spread_home"), 1.5),
+    ("total", ("total_last", "market_total", "total"), 1.5),
+)
+_SCORING_FEATURES = tuple(
+    (f"{side}_{name}", (f"{side}_{name}",), 1.0)
+    for side in ("home", "away")
+    for name in ("avg_points_for", "avg_points_against", "last5_points_for", "last5_points_against")
+)
+FEATURES = {
+    "nba": _LINE_FEATURES + _SCORING_FEATURES + tuple(
+        (f"{side}_{name}", (f"{side}_{name}",), 1.0)
+        for side in ("home", "away")
+        for name in ("rest_days", "fatigue_score", "injury_impact", "team_3pt_pct")
+    ),
+    "ncaam": _LINE_FEATURES + _SCORING_FEATURES,
+}
+
+_STR_FIELDS = ("game_id", "game_date", "home_team", "away_team", "ats", "ou")
+_NUM_FIELDS = ("spread_home", "total", "margin", "points")
+
+
+def _check_league(league: str) -> str:
+    league = (league or "").strip().lower()
+    if league not in FEATURES:
+        raise ValueError(f"Unknown league: {league!r}. Use 'nba' or 'ncaam'.")
+    return league
+
+
+def _safe_float(x):
+    if x is None or x == "":
+        return None
+    try:
+        v = float(x)
+    except (TypeError, ValueError):
+        return None
+    return v if v == v else None
+
+
+def _first_float(row: dict, keys: tuple):
+    for key in keys:
+        v = _safe_float(row.get(key))
+        if v is not None:
+            return v
+    return None
+
+
+def _game_id(g: dict) -> str:
+    return str(g.get("canonical_game_id") or g.get("game_id") or "").strip()
+
+
+def _game_date(g: dict) -> str:
+    return str(g.get("nba_game_day_local") or g.get("game_date") or "")[:10]
+
+
+def feature_vector(g: dict, league: str) -> list[float]:
+    """Raw feature values for one game (NaN where missing)."""
+    nan = float("nan")
+    out = []
+    for _, keys, _ in FEATURES[league]:
+        v = _first_float(g, keys)
+        out.append(nan if v is None else v)
+    return out
+
+
+def _outcome(g: dict, league: str) -> dict | None:
+    """Final scores + ATS/O-U result for an indexed game, or None if not final."""
+    from eng.backtest.backtest_gen_runner import _is_final_game, _normalize_scores
+
+    if not _is_final_game(g):
+        return None
+    home, away, _, _ = _normalize_scores(g)
+    if home is None or away is None or (home == 0 and away == 0):
+        return None
+    spread = _first_float(g, FEATURES[league][0][1])
+    total = _first_float(g, FEATURES[league][1][1])
+    margin = home - away
+    points = home + away
+    ats = ou = ""
+    if spread is not None:
+        adjusted = margin + spread
+        ats = "PUSH" if adjusted == 0 else ("HOME" if adjusted > 0 else "AWAY")
+    if total is not None:
+        ou = "PUSH" if points == total else ("OVER" if points > total else "UNDER")
+    return {
+        "game_id": _game_id(g),
+        "game_date": _game_date(g),
+        "home_team": str(g.get("home_team") or g.get("home_team_display") or ""),
+        "away_team": str(g.get("away_team") or g.get("away_team_display") or ""),
+        "ats": ats,
+        "ou": ou,
+        "spread_home": float("nan") if spread is None else spread,
+        "total": float("nan") if total is None else total,
+        "margin": margin,
+        "points": points,
+    }
+
+
+# -----------------------------------------------------------------------------
+# Persisted index
+# -----------------------------------------------------------------------------
+
+
+def _index_paths(league: str) -> tuple[Path, Path]:
+    d = get_similarity_dir(league)
+    return d / "similar_games_index.npz", d / "similar_games_meta.json"
+
+
+def load_raw_index(league: str) -> dict | None:
+    """Raw arrays as persisted, or None when missing or built with a different feature set."""
+    league = _check_league(league)
+    npz_path, meta_path = _index_paths(league)
+    if not npz_path.exists() or not meta_path.exists():
+        return None
+    with open(meta_path, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("index_version") != INDEX_VERSION or meta.get("features") != [f[0] for f in FEATURES[league]]:
+        return None
+    with np.load(npz_path) as data:
+        return {k: data[k] for k in data.files}
+
+
+def build_index(league: str, games: list[dict] | None = None, rebuild: bool = False) -> dict:
+    """Append finalized games not yet indexed (all of them when rebuild). Returns the raw index."""
+    league = _check_league(league)
+    if games is None:
+        games = load_game_state(league)
+
+    existing = None if rebuild else load_raw_index(league)
+    known = set(existing["game_id"].tolist()) if existing is not None else set()
+
+    new_vectors, new_rows = [], []
+    for g in games:
+        gid = _game_id(g)
+        if not gid or gid in known:
+            continue
+        outcome = _outcome(g, league)
+        if outcome is None:
+            continue
+        known.add(gid)
+        new_vectors.append(feature_vector(g, league))
+        new_rows.append(outcome)
+
+    n_features = len(FEATURES[league])
+    added = {
+        "X": np.asarray(new_vectors, dtype=float).reshape(-1, n_features),
+        **{k: np.asarray([r[k] for r in new_rows], dtype=str) for k in _STR_FIELDS},
+        **{k: np.asarray([r[k] for r in new_rows], dtype=float) for k in _NUM_FIELDS},
+    }
+    if existing is None:
+        index = added
+    else:
+        index = {k: np.concatenate([existing[k], added[k]]) for k in added}
+
+    order = np.argsort(index["game_date"], kind="stable")
+    index = {k: v[order] for k, v in index.items()}
+
+    npz_path, meta_path = _index_paths(league)
+    npz_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = npz_path.with_name(npz_path.stem + ".tmp.npz")
+    np.savez(tmp, **index)
+    tmp.replace(npz_path)
+    meta = {
+        "index_version": INDEX_VERSION,
+        "league": league,
+        "built_at_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "features": [f[0] for f in FEATURES[league]],
+        "weights": [f[2] for f in FEATURES[league]],
+        "rows": int(len(index["game_id"])),
+        "added": len(new_rows),
+        "min_game_date": str(index["game_date"][0]) if len(index["game_date"]) else None,
+        "max_game_date": str(index["game_date"][-1]) if len(index["game_date"]) else None,
+    }
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    log_info(f"Similar-games index ({league}): {meta['rows']} games (+{meta['added']}) -> {npz_path}")
+    return index
+
+
+# -----------------------------------------------------------------------------
+# Query
+# -----------------------------------------------------------------------------
+
+
+class SimilarGamesIndex:
+    """Standardized in-memory view of the persisted index; query() is one matrix product."""
+
+    def __init__(self, league: str, raw: dict):
+        self.league = _check_league(league)
+        self.raw = raw
+        weights = np.asarray([f[2] for f in FEATURES[self.league]], dtype=float)
+        X = raw["X"]
+        if len(X):
+            # All-missing columns are zero-filled so they standardize to 0 without warnings.
+            filled = np.where(np.isnan(X).all(axis=0), 0.0, X)
+            mean = np.nanmean(filled, axis=0)
+            std = np.nanstd(filled, axis=0)
+        else:
+            mean = std = np.zeros(X.shape[1])
+        self.mean = np.nan_to_num(mean)
+        self.scale = weights / np.where((std > 0) & ~np.isnan(std), std, 1.0)
+        self.Z = self._standardize(X)
+        self.sq_norms = np.einsum("ij,ij->i", self.Z, self.Z)
+
+    @classmethod
+    def load(cls, league: str) -> "SimilarGamesIndex | None":
+        raw = load_raw_index(league)
+        return cls(league, raw) if raw is not None else None
+
+    def __len__(self) -> int:
+        return len(self.raw["game_id"])
+
+    def _standardize(self, X: np.ndarray) -> np.ndarray:
+        Z = (X - self.mean) * self.scale
+        return np.where(np.isnan(Z), 0.0, Z)
+
+    def query_many(self, games: list[dict], k: int = DEFAULT_K) -> list[list[dict]]:
+        """k most similar earlier games for each query game (nearest first)."""
+        if not games or not len(self):
+            return [[] for _ in games]
+        Q = self._standardize(np.asarray([feature_vector(g, self.league) for g in games], dtype=float))
+        D = self.sq_norms[None, :] + np.einsum("ij,ij->i", Q, Q)[:, None] - 2.0 * (Q @ self.Z.T)
+
+        dates = self.raw["game_date"]
+        ids = self.raw["game_id"]
+        out = []
+        for i, g in enumerate(games):
+            row = D[i]
+            eligible = (dates < _game_date(g)) & (ids != _game_id(g)) if _game_date(g) else ids != _game_id(g)
+            row = np.where(eligible, row, np.inf)
+            n = min(k, int(eligible.sum()))
+            if n == 0:
+                out.append([])
+                continue
+            top = np.argpartition(row, n - 1)[:n]
+            top = top[np.argsort(row[top], kind="stable")]
+            out.append([self._neighbour(j, row[j]) for j in top])
+        return out
+
+    def query(self, game: dict, k: int = DEFAULT_K) -> list[dict]:
+        return self.query_many([game], k)[0]
+
+    def _neighbour(self, j: int, sq_dist: float) -> dict:
+        raw = self.raw
+        rec = {k: str(raw[k][j]) for k in _STR_FIELDS}
+        for k in _NUM_FIELDS:
+            v = float(raw[k][j])
+            rec[k] = None if v != v else v
+        rec["distance"] = round(float(np.sqrt(max(sq_dist, 0.0))), 4)
+        return rec
+
+
+def summarize_neighbours(neighbours: list[dict]) -> dict:
+    """Home-cover and over rates (pushes excluded) across a neighbour list."""
+    ats = [n["ats"] for n in neighbours if n["ats"] in ("HOME", "AWAY")]
+    ou = [n["ou"] for n in neighbours if n["ou"] in ("OVER", "UNDER")]
+    return {
+        "n": len(neighbours),
+        "home_covers": ats.count("HOME"),
+        "ats_decided": len(ats),
+        "overs": ou.count("OVER"),
+        "ou_decided": len(ou),
+        "home_cover_pct": round(100 * ats.count("HOME") / len(ats), 1) if ats else None,
+        "over_pct": round(100 * ou.count("OVER") / len(ou), 1) if ou else None,
+    }
+
+
+# -----------------------------------------------------------------------------
+# CLI
+# -----------------------------------------------------------------------------
+
+
+def write_slate_neighbours(league: str, games: list[dict], k: int = DEFAULT_K) -> Path:
+    """Neighbours + summary for every not-yet-final game, keyed by game_id (read by the dashboard)."""
+    from eng.backtest.backtest_gen_runner import _is_final_game
+
+    league = _check_league(league)
+    index = SimilarGamesIndex.load(league)
+    pending = [g for g in games if _game_id(g) and not _is_final_game(g)]
+    results = index.query_many(pending, k=k) if index is not None else [[] for _ in pending]
+    payload = {
+        "index_version": INDEX_VERSION,
+        "league": league,
+        "built_at_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "k": k,
+        "games": {
+            _game_id(g): {"summary": summarize_neighbours(n), "neighbours": n}
+            for g, n in zip(pending, results)
+        },
+    }
+    path = get_similarity_dir(league) / "similar_games_slate.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    log_info(f"Similar games for {len(pending)} pending game(s) -> {path}")
+    return path
+
+
+def load_similar_slate(league: str) -> dict | None:
+    path = get_similarity_dir(league) / "similar_games_slate.json"
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build / extend the similar-games k-NN index.")
+    parser.add_argument("--league", choices=["nba", "ncaam"], default="nba")
+    parser.add_argument("--rebuild", action="store_true", help="Re-extract every game instead of appending new ones")
+    parser.add_argument("-k", type=int, default=DEFAULT_K, help=f"Neighbours per pending game (default {DEFAULT_K})")
+    parser.add_argument("--silent", action="store_true", help="Suppress log output")
+    args = parser.parse_args()
+    set_silent(args.silent)
+    games = load_game_state(args.league)
+    build_index(args.league, games=games, rebuild=args.rebuild)
+    write_slate_neighbours(args.league, games, k=args.k)
+
+
+if __name__ == "__main__":
+    main()
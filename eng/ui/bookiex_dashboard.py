@@ -13,7 +13,8 @@ import streamlit as st
 import json
 import pandas as pd
 from collections import defaultdict
-from datetime import datetime, timezone
+from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 
@@ -21,7 +22,10 @@ from zoneinfo import ZoneInfo
 # CONFIG (NBA/NCAAM daily dirs: same contract as producer via io_helpers)
 # --------------------------------------------------
 
+from eng.pockets.pocket_engine import daily_view_digest
+from utils.datetime_bridge import iso_to_epoch
 from utils.io_helpers import get_daily_view_output_dir, get_backtest_output_root
+from utils.risk_management import allocate_slate_kelly
 
 NBA_DAILY_DIR = get_daily_view_output_dir("nba")
 NCAAM_DAILY_DIR = get_daily_view_output_dir("ncaam")
@@ -270,6 +274,11 @@ def _parse_iso_datetime(value) -> datetime | None:
         return None
     if not isinstance(value, str):
         return None
+    return _parse_iso_datetime_str(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime_str(value: str) -> datetime | None:
     s = value.strip()
     if not s:
         return None
@@ -293,11 +302,8 @@ def _game_commence_sort_key(g: dict) -> tuple:
         ti.get("tipoff_time_cst"),
         ident.get("game_date_local"),
     ):
-        dt = _parse_iso_datetime(raw)
-        if dt is not None:
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            ts = dt.astimezone(timezone.utc).timestamp()
+        ts = iso_to_epoch(raw) if isinstance(raw, str) else None
+        if ts is not None:
             break
     else:
         ts = float("inf")
@@ -648,6 +654,50 @@ def _load_ncaam_pocket_leaderboard_validation() -> dict | None:
 _ncaam_pocket_validation_doc = _load_ncaam_pocket_leaderboard_validation() if league == "NCAAM" else None
 
 
+@st.cache_data(max_entries=4, show_spinner=False)
+def _read_pocket_slate_lookup(path_str: str, mtime_ns: int) -> dict | None:
+    """Parsed lookup; mtime_ns is part of the cache key so a rewritten file is re-read."""
+    with open(path_str, "r", encoding="utf-8") as f:
+        doc = json.load(f)
+    return doc if isinstance(doc, dict) else None
+
+
+def _load_pocket_slate_lookup(lg: str) -> dict | None:
+    """Optional {lg}_pocket_slate_lookup.json (per-date pre-joined pocket boards) from latest backtest dir."""
+    try:
+        root = get_backtest_output_root(lg)
+        if not root.exists():
+            return None
+        subdirs = [d for d in root.iterdir() if d.is_dir() and d.name.startswith("backtest_")]
+        if not subdirs:
+            return None
+        latest = max(subdirs, key=lambda d: d.stat().st_mtime)
+        p = latest / f"{lg}_pocket_slate_lookup.json"
+        if not p.exists():
+            return None
+        return _read_pocket_slate_lookup(str(p), p.stat().st_mtime_ns)
+    except Exception:
+        return None
+
+
+def _pocket_lookup_entry(lookup_doc: dict | None, selected_date: str, daily_sha1: str | None) -> dict | None:
+    """
+    Precomputed slate for Select Date (leaderboard / ranked / BPP / slate rows), or None.
+    None as well when the entry was built from a different version of the daily view file
+    (daily view rebuilt after the pocket engine ran), so callers fall back to the live resolve.
+    """
+    entry = ((lookup_doc or {}).get("dates") or {}).get(str(selected_date).strip())
+    if not isinstance(entry, dict) or not entry.get("leaderboard"):
+        return None
+    if not daily_sha1 or entry.get("source_daily_view_sha1") != daily_sha1:
+        return None
+    return entry
+
+
+_nba_pocket_lookup_doc = _load_pocket_slate_lookup("nba") if league == "NBA" else None
+_ncaam_pocket_lookup_doc = _load_pocket_slate_lookup("ncaam") if league == "NCAAM" else None
+
+
 # Load overlay performance once: dynamic-only (no fallback to fixed/stale). Used for Execution Overlay table and Kelly Win%.
 _overlay_buckets, _overlay_date = _load_execution_overlay_performance(league)
 _overlay_table = _overlay_buckets
@@ -895,17 +945,34 @@ def _pocket_roi_row_background_css(v) -> str:
     return ""
 
 
+_POCKET_ROI_SIGN_BACKGROUND_CSS = {
+    1: "background-color: #ecfdf5;",
+    -1: "background-color: #fef2f2;",
+    0: "",
+}
+
+
 def _st_pocket_main_roi_table(
     rows: list[dict],
     roi_column: str,
     *,
     use_container_width: bool = True,
+    roi_signs: list[int] | None = None,
 ) -> None:
-    """Ranked / BPP boards: tint entire row by single ROI column (pandas Styler, axis=1)."""
+    """
+    Ranked / BPP boards: tint entire row by single ROI column (pandas Styler, axis=1).
+    roi_signs (precomputed by the pocket engine) styles the whole frame in one call instead.
+    """
     df = pd.DataFrame(rows)
     if df.empty:
         st.dataframe(df, use_container_width=use_container_width, hide_index=True)
         return
+    if roi_signs is not None and len(roi_signs) == len(df):
+        row_css = [_POCKET_ROI_SIGN_BACKGROUND_CSS.get(x, "") for x in roi_signs]
+        css = pd.DataFrame({c: row_css for c in df.columns}, index=df.index)
+        styler = df.style.apply(lambda _: css, axis=None).hide(axis="index")
+        st.dataframe(styler, use_container_width=use_container_width)
+        return
     if roi_column not in df.columns:
         st.dataframe(df, use_container_width=use_container_width, hide_index=True)
         return
@@ -1212,8 +1279,11 @@ file_path = date_map[selected_date]
 # Verification: exact file loaded (visible in Streamlit logs).
 print(f"[BookieX Dashboard] Loading: {file_path.resolve()}")
 
-with open(file_path, "r", encoding="utf-8") as f:
-    data = json.load(f)
+with open(file_path, "rb") as f:
+    _daily_raw = f.read()
+data = json.loads(_daily_raw)
+# Freshness key for the precomputed pocket slate lookup (must match pocket_engine).
+_daily_view_sha1 = daily_view_digest(_daily_raw)
 
 games = data.get("games", [])
 
@@ -1397,39 +1467,46 @@ def _render_nba_pocket_roi_view(games: list, selected_date: str) -> None:
         lb = _pocket_float(r.get("leaderboard_score")) or 0.0
         return (w, lb)
 
-    try:
-        from eng.execution.build_nba_model_pockets import resolve_nba_pocket_board_for_selected_slate
-
-        _lb_sf, _rpo_resolved, _bpp_resolved, _pocket_board_mode = (
-            resolve_nba_pocket_board_for_selected_slate(
-                selected_date=str(selected_date),
-                daily_games=list(games or []),
-                model_pockets_doc=_nba_pockets_doc,
-                current_game_pocket_doc=_nba_current_pockets_doc,
-                leaderboard_disk=_nba_live_pocket_leaderboard_doc,
-                ranked_disk=_nba_ranked_pocket_doc,
-                bpp_disk=_nba_best_pocket_doc,
-            )
-        )
-    except Exception:
-        _lb_sf = _nba_live_pocket_leaderboard_doc
-        _rpo_resolved = _nba_ranked_pocket_doc
-        _bpp_resolved = _nba_best_pocket_doc
-        _pocket_board_mode = "fallback_disk"
-        if _lb_sf:
-            try:
-                from eng.execution.build_nba_model_pockets import (
-                    build_nba_best_pocket_per_game_from_leaderboard,
-                    build_nba_ranked_pocket_opportunities,
+    _lookup_entry = _pocket_lookup_entry(_nba_pocket_lookup_doc, selected_date, _daily_view_sha1)
+    if _lookup_entry is not None:
+        _lb_sf = _lookup_entry.get("leaderboard")
+        _rpo_resolved = _lookup_entry.get("ranked")
+        _bpp_resolved = _lookup_entry.get("best_per_game")
+        _pocket_board_mode = "precomputed"
+    else:
+        try:
+            from eng.execution.build_nba_model_pockets import resolve_nba_pocket_board_for_selected_slate
+
+            _lb_sf, _rpo_resolved, _bpp_resolved, _pocket_board_mode = (
+                resolve_nba_pocket_board_for_selected_slate(
+                    selected_date=str(selected_date),
+                    daily_games=list(games or []),
+                    model_pockets_doc=_nba_pockets_doc,
+                    current_game_pocket_doc=_nba_current_pockets_doc,
+                    leaderboard_disk=_nba_live_pocket_leaderboard_doc,
+                    ranked_disk=_nba_ranked_pocket_doc,
+                    bpp_disk=_nba_best_pocket_doc,
                 )
-
-                _pockets_list_fb = list(((_nba_pockets_doc or {}).get("pockets") or []))
-                if _rpo_resolved is None and _pockets_list_fb:
-                    _rpo_resolved = build_nba_ranked_pocket_opportunities(_lb_sf, _pockets_list_fb)
-                if _bpp_resolved is None:
-                    _bpp_resolved = build_nba_best_pocket_per_game_from_leaderboard(_lb_sf)
-            except Exception:
-                pass
+            )
+        except Exception:
+            _lb_sf = _nba_live_pocket_leaderboard_doc
+            _rpo_resolved = _nba_ranked_pocket_doc
+            _bpp_resolved = _nba_best_pocket_doc
+            _pocket_board_mode = "fallback_disk"
+            if _lb_sf:
+                try:
+                    from eng.execution.build_nba_model_pockets import (
+                        build_nba_best_pocket_per_game_from_leaderboard,
+                        build_nba_ranked_pocket_opportunities,
+                    )
+
+                    _pockets_list_fb = list(((_nba_pockets_doc or {}).get("pockets") or []))
+                    if _rpo_resolved is None and _pockets_list_fb:
+                        _rpo_resolved = build_nba_ranked_pocket_opportunities(_lb_sf, _pockets_list_fb)
+                    if _bpp_resolved is None:
+                        _bpp_resolved = build_nba_best_pocket_per_game_from_leaderboard(_lb_sf)
+                except Exception:
+                    pass
     _opp_rows = [r for r in ((_rpo_resolved or {}).get("opportunities") or []) if isinstance(r, dict)]
     _games_bpp = list((_bpp_resolved or {}).get("games") or [])
     _parlay_eligible_n = sum(1 for r in _opp_rows if r.get("eligible_for_parlay"))
@@ -1451,6 +1528,11 @@ def _render_nba_pocket_roi_view(games: list, selected_date: str) -> None:
             f"Pocket ROI **aligned to Select Date** `{_sel_date}` (leaderboard, ranked opportunities, and best-pocket-per-game "
             f"rebuilt in-session from current pocket view + this daily slate)."
         )
+    elif _pocket_board_mode == "precomputed":
+        st.caption(
+            f"Pocket ROI **aligned to Select Date** `{_sel_date}` (precomputed slate from the pocket slate lookup; "
+            f"same formulas as the in-session rebuild)."
+        )
     elif _lb_sf and _lb_slate and _lb_slate != _sel_date and _pocket_join_mode == "leaderboard_slate":
         st.warning(
             f"**Recommended Bet** uses the daily file for leaderboard slate **`{_lb_slate}`** (≠ **Select Date** `{_sel_date}`)."
@@ -1558,10 +1640,10 @@ def _render_nba_pocket_roi_view(games: list, selected_date: str) -> None:
                             r, _pocket_daily_by_id, join_mode=_pocket_join_mode
                         ),
                         "Pocket Type": _rpo_cell(r.get("pocket_type")),
-                        "Pocket Models": _rpo_models_col(r),
-                        "State Signature": _rpo_sig_cell(r),
-                        "ROI": _rpo_num(r.get("roi")),
-                        "Win Rate": _rpo_num(r.get("win_rate")),
+                        "Pocket Models": (r.get("display") or {}).get("models") or _rpo_models_col(r),
+                        "State Signature": (r.get("display") or {}).get("state_signature") or _rpo_sig_cell(r),
+                        "ROI": (r.get("display") or {}).get("roi") or _rpo_num(r.get("roi")),
+                        "Win Rate": (r.get("display") or {}).get("win_rate") or _rpo_num(r.get("win_rate")),
                         "Graded Games": r.get("graded_games") if r.get("graded_games") is not None else "—",
                         "Why": (r.get("reason") or "")[:280],
                         "Parlay Eligible": r.get("eligible_for_parlay"),
@@ -1569,6 +1651,11 @@ def _render_nba_pocket_roi_view(games: list, selected_date: str) -> None:
                     for r in _opp_display
                 ],
                 "ROI",
+                roi_signs=(
+                    [r["display"]["roi_sign"] for r in _opp_display]
+                    if all(isinstance(r.get("display"), dict) for r in _opp_display)
+                    else None
+                ),
             )
 
     with st.expander("Best pocket per game (secondary summary)", expanded=False):
@@ -1693,12 +1780,19 @@ def _render_nba_pocket_roi_view(games: list, selected_date: str) -> None:
         "not a substitute for authority logic. No bets placed or automated."
     )
 
-    _adm_rows, _adm_cap = _resolve_nba_pocket_slate_rows(
-        _nba_current_pockets_doc,
-        _nba_live_pockets_doc,
-        games,
-        selected_date,
-    )
+    if _lookup_entry is not None:
+        _adm_rows = list(_lookup_entry.get("slate_rows") or [])
+        _adm_cap = (
+            f"**Selected slate (**{str(selected_date).strip()}**):** **{len(_adm_rows)}** games from "
+            f"`nba_pocket_slate_lookup.json` (pre-joined by the pocket engine)."
+        )
+    else:
+        _adm_rows, _adm_cap = _resolve_nba_pocket_slate_rows(
+            _nba_current_pockets_doc,
+            _nba_live_pockets_doc,
+            games,
+            selected_date,
+        )
     _adm_bt = str((_nba_pockets_doc or {}).get("source_backtest_dir") or "")
     if _lb_sf:
         _adm_bt = str(_lb_sf.get("source_backtest_dir") or _adm_bt)
@@ -2068,39 +2162,46 @@ def _render_ncaam_pocket_roi_view(games: list, selected_date: str) -> None:
         lb = _pocket_float(r.get("leaderboard_score")) or 0.0
         return (w, lb)
 
-    try:
-        from eng.execution.build_ncaam_model_pockets import resolve_ncaam_pocket_board_for_selected_slate
-
-        _lb_sf, _rpo_resolved, _bpp_resolved, _pocket_board_mode = (
-            resolve_ncaam_pocket_board_for_selected_slate(
-                selected_date=str(selected_date),
-                daily_games=list(games or []),
-                model_pockets_doc=_ncaam_pockets_doc,
-                current_game_pocket_doc=_ncaam_current_pockets_doc,
-                leaderboard_disk=_ncaam_live_pocket_leaderboard_doc,
-                ranked_disk=_ncaam_ranked_pocket_doc,
-                bpp_disk=_ncaam_best_pocket_doc,
-            )
-        )
-    except Exception:
-        _lb_sf = _ncaam_live_pocket_leaderboard_doc
-        _rpo_resolved = _ncaam_ranked_pocket_doc
-        _bpp_resolved = _ncaam_best_pocket_doc
-        _pocket_board_mode = "fallback_disk"
-        if _lb_sf:
-            try:
-                from eng.execution.build_ncaam_model_pockets import (
-                    build_ncaam_best_pocket_per_game_from_leaderboard,
-                    build_ncaam_ranked_pocket_opportunities,
+    _lookup_entry = _pocket_lookup_entry(_ncaam_pocket_lookup_doc, selected_date, _daily_view_sha1)
+    if _lookup_entry is not None:
+        _lb_sf = _lookup_entry.get("leaderboard")
+        _rpo_resolved = _lookup_entry.get("ranked")
+        _bpp_resolved = _lookup_entry.get("best_per_game")
+        _pocket_board_mode = "precomputed"
+    else:
+        try:
+            from eng.execution.build_ncaam_model_pockets import resolve_ncaam_pocket_board_for_selected_slate
+
+            _lb_sf, _rpo_resolved, _bpp_resolved, _pocket_board_mode = (
+                resolve_ncaam_pocket_board_for_selected_slate(
+                    selected_date=str(selected_date),
+                    daily_games=list(games or []),
+                    model_pockets_doc=_ncaam_pockets_doc,
+                    current_game_pocket_doc=_ncaam_current_pockets_doc,
+                    leaderboard_disk=_ncaam_live_pocket_leaderboard_doc,
+                    ranked_disk=_ncaam_ranked_pocket_doc,
+                    bpp_disk=_ncaam_best_pocket_doc,
                 )
-
-                _pockets_list_fb = list(((_ncaam_pockets_doc or {}).get("pockets") or []))
-                if _rpo_resolved is None and _pockets_list_fb:
-                    _rpo_resolved = build_ncaam_ranked_pocket_opportunities(_lb_sf, _pockets_list_fb)
-                if _bpp_resolved is None:
-                    _bpp_resolved = build_ncaam_best_pocket_per_game_from_leaderboard(_lb_sf)
-            except Exception:
-                pass
+            )
+        except Exception:
+            _lb_sf = _ncaam_live_pocket_leaderboard_doc
+            _rpo_resolved = _ncaam_ranked_pocket_doc
+            _bpp_resolved = _ncaam_best_pocket_doc
+            _pocket_board_mode = "fallback_disk"
+            if _lb_sf:
+                try:
+                    from eng.execution.build_ncaam_model_pockets import (
+                        build_ncaam_best_pocket_per_game_from_leaderboard,
+                        build_ncaam_ranked_pocket_opportunities,
+                    )
+
+                    _pockets_list_fb = list(((_ncaam_pockets_doc or {}).get("pockets") or []))
+                    if _rpo_resolved is None and _pockets_list_fb:
+                        _rpo_resolved = build_ncaam_ranked_pocket_opportunities(_lb_sf, _pockets_list_fb)
+                    if _bpp_resolved is None:
+                        _bpp_resolved = build_ncaam_best_pocket_per_game_from_leaderboard(_lb_sf)
+                except Exception:
+                    pass
     _opp_rows = [r for r in ((_rpo_resolved or {}).get("opportunities") or []) if isinstance(r, dict)]
     _games_bpp = list((_bpp_resolved or {}).get("games") or [])
     _parlay_eligible_n = sum(1 for r in _opp_rows if r.get("eligible_for_parlay"))
@@ -2122,6 +2223,11 @@ def _render_ncaam_pocket_roi_view(games: list, selected_date: str) -> None:
             f"Pocket ROI **aligned to Select Date** `{_sel_date}` (leaderboard, ranked opportunities, and best-pocket-per-game "
             f"rebuilt in-session from current pocket view + this daily slate)."
         )
+    elif _pocket_board_mode == "precomputed":
+        st.caption(
+            f"Pocket ROI **aligned to Select Date** `{_sel_date}` (precomputed slate from the pocket slate lookup; "
+            f"same formulas as the in-session rebuild)."
+        )
     elif _lb_sf and _lb_slate and _lb_slate != _sel_date and _pocket_join_mode == "leaderboard_slate":
         st.warning(
             f"**Recommended Bet** uses the daily file for leaderboard slate **`{_lb_slate}`** (≠ **Select Date** `{_sel_date}`)."
@@ -2229,10 +2335,10 @@ def _render_ncaam_pocket_roi_view(games: list, selected_date: str) -> None:
                             r, _pocket_daily_by_id, join_mode=_pocket_join_mode
                         ),
                         "Pocket Type": _rpo_cell(r.get("pocket_type")),
-                        "Pocket Models": _rpo_models_col(r),
-                        "State Signature": _rpo_sig_cell(r),
-                        "ROI": _rpo_num(r.get("roi")),
-                        "Win Rate": _rpo_num(r.get("win_rate")),
+                        "Pocket Models": (r.get("display") or {}).get("models") or _rpo_models_col(r),
+                        "State Signature": (r.get("display") or {}).get("state_signature") or _rpo_sig_cell(r),
+                        "ROI": (r.get("display") or {}).get("roi") or _rpo_num(r.get("roi")),
+                        "Win Rate": (r.get("display") or {}).get("win_rate") or _rpo_num(r.get("win_rate")),
                         "Graded Games": r.get("graded_games") if r.get("graded_games") is not None else "—",
                         "Why": (r.get("reason") or "")[:280],
                         "Parlay Eligible": r.get("eligible_for_parlay"),
@@ -2240,6 +2346,11 @@ def _render_ncaam_pocket_roi_view(games: list, selected_date: str) -> None:
                     for r in _opp_display
                 ],
                 "ROI",
+                roi_signs=(
+                    [r["display"]["roi_sign"] for r in _opp_display]
+                    if all(isinstance(r.get("display"), dict) for r in _opp_display)
+                    else None
+                ),
             )
 
     with st.expander("Best pocket per game (secondary summary)", expanded=False):
@@ -2364,12 +2475,19 @@ def _render_ncaam_pocket_roi_view(games: list, selected_date: str) -> None:
         "not a substitute for authority logic. No bets placed or automated."
     )
 
-    _adm_rows, _adm_cap = _resolve_ncaam_pocket_slate_rows(
-        _ncaam_current_pockets_doc,
-        _ncaam_live_pockets_doc,
-        games,
-        selected_date,
-    )
+    if _lookup_entry is not None:
+        _adm_rows = list(_lookup_entry.get("slate_rows") or [])
+        _adm_cap = (
+            f"**Selected slate (**{str(selected_date).strip()}**):** **{len(_adm_rows)}** games from "
+            f"`ncaam_pocket_slate_lookup.json` (pre-joined by the pocket engine)."
+        )
+    else:
+        _adm_rows, _adm_cap = _resolve_ncaam_pocket_slate_rows(
+            _ncaam_current_pockets_doc,
+            _ncaam_live_pockets_doc,
+            games,
+            selected_date,
+        )
     _adm_bt = str((_ncaam_pockets_doc or {}).get("source_backtest_dir") or "")
     if _lb_sf:
         _adm_bt = str(_lb_sf.get("source_backtest_dir") or _adm_bt)
@@ -2702,6 +2820,28 @@ if _overlay_path.exists():
     except Exception:
         pass
 
+# --------------------------------------------------
+# CLV LINES (read-only): open / close per game_id from eng/clv/clv_engine.py
+# --------------------------------------------------
+_clv_lines_by_game_id = {}
+try:
+    from eng.clv.clv_engine import load_clv_lines
+
+    _clv_lines_by_game_id = (load_clv_lines(league.lower()) or {}).get("games") or {}
+except Exception:
+    pass
+
+# --------------------------------------------------
+# SIMILAR GAMES (read-only): per-game k-NN summary from eng/similarity/similar_games.py
+# --------------------------------------------------
+_similar_by_game_id = {}
+try:
+    from eng.similarity.similar_games import load_similar_slate
+
+    _similar_by_game_id = (load_similar_slate(league.lower()) or {}).get("games") or {}
+except Exception:
+    pass
+
 
 def _overlay_slate_date_from_source_artifact(overlay_root: dict) -> str | None:
     """Extract slate date (YYYY-MM-DD) from overlay source_artifact path. Returns None if missing or unparseable."""
@@ -2811,6 +2951,7 @@ with st.expander("🍀 KBX Bet Sizing System 🌵", expanded=False):
         kelly_rows = []
     else:
         kelly_rows = []
+        _kelly_bets = []
         for g in games:
             identity = g.get("identity", {})
             market = g.get("market_state", {})
@@ -2836,16 +2977,31 @@ with st.expander("🍀 KBX Bet Sizing System 🌵", expanded=False):
             total_pick = model.get("total_pick")
             models_allingment = model.get("confidence_tier")
 
-            full_kelly = calculate_full_kelly(regime_win_pct, KELLY_PAYOUT_RATIO)
-            bet_amount = round(current_bankroll * full_kelly)
-
-            if regime_name == "Total Sweet Spot":
-                if total_pick and total_line is not None:
-                    pick_text = f"{total_pick} ({total_line})"
-                elif total_pick:
-                    pick_text = f"{total_pick} (—)"
-                else:
-                    pick_text = "No Total Pick"
+            # One Kelly leg per market played; a Dual Sweet Spot game is a spread leg plus a
+            # total leg on the same game_id, sized as correlated legs by allocate_slate_kelly.
+            _game_key = identity.get("game_id") or f"{away}@{home}"
+            _markets = ["spread", "total"] if regime_name == "Dual Sweet Spot" and total_pick else (
+                ["total"] if regime_name == "Total Sweet Spot" else ["spread"]
+            )
+            for _market in _markets:
+                _kelly_bets.append({
+                    "win_probability": regime_win_pct,
+                    "market_odds": -110,
+                    "game_id": _game_key,
+                    "row": len(kelly_rows),
+                    "market": _market,
+                })
+
+            if total_pick and total_line is not None:
+                total_text = f"{total_pick} ({total_line})"
+            elif total_pick:
+                total_text = f"{total_pick} (—)"
+            else:
+                total_text = "No Total Pick"
+            if _markets == ["total"]:
+                pick_text = total_text
+            elif _markets == ["spread", "total"]:
+                pick_text = f"{format_spread_text(home, away, spread_line, spread_pick)} / {total_text}"
             else:
                 pick_text = format_spread_text(home, away, spread_line, spread_pick)
 
@@ -2853,10 +3009,18 @@ with st.expander("🍀 KBX Bet Sizing System 🌵", expanded=False):
                 "Game": format_matchup_short(away, home),
                 "Pick": pick_text,
                 "Regime": regime_name,
-                "Bet $": f"${bet_amount}",
+                "Bet $": None,
                 "Models Align": models_allingment,
             })
 
+        # Size the whole slate at once so simultaneous plays cannot over-allocate the bankroll.
+        _allocation = allocate_slate_kelly(_kelly_bets, current_bankroll, kelly_fraction=1.0)
+        _row_amounts = [0.0] * len(kelly_rows)
+        for _bet, _amount in zip(_kelly_bets, _allocation["amounts"]):
+            _row_amounts[_bet["row"]] += _amount
+        for _row, _amount in zip(kelly_rows, _row_amounts):
+            _row["Bet $"] = f"${round(_amount)}"
+
     st.markdown("### Suggested Bet Sizing")
 
     if kelly_rows:
@@ -2874,7 +3038,9 @@ with st.expander("🍀 KBX Bet Sizing System 🌵", expanded=False):
     st.markdown(
         "<sub>"
         f"1. Uses current bankroll (sidebar) = ${current_bankroll:,}. "
-        "2. Full Kelly shown using the historical win rate of the qualifying regime. "
+        "2. Full Kelly using the historical win rate of the qualifying regime, solved jointly across the slate "
+        "(simultaneous Kelly; a Dual Sweet Spot game's spread and total are correlated legs) and capped "
+        "per bet / per game / per slate by configs/runtime/bankroll.json. "
         "3. Historical win rate is context, not guarantee. "
         "4. Conservative mode should scale all bets evenly, such as 50% Kelly or 25% Kelly."
         "</sub>",
@@ -3120,6 +3286,21 @@ for g in games:
         _sl_disp = spread_line if spread_line is not None else "—"
         _tl_disp = total_line if total_line is not None else "—"
         st.write(f"Market: {_sl_disp} | Total {_tl_disp}")
+        _clv_entry = _clv_lines_by_game_id.get(str(g.get("canonical_game_id") or _game_id or "").strip())
+        if _clv_entry:
+            _open = _clv_entry.get("open") or {}
+            _close = _clv_entry.get("close") or {}
+            _dash = lambda v: v if v is not None else "—"
+            st.write(
+                f"Line move (open → close): {_dash(_open.get('spread_home'))} → {_dash(_close.get('spread_home'))}"
+                f" | Total {_dash(_open.get('total'))} → {_dash(_close.get('total'))}"
+            )
+        _sim = (_similar_by_game_id.get(str(g.get("canonical_game_id") or _game_id or "").strip()) or {}).get("summary")
+        if _sim and _sim.get("n"):
+            st.write(
+                f"Similar spots ({_sim['n']}): home covered {_sim['home_covers']}/{_sim['ats_decided']}"
+                f" | over {_sim['overs']}/{_sim['ou_decided']}"
+            )
         # Final box score: NCAAM post games only (same as zzz_0322-01-bookiex_dashboard.py).
         if league == "NCAAM" and str(g.get("status_state") or "").strip().lower() == "post":
             away_points = g.get("away_points")
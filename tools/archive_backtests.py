@@ -0,0 +1,82 @@
+"""
+archive_backtests.py
+
+Purpose
+-------
+Compress backtest_games.json in older backtest runs with the backtest_archive
+codec (utils/json_codec.py: compact + gzip by default, zstd via
+BOOKIEX_JSON_BACKTEST_ARCHIVE=compact+zstd when zstandard is installed).
+
+The newest --keep runs (by name) per league are left untouched, so every "latest
+backtest" reader keeps working on plain JSON. Readers pick the latest run by
+directory mtime, so each archived run dir gets its original mtime back (os.utime)
+and archiving never makes an old run look newest. Archived runs stay readable through
+json_codec.read_json / find_json (pocket_history.py scans them that way).
+Small per-run artifacts (summary, overlay performance, CSV) are not touched.
+
+Usage:
+  python tools/archive_backtests.py --league nba
+  python tools/archive_backtests.py --league all --keep 5 --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.io_helpers import get_backtest_output_root
+from utils.json_codec import compress_json_file
+from utils.run_log import log_info, set_silent
+
+BACKTEST_PREFIXES = ("backtest_", "walkforward_")
+DEFAULT_KEEP = 3
+
+
+def archive_league(league: str, *, keep: int = DEFAULT_KEEP, dry_run: bool = False) -> list[Path]:
+    """Compress backtest_games.json in all but the newest `keep` runs. Returns paths written."""
+    root = get_backtest_output_root(league)
+    if not root.exists():
+        return []
+    runs = sorted(
+        (d for d in root.iterdir() if d.is_dir() and d.name.startswith(BACKTEST_PREFIXES)),
+        key=lambda d: d.name,
+    )
+    old = runs[: max(len(runs) - keep, 0)]
+    written: list[Path] = []
+    for d in old:
+        path = d / "backtest_games.json"
+        if not path.exists():
+            continue  # already archived (or never written)
+        before = path.stat().st_size
+        if dry_run:
+            log_info(f"[{league}] would archive {d.name} ({before:,} bytes)")
+            continue
+        dir_stat = d.stat()
+        out = compress_json_file(path)
+        os.utime(d, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+        log_info(f"[{league}] {d.name}: {before:,} -> {out.stat().st_size:,} bytes ({out.name})")
+        written.append(out)
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compress backtest_games.json in older backtest runs.")
+    parser.add_argument("--league", choices=["nba", "ncaam", "all"], default="all")
+    parser.add_argument("--keep", type=int, default=DEFAULT_KEEP, help="Newest runs left uncompressed")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--silent", action="store_true")
+    args = parser.parse_args()
+    set_silent(args.silent)
+    leagues = ["nba", "ncaam"] if args.league == "all" else [args.league]
+    for league in leagues:
+        archive_league(league, keep=args.keep, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+check_import_budget.py
+
+Purpose
+-------
+Cold-start budget check for the CLI entry layer. Each target module is imported
+in a fresh interpreter under `python -X importtime`; the check fails (exit 1) when
+its cumulative import time exceeds the budget or it pulls in a heavy module
+(pandas, numpy, requests, ...). The end-to-end CLI command is also timed
+(wall clock, median of --runs) against --cli-budget-ms.
+
+Budgets are deliberately loose compared to a warm machine (~20 ms import here);
+the point is catching a top-level `import pandas` creeping back in, which costs
+hundreds of ms per subprocess launch.
+
+Usage:
+  python tools/diagnostics/check_import_budget.py
+  python tools/diagnostics/check_import_budget.py --target eng.daily.build_daily_view:400 --runs 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+HEAVY_MODULES = ("pandas", "numpy", "scipy", "sklearn", "requests", "streamlit", "matplotlib")
+
+# module -> cumulative import budget (ms)
+DEFAULT_TARGETS = {
+    "eng.cli.bookiex_cli": 150,
+}
+CLI_COMMAND = ["eng/cli/bookiex_cli.py", "action"]
+DEFAULT_CLI_BUDGET_MS = 1000
+DEFAULT_RUNS = 5
+
+
+def _import_profile(module: str) -> tuple[float, set[str]]:
+    """(cumulative import ms of module, top-level packages imported) from one cold interpreter."""
+    code = f"import sys; sys.path.insert(0, {str(PROJECT_ROOT)!r}); import {module}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        last = (proc.stderr.strip().splitlines() or ["?"])[-1]
+        raise RuntimeError(f"import {module} failed: {last}")
+    cumulative_us = None
+    imported: set[str] = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        imported.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(parts[1])
+    if cumulative_us is None:
+        raise RuntimeError(f"No importtime record for {module} (already imported by site?)")
+    return cumulative_us / 1000.0, imported
+
+
+def check_import(module: str, budget_ms: float, runs: int) -> bool:
+    samples, heavy = [], set()
+    for _ in range(runs):
+        try:
+            ms, imported = _import_profile(module)
+        except RuntimeError as e:
+            print(f"  [FAIL] {e}")
+            return False
+        samples.append(ms)
+        heavy |= imported.intersection(HEAVY_MODULES)
+    median = statistics.median(samples)
+    ok = median <= budget_ms and not heavy
+    status = "OK" if ok else "FAIL"
+    print(f"  [{status}] import {module}: {median:.1f} ms (budget {budget_ms:.0f} ms)")
+    if heavy:
+        print(f"         heavy modules at import: {', '.join(sorted(heavy))}")
+    return ok
+
+
+def check_cli(budget_ms: float, runs: int) -> bool:
+    samples = []
+    rc = 0
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        proc = subprocess.run([sys.executable, *CLI_COMMAND], cwd=PROJECT_ROOT, capture_output=True)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+        rc = proc.returncode
+    median = statistics.median(samples)
+    ok = median <= budget_ms
+    status = "OK" if ok else "FAIL"
+    note = "" if rc == 0 else f" (exit {rc}: no daily view here?)"
+    print(f"  [{status}] {' '.join(CLI_COMMAND)}: {median:.0f} ms wall (budget {budget_ms:.0f} ms){note}")
+    return ok
+
+
+def _parse_target(text: str) -> tuple[str, float]:
+    module, _, budget = text.partition(":")
+    return module, float(budget) if budget else 300.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fail when CLI cold start exceeds its import-time budget.")
+    parser.add_argument("--target", action="append", default=[], help="module[:budget_ms] (repeatable)")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--cli-budget-ms", type=float, default=DEFAULT_CLI_BUDGET_MS)
+    parser.add_argument("--skip-cli", action="store_true", help="Only check imports")
+    args = parser.parse_args()
+
+    targets = dict(DEFAULT_TARGETS)
+    targets.update(_parse_target(t) for t in args.target)
+
+    print("--- Import budget ---")
+    ok = True
+    for module, budget in targets.items():
+        ok &= check_import(module, budget, args.runs)
+    if not args.skip_cli:
+        ok &= check_cli(args.cli_budget_ms, args.runs)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+xxx_find_similar_games.py
+
+Print the k most similar historical games (eng/similarity/similar_games.py index)
+for one game or every game on a slate date, with their ATS / O-U outcomes.
+
+Builds the index first when it is missing; --refresh appends games finalized since
+the last build.
+
+Usage (from project root):
+  python tools/diagnostics/xxx_find_similar_games.py --league nba --date 2026-03-22
+  python tools/diagnostics/xxx_find_similar_games.py --league nba --game-id 0022500981 -k 15
+  python tools/diagnostics/xxx_find_similar_games.py --league ncaam --refresh
+
+Read-only apart from the similarity index itself.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from eng.similarity.similar_games import (
+    DEFAULT_K,
+    SimilarGamesIndex,
+    _game_date,
+    _game_id,
+    build_index,
+    summarize_neighbours,
+)
+from utils.datetime_bridge import get_default_target_slate_date
+from utils.io_helpers import load_game_state
+
+
+def _fmt(v) -> str:
+    return "—" if v is None else f"{v:g}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="k most similar historical games per slate game.")
+    parser.add_argument("--league", choices=["nba", "ncaam"], default="nba")
+    parser.add_argument("--date", type=str, default=None, help="Slate date YYYY-MM-DD (default: current slate)")
+    parser.add_argument("--game-id", type=str, default=None, help="Single game id (overrides --date)")
+    parser.add_argument("-k", type=int, default=DEFAULT_K, help=f"Neighbours per game (default {DEFAULT_K})")
+    parser.add_argument("--refresh", action="store_true", help="Append newly finalized games to the index first")
+    args = parser.parse_args()
+
+    games = load_game_state(args.league)
+    index = None if args.refresh else SimilarGamesIndex.load(args.league)
+    if index is None:
+        build_index(args.league, games=games)
+        index = SimilarGamesIndex.load(args.league)
+
+    if args.game_id:
+        targets = [g for g in games if _game_id(g) == args.game_id.strip()]
+    else:
+        day = args.date or get_default_target_slate_date()
+        targets = [g for g in games if _game_date(g) == day]
+    if not targets:
+        print("No matching games in game state.")
+        return
+
+    start = time.perf_counter()
+    results = index.query_many(targets, k=args.k)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    for g, neighbours in zip(targets, results):
+        s = summarize_neighbours(neighbours)
+        print(f"\n=== {g.get('away_team')} @ {g.get('home_team')} ({_game_date(g)}) [{_game_id(g)}] ===")
+        print(
+            f"Neighbours: {s['n']} | Home covered {s['home_covers']}/{s['ats_decided']}"
+            f" | Over {s['overs']}/{s['ou_decided']}"
+        )
+        print(f"{'Date':<12}{'Matchup':<44}{'Spread':<8}{'Total':<8}{'Margin':<8}{'Pts':<6}{'ATS':<6}{'O/U':<7}{'Dist':<7}")
+        print("-" * 106)
+        for n in neighbours:
+            matchup = f"{n['away_team']} @ {n['home_team']}"[:42]
+            print(
+                f"{n['game_date']:<12}{matchup:<44}{_fmt(n['spread_home']):<8}{_fmt(n['total']):<8}"
+                f"{_fmt(n['margin']):<8}{_fmt(n['points']):<6}{n['ats'] or '—':<6}{n['ou'] or '—':<7}{n['distance']:<7}"
+            )
+
+    print(f"\nIndex: {len(index)} games | {len(targets)} queries in {elapsed_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+tools/http_stub_server.py
+
+Purpose
+-------
+Local HTTP server that serves recorded cassettes (utils/http_client.py) so a LIVE
+pipeline can run offline against a real socket, e.g. to benchmark with controlled
+latency instead of cdn.nba.com / ESPN / Odds API round trips.
+
+Clients in BOOKIEX_HTTP_MODE=stub request
+  http://127.0.0.1:{port}/{scheme}/{host}{path}?{params}
+and the server looks up the cassette for {scheme}://{host}{path} + params.
+A miss returns 404 with header X-BookieX-Cassette: miss.
+
+Usage
+-----
+  python tools/http_stub_server.py
+  python tools/http_stub_server.py --port 8765 --latency-ms 50
+  BOOKIEX_HTTP_MODE=stub python 000_RUN_ALL_NBA.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.http_client import cassette_key, get_cassette_dir, load_cassette
+
+
+def make_handler(cassette_dir: Path, latency_sec: float, verbose: bool):
+    class CassetteHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            segments = parts.path.lstrip("/").split("/", 2)
+            if len(segments) < 2:
+                self._send(400, b"expected /{scheme}/{host}/{path}", {"Content-Type": "text/plain"})
+                return
+            scheme, host = segments[0], segments[1]
+            rest = "/" + segments[2] if len(segments) == 3 else ""
+            url = f"{scheme}://{host}{rest}"
+            params = dict(parse_qsl(parts.query, keep_blank_values=True))
+
+            cassette = load_cassette(url, cassette_key("GET", url, params), cassette_dir)
+            if latency_sec:
+                time.sleep(latency_sec)
+            if cassette is None:
+                self._send(404, f"no cassette for {url}".encode("utf-8"), {
+                    "Content-Type": "text/plain",
+                    "X-BookieX-Cassette": "miss",
+                })
+                return
+
+            headers = dict(cassette.get("headers") or {})
+            headers.setdefault("content-type", "application/json")
+            headers["X-BookieX-Cassette"] = "hit"
+            self._send(int(cassette.get("status_code") or 200), (cassette.get("body") or "").encode("utf-8"), headers)
+
+        def _send(self, status: int, body: bytes, headers: dict):
+            self.send_response(status)
+            for k, v in headers.items():
+                self.send_header(k, str(v))
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            if verbose:
+                super().log_message(fmt, *args)
+
+    return CassetteHandler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve recorded HTTP cassettes for offline pipeline runs.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cassette-dir", type=Path, default=None, help="Default: BOOKIEX_HTTP_CASSETTE_DIR or data/http_cassettes")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Artificial delay per request")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    cassette_dir = args.cassette_dir or get_cassette_dir()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(cassette_dir, args.latency_ms / 1000.0, args.verbose))
+    print(f"Serving cassettes from {cassette_dir} on http://{args.host}:{args.port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
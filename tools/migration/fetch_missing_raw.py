@@ -9,7 +9,8 @@ Task 1 – Build the True Universe:
   Validation: Print League | Season | Game Count; raise if any NBA season has 0 or < 800.
 
 Task 2 – Deep Audit:
-  Cross-reference universe against data/external/odds_api_raw.json (NBA) and NCAAM market folder.
+  Cross-reference universe against the NBA odds snapshot log (utils/odds_snapshot_log.py) and
+  NCAAM market folder.
   Identify Missing (no entry) or Empty (entry exists but bookmakers/outcomes empty).
 
 Task 3 – Staged Execution:
@@ -27,6 +28,7 @@ Usage:
   python tools/fetch_missing_raw.py --league ncaam --historical-start 2025-11-04 --historical-end 2026-03-01 --limit 1000
 
 Requires: ODDS_API_KEY in environment.
+Fetching goes through utils/odds_client.py (TTL cache, quota budget, bounded concurrency via --workers).
 """
 
 from __future__ import annotations
@@ -36,7 +38,6 @@ import json
 import os
 import re
 import sys
-import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -50,17 +51,10 @@ load_dotenv(PROJECT_ROOT / ".env")
 TARGET_SEASON_YEARS = (2023, 2024, 2025)
 CURRENT_SEASON = 2025  # Only this season triggers validation failure if missing
 NBA_MIN_GAMES_PER_SEASON = 800
-MASTER_ODDS_PATH = PROJECT_ROOT / "data" / "external" / "odds_api_raw.json"
 NCAAM_MARKET_RAW_DIR = PROJECT_ROOT / "data" / "ncaam" / "market" / "raw"
 TEMP_OUTPUT_PATH = PROJECT_ROOT / "data" / "temp_historical_odds.json"
 TEMP_NCAAM_OUTPUT_PATH = PROJECT_ROOT / "data" / "temp_ncaam_historical_odds.json"
 
-BASE_URL = "https://api.the-odds-api.com/v4/sports"
-HISTORICAL_BASE_URL = "https://api.the-odds-api.com/v4/historical/sports"
-MARKETS = "spreads,totals,h2h"
-REGIONS = "us"
-ODDS_FORMAT = "american"
-
 API_KEY = os.getenv("ODDS_API_KEY")
 if not API_KEY:
     raise RuntimeError("Missing ODDS_API_KEY. Set in .env or environment.")
@@ -380,14 +374,14 @@ def _validate_universe(nba_games: list, ncaam_games: list, league: str = "all")
 # -----------------------------------------------------------------------------
 
 def _load_nba_master_snapshots() -> list[dict]:
-    if not MASTER_ODDS_PATH.exists():
-        return []
+    """All NBA snapshots from the snapshot log (legacy odds_api_raw.json is imported on first use)."""
+    from utils.odds_snapshot_log import import_legacy, load_snapshots
+
+    import_legacy()
     try:
-        with open(MASTER_ODDS_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        return load_snapshots()
     except Exception:
         return []
-    return data if isinstance(data, list) else []
 
 
 def _audit_nba(snapshots: list) -> tuple[set[str], set[str]]:
@@ -453,37 +447,28 @@ def _audit_ncaam(ncaam_games: list, all_ids: set, non_empty_ids: set) -> tuple[s
 # -----------------------------------------------------------------------------
 
 def _fetch_events_list(sport_key: str) -> list:
-    import requests
-    url = f"{BASE_URL}/{sport_key}/events"
-    params = {"apiKey": API_KEY}
-    if sport_key == "basketball_ncaab":
-        params["dateFormat"] = "iso"
-    try:
-        r = requests.get(url, params=params, timeout=30)
-        r.raise_for_status()
-        out = r.json()
-        return out if isinstance(out, list) else []
-    except Exception:
-        return []
+    from utils.odds_client import get_odds_client
+    return get_odds_client().events_list(sport_key)
 
 
-def _fetch_event_odds(sport_key: str, event_id: str) -> dict | None:
-    import requests
-    url = f"{BASE_URL}/{sport_key}/events/{event_id}/odds"
-    params = {
-        "apiKey": API_KEY,
-        "markets": MARKETS,
-        "regions": REGIONS,
-        "oddsFormat": ODDS_FORMAT,
-    }
-    if sport_key == "basketball_ncaab":
-        params["dateFormat"] = "iso"
-    try:
-        r = requests.get(url, params=params, timeout=30)
-        r.raise_for_status()
-        return r.json()
-    except Exception:
-        return None
+def _fetch_event_odds_many(sport_key: str, batch: list, workers: int, label: str, every: int) -> list[dict]:
+    """batch: (event_id, game). Near-tipoff first, bounded concurrency, shared quota budget; keeps batch order."""
+    from utils.odds_client import get_odds_client
+
+    client = get_odds_client()
+
+    def _progress(done: int, total: int) -> None:
+        if done % every == 0 or done == total:
+            print(f"  {label}fetched {done}/{total}")
+
+    def _commence(g: dict) -> str | None:
+        return g.get("commence_time") or g.get("game_time_utc") or g.get("game_date")
+
+    by_id = client.fetch_event_odds_many(
+        sport_key, [(eid, _commence(g or {})) for eid, g in batch], max_workers=workers, on_progress=_progress
+    )
+    print(f"  {client.summary()}")
+    return [by_id[eid] for eid, _ in batch if by_id.get(eid)]
 
 
 def _build_event_key_to_id_nba(events: list) -> dict[tuple[str, str, str], str]:
@@ -532,16 +517,7 @@ def _dates_with_data_in_master() -> set[str]:
     games with at least one active market (spread/total). Dates with 0 or few games are treated as Missing.
     """
     date_counts = {}
-    if not MASTER_ODDS_PATH.exists():
-        return set()
-    try:
-        with open(MASTER_ODDS_PATH, "r", encoding="utf-8") as f:
-            snapshots = json.load(f)
-    except Exception:
-        return set()
-    if not isinstance(snapshots, list):
-        return set()
-    for snap in snapshots:
+    for snap in _load_nba_master_snapshots():
         if not isinstance(snap, dict):
             continue
         for g in snap.get("data") or []:
@@ -583,21 +559,8 @@ def _fetch_historical_odds_for_date(sport_key: str, date_iso: str) -> dict | Non
     Call v4/historical/sports/{sport}/odds for the given date (ISO8601, e.g. 2025-10-22T12:00:00Z).
     Returns the raw response dict (has 'data' array of events) or None on failure.
     """
-    import requests
-    url = f"{HISTORICAL_BASE_URL}/{sport_key}/odds"
-    params = {
-        "apiKey": API_KEY,
-        "regions": REGIONS,
-        "markets": MARKETS,
-        "oddsFormat": ODDS_FORMAT,
-        "date": date_iso,
-    }
-    try:
-        r = requests.get(url, params=params, timeout=30)
-        r.raise_for_status()
-        return r.json()
-    except Exception:
-        return None
+    from utils.odds_client import get_odds_client
+    return get_odds_client().historical_odds(sport_key, date_iso)
 
 
 def crawl_historical_gap(
@@ -606,6 +569,7 @@ def crawl_historical_gap(
     end_date: str,
     skip_dates_with_data: bool = True,
     limit_games: int | None = None,
+    workers: int = 4,
 ) -> tuple[list[dict], int, int]:
     """
     Fetch historical odds for each day from start_date to end_date (inclusive).
@@ -613,6 +577,7 @@ def crawl_historical_gap(
     Returns (list of game dicts from all fetched snapshots, count_skipped_by_guard, count_fetched).
     Token guard: only skips a date if master has >= MIN_GAMES_PER_DATE_TO_SKIP non-empty games (force-heal empty dates).
     limit_games: if set, stop after collecting this many games (e.g. 1000 for sprints).
+    workers: dates fetched concurrently per window (utils/odds_client quota budget applies).
     """
     try:
         start = datetime.strptime(start_date.strip()[:10], "%Y-%m-%d")
@@ -629,27 +594,32 @@ def crawl_historical_gap(
         )
     else:
         dates_with_data = set()
-    all_games = []
     skipped = 0
-    fetched = 0
+    date_isos = []
     current = start
     while current <= end:
-        if limit_games is not None and len(all_games) >= limit_games:
-            break
         date_str = current.strftime("%Y-%m-%d")
         if date_str in dates_with_data:
             skipped += 1
-            current += timedelta(days=1)
-            continue
-        date_iso = f"{date_str}T12:00:00Z"
-        resp = _fetch_historical_odds_for_date(sport_key, date_iso)
+        else:
+            date_isos.append(f"{date_str}T12:00:00Z")
+        current += timedelta(days=1)
+
+    from utils.odds_client import get_odds_client
+
+    def _limit_hit(responses: list[dict]) -> bool:
+        if limit_games is None:
+            return False
+        return sum(len(r.get("data") or []) for r in responses if isinstance(r.get("data"), list)) >= limit_games
+
+    all_games = []
+    fetched = 0
+    for _, resp in get_odds_client().fetch_historical_many(sport_key, date_isos, max_workers=workers, stop=_limit_hit):
+        if limit_games is not None and len(all_games) >= limit_games:
+            break
         if resp and isinstance(resp.get("data"), list) and len(resp["data"]) > 0:
             all_games.extend(resp["data"])
             fetched += 1
-            if limit_games is not None and len(all_games) >= limit_games:
-                break
-        current += timedelta(days=1)
-        time.sleep(0.3)
     return all_games, skipped, fetched
 
 
@@ -662,9 +632,9 @@ def _run_historical_nba(
     historical_start: str | None,
     historical_end: str | None,
     limit_games: int | None = None,
+    workers: int = 4,
 ) -> None:
     """Fetch NBA historical odds for a single date or a date range; write to temp_historical_odds.json."""
-    MASTER_ODDS_PATH.parent.mkdir(parents=True, exist_ok=True)
     PROJECT_ROOT.joinpath("data").mkdir(parents=True, exist_ok=True)
     sport_key = "basketball_nba"
     dates_covered = _dates_with_data_in_master()
@@ -684,7 +654,7 @@ def _run_historical_nba(
     elif historical_start and historical_end:
         all_games, skipped, fetched = crawl_historical_gap(
             sport_key, historical_start, historical_end,
-            skip_dates_with_data=True, limit_games=limit_games,
+            skip_dates_with_data=True, limit_games=limit_games, workers=workers,
         )
         print(f"Historical gap {historical_start} to {historical_end}: skipped {skipped} dates (token guard), fetched {fetched} dates, {len(all_games)} total games.")
     else:
@@ -707,6 +677,7 @@ def _run_historical_ncaam(
     historical_start: str,
     historical_end: str,
     limit_games: int | None = None,
+    workers: int = 4,
 ) -> None:
     """Fetch NCAAM historical odds for date range; write to temp_ncaam_historical_odds.json. Token guard: skip only dates with >= 5 non-empty games."""
     PROJECT_ROOT.joinpath("data").mkdir(parents=True, exist_ok=True)
@@ -715,7 +686,7 @@ def _run_historical_ncaam(
 
     all_games, skipped, fetched = crawl_historical_gap(
         sport_key, historical_start, historical_end,
-        skip_dates_with_data=True, limit_games=limit_games,
+        skip_dates_with_data=True, limit_games=limit_games, workers=workers,
     )
     print(f"NCAAM historical {historical_start} to {historical_end}: skipped {skipped} dates (token guard), fetched {fetched} dates, {len(all_games)} games.")
 
@@ -738,6 +709,7 @@ def main(
     historical_date: str | None = None,
     historical_start: str | None = None,
     historical_end: str | None = None,
+    workers: int = 4,
 ) -> None:
     # Historical path: no live events list, use v4/historical/.../odds only
     if historical_date or (historical_start and historical_end):
@@ -745,16 +717,15 @@ def main(
         if league_hist == "ncaam":
             if not (historical_start and historical_end):
                 raise ValueError("NCAAM historical requires --historical-start and --historical-end (no single-date mode).")
-            _run_historical_ncaam(historical_start, historical_end, limit_games=limit)
+            _run_historical_ncaam(historical_start, historical_end, limit_games=limit, workers=workers)
         else:
-            _run_historical_nba(historical_date, historical_start, historical_end, limit_games=limit)
+            _run_historical_nba(historical_date, historical_start, historical_end, limit_games=limit, workers=workers)
         return
 
     league = (league or "all").strip().lower()
     if league not in ("nba", "ncaam", "all"):
         raise ValueError("--league must be nba, ncaam, or all")
 
-    MASTER_ODDS_PATH.parent.mkdir(parents=True, exist_ok=True)
     PROJECT_ROOT.joinpath("data").mkdir(parents=True, exist_ok=True)
 
     # ----- Task 1: Build true universe (aggregate all sources) -----
@@ -861,13 +832,7 @@ def main(
         if league == "nba" and limit is not None and len(nba_to_fetch) > limit:
             print(f"\nNBA: Applying --limit {limit}; fetching {len(nba_batch)} of {len(nba_to_fetch)}.")
         print(f"\nFetching {len(nba_batch)} NBA events...")
-        for i, (eid, _) in enumerate(nba_batch):
-            odds = _fetch_event_odds("basketball_nba", eid)
-            if odds:
-                pulled.append(odds)
-            if (i + 1) % 10 == 0:
-                print(f"  Fetched {i + 1}/{len(nba_batch)}")
-            time.sleep(0.2)
+        pulled = _fetch_event_odds_many("basketball_nba", nba_batch, workers, "", 10)
     elif league in ("nba", "all"):
         print("No NBA games to fetch (Missing or Empty); writing empty temp file.")
 
@@ -890,14 +855,7 @@ def main(
         if limit is not None and len(ncaam_to_fetch) > limit:
             print(f"\nNCAAM: Applying --limit {limit}; fetching {len(ncaam_batch)} of {len(ncaam_to_fetch)}.")
         print(f"\nFetching {len(ncaam_batch)} NCAAM events...")
-        ncaam_pulled = []
-        for i, (eid, _) in enumerate(ncaam_batch):
-            odds = _fetch_event_odds("basketball_ncaab", eid)
-            if odds:
-                ncaam_pulled.append(odds)
-            if (i + 1) % 50 == 0 or (i + 1) == len(ncaam_batch):
-                print(f"  NCAAM fetched {i + 1}/{len(ncaam_batch)}")
-            time.sleep(0.2)
+        ncaam_pulled = _fetch_event_odds_many("basketball_ncaab", ncaam_batch, workers, "NCAAM ", 50)
         ncaam_payload = {
             "captured_at_utc": __import__("datetime").datetime.now(__import__("datetime").timezone.utc).isoformat(),
             "sport": "basketball_ncaab",
@@ -920,6 +878,7 @@ def _parse_args() -> argparse.Namespace:
     p.add_argument("--historical-date", type=str, default=None, metavar="YYYY-MM-DD", help="Fetch historical NBA odds for this single date (v4/historical/.../odds).")
     p.add_argument("--historical-start", type=str, default=None, metavar="YYYY-MM-DD", help="Start date for historical gap crawl (use with --historical-end).")
     p.add_argument("--historical-end", type=str, default=None, metavar="YYYY-MM-DD", help="End date for historical gap crawl (use with --historical-start).")
+    p.add_argument("--workers", type=int, default=4, help="Concurrent Odds API requests (quota-bounded, near-tipoff first).")
     return p.parse_args()
 
 
@@ -931,4 +890,5 @@ if __name__ == "__main__":
         historical_date=args.historical_date,
         historical_start=args.historical_start,
         historical_end=args.historical_end,
+        workers=args.workers,
     )
@@ -3,13 +3,15 @@ tools/merge_and_heal.py
 
 Staged Recovery – Merge: Heal empty records in master with temp pull, then archive temp.
 
-- Safe Merge Rule: Load current master (data/external/odds_api_raw.json) and
-  data/temp_historical_odds.json. Optionally load data/temp_ncaam_historical_odds.json.
+- Safe Merge Rule: Load current master (the NBA odds snapshot log, utils/odds_snapshot_log.py)
+  and data/temp_historical_odds.json. Optionally load data/temp_ncaam_historical_odds.json.
 - NBA: (1) Heal empty records in master with temp pull; do not overwrite populated data.
   (2) Append logic: any game in temp whose id does NOT exist in the master is appended
-  (no duplicates). (3) After merge, sort master by commence_time.
-  (4) Phase 2: Write merged snapshot to data/nba/raw/odds_master_nba.json so the NBA
-  pipeline (f_gen_041) uses 3-season paid history and graded count can exceed 2,000.
+  (no duplicates). (3) Healed + appended games are appended to the snapshot log as one
+  snapshot (the log is never rewritten), so 031's token guard sees them.
+  (4) Phase 2: Write merged snapshot (sorted by commence_time) to
+  data/nba/raw/odds_master_nba.json so the NBA pipeline (f_gen_041) uses 3-season paid
+  history and graded count can exceed 2,000.
 - NCAAM: If temp_ncaam exists, add its games to data/ncaam/market/raw/ in a new
   timestamped file, skipping any event already present with non-empty data (no overwrite).
 - Cleanup: Archive temp file(s) after merge.
@@ -27,7 +29,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
-MASTER_ODDS_PATH = PROJECT_ROOT / "data" / "external" / "odds_api_raw.json"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 # NBA pipeline (f_gen_041) reads from data/nba/raw/odds_master_nba.json when present
 NBA_ODDS_MASTER_PATH = PROJECT_ROOT / "data" / "nba" / "raw" / "odds_master_nba.json"
 TEMP_ODDS_PATH = PROJECT_ROOT / "data" / "temp_historical_odds.json"
@@ -64,13 +67,12 @@ def is_game_empty(game: dict) -> bool:
 
 
 def load_master() -> list[dict]:
-    if not MASTER_ODDS_PATH.exists():
-        raise SystemExit(f"Master file not found: {MASTER_ODDS_PATH}")
-    with open(MASTER_ODDS_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    if not isinstance(data, list):
-        raise SystemExit("Master file must be a JSON array of snapshots.")
-    return data
+    from utils.odds_snapshot_log import SNAPSHOT_LOG_DIR, has_log, import_legacy, load_snapshots
+
+    import_legacy()
+    if not has_log():
+        raise SystemExit(f"Odds snapshot log not found: {SNAPSHOT_LOG_DIR}")
+    return load_snapshots()
 
 
 def load_temp() -> dict:
@@ -132,6 +134,7 @@ def main() -> None:
 
         count_before = count_master_games(master)
         healed = 0
+        healed_games = {}
         for snap in master:
             if not isinstance(snap, dict):
                 continue
@@ -148,6 +151,7 @@ def main() -> None:
                 if replacement is None:
                     continue
                 data[i] = dict(replacement)
+                healed_games[gid] = data[i]
                 healed += 1
 
         # Append logic: games in temp whose id does NOT exist in master (dedupe by id)
@@ -178,6 +182,7 @@ def main() -> None:
                 "description": temp.get("description", "fetch_missing_raw_historical"),
                 "data": to_append,
             })
+        log_games = list(healed_games.values()) + to_append
 
         count_after = count_master_games(master)
         if count_after < count_before:
@@ -203,15 +208,22 @@ def main() -> None:
             "data": all_games,
         }
         master_payload = [merged_snapshot]
-        MASTER_ODDS_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(MASTER_ODDS_PATH, "w", encoding="utf-8") as f:
-            json.dump(master_payload, f, indent=2)
+        if log_games:
+            from utils.odds_snapshot_log import append_snapshot
+
+            append_snapshot({
+                "captured_at_utc": datetime.now(timezone.utc).isoformat(),
+                "sport": temp.get("sport", "basketball_nba"),
+                "source": temp.get("source", "the_odds_api"),
+                "description": temp.get("description", "fetch_missing_raw_historical"),
+                "data": log_games,
+            })
         # Phase 2: write same merged snapshot to NBA pipeline master so graded count can exceed 2,000
         NBA_ODDS_MASTER_PATH.parent.mkdir(parents=True, exist_ok=True)
         with open(NBA_ODDS_MASTER_PATH, "w", encoding="utf-8") as f:
             json.dump(master_payload, f, indent=2)
         print(f"NBA: Healed {healed} empty records, appended {appended} new games. Master sorted by commence_time.")
-        print(f"  Written to {MASTER_ODDS_PATH} and {NBA_ODDS_MASTER_PATH} (pipeline will use latter for >2,000 graded).")
+        print(f"  Appended {len(log_games)} games to the odds snapshot log; merged master written to {NBA_ODDS_MASTER_PATH}.")
         ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
         ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         archive_path = ARCHIVE_DIR / f"temp_historical_odds_{ts}.json"
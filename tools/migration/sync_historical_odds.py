@@ -6,14 +6,18 @@ Historical odds backfill for 2023-24, 2024-25, and 2025-26 seasons (NBA + NCAAM)
 Step 1 (Universe): Filter raw schedule files for games with season_type or season_year
   matching these three cycles.
 Step 2 (Audit): Use Token Guard to find games in those seasons that are missing from
-  data/external/odds_api_raw.json (NBA) or data/ncaam/market/raw/ (NCAAM).
-Step 3 (Historical Fetch): Fetch missing events via paid API and append to existing
-  JSON ledgers (no overwrite).
+  the NBA odds snapshot log (utils/odds_snapshot_log.py) or data/ncaam/market/raw/ (NCAAM).
+Step 3 (Historical Fetch): Fetch missing events via paid API and append to the
+  snapshot log (NBA) / existing JSON ledgers (NCAAM); nothing is overwritten.
 
 Usage:
   python tools/sync_historical_odds.py --league nba
   python tools/sync_historical_odds.py --league ncaam
   python tools/sync_historical_odds.py --league both
+  python tools/sync_historical_odds.py --league nba --workers 8
+
+Fetching goes through utils/odds_client.py (TTL cache, quota budget, near-tipoff-first
+ordering, bounded concurrency).
 
 Requires: ODDS_API_KEY in environment (paid key for historical event-odds calls).
 """
@@ -39,11 +43,6 @@ load_dotenv(PROJECT_ROOT / ".env")
 # Target seasons: 2023-24, 2024-25, 2025-26 (season start year)
 TARGET_SEASON_YEARS = (2023, 2024, 2025)
 
-BASE_URL = "https://api.the-odds-api.com/v4/sports"
-MARKETS = "spreads,totals,h2h"
-REGIONS = "us"
-ODDS_FORMAT = "american"
-
 API_KEY = os.getenv("ODDS_API_KEY")
 if not API_KEY:
     raise RuntimeError("Missing ODDS_API_KEY. Set in .env or environment.")
@@ -252,32 +251,12 @@ def _load_ncaam_universe() -> list[dict]:
 # Step 2: Audit (existing odds + token guard)
 # -----------------------------------------------------------------------------
 
-def _load_existing_nba(project_root: Path) -> tuple[list, set[str], set[tuple[str, str]]]:
-    """Return (snapshots, have_event_ids, past_set for token guard)."""
-    path = project_root / "data" / "external" / "odds_api_raw.json"
-    snapshots = []
-    have_event_ids = set()
-    past_set = set()
-    now = _now_utc()
-    if not path.exists():
-        return [], set(), set()
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            snapshots = json.load(f)
-    except Exception:
-        return [], set(), set()
-    if not isinstance(snapshots, list):
-        return [], set(), set()
-    for snap in snapshots:
-        for g in (snap.get("data") or []) if isinstance(snap, dict) else []:
-            eid = (g.get("id") or "").strip()
-            if eid:
-                have_event_ids.add(eid)
-            ct = g.get("commence_time")
-            ct_dt = _parse_commence(ct)
-            if ct_dt is not None and ct_dt < now:
-                past_set.add((eid, str(ct) if ct else ""))
-    return snapshots, have_event_ids, past_set
+def _load_existing_nba(project_root: Path) -> tuple[set[str], set[tuple[str, str]]]:
+    """Return (have_event_ids, past_set for token guard) from the snapshot log index."""
+    from utils.odds_snapshot_log import logged_game_keys, past_game_keys
+
+    have_event_ids = {eid for eid, _ in logged_game_keys() if eid}
+    return have_event_ids, past_game_keys(_now_utc())
 
 
 def _load_existing_ncaam(project_root: Path) -> tuple[list[dict], set[str], set[tuple[str, str]]]:
@@ -324,42 +303,26 @@ def _token_guard_skip(game_id: str, commence_time: str | None, past_set: set[tup
 # -----------------------------------------------------------------------------
 
 def _fetch_events_list(sport_key: str) -> list:
-    import requests
-    url = f"{BASE_URL}/{sport_key}/events"
-    params = {"apiKey": API_KEY}
-    if sport_key == "basketball_ncaab":
-        params["dateFormat"] = "iso"
-    try:
-        r = requests.get(url, params=params, timeout=30)
-        r.raise_for_status()
-        out = r.json()
-        return out if isinstance(out, list) else []
-    except Exception:
-        return []
+    from utils.odds_client import get_odds_client
+    return get_odds_client().events_list(sport_key)
 
 
-def _fetch_event_odds(sport_key: str, event_id: str):
-    import requests
-    url = f"{BASE_URL}/{sport_key}/events/{event_id}/odds"
-    params = {
-        "apiKey": API_KEY,
-        "markets": MARKETS,
-        "regions": REGIONS,
-        "oddsFormat": ODDS_FORMAT,
-    }
-    if sport_key == "basketball_ncaab":
-        params["dateFormat"] = "iso"
-    try:
-        r = requests.get(url, params=params, timeout=30)
-        r.raise_for_status()
-        return r.json()
-    except Exception:
-        return None
+def _fetch_event_odds_many(sport_key: str, missing: list, workers: int) -> dict[str, dict]:
+    """missing: (event_id, commence, game). Near-tipoff first, bounded concurrency, shared quota budget."""
+    from utils.odds_client import get_odds_client
 
+    client = get_odds_client()
+
+    def _progress(done: int, total: int) -> None:
+        if done % 10 == 0 or done == total:
+            print(f"  Fetched {done}/{total}")
+
+    out = client.fetch_event_odds_many(
+        sport_key, [(eid, commence) for eid, commence, _ in missing], max_workers=workers, on_progress=_progress
+    )
+    print(f"  {client.summary()}")
+    return out
 
-# -----------------------------------------------------------------------------
-# Run: NBA
-# -----------------------------------------------------------------------------
 
 def _build_event_key_to_id_nba(events: list) -> dict[tuple[str, str, str], str]:
     """(norm_date, norm_home, norm_away) -> event_id."""
@@ -377,18 +340,18 @@ def _build_event_key_to_id_nba(events: list) -> dict[tuple[str, str, str], str]:
     return key_to_id
 
 
-def run_nba() -> None:
+def run_nba(workers: int = 4) -> None:
     sport_key = "basketball_nba"
-    json_path = PROJECT_ROOT / "data" / "external" / "odds_api_raw.json"
-    json_path.parent.mkdir(parents=True, exist_ok=True)
+    from utils.odds_snapshot_log import SNAPSHOT_LOG_DIR, append_snapshot
 
     universe = _load_nba_universe()
     print(f"[NBA] Universe (target seasons {TARGET_SEASON_YEARS}): {len(universe)} games")
 
-    snapshots, have_event_ids, past_set = _load_existing_nba(PROJECT_ROOT)
-    print(f"[NBA] Existing snapshots: {len(snapshots)}; events already have odds: {len(have_event_ids)}")
+    have_event_ids, past_set = _load_existing_nba(PROJECT_ROOT)
+    print(f"[NBA] Events already have odds: {len(have_event_ids)}")
 
     events = _fetch_events_list(sport_key)
+    commence_by_id = {(ev.get("id") or "").strip(): ev.get("commence_time") for ev in events}
     event_key_to_id = _build_event_key_to_id_nba(events)
 
     missing = []
@@ -402,11 +365,7 @@ def run_nba() -> None:
             continue
         if eid in have_event_ids:
             continue
-        commence = None
-        for ev in events:
-            if (ev.get("id") or "").strip() == eid:
-                commence = ev.get("commence_time")
-                break
+        commence = commence_by_id.get(eid)
         if _token_guard_skip(eid, commence, past_set):
             continue
         missing.append((eid, commence, g))
@@ -416,18 +375,15 @@ def run_nba() -> None:
         return
 
     print(f"[NBA] Fetching odds for {len(missing)} missing events (append to ledger)...")
-    import time
+    odds_by_id = _fetch_event_odds_many(sport_key, missing, workers)
     new_games = []
-    for i, (eid, commence, g) in enumerate(missing):
-        odds = _fetch_event_odds(sport_key, eid)
+    for eid, commence, g in missing:
+        odds = odds_by_id.get(eid)
         if odds:
             new_games.append(odds)
             have_event_ids.add(eid)
             if commence:
                 past_set.add((eid, str(commence)))
-        if (i + 1) % 10 == 0:
-            print(f"  Fetched {i + 1}/{len(missing)}")
-        time.sleep(0.2)
 
     if not new_games:
         print("[NBA] No odds returned from API.")
@@ -442,10 +398,8 @@ def run_nba() -> None:
         "description": "historical_backfill",
         "data": new_games,
     }
-    snapshots.append(new_snapshot)
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(snapshots, f, indent=2)
-    print(f"[NBA] Appended 1 snapshot ({len(new_games)} games) to {json_path}")
+    append_snapshot(new_snapshot)
+    print(f"[NBA] Appended 1 snapshot ({len(new_games)} games) to {SNAPSHOT_LOG_DIR}")
 
 
 # -----------------------------------------------------------------------------
@@ -467,7 +421,7 @@ def _build_event_key_to_id_ncaam(events: list) -> dict[tuple[str, str, str], str
     return key_to_id
 
 
-def run_ncaam() -> None:
+def run_ncaam(workers: int = 4) -> None:
     from configs.leagues.league_ncaam import (
         ODDS_RAW_LATEST_PATH,
         MARKET_RAW_DIR,
@@ -484,6 +438,7 @@ def run_ncaam() -> None:
     print(f"[NCAAM] Existing raw files: {len(snapshots)}; events already have odds: {len(have_event_ids)}")
 
     events = _fetch_events_list(sport_key)
+    commence_by_id = {(ev.get("id") or "").strip(): ev.get("commence_time") for ev in events}
     event_key_to_id = _build_event_key_to_id_ncaam(events)
 
     missing = []
@@ -497,11 +452,7 @@ def run_ncaam() -> None:
             continue
         if eid in have_event_ids:
             continue
-        commence = None
-        for ev in events:
-            if (ev.get("id") or "").strip() == eid:
-                commence = ev.get("commence_time")
-                break
+        commence = commence_by_id.get(eid)
         if _token_guard_skip(eid, commence, past_set):
             continue
         missing.append((eid, commence, g))
@@ -511,18 +462,15 @@ def run_ncaam() -> None:
         return
 
     print(f"[NCAAM] Fetching odds for {len(missing)} missing events (append to ledger)...")
-    import time
+    odds_by_id = _fetch_event_odds_many(sport_key, missing, workers)
     new_games = []
-    for i, (eid, commence, g) in enumerate(missing):
-        odds = _fetch_event_odds(sport_key, eid)
+    for eid, commence, g in missing:
+        odds = odds_by_id.get(eid)
         if odds:
             new_games.append(odds)
             have_event_ids.add(eid)
             if commence:
                 past_set.add((eid, str(commence)))
-        if (i + 1) % 10 == 0:
-            print(f"  Fetched {i + 1}/{len(missing)}")
-        time.sleep(0.2)
 
     if not new_games:
         print("[NCAAM] No odds returned from API.")
@@ -560,12 +508,13 @@ def main() -> None:
     import argparse
     parser = argparse.ArgumentParser(description="Historical odds backfill (2023-24, 2024-25, 2025-26)")
     parser.add_argument("--league", choices=["nba", "ncaam", "both"], default="both")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent event-odds requests (quota-bounded)")
     args = parser.parse_args()
 
     if args.league in ("nba", "both"):
-        run_nba()
+        run_nba(workers=args.workers)
     if args.league in ("ncaam", "both"):
-        run_ncaam()
+        run_ncaam(workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -58,6 +58,7 @@ def main():
         "data/nba/backtests/*/nba_best_pocket_per_game.json",
         "data/nba/backtests/*/nba_ranked_pocket_opportunities.json",
         "data/nba/backtests/*/nba_pocket_leaderboard_validation.json",
+        "data/nba/backtests/*/nba_pocket_slate_lookup.json",
         "data/ncaam/backtests/*/ncaam_model_pockets.json",
         "data/ncaam/backtests/*/ncaam_model_combo_pockets.json",
         "data/ncaam/backtests/*/ncaam_current_game_pocket_view.json",
@@ -66,6 +67,7 @@ def main():
         "data/ncaam/backtests/*/ncaam_best_pocket_per_game.json",
         "data/ncaam/backtests/*/ncaam_ranked_pocket_opportunities.json",
         "data/ncaam/backtests/*/ncaam_pocket_leaderboard_validation.json",
+        "data/ncaam/backtests/*/ncaam_pocket_slate_lookup.json",
     ):
         if list(PROJECT_ROOT.glob(_glob)):
             run_command(f"git add -f {_glob}")
@@ -76,6 +78,10 @@ def main():
         "eng/execution/build_nba_pocket_leaderboard_validation.py",
         "eng/execution/build_ncaam_model_pockets.py",
         "eng/execution/build_ncaam_pocket_leaderboard_validation.py",
+        "eng/pockets/__init__.py",
+        "eng/pockets/league_adapters.py",
+        "eng/pockets/pocket_engine.py",
+        "eng/pockets/pocket_validation.py",
         "utils/io_helpers.py",
         "assets/RS_JP_BookieX_v02.png",
         "assets/RS_JP_BookieX_v04_COLLEGE.png",
@@ -1,10 +1,14 @@
-"""Verify domain isolation: scripts find data in data/nba/ and data/ncaam/ parallel layout."""
+"""Verify domain isolation: scripts find data in data/nba/ and data/ncaam/ parallel layout.
+
+Also provides a write-set check for concurrent league runs: snapshot the data tree
+before and after, then confirm every changed file sits under a league-owned root.
+"""
 import os
 import sys
 from pathlib import Path
 
 # Project root
-ROOT = Path(__file__).resolve().parent
+ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
@@ -77,6 +81,110 @@ def check_isolation():
     return ok
 
 
+# Roots each league pipeline is allowed to write. data/external/ is NBA-only (odds
+# snapshot log, odds_api_current.csv) apart from the shared roots below.
+LEAGUE_WRITE_ROOTS = {
+    "nba": (ROOT / "data" / "nba", ROOT / "data" / "external"),
+    "ncaam": (ROOT / "data" / "ncaam",),
+}
+
+# Roots both leagues write (one Odds API key, one HTTP cassette store). Files here are
+# attributed to a league by the request URL stored in the file, not by directory.
+SHARED_WRITE_ROOTS = (
+    ROOT / "data" / "external" / "odds_api_cache",  # utils/odds_client.py TTL cache
+    ROOT / "data" / "http_cassettes",               # utils/http_client.py record mode
+)
+# League-neutral shared state (the Odds API quota is per key, not per league).
+SHARED_NEUTRAL_FILES = ("quota.json",)
+
+# URL fragments that identify the league of a cached / recorded request.
+LEAGUE_URL_MARKERS = {
+    "nba": ("basketball_nba", "/basketball/nba", "nba.com/"),
+    "ncaam": ("basketball_ncaab", "mens-college-basketball", "ncaa.com/"),
+}
+
+
+def snapshot_data_tree(data_root: Path | None = None) -> dict[str, tuple[int, int]]:
+    """Return {relative path: (mtime_ns, size)} for every file under data/."""
+    data_root = data_root or (ROOT / "data")
+    snap: dict[str, tuple[int, int]] = {}
+    if not data_root.exists():
+        return snap
+    for dirpath, _dirnames, filenames in os.walk(data_root):
+        for name in filenames:
+            fp = Path(dirpath) / name
+            try:
+                st = fp.stat()
+            except OSError:
+                continue
+            snap[str(fp.relative_to(ROOT))] = (st.st_mtime_ns, st.st_size)
+    return snap
+
+
+def changed_paths(before: dict, after: dict) -> list[str]:
+    """Paths created or modified between two snapshot_data_tree() results."""
+    return sorted(p for p, sig in after.items() if before.get(p) != sig)
+
+
+def shared_file_league(path: Path) -> str | None:
+    """
+    League a shared-root file belongs to: "shared" for league-neutral state, else read
+    from the "url" field that cache entries and cassettes store. None when unknown.
+    """
+    if path.name in SHARED_NEUTRAL_FILES:
+        return "shared"
+    import json
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            url = str((json.load(f) or {}).get("url") or "")
+    except (OSError, ValueError, AttributeError):
+        return None
+    owners = [lg for lg, markers in LEAGUE_URL_MARKERS.items() if any(m in url for m in markers)]
+    return owners[0] if len(owners) == 1 else None
+
+
+def check_write_isolation(
+    before: dict,
+    after: dict,
+    leagues: tuple[str, ...] = ("nba", "ncaam"),
+) -> tuple[bool, list[str]]:
+    """
+    Verify a (concurrent) league run kept to its own trees.
+
+    Every changed file must live under the write roots of a league that ran, and
+    league-named files must not appear under the other league's roots. Files under
+    SHARED_WRITE_ROOTS are attributed by content (shared_file_league) and must belong
+    to a league that ran (or be league-neutral). Returns (ok, violations).
+    """
+    violations: list[str] = []
+    for rel in changed_paths(before, after):
+        abs_path = ROOT / rel
+        if any(abs_path.is_relative_to(r) for r in SHARED_WRITE_ROOTS):
+            owner = shared_file_league(abs_path)
+            if owner is None:
+                violations.append(f"{rel}: shared-root file with no league attribution")
+            elif owner != "shared" and owner not in leagues:
+                violations.append(f"{rel}: {owner.upper()} request cached during a {'+'.join(leagues).upper()} run")
+            continue
+        owners = [
+            league for league, roots in LEAGUE_WRITE_ROOTS.items()
+            if any(abs_path.is_relative_to(r) for r in roots)
+        ]
+        if not owners:
+            violations.append(f"{rel}: written outside any league root")
+            continue
+        if not any(o in leagues for o in owners):
+            violations.append(f"{rel}: written under {'/'.join(owners).upper()} root during a {'+'.join(leagues).upper()} run")
+            continue
+        name = abs_path.name.lower()
+        if owners == ["nba"] and "ncaam" in name:
+            violations.append(f"{rel}: NCAAM-named file written under NBA root")
+        elif owners == ["ncaam"] and "nba" in name:
+            violations.append(f"{rel}: NBA-named file written under NCAAM root")
+    return not violations, violations
+
+
 if __name__ == "__main__":
     success = check_isolation()
     sys.exit(0 if success else 1)
\ No newline at end of file
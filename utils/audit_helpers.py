@@ -3,16 +3,37 @@ utils/audit_helpers.py
 
 Verification log for the pipeline: compare JSON vs CSV row counts.
 
-Uses only standard library (json, csv, pathlib, logging). No new dependencies.
+Counts come from the write-time sidecar manifests (utils.io_helpers.save_json_rows /
+save_csv_rows) when present and fresh, so an audit is a stat + small JSON read per
+artifact. Artifacts without a valid manifest fall back to a full parse.
+
+Uses the standard library (csv, pathlib, logging) and utils.json_codec. No new dependencies.
 """
 
 import csv
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
 
+def _manifest_row_count(path: Path) -> int | None:
+    """row_count from a fresh sidecar manifest, else None (caller parses the file)."""
+    from utils.io_helpers import load_artifact_manifest
+
+    manifest = load_artifact_manifest(path)
+    if manifest is None:
+        return None
+    count = manifest.get("row_count")
+    return count if isinstance(count, int) else None
+
+
+def _count_csv_rows(path: Path) -> int:
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # skip header
+        return sum(1 for _ in reader)
+
+
 def _count_json_objects(data: Any) -> int:
     """Count objects: length of a list, or length of 'games' array if dict."""
     if isinstance(data, list):
@@ -35,6 +56,9 @@ def audit_file_consistency(
       key, counts len(games). Otherwise 0.
     - CSV: counts data rows (excluding header).
 
+    Each count is read from the artifact's manifest when one is present and
+    fresh; otherwise the file is parsed.
+
     If counts differ, logs a CRITICAL warning. Returns a result dict for
     callers to record or assert on.
 
@@ -46,23 +70,28 @@ def audit_file_consistency(
             "json_count": int,
             "csv_count": int,
             "match_status": "match" | "mismatch",
+            "source": "manifest" | "parse",
         }
     """
     json_path = Path(json_path)
     csv_path = Path(csv_path)
-    if not json_path.exists():
+    from utils.json_codec import find_json, read_json
+
+    # A codec override may have written a .jsonl / .gz / .zst variant of json_path.
+    found = find_json(json_path)
+    if found is None:
         raise FileNotFoundError(f"JSON file not found: {json_path}")
+    json_path = found
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        json_data = json.load(f)
-    json_count = _count_json_objects(json_data)
-
-    with open(csv_path, "r", encoding="utf-8", newline="") as f:
-        reader = csv.reader(f)
-        next(reader, None)  # skip header
-        csv_count = sum(1 for _ in reader)
+    json_count = _manifest_row_count(json_path)
+    csv_count = _manifest_row_count(csv_path)
+    source = "manifest" if json_count is not None and csv_count is not None else "parse"
+    if json_count is None:
+        json_count = _count_json_objects(read_json(json_path))
+    if csv_count is None:
+        csv_count = _count_csv_rows(csv_path)
 
     match_status = "match" if json_count == csv_count else "mismatch"
     if match_status == "mismatch":
@@ -80,6 +109,7 @@ def audit_file_consistency(
         "json_count": json_count,
         "csv_count": csv_count,
         "match_status": match_status,
+        "source": source,
     }
 
 
@@ -95,7 +125,8 @@ def audit_csv_consistency(
     Expects: derived_count == primary_count * expected_derived_per_primary
     (i.e. expected_derived = primary_count * ratio). E.g. 0.5 when collapsing
     2 rows per game -> 1 row per game; 1.0 when 1:1.
-    If not, logs CRITICAL and returns match_status "mismatch".
+    If not, logs CRITICAL and returns match_status "mismatch". Counts come from
+    manifests when available (see audit_file_consistency).
 
     Raises FileNotFoundError if either path is missing.
 
@@ -105,6 +136,7 @@ def audit_csv_consistency(
             "primary_count": int,
             "derived_count": int,
             "match_status": "match" | "mismatch",
+            "source": "manifest" | "parse",
         }
     """
     csv_primary_path = Path(csv_primary_path)
@@ -114,14 +146,13 @@ def audit_csv_consistency(
     if not csv_derived_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_derived_path}")
 
-    def count_rows(path: Path) -> int:
-        with open(path, "r", encoding="utf-8", newline="") as f:
-            reader = csv.reader(f)
-            next(reader, None)
-            return sum(1 for _ in reader)
-
-    primary_count = count_rows(csv_primary_path)
-    derived_count = count_rows(csv_derived_path)
+    primary_count = _manifest_row_count(csv_primary_path)
+    derived_count = _manifest_row_count(csv_derived_path)
+    source = "manifest" if primary_count is not None and derived_count is not None else "parse"
+    if primary_count is None:
+        primary_count = _count_csv_rows(csv_primary_path)
+    if derived_count is None:
+        derived_count = _count_csv_rows(csv_derived_path)
     expected_derived = primary_count * expected_derived_per_primary
     match_status = "match" if derived_count == expected_derived else "mismatch"
     if match_status == "mismatch":
@@ -140,4 +171,5 @@ def audit_csv_consistency(
         "primary_count": primary_count,
         "derived_count": derived_count,
         "match_status": match_status,
+        "source": source,
     }
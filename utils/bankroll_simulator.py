@@ -0,0 +1,178 @@
+"""
+utils/bankroll_simulator.py
+
+Vectorized Monte Carlo / bootstrap bankroll simulation over a graded bet ledger.
+
+- Ledger: arrays of result (WIN/LOSS/PUSH), American odds and win probability per bet
+  (BetLedger.from_records). Sizing reuses utils.risk_management (american_to_decimal,
+  Kelly f* = p - q/b), vectorized over bets.
+- Paths are NumPy arrays (paths x bets) of log bankroll; no per-bet Python loop.
+  mode="bootstrap": resample graded bets with replacement (keeps realized outcomes).
+  mode="montecarlo": keep bet order/sizing, draw WIN/LOSS from each bet's p (push kept).
+- Per (kelly_fraction, cap): ruin probability, max drawdown distribution, log growth
+  per bet, terminal bankroll multiple percentiles.
+
+Usage:
+  from utils.bankroll_simulator import BetLedger, simulate_grid
+  ledger = BetLedger.from_records(rows)
+  report = simulate_grid(ledger, kelly_fractions=(0.25, 0.5), caps=(0.02, 0.05), paths=10_000)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+
+from utils.risk_management import american_to_decimal
+
+DEFAULT_ODDS = -110
+DEFAULT_PATHS = 10_000
+PATH_CHUNK = 2_500  # bounds peak memory at ~chunk x bets x 8 bytes per array
+DD_PERCENTILES = (50, 75, 90, 95, 99)
+TERMINAL_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+@dataclass
+class BetLedger:
+    """Column arrays for graded bets. outcome: 1 win, 0 push, -1 loss."""
+
+    outcome: np.ndarray
+    decimal_odds: np.ndarray
+    win_probability: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict], default_p: float = 0.5238) -> "BetLedger":
+        """records: dicts with result, optional odds_american and win_probability. UNKNOWN/blank rows dropped."""
+        out, dec, prob = [], [], []
+        code = {"WIN": 1, "PUSH": 0, "LOSS": -1}
+        for r in records:
+            res = str(r.get("result") or "").strip().upper()
+            if res not in code:
+                continue
+            out.append(code[res])
+            dec.append(american_to_decimal(r.get("odds_american") if r.get("odds_american") is not None else DEFAULT_ODDS))
+            p = r.get("win_probability")
+            prob.append(float(p) if p is not None else default_p)
+        return cls(
+            outcome=np.asarray(out, dtype=np.int8),
+            decimal_odds=np.asarray(dec, dtype=np.float64),
+            win_probability=np.clip(np.asarray(prob, dtype=np.float64), 0.0, 1.0),
+        )
+
+    def __len__(self) -> int:
+        return int(self.outcome.shape[0])
+
+    def kelly_full(self) -> np.ndarray:
+        """Vectorized risk_management.kelly_fraction_full."""
+        b = self.decimal_odds - 1.0
+        p = self.win_probability
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f = p - (1.0 - p) / b
+        f = np.where((b > 0) & (p > 0) & (p < 1), f, 0.0)
+        return np.maximum(f, 0.0)
+
+
+def _unit_returns(outcome: np.ndarray, decimal_odds: np.ndarray) -> np.ndarray:
+    """Profit per unit staked: win -> b, push -> 0, loss -> -1."""
+    return np.where(outcome > 0, decimal_odds - 1.0, np.where(outcome < 0, -1.0, 0.0))
+
+
+def _sample_paths(
+    ledger: BetLedger,
+    stake_frac: np.ndarray,
+    n_paths: int,
+    mode: str,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    """(stake fractions, unit returns), each shaped (n_paths, n_bets)."""
+    n = len(ledger)
+    if mode == "bootstrap":
+        idx = rng.integers(0, n, size=(n_paths, n))
+        return stake_frac[idx], _unit_returns(ledger.outcome[idx], ledger.decimal_odds[idx])
+    if mode == "montecarlo":
+        wins = rng.random((n_paths, n)) < ledger.win_probability
+        outcome = np.where(ledger.outcome == 0, 0, np.where(wins, 1, -1))
+        return np.broadcast_to(stake_frac, (n_paths, n)), _unit_returns(outcome, ledger.decimal_odds)
+    raise ValueError(f"Unknown simulation mode: {mode!r}. Use 'bootstrap' or 'montecarlo'.")
+
+
+def simulate(
+    ledger: BetLedger,
+    *,
+    kelly_fraction: float = 0.25,
+    cap: Optional[float] = None,
+    paths: int = DEFAULT_PATHS,
+    mode: str = "bootstrap",
+    ruin_level: float = 0.25,
+    seed: Optional[int] = 7,
+) -> dict:
+    """
+    Simulate one sizing rule. Stake fraction per bet = min(cap, kelly_fraction * f*), applied to
+    the current bankroll. Ruin = bankroll ever <= ruin_level x starting bankroll.
+    """
+    n = len(ledger)
+    if n == 0:
+        return {"kelly_fraction": kelly_fraction, "cap": cap, "bets": 0, "paths": 0}
+    rng = np.random.default_rng(seed)
+    stake_frac = kelly_fraction * ledger.kelly_full()
+    if cap is not None:
+        stake_frac = np.minimum(stake_frac, cap)
+    log_ruin = np.log(ruin_level) if ruin_level > 0 else -np.inf
+
+    max_dd_all, terminal_all, ruined_all, growth_all = [], [], [], []
+    for start in range(0, paths, PATH_CHUNK):
+        m = min(PATH_CHUNK, paths - start)
+        f, r = _sample_paths(ledger, stake_frac, m, mode, rng)
+        step = np.log1p(np.maximum(f * r, -0.999999))
+        log_w = np.cumsum(step, axis=1)
+        peak = np.maximum(np.maximum.accumulate(log_w, axis=1), 0.0)
+        max_dd_all.append(np.max(1.0 - np.exp(log_w - peak), axis=1))
+        ruined_all.append(np.min(log_w, axis=1) <= log_ruin)
+        terminal_all.append(np.exp(log_w[:, -1]))
+        growth_all.append(log_w[:, -1] / n)
+
+    max_dd = np.concatenate(max_dd_all)
+    terminal = np.concatenate(terminal_all)
+    ruined = np.concatenate(ruined_all)
+    growth = np.concatenate(growth_all)
+    return {
+        "kelly_fraction": kelly_fraction,
+        "cap": cap,
+        "mode": mode,
+        "bets": n,
+        "paths": int(paths),
+        "mean_stake_fraction": round(float(stake_frac.mean()), 6),
+        "ruin_level": ruin_level,
+        "ruin_probability": round(float(ruined.mean()), 6),
+        "max_drawdown": {
+            "mean": round(float(max_dd.mean()), 6),
+            **{f"p{q}": round(float(v), 6) for q, v in zip(DD_PERCENTILES, np.percentile(max_dd, DD_PERCENTILES))},
+        },
+        "log_growth_per_bet": {
+            "mean": round(float(growth.mean()), 8),
+            "median": round(float(np.median(growth)), 8),
+        },
+        "terminal_multiple": {
+            f"p{q}": round(float(v), 6) for q, v in zip(TERMINAL_PERCENTILES, np.percentile(terminal, TERMINAL_PERCENTILES))
+        },
+    }
+
+
+def simulate_grid(
+    ledger: BetLedger,
+    *,
+    kelly_fractions: Iterable[float] = (0.1, 0.25, 0.5, 1.0),
+    caps: Iterable[Optional[float]] = (0.02, 0.05, None),
+    paths: int = DEFAULT_PATHS,
+    mode: str = "bootstrap",
+    ruin_level: float = 0.25,
+    seed: Optional[int] = 7,
+) -> list[dict]:
+    """simulate() for every (kelly_fraction, cap); same seed per cell so cells share sampled paths."""
+    return [
+        simulate(ledger, kelly_fraction=k, cap=c, paths=paths, mode=mode, ruin_level=ruin_level, seed=seed)
+        for k in kelly_fractions
+        for c in caps
+    ]
@@ -8,9 +8,14 @@ All functions must be:
 - deterministic
 - explicit
 - league-scoped
+
+Temporal normalization: ISO strings are converted once to integer epoch seconds
+(iso_to_epoch / wall_clock_epoch / day_to_epoch, memoized) so matchers and sorters
+compare ints in their inner loops instead of re-parsing the same strings.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 # -----------------------------
@@ -24,6 +29,11 @@ LEAGUE_TIMEZONES = {
     # "NHL": ZoneInfo("America/New_York"),
 }
 
+# Slate day for NCAAM daily views / default target date.
+SLATE_TIMEZONE = ZoneInfo("America/Chicago")
+
+_EPOCH_CACHE_SIZE = 1 << 16
+
 # -----------------------------
 # Public API
 # -----------------------------
@@ -51,6 +61,11 @@ def derive_game_day_local(
     if league not in LEAGUE_TIMEZONES:
         raise ValueError(f"Unsupported league: {league}")
 
+    return _derive_game_day_local(commence_time_utc, league)
+
+
+@lru_cache(maxsize=_EPOCH_CACHE_SIZE)
+def _derive_game_day_local(commence_time_utc: str, league: str) -> str:
     tz = LEAGUE_TIMEZONES[league]
 
     dt_utc = datetime.fromisoformat(
@@ -59,4 +74,61 @@ def derive_game_day_local(
 
     dt_local = dt_utc.astimezone(tz)
 
-    return dt_local.date().isoformat()
\ No newline at end of file
+    return dt_local.date().isoformat()
+
+
+def get_default_target_slate_date() -> str:
+    """Today's slate day (YYYY-MM-DD) in America/Chicago."""
+    return datetime.now(SLATE_TIMEZONE).date().isoformat()
+
+
+# -----------------------------
+# Epoch conversion (memoized)
+# -----------------------------
+
+@lru_cache(maxsize=_EPOCH_CACHE_SIZE)
+def iso_to_epoch(ts: str | None) -> int | None:
+    """
+    ISO-8601 timestamp -> UTC epoch seconds (int). Z / offsets honored; naive
+    timestamps and bare dates read as UTC. None when empty or unparseable.
+    """
+    raw = (ts or "").strip()
+    if not raw:
+        return None
+    try:
+        dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+@lru_cache(maxsize=_EPOCH_CACHE_SIZE)
+def wall_clock_epoch(ts: str | None) -> int | None:
+    """
+    ISO-8601 timestamp -> epoch seconds of its wall-clock reading with any offset
+    dropped (mapping_helpers.parse_utc semantics: naive comparison).
+    """
+    raw = (ts or "").strip()
+    if not raw:
+        return None
+    try:
+        dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return int(dt.replace(tzinfo=timezone.utc).timestamp())
+
+
+@lru_cache(maxsize=_EPOCH_CACHE_SIZE)
+def day_to_epoch(day: str | None) -> int | None:
+    """YYYY-MM-DD (first 10 chars) -> epoch seconds at UTC midnight."""
+    s = (day or "").strip()[:10]
+    if not s:
+        return None
+    try:
+        d = datetime.strptime(s, "%Y-%m-%d")
+    except ValueError:
+        return None
+    return int(d.replace(tzinfo=timezone.utc).timestamp())
+
@@ -0,0 +1,297 @@
+"""
+utils/http_client.py
+
+Shared HTTP GET layer for ingestion scripts (cdn.nba.com, ESPN, The Odds API) with
+record/replay against an on-disk cassette store.
+
+Modes (env BOOKIEX_HTTP_MODE; default live):
+- live:   plain requests.get.
+- record: requests.get, then write the response to the cassette store.
+- replay: serve from the cassette store only; no network. A miss raises CassetteMiss.
+- stub:   send the request to tools/http_stub_server.py (BOOKIEX_HTTP_STUB_URL,
+          default http://127.0.0.1:8765), which serves the same cassettes over HTTP.
+
+Cassettes: BOOKIEX_HTTP_CASSETTE_DIR (default data/http_cassettes)/{host}/{key}.json.
+key = sha256(method, url, sorted params) with secrets (apiKey) removed, so recordings
+never contain the Odds API key and replay works without one.
+
+Network timing: every call adds to per-process counters (network_stats()). When
+BOOKIEX_HTTP_STATS is set, totals are appended as one JSON line at process exit so
+runners can split step time into network vs compute.
+
+Usage:
+  from utils.http_client import http_get
+  resp = http_get(url, params=params, headers=HEADERS, timeout=30)
+  resp.raise_for_status()
+  data = resp.json()
+
+  BOOKIEX_HTTP_MODE=record python 000_RUN_ALL_NBA.py
+  BOOKIEX_HTTP_MODE=replay python 000_RUN_ALL_NBA.py
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+MODES = ("live", "record", "replay", "stub")
+DEFAULT_CASSETTE_DIR = _PROJECT_ROOT / "data" / "http_cassettes"
+DEFAULT_STUB_URL = "http://127.0.0.1:8765"
+CASSETTE_VERSION = "HTTP_CASSETTE_V1"
+
+# Query params never written to cassettes nor used in the key.
+SECRET_PARAMS = frozenset({"apiKey", "apikey", "api_key"})
+
+# Response headers kept in cassettes (Odds API quota headers included).
+KEPT_HEADERS = ("content-type", "x-requests-remaining", "x-requests-used", "x-requests-last")
+
+try:
+    import requests as _requests
+
+    HTTPError = _requests.exceptions.HTTPError
+    _ConnectionError = _requests.exceptions.ConnectionError
+except ImportError:  # replay / stub runs do not need requests
+    _requests = None
+
+    class HTTPError(Exception):
+        pass
+
+    class _ConnectionError(Exception):
+        pass
+
+
+class CassetteMiss(_ConnectionError):
+    """Replay mode: no recorded response for this request."""
+
+
+# -----------------------------------------------------------------------------
+# CONFIG
+# -----------------------------------------------------------------------------
+
+def get_mode() -> str:
+    mode = (os.environ.get("BOOKIEX_HTTP_MODE") or "live").strip().lower()
+    if mode not in MODES:
+        raise ValueError(f"Unknown BOOKIEX_HTTP_MODE: {mode!r}. Use one of {', '.join(MODES)}.")
+    return mode
+
+
+def is_offline() -> bool:
+    """True when requests are served from cassettes (no API key or network needed)."""
+    return get_mode() in ("replay", "stub")
+
+
+def get_cassette_dir() -> Path:
+    raw = os.environ.get("BOOKIEX_HTTP_CASSETTE_DIR")
+    return Path(raw) if raw else DEFAULT_CASSETTE_DIR
+
+
+def get_stub_url() -> str:
+    return (os.environ.get("BOOKIEX_HTTP_STUB_URL") or DEFAULT_STUB_URL).rstrip("/")
+
+
+# -----------------------------------------------------------------------------
+# CASSETTE STORE
+# -----------------------------------------------------------------------------
+
+def _public_params(params: dict | None) -> dict:
+    return {str(k): str(v) for k, v in (params or {}).items() if k not in SECRET_PARAMS and v is not None}
+
+
+def cassette_key(method: str, url: str, params: dict | None = None) -> str:
+    """Stable request key: method + url (without query) + sorted non-secret params."""
+    parts = urlsplit(url)
+    merged = dict(p.split("=", 1) if "=" in p else (p, "") for p in parts.query.split("&") if p)
+    merged.update(_public_params(params))
+    merged = {k: v for k, v in merged.items() if k not in SECRET_PARAMS}
+    base = f"{parts.scheme}://{parts.netloc}{parts.path}"
+    blob = f"{method.upper()} {base}?{urlencode(sorted(merged.items()))}"
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32]
+
+
+def cassette_path(url: str, key: str, root: Path | None = None) -> Path:
+    host = urlsplit(url).netloc or "_"
+    return (root or get_cassette_dir()) / host / f"{key}.json"
+
+
+def load_cassette(url: str, key: str, root: Path | None = None) -> dict | None:
+    path = cassette_path(url, key, root)
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_cassette(method: str, url: str, params: dict | None, resp, elapsed_sec: float, root: Path | None = None) -> Path:
+    key = cassette_key(method, url, params)
+    path = cassette_path(url, key, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    headers = {k: v for k, v in ((h, resp.headers.get(h)) for h in KEPT_HEADERS) if v is not None}
+    payload = {
+        "cassette_version": CASSETTE_VERSION,
+        "key": key,
+        "method": method.upper(),
+        "url": url,
+        "params": _public_params(params),
+        "status_code": resp.status_code,
+        "headers": headers,
+        "body": resp.text,
+        "recorded_at_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "elapsed_sec": round(elapsed_sec, 4),
+    }
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(tmp, path)
+    return path
+
+
+class CassetteResponse:
+    """Minimal requests.Response stand-in for replayed cassettes."""
+
+    def __init__(self, cassette: dict):
+        self.status_code = int(cassette.get("status_code") or 0)
+        self.headers = {k.lower(): v for k, v in (cassette.get("headers") or {}).items()}
+        self.text = cassette.get("body") or ""
+        self.url = cassette.get("url")
+        self.ok = 200 <= self.status_code < 400
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise HTTPError(f"{self.status_code} (replayed) for url: {self.url}")
+
+
+# -----------------------------------------------------------------------------
+# NETWORK STATS
+# -----------------------------------------------------------------------------
+
+_stats_lock = threading.Lock()
+_stats = {"calls": 0, "network_sec": 0.0, "recorded": 0, "replayed": 0, "misses": 0}
+
+
+def _bump(field: str, n=1) -> None:
+    with _stats_lock:
+        _stats[field] += n
+
+
+def network_stats() -> dict:
+    with _stats_lock:
+        out = dict(_stats)
+    out["network_sec"] = round(out["network_sec"], 4)
+    out["mode"] = get_mode()
+    return out
+
+
+def _flush_stats() -> None:
+    path = os.environ.get("BOOKIEX_HTTP_STATS")
+    if not path or not _stats["calls"]:
+        return
+    entry = {"script": Path(sys.argv[0]).as_posix() if sys.argv and sys.argv[0] else "", "pid": os.getpid(), **network_stats()}
+    try:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+    except OSError:
+        pass
+
+
+atexit.register(_flush_stats)
+
+
+# -----------------------------------------------------------------------------
+# GET
+# -----------------------------------------------------------------------------
+
+def http_get(url: str, params: dict | None = None, headers: dict | None = None, timeout=30):
+    """
+    requests.get replacement honoring BOOKIEX_HTTP_MODE. Returns a requests.Response
+    (live/record/stub) or CassetteResponse (replay); both expose status_code, headers,
+    text, json() and raise_for_status().
+    """
+    mode = get_mode()
+    _bump("calls")
+
+    if mode == "replay":
+        cassette = load_cassette(url, cassette_key("GET", url, params))
+        if cassette is None:
+            _bump("misses")
+            raise CassetteMiss(f"No cassette for GET {url} params={_public_params(params)} in {get_cassette_dir()}")
+        _bump("replayed")
+        return CassetteResponse(cassette)
+
+    if _requests is None:
+        raise ImportError("requests is required for BOOKIEX_HTTP_MODE=live/record/stub")
+
+    if mode == "stub":
+        parts = urlsplit(url)
+        target = f"{get_stub_url()}/{parts.scheme}/{parts.netloc}{parts.path}"
+        query = dict(p.split("=", 1) if "=" in p else (p, "") for p in parts.query.split("&") if p)
+        query.update(_public_params(params))
+        start = time.perf_counter()
+        resp = _requests.get(target, params=query, headers=headers, timeout=timeout)
+        _bump("network_sec", time.perf_counter() - start)
+        if resp.status_code == 404 and resp.headers.get("x-bookiex-cassette") == "miss":
+            _bump("misses")
+            raise CassetteMiss(f"Stub server has no cassette for GET {url}")
+        _bump("replayed")
+        return resp
+
+    start = time.perf_counter()
+    resp = _requests.get(url, params=params, headers=headers, timeout=timeout)
+    elapsed = time.perf_counter() - start
+    _bump("network_sec", elapsed)
+
+    if mode == "record":
+        save_cassette("GET", url, params, resp, elapsed)
+        _bump("recorded")
+    return resp
+
+
+# -----------------------------------------------------------------------------
+# RUNNER HELPERS
+# -----------------------------------------------------------------------------
+
+def step_stats_env(label: str, base_env: dict | None = None) -> tuple[dict, Path]:
+    """Env for a pipeline subprocess whose http_client totals land in a fresh stats file."""
+    import tempfile
+
+    env = dict(os.environ if base_env is None else base_env)
+    safe = "".join(c if c.isalnum() else "_" for c in label)[-60:]
+    fd, path = tempfile.mkstemp(prefix=f"bookiex_http_{safe}_", suffix=".jsonl")
+    os.close(fd)
+    env["BOOKIEX_HTTP_STATS"] = path
+    return env, Path(path)
+
+
+def read_step_stats(path: Path) -> dict:
+    """Sum the stats lines a step wrote (one per process), then delete the file."""
+    total = {"calls": 0, "network_sec": 0.0, "recorded": 0, "replayed": 0, "misses": 0}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                for k in total:
+                    total[k] += entry.get(k) or 0
+    except (OSError, ValueError):
+        pass
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    total["network_sec"] = round(total["network_sec"], 4)
+    return total
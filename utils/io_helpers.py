@@ -8,6 +8,11 @@ Design:
 - No circular dependency: configs do not import utils; utils may import configs.
 - Standardized interface: load_game_state(league) returns a list of game dicts
   (JSON-aligned structure). save_game_state(league, games) writes the same.
+- Write-time manifests: save_* functions (and save_json_rows / save_csv_rows) drop a
+  {artifact}.manifest.json sidecar with row count, byte size, content hash, schema
+  fingerprint and min/max game_date, so audits compare manifests instead of re-parsing.
+- Encoding: JSON goes through utils/json_codec.py (compact / pretty / jsonl per
+  artifact class); loaders accept any of its formats.
 """
 
 from pathlib import Path
@@ -35,13 +40,12 @@ def load_game_state(league: str) -> list[dict]:
     Load the game-state JSON for the given league. Returns a list of game dicts
     (JSON-aligned). Raises FileNotFoundError if the file does not exist.
     """
+    from utils.json_codec import find_json, read_json
     path = get_game_state_path(league)
-    if not path.exists():
+    if find_json(path) is None:
         raise FileNotFoundError(f"Game state file not found: {path}")
 
-    import json
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(path)
     if not isinstance(data, list):
         raise ValueError(f"Game state JSON must be a list of game objects: {path}")
     return data
@@ -52,12 +56,7 @@ def save_game_state(league: str, games: list[dict]) -> Path:
     Save the game-state JSON for the given league. Creates parent dirs if needed.
     Returns the path written.
     """
-    import json
-    path = get_game_state_path(league)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(games, f, indent=2)
-    return path
+    return save_json_rows(get_game_state_path(league), games, artifact="game_state")
 
 
 def load_previous_game_state_by_id(league: str, game_id_key: str = "game_id") -> dict[str, dict]:
@@ -67,13 +66,12 @@ def load_previous_game_state_by_id(league: str, game_id_key: str = "game_id") ->
     game_id_key: key to use as unique game id ('game_id' for NBA; for NCAAM use
     ``canonical_game_id`` unless the caller has standardized on ``game_id``).
     """
+    from utils.json_codec import find_json, read_json
     path = get_game_state_path(league)
-    if not path.exists():
+    if find_json(path) is None:
         return {}
 
-    import json
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(path)
     if not isinstance(data, list):
         return {}
 
@@ -103,12 +101,7 @@ def get_boxscore_path(league: str) -> Path:
 
 def save_boxscores(league: str, boxscore_rows: list[dict]) -> Path:
     """Save boxscore list as JSON. Creates parent dirs. Returns path written."""
-    import json
-    path = get_boxscore_path(league)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(boxscore_rows, f, indent=2)
-    return path
+    return save_json_rows(get_boxscore_path(league), boxscore_rows)
 
 
 def load_previous_boxscores_by_id(league: str, id_key: str) -> dict[str, dict]:
@@ -118,13 +111,12 @@ def load_previous_boxscores_by_id(league: str, id_key: str) -> dict[str, dict]:
     id_key: 'game_id' for NBA, 'espn_game_id' for NCAAM.
     Returns {} if file missing.
     """
+    from utils.json_codec import find_json, read_json
     path = get_boxscore_path(league)
-    if not path.exists():
+    if find_json(path) is None:
         return {}
 
-    import json
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(path)
     if not isinstance(data, list):
         return {}
 
@@ -184,22 +176,16 @@ def get_schedule_joined_path(league: str) -> Path:
 
 def save_schedule_raw(league: str, rows: list[dict]) -> Path:
     """Save normalized schedule (001 output) as JSON. Creates parent dirs."""
-    import json
-    path = get_schedule_raw_path(league)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(rows, f, indent=2)
-    return path
+    return save_json_rows(get_schedule_raw_path(league), rows)
 
 
 def load_schedule_raw(league: str) -> list[dict]:
     """Load normalized schedule JSON (001 output). Raises if missing."""
-    import json
+    from utils.json_codec import find_json, read_json
     path = get_schedule_raw_path(league)
-    if not path.exists():
+    if find_json(path) is None:
         raise FileNotFoundError(f"Schedule raw file not found: {path}")
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(path)
     if not isinstance(data, list):
         raise ValueError(f"Schedule JSON must be a list: {path}")
     return data
@@ -207,12 +193,7 @@ def load_schedule_raw(league: str) -> list[dict]:
 
 def save_schedule_joined(league: str, rows: list[dict]) -> Path:
     """Save joined/mapped schedule (003 output) as JSON. Creates parent dirs."""
-    import json
-    path = get_schedule_joined_path(league)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(rows, f, indent=2)
-    return path
+    return save_json_rows(get_schedule_joined_path(league), rows)
 
 
 def get_team_map_path(league: str) -> Path:
@@ -235,12 +216,11 @@ def get_team_map_path(league: str) -> Path:
 
 def load_schedule_joined(league: str) -> list[dict]:
     """Load joined/mapped schedule (003 output) from JSON. Raises if missing."""
-    import json
+    from utils.json_codec import find_json, read_json
     path = get_schedule_joined_path(league)
-    if not path.exists():
+    if find_json(path) is None:
         raise FileNotFoundError(f"Schedule joined file not found: {path}")
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(path)
     if not isinstance(data, list):
         raise ValueError(f"Schedule joined JSON must be a list: {path}")
     return data
@@ -248,12 +228,11 @@ def load_schedule_joined(league: str) -> list[dict]:
 
 def load_boxscores(league: str) -> list[dict]:
     """Load boxscore list (004 output) from JSON. Raises if missing."""
-    import json
+    from utils.json_codec import find_json, read_json
     path = get_boxscore_path(league)
-    if not path.exists():
+    if find_json(path) is None:
         raise FileNotFoundError(f"Boxscore file not found: {path}")
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(path)
     if not isinstance(data, list):
         raise ValueError(f"Boxscore JSON must be a list: {path}")
     return data
@@ -388,6 +367,87 @@ def get_daily_view_output_dir(league: str) -> Path:
     raise ValueError(f"Unknown league: {league!r}. Use 'nba' or 'ncaam'.")
 
 
+# Sidecar in each daily dir: {"dates": {YYYY-MM-DD: filename}, "latest": YYYY-MM-DD}.
+# Lets readers (bookiex_cli) open the latest slate without globbing the directory.
+DAILY_VIEW_INDEX_NAME = "daily_view_index.json"
+DAILY_VIEW_INDEX_VERSION = "DAILY_VIEW_INDEX_V1"
+
+
+def _daily_view_date(filename: str) -> str | None:
+    """Date from daily_view_{date}_v1.json / daily_view_ncaam_{date}_v1.json (+ .gz/.zst), else None."""
+    import re
+    m = re.match(r"^daily_view_(?:ncaam_)?(\d{4}-\d{2}-\d{2})_v1\.json(?:\.gz|\.zst)?$", filename)
+    return m.group(1) if m else None
+
+
+def _scan_daily_views(daily_dir: Path) -> dict[str, str]:
+    dates: dict[str, str] = {}
+    for f in daily_dir.glob("daily_view_*_v1.json*"):
+        d = _daily_view_date(f.name)
+        if d:
+            dates[d] = f.name
+    return dates
+
+
+def load_daily_view_index(daily_dir: Path) -> dict | None:
+    """Index doc for daily_dir, or None when missing / unreadable / other version."""
+    import json
+    path = Path(daily_dir) / DAILY_VIEW_INDEX_NAME
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            doc = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(doc, dict) or doc.get("index_version") != DAILY_VIEW_INDEX_VERSION:
+        return None
+    return doc
+
+
+def record_daily_view(path: Path | str, date_str: str | None = None) -> Path:
+    """
+    Register a daily view just written at path in its directory's index (date_str
+    defaults to the date in the filename). The first call in a directory without an
+    index seeds it from the files already there.
+    """
+    import json
+    import os
+
+    path = Path(path)
+    date_str = date_str or _daily_view_date(path.name)
+    if not date_str:
+        raise ValueError(f"Not a daily view filename: {path.name!r}")
+    daily_dir = path.parent
+    doc = load_daily_view_index(daily_dir)
+    dates = dict(doc["dates"]) if doc else _scan_daily_views(daily_dir)
+    dates[date_str] = path.name
+    out = {
+        "index_version": DAILY_VIEW_INDEX_VERSION,
+        "latest": max(dates),
+        "dates": dict(sorted(dates.items())),
+    }
+    index_path = daily_dir / DAILY_VIEW_INDEX_NAME
+    tmp = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(out, f, indent=2)
+    os.replace(tmp, index_path)
+    return index_path
+
+
+def latest_daily_view_path(daily_dir: Path | str) -> Path | None:
+    """
+    Latest daily view in daily_dir: one small index read; falls back to a glob
+    (greatest date) when the index is missing or points at a deleted file.
+    """
+    daily_dir = Path(daily_dir)
+    doc = load_daily_view_index(daily_dir)
+    if doc and doc.get("latest"):
+        name = (doc.get("dates") or {}).get(doc["latest"])
+        if name and (daily_dir / name).exists():
+            return daily_dir / name
+    dates = _scan_daily_views(daily_dir)
+    return daily_dir / dates[max(dates)] if dates else None
+
+
 def get_backtest_output_root(league: str) -> Path:
     """Root directory for backtest runs (backtest_gen_runner). data/{league}/backtests/."""
     league = (league or "").strip().lower()
@@ -396,6 +456,46 @@ def get_backtest_output_root(league: str) -> Path:
     return PROJECT_ROOT / "data" / league / "backtests"
 
 
+def get_clv_dir(league: str) -> Path:
+    """CLV engine outputs (clv_lines.json, clv_picks.json). data/{league}/clv/."""
+    league = (league or "").strip().lower()
+    if league not in ("nba", "ncaam"):
+        raise ValueError(f"Unknown league: {league!r}. Use 'nba' or 'ncaam'.")
+    return PROJECT_ROOT / "data" / league / "clv"
+
+
+def get_similarity_dir(league: str) -> Path:
+    """Similar-games k-NN index (similar_games_index.npz + meta). data/{league}/similarity/."""
+    league = (league or "").strip().lower()
+    if league not in ("nba", "ncaam"):
+        raise ValueError(f"Unknown league: {league!r}. Use 'nba' or 'ncaam'.")
+    return PROJECT_ROOT / "data" / league / "similarity"
+
+
+def get_pocket_history_dir(league: str) -> Path:
+    """Walk-forward pocket validation (summary + per-backtest cache). data/{league}/pocket_history/."""
+    league = (league or "").strip().lower()
+    if league not in ("nba", "ncaam"):
+        raise ValueError(f"Unknown league: {league!r}. Use 'nba' or 'ncaam'.")
+    return PROJECT_ROOT / "data" / league / "pocket_history"
+
+
+def get_warehouse_path(league: str) -> Path:
+    """
+    SQLite warehouse (utils/warehouse.py), one per league so concurrent runs never share a
+    writer: data/{league}/warehouse/bookiex.sqlite. BOOKIEX_WAREHOUSE_DIR overrides the
+    directory ({dir}/{league}.sqlite).
+    """
+    import os
+    league = (league or "").strip().lower()
+    if league not in ("nba", "ncaam"):
+        raise ValueError(f"Unknown league: {league!r}. Use 'nba' or 'ncaam'.")
+    env = os.environ.get("BOOKIEX_WAREHOUSE_DIR")
+    if env:
+        return Path(env) / f"{league}.sqlite"
+    return PROJECT_ROOT / "data" / league / "warehouse" / "bookiex.sqlite"
+
+
 def get_odds_master_path(league: str) -> Path:
     """Path to odds master JSON. NBA: data/nba/raw/odds_master_nba.json; NCAAM: data/ncaam/raw/odds_master_ncaam.json."""
     league = (league or "").strip().lower()
@@ -406,3 +506,153 @@ def get_odds_master_path(league: str) -> Path:
         from configs.leagues.league_ncaam import RAW_DIR
         return RAW_DIR / "odds_master_ncaam.json"
     raise ValueError(f"Unknown league: {league!r}. Use 'nba' or 'ncaam'.")
+
+
+# -----------------------------------------------------------------------------
+# Write-time integrity manifests (sidecar {artifact}.manifest.json)
+# -----------------------------------------------------------------------------
+
+MANIFEST_VERSION = "ARTIFACT_MANIFEST_V1"
+MANIFEST_DATE_FIELDS = ("game_date", "nba_game_day_local", "game_date_local", "slate_date_cst")
+
+
+def get_manifest_path(artifact_path: Path | str) -> Path:
+    """Sidecar manifest path for an artifact: foo.json -> foo.json.manifest.json."""
+    artifact_path = Path(artifact_path)
+    return artifact_path.with_name(artifact_path.name + ".manifest.json")
+
+
+def _schema_fingerprint(columns: list[str]) -> str:
+    import hashlib
+    return hashlib.sha256("\x1f".join(columns).encode("utf-8")).hexdigest()[:16]
+
+
+def _date_range(rows: list[dict]) -> tuple[str | None, str | None]:
+    lo = hi = None
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        for field in MANIFEST_DATE_FIELDS:
+            v = row.get(field)
+            if v:
+                d = str(v).strip()[:10]
+                if lo is None or d < lo:
+                    lo = d
+                if hi is None or d > hi:
+                    hi = d
+                break
+    return lo, hi
+
+
+def write_artifact_manifest(
+    artifact_path: Path | str,
+    rows: list,
+    columns: list[str],
+    payload: bytes | None = None,
+) -> Path:
+    """
+    Write the sidecar manifest for an artifact just written. payload is the exact bytes on
+    disk when the caller has them; otherwise the file is read back for the hash. Size and
+    mtime are taken from the file so audits can detect stale manifests with a stat()
+    instead of a parse.
+    """
+    import hashlib
+    import json
+    import os
+
+    artifact_path = Path(artifact_path)
+    st = artifact_path.stat()
+    if payload is not None:
+        content_sha256 = hashlib.sha256(payload).hexdigest()
+    else:
+        h = hashlib.sha256()
+        with open(artifact_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        content_sha256 = h.hexdigest()
+    min_date, max_date = _date_range(rows)
+    manifest = {
+        "manifest_version": MANIFEST_VERSION,
+        "artifact": artifact_path.name,
+        "format": artifact_path.suffix.lstrip(".").lower(),
+        "row_count": len(rows),
+        "bytes": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "content_sha256": content_sha256,
+        "schema_fingerprint": _schema_fingerprint(columns),
+        "columns": columns,
+        "min_game_date": min_date,
+        "max_game_date": max_date,
+    }
+    path = get_manifest_path(artifact_path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, path)
+    return path
+
+
+def load_artifact_manifest(artifact_path: Path | str) -> dict | None:
+    """
+    Manifest for artifact_path, or None when missing, unreadable or stale (artifact
+    size/mtime differ from what was recorded, e.g. rewritten by a tool that skips
+    manifests). O(1): one stat and one small JSON read.
+    """
+    import json
+
+    artifact_path = Path(artifact_path)
+    path = get_manifest_path(artifact_path)
+    if not path.exists() or not artifact_path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("manifest_version") != MANIFEST_VERSION:
+        return None
+    st = artifact_path.stat()
+    if manifest.get("bytes") != st.st_size or manifest.get("mtime_ns") != st.st_mtime_ns:
+        return None
+    return manifest
+
+
+def save_json_rows(path: Path | str, rows: list, artifact: str = "rows") -> Path:
+    """
+    rows serialized with the artifact class codec (utils/json_codec.py; compact by
+    default) plus its manifest. Written atomically through json_codec.write_json, so a
+    codec override may change the file name (.jsonl / .gz / .zst); returns the path written.
+    """
+    from utils.json_codec import write_json
+
+    out = write_json(path, rows, artifact=artifact)
+    columns: dict[str, None] = {}
+    for row in rows:
+        if isinstance(row, dict):
+            columns.update(dict.fromkeys(row))
+    write_artifact_manifest(out, rows, list(columns))
+    return out
+
+
+def save_csv_rows(
+    path: Path | str,
+    rows: list[dict],
+    fieldnames: list[str] | None = None,
+    extrasaction: str = "raise",
+) -> Path:
+    """csv.DictWriter rows (header + one record per row) to path plus its manifest. Creates parent dirs."""
+    import csv
+    import io
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    columns = list(fieldnames if fieldnames is not None else (rows[0].keys() if rows else []))
+    buf = io.StringIO(newline="")
+    w = csv.DictWriter(buf, fieldnames=columns, extrasaction=extrasaction)
+    w.writeheader()
+    w.writerows(rows)
+    payload = buf.getvalue().encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
+    write_artifact_manifest(path, rows, columns, payload)
+    return path
@@ -0,0 +1,355 @@
+"""
+utils/json_codec.py
+
+Pluggable JSON codec shared by the artifact writers and readers.
+
+Design:
+- One place decides how an artifact class is serialized; writers pass
+  artifact="backtest" / "pocket" / ... instead of hard-coding json.dump(indent=2).
+- Modes: "pretty" (indent=2, the old behaviour), "compact" (no whitespace) and
+  "jsonl" (one row per line, for list-of-rows artifacts; streamable).
+- Compression: None, "gzip" (stdlib) or "zstd" (needs the optional zstandard
+  package, falls back to gzip). Compressed files carry a .gz / .zst suffix.
+- orjson is used when installed (several times faster for the multi-model and
+  backtest files); otherwise stdlib json. Anything orjson refuses (NaN literals in
+  old files, ints past 64 bits, exotic keys) falls back to stdlib per call, so the
+  bytes on disk stay plain JSON either way. The stdlib path mirrors orjson: NaN /
+  Infinity become null and datetime / date / time values are written as isoformat().
+- Writers keep the logical name (foo.json); the codec decides the file on disk
+  (foo.jsonl, foo.json.gz, ...). Readers (read_json) take the logical name, find
+  whichever variant exists and decode it from its suffix.
+- write_json replaces the file atomically (temp file in the same dir + os.replace),
+  so a reader never sees a half-written artifact.
+
+Per-class override: BOOKIEX_JSON_<CLASS>=<mode>[+<compression>], e.g.
+  BOOKIEX_JSON_BACKTEST=pretty          (readable backtests while debugging)
+  BOOKIEX_JSON_BACKTEST_ARCHIVE=compact+zstd
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional speed-up
+    _orjson = None
+
+MODES = ("pretty", "compact", "jsonl")
+COMPRESSIONS = (None, "gzip", "zstd")
+COMPRESSION_SUFFIX = {"gzip": ".gz", "zstd": ".zst"}
+
+
+@dataclass(frozen=True)
+class CodecSpec:
+    mode: str = "pretty"
+    compression: Optional[str] = None
+    sort_keys: bool = False
+
+
+# ------------------------------------------------------------
+# Artifact classes
+# ------------------------------------------------------------
+
+ARTIFACT_CODECS: dict[str, CodecSpec] = {
+    # Small / hand-read / pushed to git and diffed: keep indent=2.
+    "default": CodecSpec("pretty"),
+    "manifest": CodecSpec("pretty"),
+    "daily_view": CodecSpec("pretty"),
+    "summary": CodecSpec("pretty"),
+    # Large machine-read artifacts.
+    "game_state": CodecSpec("compact"),
+    "rows": CodecSpec("compact"),
+    "model_runner": CodecSpec("compact", sort_keys=True),
+    "backtest": CodecSpec("compact"),
+    "final_view": CodecSpec("compact"),
+    "pocket": CodecSpec("compact"),
+    "cache": CodecSpec("compact"),
+    "state": CodecSpec("compact"),
+    "state_rows": CodecSpec("jsonl"),  # append-style row dumps (walk-forward graded rows)
+    # Older backtest runs (tools/archive_backtests.py).
+    "backtest_archive": CodecSpec("compact", compression="gzip"),
+}
+
+
+def _parse_spec(text: str, base: CodecSpec) -> CodecSpec:
+    mode, _, compression = text.strip().lower().partition("+")
+    if mode not in MODES:
+        raise ValueError(f"Unknown JSON codec mode: {mode!r}. Use one of {MODES}.")
+    comp = compression or None
+    if comp not in COMPRESSIONS:
+        raise ValueError(f"Unknown JSON compression: {comp!r}. Use 'gzip' or 'zstd'.")
+    return CodecSpec(mode, comp, base.sort_keys)
+
+
+def get_codec(artifact: str = "default") -> CodecSpec:
+    """Codec for an artifact class, honouring BOOKIEX_JSON_<CLASS> overrides."""
+    if artifact not in ARTIFACT_CODECS:
+        raise ValueError(f"Unknown artifact class: {artifact!r}. Known: {sorted(ARTIFACT_CODECS)}.")
+    spec = ARTIFACT_CODECS[artifact]
+    override = os.environ.get(f"BOOKIEX_JSON_{artifact.upper()}")
+    return _parse_spec(override, spec) if override else spec
+
+
+# ------------------------------------------------------------
+# Encode / decode
+# ------------------------------------------------------------
+
+def dumps(
+    obj: Any,
+    *,
+    mode: str = "pretty",
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """obj -> UTF-8 JSON bytes. mode "jsonl" expects a list (one row per line)."""
+    if mode == "jsonl":
+        return b"".join(_dumps_one(row, indent=False, sort_keys=sort_keys, default=default) + b"\n" for row in obj)
+    if mode not in MODES:
+        raise ValueError(f"Unknown JSON codec mode: {mode!r}. Use one of {MODES}.")
+    return _dumps_one(obj, indent=(mode == "pretty"), sort_keys=sort_keys, default=default)
+
+
+def _dumps_one(obj: Any, *, indent: bool, sort_keys: bool, default) -> bytes:
+    if _orjson is not None:
+        opts = _orjson.OPT_NON_STR_KEYS
+        if indent:
+            opts |= _orjson.OPT_INDENT_2
+        if sort_keys:
+            opts |= _orjson.OPT_SORT_KEYS
+        try:
+            return _orjson.dumps(obj, default=default, option=opts)
+        except TypeError:
+            pass
+    obj = _std_safe(obj)
+    std_default = _std_default(default)
+    if indent:
+        text = json.dumps(obj, indent=2, sort_keys=sort_keys, default=std_default, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys, default=std_default, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def _std_safe(obj: Any) -> Any:
+    """Match orjson for stdlib json: NaN / Infinity -> None, datetime keys -> isoformat."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {
+            (k.isoformat() if isinstance(k, (datetime, date, time)) else k): _std_safe(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_std_safe(v) for v in obj]
+    return obj
+
+
+def _std_default(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    def _fallback(o: Any) -> Any:
+        if isinstance(o, (datetime, date, time)):
+            return o.isoformat()
+        if default is not None:
+            return _std_safe(default(o))
+        raise TypeError(f"Type is not JSON serializable: {type(o).__name__}")
+
+    return _fallback
+
+
+def loads(data: bytes | str) -> Any:
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except ValueError:
+            pass  # e.g. NaN / Infinity written by stdlib json
+    return json.loads(data)
+
+
+# ------------------------------------------------------------
+# Files
+# ------------------------------------------------------------
+
+def _compression_for(path: Path) -> Optional[str]:
+    for comp, suffix in COMPRESSION_SUFFIX.items():
+        if path.name.endswith(suffix):
+            return comp
+    return None
+
+
+def _is_jsonl(path: Path) -> bool:
+    name = path.name
+    comp = _compression_for(path)
+    if comp:
+        name = name[: -len(COMPRESSION_SUFFIX[comp])]
+    return name.endswith(".jsonl")
+
+
+def _compress(payload: bytes, compression: Optional[str]) -> tuple[bytes, Optional[str]]:
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            compression = "gzip"
+        else:
+            return zstandard.ZstdCompressor(level=10).compress(payload), "zstd"
+    if compression == "gzip":
+        return gzip.compress(payload, compresslevel=6, mtime=0), "gzip"
+    return payload, None
+
+
+def _decompress(raw: bytes, compression: Optional[str]) -> bytes:
+    if compression == "gzip":
+        return gzip.decompress(raw)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    return raw
+
+
+def _plain_path(path: Path) -> Path:
+    comp = _compression_for(path)
+    return path.with_name(path.name[: -len(COMPRESSION_SUFFIX[comp])]) if comp else path
+
+
+def artifact_path(path: Path | str, spec: CodecSpec) -> Path:
+    """
+    On-disk name for a logical artifact under spec: foo.json -> foo.jsonl in jsonl
+    mode, plus .gz / .zst when compressed.
+    """
+    path = _plain_path(Path(path))
+    if spec.mode == "jsonl" and path.suffix == ".json":
+        path = path.with_suffix(".jsonl")
+    if spec.compression:
+        path = path.with_name(path.name + COMPRESSION_SUFFIX[spec.compression])
+    return path
+
+
+def _variants(path: Path) -> list[Path]:
+    """Every on-disk name the logical artifact at path may have, plain first."""
+    plain = _plain_path(path)
+    if plain.suffix == ".jsonl":
+        plain = plain.with_suffix(".json")
+    bases = [plain]
+    if plain.suffix == ".json":
+        bases.append(plain.with_suffix(".jsonl"))
+    out = []
+    for base in bases:
+        out.append(base)
+        out.extend(base.with_name(base.name + sfx) for sfx in COMPRESSION_SUFFIX.values())
+    return out
+
+
+def find_json(path: Path | str) -> Optional[Path]:
+    """path if it exists, else the existing jsonl / .gz / .zst variant of it, else None."""
+    path = Path(path)
+    if path.exists():
+        return path
+    for alt in _variants(path):
+        if alt.exists():
+            return alt
+    return None
+
+
+def write_json(
+    path: Path | str,
+    obj: Any,
+    *,
+    artifact: str = "default",
+    default: Optional[Callable[[Any], Any]] = None,
+) -> Path:
+    """
+    Serialize obj with the artifact class codec and write it atomically (creating
+    parent dirs). Returns the path written (see artifact_path: .jsonl / .gz / .zst as the codec
+    requires); other variants of the same artifact are removed.
+    """
+    spec = get_codec(artifact)
+    payload = dumps(obj, mode=spec.mode, sort_keys=spec.sort_keys, default=default)
+    payload, comp = _compress(payload, spec.compression)
+    out = artifact_path(path, CodecSpec(spec.mode, comp, spec.sort_keys))
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(f".{out.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, out)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    # One logical artifact, one file: drop variants left by a previous codec.
+    for alt in _variants(out):
+        if alt != out and alt.exists():
+            alt.unlink()
+    return out
+
+
+def encode_for(obj: Any, artifact: str = "default", *, default=None) -> bytes:
+    """Uncompressed bytes for obj under the artifact codec (for callers that hash/write themselves)."""
+    spec = get_codec(artifact)
+    return dumps(obj, mode=spec.mode, sort_keys=spec.sort_keys, default=default)
+
+
+def read_json(path: Path | str) -> Any:
+    """
+    Load a JSON / JSON-lines artifact (plain, .gz or .zst). Missing plain files fall
+    back to a compressed sibling; raises FileNotFoundError when neither exists.
+    JSON-lines files return a list of rows.
+    """
+    found = find_json(path)
+    if found is None:
+        raise FileNotFoundError(f"JSON artifact not found: {path}")
+    with open(found, "rb") as f:
+        raw = _decompress(f.read(), _compression_for(found))
+    if _is_jsonl(found):
+        return [loads(line) for line in raw.splitlines() if line.strip()]
+    return loads(raw)
+
+
+# ------------------------------------------------------------
+# JSON lines (streaming)
+# ------------------------------------------------------------
+
+def write_jsonl(path: Path | str, rows: Iterable[Any], *, append: bool = False) -> Path:
+    """Stream rows to a .jsonl file one line at a time (no full-document buffer)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "ab" if append else "wb") as f:
+        for row in rows:
+            f.write(_dumps_one(row, indent=False, sort_keys=False, default=None))
+            f.write(b"\n")
+    return path
+
+
+def iter_jsonl(path: Path | str) -> Iterator[Any]:
+    """Yield rows from a .jsonl (optionally .gz) file without loading it whole."""
+    found = find_json(path)
+    if found is None:
+        raise FileNotFoundError(f"JSON-lines artifact not found: {path}")
+    comp = _compression_for(found)
+    if comp == "zstd":
+        yield from read_json(found)
+        return
+    opener = gzip.open if comp == "gzip" else open
+    with opener(found, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+# ------------------------------------------------------------
+# Archiving
+# ------------------------------------------------------------
+
+def compress_json_file(path: Path | str, artifact: str = "backtest_archive") -> Path:
+    """
+    Re-encode an existing JSON artifact with the artifact class codec (compact + gzip
+    for backtest_archive); the original file is replaced. Returns the new path.
+    """
+    return write_json(path, read_json(path), artifact=artifact)
@@ -55,10 +55,13 @@ prefer CSV overrides for recurring cases.
 import csv
 import os
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from utils.datetime_bridge import day_to_epoch, wall_clock_epoch
+
 _PROJECT_ROOT = Path(__file__).resolve().parents[1]
 _NCAAM_MATCH_OVERRIDES_CSV = _PROJECT_ROOT / "data" / "ncaam" / "static" / "ncaam_match_overrides.csv"
 
@@ -294,58 +297,72 @@ def parse_date(s: str) -> datetime | None:
             return None
 
 
-def _game_day_to_dt(s: str) -> datetime | None:
-    """Game day string YYYY-MM-DD -> midnight naive datetime."""
-    s = (s or "").strip()[:10]
-    if not s:
-        return None
-    try:
-        return datetime.strptime(s, "%Y-%m-%d")
-    except ValueError:
-        return None
-
-
 # -----------------------------------------------------------------------------
 # Generic best market match (NBA + NCAAM)
 # -----------------------------------------------------------------------------
 
-def _window_nba(game_day_str: str, window_hours: int) -> tuple[datetime | None, datetime | None]:
-    """Low/high naive datetimes for NBA: game_day midnight ± window_hours."""
-    game_dt = _game_day_to_dt(game_day_str)
-    if not game_dt:
+def _window_nba(game_day_str: str, window_hours: int) -> tuple[int | None, int | None]:
+    """Low/high epoch seconds for NBA: game_day midnight ± window_hours."""
+    game_ts = day_to_epoch(game_day_str)
+    if game_ts is None:
         return None, None
-    delta = timedelta(hours=window_hours)
-    return game_dt - delta, game_dt + delta
+    delta = window_hours * 3600
+    return game_ts - delta, game_ts + delta
 
 
-def _window_ncaam(game_date_str: str, window_hours: int) -> tuple[datetime | None, datetime | None]:
+def _window_ncaam(game_date_str: str, window_hours: int) -> tuple[int | None, int | None]:
     """
-    Low/high naive datetimes for NCAAM so game_date (often local) matches
+    Low/high epoch seconds for NCAAM so game_date (often local) matches
     commence_time (UTC). E.g. game tips 11 PM Monday local -> Tuesday early UTC.
     Window: game_date midnight UTC - 12h to game_date midnight UTC + 36h.
     """
-    game_dt = _game_day_to_dt(game_date_str)
-    if not game_dt:
+    game_ts = day_to_epoch(game_date_str)
+    if game_ts is None:
         return None, None
-    low = game_dt - timedelta(hours=12)
-    high = game_dt + timedelta(hours=36)
-    return low, high
+    return game_ts - 12 * 3600, game_ts + 36 * 3600
 
 
-def _get_market_commence_dt(row: dict, league: str) -> datetime | None:
-    """Extract commence datetime from a market/odds row."""
+@lru_cache(maxsize=1 << 16)
+def _ncaam_commence_epoch(raw: str) -> int | None:
+    dt = parse_date(raw)
+    if not dt:
+        return None
+    return int(dt.replace(tzinfo=timezone.utc).timestamp())
+
+
+def _get_market_commence_epoch(row: dict, league: str) -> int | None:
+    """Commence time of a market/odds row as naive-UTC epoch seconds (memoized per string)."""
     if league == "nba":
-        raw = row.get("odds_commence_time_utc") or row.get("odds_commence_time_raw") or ""
-        return parse_utc(raw)
+        return wall_clock_epoch(row.get("odds_commence_time_utc") or row.get("odds_commence_time_raw") or "")
     if league == "ncaam":
-        raw = row.get("commence_time") or ""
-        dt = parse_date(raw)
-        if dt and dt.tzinfo:
-            dt = dt.replace(tzinfo=None)
-        return dt
+        return _ncaam_commence_epoch(row.get("commence_time") or "")
     return None
 
 
+def _market_team_key(row: dict, league: str) -> tuple[str, str]:
+    if league == "nba":
+        return ((row.get("home_team") or "").strip(), (row.get("away_team") or "").strip())
+    return ((row.get("home_team_id") or "").strip(), (row.get("away_team_id") or "").strip())
+
+
+def build_market_index(market_rows: list[dict], league: str) -> dict[tuple[str, str], list[tuple[int, dict]]]:
+    """
+    Pre-normalize market rows once for find_best_market_match(market_index=...):
+    (home, away) team key -> [(commence_epoch, row)] in input order. Rows without a
+    parseable commence time (and NCAAM rows without odds) are dropped up front.
+    """
+    league = (league or "").strip().lower()
+    index: dict[tuple[str, str], list[tuple[int, dict]]] = {}
+    for row in market_rows:
+        if league == "ncaam" and not _ncaam_row_has_odds(row):
+            continue
+        comm = _get_market_commence_epoch(row, league)
+        if comm is None:
+            continue
+        index.setdefault(_market_team_key(row, league), []).append((comm, row))
+    return index
+
+
 def _teams_match(game: dict, market_row: dict, league: str) -> bool:
     if league == "nba":
         return (
@@ -390,6 +407,7 @@ def find_best_market_match(
     market_rows: list[dict],
     league: str,
     window_hours: int = 24,
+    market_index: dict[tuple[str, str], list[tuple[int, dict]]] | None = None,
 ) -> dict | None:
     """
     Find the single best market row for this game: same teams and commence time
@@ -400,6 +418,9 @@ def find_best_market_match(
     - NCAAM: (home_team_id, away_team_id) exact, commence within
       [game_date UTC midnight - 12h, game_date UTC midnight + 36h] so that
       a game tipping 11 PM Monday local (early Tuesday UTC) matches game_date Monday.
+
+    market_index: optional build_market_index(market_rows, league) shared across many
+    games; only that team pair's rows are scanned and commence times are already ints.
     """
     league = (league or "").strip().lower()
     if league not in ("nba", "ncaam"):
@@ -423,24 +444,27 @@ def find_best_market_match(
     if low is None or high is None:
         return None
 
+    if market_index is not None:
+        candidates = market_index.get(_market_team_key(game, league), ())
+    else:
+        candidates = (
+            (comm, row)
+            for row in market_rows
+            if _teams_match(game, row, league)
+            and (league != "ncaam" or _ncaam_row_has_odds(row))
+            for comm in (_get_market_commence_epoch(row, league),)
+            if comm is not None
+        )
+
     best = None
-    best_diff: float | None = None
-    game_dt = _game_day_to_dt((game.get("slate_date_cst") or game.get("nba_game_day_local") or game.get("game_date") or "").strip()[:10])
+    best_diff: int | None = None
+    game_ts = day_to_epoch((game.get("slate_date_cst") or game.get("nba_game_day_local") or game.get("game_date") or "").strip()[:10])
 
-    for row in market_rows:
-        if not _teams_match(game, row, league):
-            continue
-        if league == "ncaam" and not _ncaam_row_has_odds(row):
-            continue
-        comm = _get_market_commence_dt(row, league)
-        if not comm:
-            continue
-        if comm.tzinfo:
-            comm = comm.replace(tzinfo=None)
+    for comm, row in candidates:
         if not (low <= comm <= high):
             continue
-        ref = game_dt or comm
-        diff = abs((comm - ref).total_seconds())
+        ref = game_ts if game_ts is not None else comm
+        diff = abs(comm - ref)
         if best_diff is None or diff < best_diff:
             best_diff = diff
             best = row
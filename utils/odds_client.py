@@ -0,0 +1,477 @@
+"""
+utils/odds_client.py
+
+Shared The Odds API client used by every odds fetcher (e_gen_031_get_betline,
+tools/migration/sync_historical_odds.py, tools/migration/fetch_missing_raw.py).
+
+- Persistent TTL response cache: data/external/odds_api_cache/{key}.json keyed like
+  utils/http_client cassettes (apiKey excluded). Entries older than their TTL are
+  refreshed; an ETag, when the API sends one, is replayed as If-None-Match so a
+  304 refreshes the entry without re-downloading. The directory is shared by both
+  leagues (one API key); tools/verify_isolation.py attributes entries by their "url".
+- Request budget: x-requests-remaining / x-requests-used / x-requests-last from every
+  response are persisted (quota.json). A request whose estimated cost would take
+  remaining below ODDS_API_MIN_REMAINING (default 50) is refused (OddsQuotaExhausted).
+- Priority queue: fetch_event_odds_many() orders event requests by distance from
+  tipoff (upcoming / near-tipoff first, long-finished last) and runs them with bounded
+  concurrency plus a shared minimum interval between request starts (replaces the
+  per-call time.sleep in the backfill tools).
+
+Network goes through utils.http_client.http_get, so record/replay/stub modes apply.
+
+Usage:
+  from utils.odds_client import get_odds_client
+  client = get_odds_client()
+  resp = client.current_odds("basketball_nba")          # OddsResponse
+  games = resp.payload
+  by_id = client.fetch_event_odds_many("basketball_ncaab", [(eid, commence), ...], max_workers=4)
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+BASE_URL = "https://api.the-odds-api.com/v4/sports"
+HISTORICAL_BASE_URL = "https://api.the-odds-api.com/v4/historical/sports"
+MARKETS = "spreads,totals,h2h"
+REGIONS = "us"
+ODDS_FORMAT = "american"
+
+DEFAULT_CACHE_DIR = _PROJECT_ROOT / "data" / "external" / "odds_api_cache"
+QUOTA_FILE = "quota.json"
+
+# TTL (seconds) per request kind. None = never expires (historical snapshots are immutable).
+TTL_CURRENT_ODDS = 60
+TTL_EVENTS_LIST = 15 * 60
+TTL_EVENT_ODDS_UPCOMING = 5 * 60
+TTL_EVENT_ODDS_FINAL = None
+TTL_HISTORICAL = None
+FINAL_AFTER_TIPOFF_SEC = 6 * 3600
+
+DEFAULT_MIN_REMAINING = 50
+DEFAULT_MIN_INTERVAL_SEC = 0.2
+DEFAULT_MAX_WORKERS = 4
+
+
+class OddsQuotaExhausted(RuntimeError):
+    """Estimated request cost would take the remaining quota below the reserve."""
+
+
+@dataclass
+class OddsResponse:
+    payload: object
+    fetched_at_utc: str
+    from_cache: bool = False
+    headers: dict = field(default_factory=dict)
+
+
+def _now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _iso_now() -> str:
+    return _now_utc().isoformat()
+
+
+def _parse_iso(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def estimate_cost(kind: str, markets: str = MARKETS, regions: str = REGIONS) -> int:
+    """Odds API usage cost: markets x regions per odds call (x10 historical); events list is free."""
+    n = max(1, len([m for m in markets.split(",") if m])) * max(1, len([r for r in regions.split(",") if r]))
+    if kind == "events":
+        return 0
+    if kind == "historical":
+        return 10 * n
+    return n
+
+
+# -----------------------------------------------------------------------------
+# QUOTA BUDGET
+# -----------------------------------------------------------------------------
+
+class QuotaBudget:
+    """Remaining quota from response headers, with in-flight reservations for concurrent fetches."""
+
+    def __init__(self, path: Path, min_remaining: int = DEFAULT_MIN_REMAINING):
+        self.path = path
+        self.min_remaining = min_remaining
+        self.remaining: int | None = None
+        self.used: int | None = None
+        self.last_cost: int | None = None
+        self.updated_at_utc: str | None = None
+        self._reserved = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.remaining = data.get("remaining")
+        self.used = data.get("used")
+        self.last_cost = data.get("last_cost")
+        self.updated_at_utc = data.get("updated_at_utc")
+
+    def _save(self) -> None:
+        """Atomic write; the temp name is unique so concurrent NBA / NCAAM processes never share it."""
+        import tempfile
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp", delete=False
+        ) as f:
+            json.dump(self.snapshot(), f, indent=2)
+        try:
+            os.replace(f.name, self.path)
+        except OSError:
+            Path(f.name).unlink(missing_ok=True)
+            raise
+
+    def snapshot(self) -> dict:
+        return {
+            "remaining": self.remaining,
+            "used": self.used,
+            "last_cost": self.last_cost,
+            "updated_at_utc": self.updated_at_utc,
+            "min_remaining": self.min_remaining,
+        }
+
+    def reserve(self, cost: int) -> None:
+        with self._lock:
+            if cost and self.remaining is not None and self.remaining - self._reserved - cost < self.min_remaining:
+                raise OddsQuotaExhausted(
+                    f"Odds API quota: remaining={self.remaining} reserved={self._reserved} cost={cost} "
+                    f"< reserve {self.min_remaining}"
+                )
+            self._reserved += cost
+
+    def release(self, cost: int) -> None:
+        with self._lock:
+            self._reserved = max(0, self._reserved - cost)
+
+    def update_from_headers(self, headers) -> None:
+        def _int(name):
+            raw = headers.get(name) if headers is not None else None
+            try:
+                return int(float(raw)) if raw not in (None, "") else None
+            except (TypeError, ValueError):
+                return None
+
+        remaining, used, last = _int("x-requests-remaining"), _int("x-requests-used"), _int("x-requests-last")
+        if remaining is None and used is None:
+            return
+        with self._lock:
+            self.remaining = remaining if remaining is not None else self.remaining
+            self.used = used if used is not None else self.used
+            self.last_cost = last if last is not None else self.last_cost
+            self.updated_at_utc = _iso_now()
+            try:
+                self._save()
+            except OSError as e:
+                from utils.run_log import log_event
+
+                log_event(f"Odds API quota not saved to {self.path}: {e}", level="WARNING", echo=True)
+
+
+# -----------------------------------------------------------------------------
+# CLIENT
+# -----------------------------------------------------------------------------
+
+class OddsApiClient:
+    def __init__(
+        self,
+        api_key: str | None = None,
+        cache_dir: Path | None = None,
+        min_remaining: int | None = None,
+        min_interval_sec: float = DEFAULT_MIN_INTERVAL_SEC,
+        use_cache: bool = True,
+    ):
+        self.api_key = api_key if api_key is not None else os.getenv("ODDS_API_KEY")
+        self.cache_dir = cache_dir or Path(os.environ.get("ODDS_API_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        if min_remaining is None:
+            min_remaining = int(os.environ.get("ODDS_API_MIN_REMAINING") or DEFAULT_MIN_REMAINING)
+        self.budget = QuotaBudget(self.cache_dir / QUOTA_FILE, min_remaining=min_remaining)
+        self.min_interval_sec = min_interval_sec
+        self.use_cache = use_cache and (os.environ.get("ODDS_API_CACHE") or "on").strip().lower() not in ("0", "off", "false")
+        self._throttle_lock = threading.Lock()
+        self._next_start = 0.0
+        self.stats = {"requests": 0, "cache_hits": 0, "not_modified": 0, "refused": 0, "errors": 0}
+        self._stats_lock = threading.Lock()
+
+    # ----- cache -----
+
+    def _cache_path(self, url: str, params: dict) -> Path:
+        from utils.http_client import cassette_key
+
+        return self.cache_dir / f"{cassette_key('GET', url, params)}.json"
+
+    def _read_cache(self, path: Path) -> dict | None:
+        if not self.use_cache or not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, path: Path, entry: dict) -> None:
+        if not self.use_cache:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _is_fresh(entry: dict, ttl: int | None) -> bool:
+        if ttl is None:
+            return True
+        fetched = _parse_iso(entry.get("fetched_at_utc"))
+        return fetched is not None and (_now_utc() - fetched).total_seconds() < ttl
+
+    def _bump(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def _throttle(self) -> None:
+        if self.min_interval_sec <= 0:
+            return
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.min_interval_sec
+        if wait > 0:
+            time.sleep(wait)
+
+    # ----- core -----
+
+    def request(self, kind: str, url: str, params: dict, ttl: int | None) -> OddsResponse:
+        """
+        Cached GET. kind: current | events | event | historical (sets the cost estimate).
+        Raises OddsQuotaExhausted or the underlying HTTP error.
+        """
+        from utils.http_client import http_get
+
+        path = self._cache_path(url, params)
+        cached = self._read_cache(path)
+        if cached is not None and self._is_fresh(cached, ttl):
+            self._bump("cache_hits")
+            return OddsResponse(cached.get("payload"), cached.get("fetched_at_utc"), True, cached.get("headers") or {})
+
+        cost = estimate_cost(kind, params.get("markets", MARKETS), params.get("regions", REGIONS))
+        try:
+            self.budget.reserve(cost)
+        except OddsQuotaExhausted:
+            self._bump("refused")
+            raise
+
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        try:
+            self._throttle()
+            self._bump("requests")
+            resp = http_get(url, params={**params, "apiKey": self.api_key}, headers=headers or None, timeout=30)
+        finally:
+            self.budget.release(cost)
+
+        self.budget.update_from_headers(resp.headers)
+        if resp.status_code == 304 and cached is not None:
+            self._bump("not_modified")
+            cached["fetched_at_utc"] = _iso_now()
+            self._write_cache(path, cached)
+            return OddsResponse(cached.get("payload"), cached["fetched_at_utc"], True, cached.get("headers") or {})
+
+        resp.raise_for_status()
+        payload = resp.json()
+        kept = {k: resp.headers.get(k) for k in ("x-requests-remaining", "x-requests-used", "x-requests-last") if resp.headers.get(k) is not None}
+        entry = {
+            "url": url,
+            "params": {k: v for k, v in params.items() if k != "apiKey"},
+            "fetched_at_utc": _iso_now(),
+            "etag": resp.headers.get("etag"),
+            "headers": kept,
+            "payload": payload,
+        }
+        self._write_cache(path, entry)
+        return OddsResponse(payload, entry["fetched_at_utc"], False, kept)
+
+    # ----- endpoints -----
+
+    @staticmethod
+    def _odds_params(sport_key: str) -> dict:
+        params = {"markets": MARKETS, "regions": REGIONS, "oddsFormat": ODDS_FORMAT}
+        if sport_key == "basketball_ncaab":
+            params["dateFormat"] = "iso"
+        return params
+
+    def current_odds(self, sport_key: str, ttl: int | None = TTL_CURRENT_ODDS) -> OddsResponse:
+        return self.request("current", f"{BASE_URL}/{sport_key}/odds", self._odds_params(sport_key), ttl)
+
+    def events_list(self, sport_key: str, ttl: int | None = TTL_EVENTS_LIST) -> list:
+        params = {"dateFormat": "iso"} if sport_key == "basketball_ncaab" else {}
+        try:
+            out = self.request("events", f"{BASE_URL}/{sport_key}/events", params, ttl).payload
+        except Exception:
+            self._bump("errors")
+            return []
+        return out if isinstance(out, list) else []
+
+    @staticmethod
+    def event_ttl(commence_time: str | None) -> int | None:
+        tip = _parse_iso(commence_time)
+        if tip is not None and (_now_utc() - tip).total_seconds() > FINAL_AFTER_TIPOFF_SEC:
+            return TTL_EVENT_ODDS_FINAL
+        return TTL_EVENT_ODDS_UPCOMING
+
+    def event_odds(self, sport_key: str, event_id: str, commence_time: str | None = None) -> dict | None:
+        """One event's odds, or None on any failure (including quota refusal)."""
+        try:
+            return self.request(
+                "event",
+                f"{BASE_URL}/{sport_key}/events/{event_id}/odds",
+                self._odds_params(sport_key),
+                self.event_ttl(commence_time),
+            ).payload
+        except OddsQuotaExhausted:
+            return None
+        except Exception:
+            self._bump("errors")
+            return None
+
+    def historical_odds(self, sport_key: str, date_iso: str) -> dict | None:
+        params = {"regions": REGIONS, "markets": MARKETS, "oddsFormat": ODDS_FORMAT, "date": date_iso}
+        try:
+            return self.request("historical", f"{HISTORICAL_BASE_URL}/{sport_key}/odds", params, TTL_HISTORICAL).payload
+        except OddsQuotaExhausted:
+            return None
+        except Exception:
+            self._bump("errors")
+            return None
+
+    # ----- scheduling -----
+
+    @staticmethod
+    def tipoff_priority(commence_time: str | None, now: datetime | None = None) -> tuple[int, float]:
+        """Sort key: upcoming/in-progress by seconds to tipoff, then past games newest first, unknown last."""
+        tip = _parse_iso(commence_time)
+        if tip is None:
+            return (2, 0.0)
+        delta = (tip - (now or _now_utc())).total_seconds()
+        if delta >= -FINAL_AFTER_TIPOFF_SEC:
+            return (0, abs(delta))
+        return (1, -delta)
+
+    def fetch_event_odds_many(
+        self,
+        sport_key: str,
+        events: Iterable[tuple[str, str | None]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> dict[str, dict]:
+        """
+        events: (event_id, commence_time). Fetched near-tipoff first with at most max_workers
+        in flight. Stops scheduling once the quota reserve is hit. Returns {event_id: odds}.
+        """
+        now = _now_utc()
+        heap = []
+        seen = set()
+        for i, (eid, ct) in enumerate(events):
+            if eid and eid not in seen:
+                seen.add(eid)
+                heapq.heappush(heap, (self.tipoff_priority(ct, now), i, eid, ct))
+        total = len(heap)
+        results: dict[str, dict] = {}
+        done = 0
+        if not heap:
+            return results
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            in_flight = {}
+            while heap or in_flight:
+                while heap and len(in_flight) < max(1, max_workers):
+                    if self.budget.remaining is not None and self.budget.remaining <= self.budget.min_remaining:
+                        heap.clear()
+                        break
+                    _, _, eid, ct = heapq.heappop(heap)
+                    in_flight[pool.submit(self.event_odds, sport_key, eid, ct)] = eid
+                if not in_flight:
+                    break
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    eid = in_flight.pop(fut)
+                    odds = fut.result()
+                    if odds:
+                        results[eid] = odds
+                    done += 1
+                    if on_progress:
+                        on_progress(done, total)
+        return results
+
+    def fetch_historical_many(
+        self,
+        sport_key: str,
+        date_isos: list[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        stop: Callable[[list[dict]], bool] | None = None,
+    ) -> list[tuple[str, dict | None]]:
+        """
+        Historical snapshots for dates in order, max_workers at a time. stop(results_so_far)
+        is checked after each window (e.g. a game-count limit). Returns [(date_iso, resp)].
+        """
+        out: list[tuple[str, dict | None]] = []
+        step = max(1, max_workers)
+        with ThreadPoolExecutor(max_workers=step) as pool:
+            for start in range(0, len(date_isos), step):
+                window = date_isos[start:start + step]
+                out.extend(zip(window, pool.map(lambda d: self.historical_odds(sport_key, d), window)))
+                if stop and stop([r for _, r in out if r]):
+                    break
+                if self.budget.remaining is not None and self.budget.remaining <= self.budget.min_remaining:
+                    break
+        return out
+
+    def summary(self) -> str:
+        q = self.budget.snapshot()
+        s = self.stats
+        return (
+            f"Odds API: requests={s['requests']} cache_hits={s['cache_hits']} 304={s['not_modified']} "
+            f"refused={s['refused']} errors={s['errors']} | quota remaining={q['remaining']} used={q['used']}"
+        )
+
+
+_CLIENT: OddsApiClient | None = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_odds_client() -> OddsApiClient:
+    """Process-wide client (shares cache, budget and throttle across callers)."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = OddsApiClient()
+        return _CLIENT
@@ -0,0 +1,365 @@
+"""
+utils/odds_snapshot_log.py
+
+Append-only, segmented log of raw NBA Odds API snapshots (replaces rewriting the
+whole data/external/odds_api_raw.json list on every fetch).
+
+Layout (data/external/odds_snapshots/):
+  odds_00001.jsonl, odds_00002.jsonl, ...   one snapshot per line
+                                             ({captured_at_utc, sport, source, data})
+  index.json                                 small sidecar:
+      segments  name / records / bytes / first + last captured_at per segment
+      last      captured_at + (segment, offset) of the newest snapshot
+      games     "{odds_id}|{commence_time}" -> {captured_at, segment, offset} of the
+                latest capture that contained the game
+
+A fetch appends one line and rewrites the index, so its cost depends on the new
+snapshot and the number of games indexed, not on how many snapshots exist. A
+segment is sealed once it passes SEGMENT_MAX_BYTES.
+
+Crash safety: the line is appended before the index is replaced (atomic rename);
+load_index() re-indexes any complete lines past the recorded segment size, so an
+index that lags the log by one write repairs itself, and a torn last line (no
+trailing newline) is truncated by the next append.
+
+Concurrency: writers (031, the daemon, migration backfills) hold an exclusive lock
+on odds_snapshots/.lock across load-index / append / write-index, so no writer
+appends or truncates with a stale index.
+
+Legacy: the first append (or read) with no log imports odds_api_raw.json once.
+The legacy file is left in place but no longer updated.
+
+Usage:
+  from utils.odds_snapshot_log import append_snapshot, iter_snapshots, latest_snapshot, past_game_keys
+  from utils.odds_snapshot_log import logged_game_keys   # token guard for backfills
+"""
+
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+SNAPSHOT_LOG_DIR = PROJECT_ROOT / "data" / "external" / "odds_snapshots"
+LEGACY_SNAPSHOT_PATH = PROJECT_ROOT / "data" / "external" / "odds_api_raw.json"
+
+INDEX_NAME = "index.json"
+LOCK_NAME = ".lock"
+INDEX_VERSION = "ODDS_SNAPSHOT_LOG_V1"
+SEGMENT_PREFIX = "odds_"
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _segment_name(n: int) -> str:
+    return f"{SEGMENT_PREFIX}{n:05d}.jsonl"
+
+
+def _parse_iso(ts: Optional[str]) -> Optional[datetime]:
+    if not ts:
+        return None
+    try:
+        return datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def game_key(odds_id: str, commence_time: Optional[str]) -> str:
+    return f"{(odds_id or '').strip()}|{commence_time or ''}"
+
+
+@contextmanager
+def _write_lock(log_dir: Path):
+    """Exclusive cross-process lock for writers (fcntl; msvcrt on Windows)."""
+    log_dir.mkdir(parents=True, exist_ok=True)
+    with open(log_dir / LOCK_NAME, "a+b") as f:
+        try:
+            import fcntl
+        except ImportError:  # Windows
+            import msvcrt
+
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10 s; keep waiting
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            return
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+# ------------------------------------------------------------
+# Index
+# ------------------------------------------------------------
+
+def _empty_index() -> dict:
+    return {"version": INDEX_VERSION, "segments": [], "last": None, "games": {}}
+
+
+def _index_record(index: dict, snap: dict, segment: str, offset: int) -> None:
+    """Fold one snapshot (at segment/offset) into the index."""
+    captured = snap.get("captured_at_utc")
+    seg = index["segments"][-1]
+    seg["records"] += 1
+    seg["first_captured_at"] = seg.get("first_captured_at") or captured
+    seg["last_captured_at"] = captured
+    index["last"] = {"captured_at": captured, "segment": segment, "offset": offset}
+    for g in snap.get("data") or []:
+        if not isinstance(g, dict):
+            continue
+        gid = str(g.get("id") or "").strip()
+        if gid:
+            index["games"][game_key(gid, g.get("commence_time"))] = {
+                "captured_at": captured, "segment": segment, "offset": offset,
+            }
+
+
+def _write_index(index: dict, log_dir: Path) -> None:
+    from utils.json_codec import dumps
+
+    path = log_dir / INDEX_NAME
+    tmp = path.with_name(f"{INDEX_NAME}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(dumps(index, mode="compact"))
+    os.replace(tmp, path)
+
+
+def _catch_up(index: dict, log_dir: Path) -> bool:
+    """Index complete lines written after the index was last saved. Returns True if any were found."""
+    from utils.json_codec import loads
+
+    if not index["segments"]:
+        return False
+    seg = index["segments"][-1]
+    path = log_dir / seg["name"]
+    if not path.exists() or path.stat().st_size <= seg["bytes"]:
+        return False
+    changed = False
+    with open(path, "rb") as f:
+        f.seek(seg["bytes"])
+        offset = seg["bytes"]
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # torn write; _append truncates it before writing
+            try:
+                snap = loads(line)
+            except ValueError:
+                snap = None
+            if isinstance(snap, dict):
+                _index_record(index, snap, seg["name"], offset)
+                changed = True
+            offset += len(line)
+            seg["bytes"] = offset
+    return changed
+
+
+def load_index(log_dir: Path = SNAPSHOT_LOG_DIR) -> dict:
+    """Sidecar index (empty when there is no log yet), caught up with the active segment."""
+    from utils.json_codec import read_json
+
+    path = log_dir / INDEX_NAME
+    index = _empty_index()
+    if path.exists():
+        try:
+            loaded = read_json(path)
+            if isinstance(loaded, dict) and loaded.get("version") == INDEX_VERSION:
+                index = loaded
+        except (OSError, ValueError):
+            pass
+    if not index["segments"] and any(log_dir.glob(f"{SEGMENT_PREFIX}*.jsonl")):
+        index = rebuild_index(log_dir)
+    elif _catch_up(index, log_dir):
+        _write_index(index, log_dir)
+    return index
+
+
+def rebuild_index(log_dir: Path = SNAPSHOT_LOG_DIR) -> dict:
+    """Re-scan every segment (recovery / after hand edits) and write a fresh index."""
+    index = _empty_index()
+    for path in sorted(log_dir.glob(f"{SEGMENT_PREFIX}*.jsonl")):
+        index["segments"].append({
+            "name": path.name, "records": 0, "bytes": 0, "first_captured_at": None, "last_captured_at": None,
+        })
+        _catch_up(index, log_dir)
+    _write_index(index, log_dir)
+    return index
+
+
+# ------------------------------------------------------------
+# Write
+# ------------------------------------------------------------
+
+def _append(index: dict, snapshot: dict, log_dir: Path) -> None:
+    from utils.json_codec import dumps
+
+    line = dumps(snapshot, mode="compact") + b"\n"
+    segs = index["segments"]
+    if not segs or segs[-1]["bytes"] + len(line) > SEGMENT_MAX_BYTES and segs[-1]["records"]:
+        segs.append({
+            "name": _segment_name(len(segs) + 1), "records": 0, "bytes": 0,
+            "first_captured_at": None, "last_captured_at": None,
+        })
+    seg = segs[-1]
+    path = log_dir / seg["name"]
+    if path.exists() and path.stat().st_size > seg["bytes"]:
+        with open(path, "rb") as f:
+            f.seek(seg["bytes"])
+            tail = f.read()
+        if b"\n" in tail:
+            raise RuntimeError(f"Snapshot log index is behind {path}; call under _write_lock after load_index")
+        # Partial line from a crashed writer (no trailing newline, so never a complete record).
+        os.truncate(path, seg["bytes"])
+    with open(path, "ab") as f:
+        offset = f.tell()
+        f.write(line)
+    seg["bytes"] = offset + len(line)
+    _index_record(index, snapshot, seg["name"], offset)
+
+
+def import_legacy(legacy_path: Path = LEGACY_SNAPSHOT_PATH, log_dir: Path = SNAPSHOT_LOG_DIR) -> int:
+    """Seed an empty log from the legacy snapshot list. Returns snapshots imported (0 if the log exists)."""
+    from utils.json_codec import read_json
+
+    def _has_log() -> bool:
+        return (log_dir / INDEX_NAME).exists() or any(log_dir.glob(f"{SEGMENT_PREFIX}*.jsonl"))
+
+    if not legacy_path.exists() or _has_log():
+        return 0
+    with _write_lock(log_dir):
+        if _has_log():
+            return 0  # another writer imported it while we waited
+        try:
+            data = read_json(legacy_path)
+        except ValueError:
+            return 0
+        index = _empty_index()
+        n = 0
+        for snap in data if isinstance(data, list) else []:
+            if isinstance(snap, dict) and snap.get("captured_at_utc"):
+                _append(index, snap, log_dir)
+                n += 1
+        _write_index(index, log_dir)
+    return n
+
+
+def append_snapshot(snapshot: dict, log_dir: Path = SNAPSHOT_LOG_DIR) -> bool:
+    """
+    Append one snapshot. Returns False (nothing written) when its captured_at_utc equals
+    the newest snapshot already logged (replayed / cached API response).
+    """
+    if log_dir == SNAPSHOT_LOG_DIR:
+        import_legacy()
+    with _write_lock(log_dir):
+        index = load_index(log_dir)
+        last = index.get("last") or {}
+        if last.get("captured_at") and last["captured_at"] == snapshot.get("captured_at_utc"):
+            return False
+        _append(index, snapshot, log_dir)
+        _write_index(index, log_dir)
+    return True
+
+
+# ------------------------------------------------------------
+# Read
+# ------------------------------------------------------------
+
+def has_log(log_dir: Path = SNAPSHOT_LOG_DIR) -> bool:
+    return (log_dir / INDEX_NAME).exists()
+
+
+def _read_at(log_dir: Path, segment: str, offset: int) -> Optional[dict]:
+    from utils.json_codec import loads
+
+    path = log_dir / segment
+    if not path.exists():
+        return None
+    with open(path, "rb") as f:
+        f.seek(offset)
+        line = f.readline()
+    try:
+        snap = loads(line)
+    except ValueError:
+        return None
+    return snap if isinstance(snap, dict) else None
+
+
+def latest_snapshot(log_dir: Path = SNAPSHOT_LOG_DIR) -> Optional[dict]:
+    """Newest snapshot (one seek + one line parse), or None when nothing is logged."""
+    if log_dir == SNAPSHOT_LOG_DIR:
+        import_legacy()
+    last = load_index(log_dir).get("last")
+    return _read_at(log_dir, last["segment"], last["offset"]) if last else None
+
+
+def logged_game_keys(log_dir: Path = SNAPSHOT_LOG_DIR) -> set[tuple[str, str]]:
+    """(odds_id, commence_time) for every game in the log (from the index only)."""
+    if log_dir == SNAPSHOT_LOG_DIR:
+        import_legacy()
+    return {tuple(key.partition("|")[::2]) for key in load_index(log_dir).get("games") or {}}
+
+
+def past_game_keys(now: Optional[datetime] = None, log_dir: Path = SNAPSHOT_LOG_DIR) -> set[tuple[str, str]]:
+    """(odds_id, commence_time) for logged games whose commence time has passed (from the index only)."""
+    now = now or datetime.now(timezone.utc)
+    out = set()
+    for gid, commence in logged_game_keys(log_dir):
+        dt = _parse_iso(commence)
+        if dt is not None and dt < now:
+            out.add((gid, commence))
+    return out
+
+
+def iter_snapshots(
+    log_dir: Path = SNAPSHOT_LOG_DIR,
+    *,
+    since: Optional[str] = None,
+    legacy_path: Path = LEGACY_SNAPSHOT_PATH,
+) -> Iterator[dict]:
+    """
+    Yield snapshots oldest first, streaming one segment line at a time. since (ISO
+    captured_at) skips whole segments that end before it. Falls back to the legacy
+    list file when no log exists.
+    """
+    from utils.json_codec import loads, read_json
+
+    if not has_log(log_dir):
+        if legacy_path.exists():
+            data = read_json(legacy_path)
+            for snap in data if isinstance(data, list) else []:
+                if isinstance(snap, dict) and (since is None or str(snap.get("captured_at_utc") or "") >= since):
+                    yield snap
+        return
+    for seg in load_index(log_dir)["segments"]:
+        if since is not None and str(seg.get("last_captured_at") or "") < since:
+            continue
+        path = log_dir / seg["name"]
+        if not path.exists():
+            continue
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    snap = loads(line)
+                except ValueError:
+                    continue
+                if isinstance(snap, dict) and (since is None or str(snap.get("captured_at_utc") or "") >= since):
+                    yield snap
+
+
+def load_snapshots(log_dir: Path = SNAPSHOT_LOG_DIR) -> list[dict]:
+    """All snapshots as a list (same shape as the legacy odds_api_raw.json)."""
+    return list(iter_snapshots(log_dir))
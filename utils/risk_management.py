@@ -6,12 +6,34 @@ Kelly Criterion bet-sizing. Quarter-Kelly (0.25 * f*) default to manage volatili
 - calculate_kelly_bet(win_probability, market_odds, bankroll, kelly_fraction=0.25)
 - market_odds: American style (e.g. -110). Converted to decimal for f*.
 - Returns recommended fraction of bankroll and dollar amount.
+- allocate_slate_kelly(bets, bankroll, ...): all bets of a slate sized together
+  (simultaneous Kelly), same-game legs correlated, with per-bet / per-game / slate
+  exposure caps. Use this whenever more than one bet is open at once.
 
 Authority: eng/execution/live_monitor_agent.py, configs/runtime/bankroll.json.
 """
 
 from __future__ import annotations
 
+from pathlib import Path
+
+BANKROLL_CONFIG_PATH = Path(__file__).resolve().parents[1] / "configs" / "runtime" / "bankroll.json"
+
+# Exposure caps (fractions of bankroll); configs/runtime/bankroll.json keys override.
+DEFAULT_MAX_BET_FRACTION = 0.05
+DEFAULT_MAX_GAME_FRACTION = 0.08
+DEFAULT_MAX_SLATE_FRACTION = 0.25
+# Latent correlation between legs of one game (spread + total) when sized together.
+DEFAULT_SAME_GAME_LEG_CORRELATION = 0.25
+
+# Simultaneous Kelly solver: exact outcome enumeration up to SLATE_KELLY_MAX_STATES
+# joint outcomes (larger slates use the second-order approximation), Gauss-Hermite
+# nodes for same-game leg correlation, and the full-Kelly exposure ceiling that
+# keeps every outcome's wealth positive.
+SLATE_KELLY_MAX_STATES = 50_000
+SLATE_KELLY_QUADRATURE_NODES = 48
+SLATE_KELLY_MAX_EXPOSURE = 0.95
+
 
 def american_to_decimal(american_odds: float) -> float:
     """Convert American odds to decimal. -110 -> ~1.909; +150 -> 2.50."""
@@ -71,3 +93,294 @@ def calculate_kelly_bet(
     f_actual = kelly_fraction * f_full
     amount = bankroll * f_actual
     return f_actual, amount
+
+
+# =============================================================================
+# SLATE (SIMULTANEOUS) KELLY
+# =============================================================================
+
+def load_exposure_caps(path: Path | None = None) -> dict:
+    """
+    max_bet_fraction / max_game_fraction / max_slate_fraction and same_game_leg_correlation
+    from bankroll.json (defaults if absent).
+    """
+    import json
+
+    caps = {
+        "max_bet_fraction": DEFAULT_MAX_BET_FRACTION,
+        "max_game_fraction": DEFAULT_MAX_GAME_FRACTION,
+        "max_slate_fraction": DEFAULT_MAX_SLATE_FRACTION,
+        "same_game_leg_correlation": DEFAULT_SAME_GAME_LEG_CORRELATION,
+    }
+    path = path or BANKROLL_CONFIG_PATH
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return caps
+    if isinstance(data, dict):
+        for key in caps:
+            try:
+                if data.get(key) is not None:
+                    caps[key] = max(0.0, float(data[key]))
+            except (TypeError, ValueError):
+                pass
+    return caps
+
+
+def _project_capped_simplex(v, cap: float):
+    """Euclidean projection of v onto {f >= 0, sum(f) <= cap}."""
+    import numpy as np
+
+    w = np.maximum(v, 0.0)
+    if w.sum() <= cap:
+        return w
+    u = np.sort(v)[::-1]
+    css = np.cumsum(u)
+    idx = np.arange(1, len(u) + 1)
+    k = np.nonzero(u - (css - cap) / idx > 0)[0][-1]
+    theta = (css[k] - cap) / (k + 1)
+    return np.maximum(v - theta, 0.0)
+
+
+def _game_outcomes(p, b, leg_correlation: float):
+    """
+    Joint outcomes of one game's legs: (probabilities[K], per-unit returns[K, L]) over the
+    K = 2**L win/loss patterns (+b on a win, -1 on a loss). Legs share a latent normal
+    factor (Gaussian copula, latent correlation leg_correlation), integrated with
+    Gauss-Hermite quadrature; marginal win rates stay p.
+    """
+    import itertools
+    import math
+
+    import numpy as np
+
+    p = np.asarray(p, dtype=float)
+    b = np.asarray(b, dtype=float)
+    wins = np.asarray(list(itertools.product((1, 0), repeat=len(p))), dtype=float)
+    returns = np.where(wins == 1, b, -1.0)
+    rho = min(max(float(leg_correlation or 0.0), 0.0), 0.99)
+    if rho == 0.0 or len(p) == 1:
+        probs = np.prod(np.where(wins == 1, p, 1.0 - p), axis=1)
+        return probs, returns
+
+    from statistics import NormalDist
+
+    nodes, weights = np.polynomial.hermite_e.hermegauss(SLATE_KELLY_QUADRATURE_NODES)
+    weights = weights / math.sqrt(2.0 * math.pi)
+    thresholds = np.asarray([NormalDist().inv_cdf(x) for x in p])
+    z = (thresholds[None, :] - math.sqrt(rho) * nodes[:, None]) / math.sqrt(1.0 - rho)
+    cond = 0.5 * (1.0 + np.vectorize(math.erf)(z / math.sqrt(2.0)))  # P(win | factor), nodes x legs
+    per_node = np.prod(np.where(wins[None, :, :] == 1, cond[:, None, :], 1.0 - cond[:, None, :]), axis=2)
+    return weights @ per_node, returns
+
+
+def _class_states(probs, returns, m: int):
+    """
+    Outcomes of m identical independent games sized identically: one state per count
+    vector over the K patterns (multinomial). Returns (probabilities, returns per unit of
+    the class's total exposure per leg), so the class's legs are solved as shared sizes.
+    """
+    import itertools
+    import math
+
+    import numpy as np
+
+    k = len(probs)
+    log_p = np.log(np.maximum(probs, 1e-300))
+    rows, weights = [], []
+    for combo in itertools.combinations_with_replacement(range(k), m):
+        counts = np.bincount(combo, minlength=k)
+        log_w = math.lgamma(m + 1) - sum(math.lgamma(c + 1) for c in counts) + float(counts @ log_p)
+        rows.append(counts @ returns / m)
+        weights.append(math.exp(log_w))
+    return np.asarray(weights), np.asarray(rows)
+
+
+def _n_class_states(k: int, m: int) -> int:
+    import math
+
+    return math.comb(m + k - 1, k - 1)
+
+
+def _project_ascent(value_and_grad, f0, cap: float, max_iter: int = 2000, tol: float = 1e-11):
+    """Maximize a concave objective over f >= 0, sum(f) <= cap (projected gradient + backtracking)."""
+    import numpy as np
+
+    f = _project_capped_simplex(f0, cap)
+    obj, grad = value_and_grad(f)
+    step = 1.0
+    for _ in range(max_iter):
+        while step > 1e-14:
+            f_new = _project_capped_simplex(f + step * grad, cap)
+            obj_new, grad_new = value_and_grad(f_new)
+            if obj_new >= obj + 1e-4 * grad @ (f_new - f):
+                break
+            step *= 0.5
+        else:
+            break
+        moved = np.abs(f_new - f).max()
+        f, obj, grad = f_new, obj_new, grad_new
+        if moved < tol:
+            break
+        step = min(step * 2.0, 1.0)
+    return f, obj
+
+
+def _solve_simultaneous_kelly(classes: list[tuple], cap: float):
+    """
+    Joint full Kelly over classes of identical games [(probs[K], returns[K, L], m), ...].
+    Returns (per-game leg fractions per class, expected log growth).
+
+    Exact when the joint outcome space (product of per-class multinomial states) has at
+    most SLATE_KELLY_MAX_STATES states: maximizes sum(w * log(1 + X h)). Otherwise the
+    second-order expansion E[X] - E[X^2] / 2 is maximized with exact first and second
+    moments (within ~0.1 percentage points of exact Kelly for sports-betting edges).
+    Variables h are each class leg's total exposure (m games x per-game fraction), so
+    identical bets always get identical sizes.
+    """
+    import math
+
+    import numpy as np
+
+    sizes = [len(ret[0]) for _, ret, _ in classes]
+    n_states = math.prod(_n_class_states(len(pr), m) for pr, _, m in classes)
+    h0 = np.concatenate([
+        np.maximum(m * (pr @ ret) / np.maximum(pr @ ret ** 2, 1e-12), 0.0) for pr, ret, m in classes
+    ])
+
+    if n_states <= SLATE_KELLY_MAX_STATES:
+        w = np.ones(1)
+        X = np.zeros((1, 0))
+        for pr, ret, m in classes:
+            wc, Xc = _class_states(pr, ret, m)
+            X = np.hstack([np.repeat(X, len(wc), axis=0), np.tile(Xc, (len(w), 1))])
+            w = np.outer(w, wc).ravel()
+
+        def value_and_grad(h):
+            wealth = 1.0 + X @ h
+            if (wealth <= 0).any():
+                return -np.inf, np.zeros_like(h)
+            return float(w @ np.log(wealth)), (w / wealth) @ X
+    else:
+        mean_parts, blocks = [], []
+        for pr, ret, m in classes:
+            mu = pr @ ret
+            second = (ret * pr[:, None]).T @ ret
+            mean_parts.append(mu)
+            blocks.append((mu, (second + (m - 1) * np.outer(mu, mu)) / m))
+        mu_all = np.concatenate(mean_parts)
+        M = np.outer(mu_all, mu_all)
+        at = 0
+        for (mu, block), size in zip(blocks, sizes):
+            M[at:at + size, at:at + size] = block
+            at += size
+
+        def value_and_grad(h):
+            Mh = M @ h
+            return float(mu_all @ h - 0.5 * h @ Mh), mu_all - Mh
+
+    h, growth = _project_ascent(value_and_grad, h0, cap)
+    out, at = [], 0
+    for (_, _, m), size in zip(classes, sizes):
+        out.append(h[at:at + size] / m)
+        at += size
+    return out, growth
+
+
+def allocate_slate_kelly(
+    bets: list[dict],
+    bankroll: float,
+    *,
+    kelly_fraction: float = 0.25,
+    max_bet_fraction: float | None = None,
+    max_game_fraction: float | None = None,
+    max_slate_fraction: float | None = None,
+    leg_correlation: float | None = None,
+) -> dict:
+    """
+    Size every bet on a slate in one call (simultaneous Kelly).
+
+    Args:
+        bets: [{"win_probability": p, "market_odds": American (default -110), "game_id": ...}, ...].
+              Bets sharing game_id (spread + total of one game) are correlated via leg_correlation.
+        bankroll: Total bankroll in dollars.
+        kelly_fraction: Multiplier on the joint full-Kelly solution (0.25 = Quarter-Kelly).
+        max_*_fraction: Exposure caps as bankroll fractions; None -> load_exposure_caps().
+        leg_correlation: Latent correlation between legs of the same game (0 = independent);
+              None -> same_game_leg_correlation from load_exposure_caps().
+
+    The joint full-Kelly vector maximizes expected log wealth over the joint outcomes of all
+    bets (settled together; see _solve_simultaneous_kelly), so simultaneous bets shrink
+    relative to independent Kelly, a lone bet gets exactly kelly_fraction_full, and
+    identical bets get identical sizes.
+    It is then scaled by kelly_fraction and capped per bet, per game and for the slate
+    (scaled down proportionally where a cap binds).
+
+    Returns:
+        {"fractions": [...], "amounts": [...] (aligned with bets), "total_fraction",
+         "total_amount", "expected_log_growth" (full-Kelly objective)}.
+    """
+    n = len(bets)
+    empty = {"fractions": [0.0] * n, "amounts": [0.0] * n, "total_fraction": 0.0, "total_amount": 0.0,
+             "expected_log_growth": 0.0}
+    if not n or bankroll is None or bankroll <= 0:
+        return empty
+
+    import numpy as np
+
+    caps = load_exposure_caps()
+    max_bet = caps["max_bet_fraction"] if max_bet_fraction is None else max_bet_fraction
+    max_game = caps["max_game_fraction"] if max_game_fraction is None else max_game_fraction
+    max_slate = caps["max_slate_fraction"] if max_slate_fraction is None else max_slate_fraction
+    if leg_correlation is None:
+        leg_correlation = caps["same_game_leg_correlation"]
+
+    p = np.asarray([b.get("win_probability") or 0.0 for b in bets], dtype=float)
+    dec = np.asarray([american_to_decimal(b.get("market_odds")) for b in bets], dtype=float)
+    keys = [str(b.get("game_id") if b.get("game_id") is not None else f"#{i}") for i, b in enumerate(bets)]
+    game_of = {k: i for i, k in enumerate(dict.fromkeys(keys))}
+    game_idx = np.asarray([game_of[k] for k in keys], dtype=int)
+
+    payout = dec - 1.0
+    live = (p > 0) & (p < 1) & (payout > 0) & (p * payout - (1.0 - p) > 0)
+    f = np.zeros(n)
+    growth = 0.0
+    if live.any():
+        # Group live legs by game, then games with identical legs into classes.
+        legs_by_game: dict[int, list[int]] = {}
+        for i in np.nonzero(live)[0]:
+            legs_by_game.setdefault(int(game_idx[i]), []).append(int(i))
+        class_games: dict[tuple, list[list[int]]] = {}
+        for legs in legs_by_game.values():
+            legs = sorted(legs, key=lambda i: (p[i], payout[i]))
+            key = tuple((round(float(p[i]), 12), round(float(payout[i]), 12)) for i in legs)
+            class_games.setdefault(key, []).append(legs)
+        classes = []
+        for key, games in class_games.items():
+            probs, returns = _game_outcomes([k[0] for k in key], [k[1] for k in key], leg_correlation)
+            classes.append((probs, returns, len(games)))
+        per_class, growth = _solve_simultaneous_kelly(classes, SLATE_KELLY_MAX_EXPOSURE)
+        for g, games in zip(per_class, class_games.values()):
+            for legs in games:
+                f[legs] = g
+
+    f *= kelly_fraction if kelly_fraction is not None else 0.25
+    f = np.minimum(f, max_bet)
+    per_game = np.bincount(game_idx, weights=f)
+    over = per_game > max_game
+    if over.any():
+        scale = np.where(over, max_game / np.where(per_game > 0, per_game, 1.0), 1.0)
+        f *= scale[game_idx]
+    if f.sum() > max_slate:
+        f *= max_slate / f.sum()
+
+    fractions = [round(float(x), 5) for x in f]
+    amounts = [round(bankroll * x, 2) for x in fractions]
+    return {
+        "fractions": fractions,
+        "amounts": amounts,
+        "total_fraction": round(sum(fractions), 5),
+        "total_amount": round(sum(amounts), 2),
+        "expected_log_growth": round(float(growth), 6),
+    }
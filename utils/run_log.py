@@ -3,9 +3,24 @@ utils/run_log.py
 
 Centralized audit logging and silent mode for _gen_ scripts.
 
-- When --silent: only critical errors go to stdout; all other messages go to logs/audit.log.
-- When not silent: info/debug also go to stdout and are appended to logs/audit.log.
-- Critical errors always go to both stdout and audit.log.
+- When --silent: only critical errors go to stdout; all other messages go to logs/audit.jsonl.
+- When not silent: info/debug also go to stdout and are appended to logs/audit.jsonl.
+- Critical errors always go to both stdout and audit.jsonl.
+
+Records are JSON lines: ts, level, msg, run_id, step, league, pid, plus optional
+counters / durations dicts (log_event). Context comes from the environment so one
+pipeline run shares a run_id across every step subprocess:
+  BOOKIEX_RUN_ID (else a fresh id per process), BOOKIEX_STEP (else the script
+  stem), BOOKIEX_LEAGUE (else --league from argv). Runners export them with child_env().
+
+Writes are buffered: records are flushed in one append when FLUSH_RECORDS pile up,
+an ERROR is logged, or the process exits (atexit). A daemon timer flushes the buffer
+FLUSH_SECONDS after the first unflushed record, so idle long-lived processes do not
+hold lines; install_signal_flush() also flushes on SIGTERM. Worker processes of a
+multiprocessing pool write unbuffered, since pool workers exit without running atexit.
+audit.jsonl rotates at BOOKIEX_LOG_MAX_BYTES (default 10 MB) to audit.jsonl.1 ..
+.{BACKUP_COUNT}. BOOKIEX_LOG_DIR overrides the logs/ dir (dev and test runs:
+BOOKIEX_LOG_DIR=$(mktemp -d) python ...).
 
 Usage in scripts:
   from utils.run_log import set_silent, log_info, log_debug, log_error
@@ -15,49 +30,317 @@ Usage in scripts:
   log_info("Writing X games...")   # stdout + file unless silent
   log_debug("Path = ...")           # file only (or stdout+file when not silent - treat as info)
   log_error("Failed to open file")  # always stdout + file
+  log_event("ingest done", counters={"games": 412}, durations={"fetch_sec": 3.2})
+
+Query:
+  from utils.run_log import read_log_records, step_durations
+  rows = read_log_records(run_id="...", level="ERROR")
 """
 
-from pathlib import Path
+import atexit
+import json
+import os
+import sys
+import threading
 from datetime import datetime, timezone
+from pathlib import Path
 
 _PROJECT_ROOT = Path(__file__).resolve().parents[1]
-_LOG_DIR = _PROJECT_ROOT / "logs"
-_AUDIT_LOG = _LOG_DIR / "audit.log"
+# BOOKIEX_LOG_DIR points dev / test runs at a scratch dir instead of the repo's logs/.
+_LOG_DIR = Path(os.environ.get("BOOKIEX_LOG_DIR") or _PROJECT_ROOT / "logs")
+_AUDIT_LOG = _LOG_DIR / "audit.jsonl"
 _silent = False
 
+FLUSH_RECORDS = 200
+FLUSH_SECONDS = 2.0
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+BACKUP_COUNT = 5
+
+_buffer: list[str] = []
+_buffer_pid = os.getpid()
+_buffer_lock = threading.RLock()  # reentrant: the SIGTERM handler may flush mid-append
+_flush_timer: threading.Timer | None = None
+_context: dict = {}
+
 
 def set_silent(flag: bool) -> None:
     global _silent
     _silent = flag
 
 
+# -----------------------------------------------------------------------------
+# Context (run_id / step / league)
+# -----------------------------------------------------------------------------
+
+def _argv_league() -> str | None:
+    argv = sys.argv
+    for i, a in enumerate(argv):
+        if a == "--league" and i + 1 < len(argv):
+            return argv[i + 1].strip().lower()
+        if a.startswith("--league="):
+            return a.split("=", 1)[1].strip().lower()
+    return None
+
+
+def _default_context() -> dict:
+    import uuid
+
+    step = os.environ.get("BOOKIEX_STEP")
+    if not step and sys.argv and sys.argv[0]:
+        step = Path(sys.argv[0]).stem
+    return {
+        "run_id": os.environ.get("BOOKIEX_RUN_ID") or uuid.uuid4().hex[:12],
+        "step": step or None,
+        "league": os.environ.get("BOOKIEX_LEAGUE") or _argv_league(),
+    }
+
+
+def get_context() -> dict:
+    if not _context:
+        _context.update(_default_context())
+    return dict(_context)
+
+
+def set_context(**fields) -> None:
+    """Override run_id / step / league (or add fields) for records from this process."""
+    if not _context:
+        _context.update(_default_context())
+    _context.update(fields)
+
+
+def child_env(step: str, base_env: dict | None = None, league: str | None = None) -> dict:
+    """Env for a step subprocess: same run_id as this process, step (and league) set."""
+    env = dict(os.environ if base_env is None else base_env)
+    env["BOOKIEX_RUN_ID"] = get_context()["run_id"]
+    env["BOOKIEX_STEP"] = Path(step).stem
+    if league:
+        env["BOOKIEX_LEAGUE"] = league
+    return env
+
+
+# -----------------------------------------------------------------------------
+# Buffered writer
+# -----------------------------------------------------------------------------
+
+def get_log_dir() -> Path:
+    """logs/ dir in use (BOOKIEX_LOG_DIR or {project}/logs); for other log artifacts of a run."""
+    return _LOG_DIR
+
+
 def _ensure_log_dir() -> None:
     _LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _write_audit(level: str, msg: str) -> None:
-    _ensure_log_dir()
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    line = f"{ts} [{level}] {msg}\n"
-    with open(_AUDIT_LOG, "a", encoding="utf-8") as f:
-        f.write(line)
+def _in_pool_worker() -> bool:
+    mp = sys.modules.get("multiprocessing")
+    return mp is not None and mp.current_process().name != "MainProcess"
+
+
+def _max_bytes() -> int:
+    try:
+        return int(os.environ.get("BOOKIEX_LOG_MAX_BYTES") or DEFAULT_MAX_BYTES)
+    except ValueError:
+        return DEFAULT_MAX_BYTES
+
 
+def _rotate_if_needed(incoming: int) -> None:
+    try:
+        size = _AUDIT_LOG.stat().st_size
+    except OSError:
+        return
+    if size + incoming <= _max_bytes():
+        return
+    for i in range(BACKUP_COUNT - 1, 0, -1):
+        src = _AUDIT_LOG.with_name(f"{_AUDIT_LOG.name}.{i}")
+        if src.exists():
+            os.replace(src, _AUDIT_LOG.with_name(f"{_AUDIT_LOG.name}.{i + 1}"))
+    try:
+        os.replace(_AUDIT_LOG, _AUDIT_LOG.with_name(f"{_AUDIT_LOG.name}.1"))
+    except OSError:
+        pass  # another process rotated first
+
+
+def flush_logs() -> None:
+    """Write buffered records (one open/append for the whole batch)."""
+    global _flush_timer
+    with _buffer_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if not _buffer:
+            return
+        payload = "".join(_buffer)
+        _buffer.clear()
+        try:
+            _ensure_log_dir()
+            _rotate_if_needed(len(payload))
+            with open(_AUDIT_LOG, "a", encoding="utf-8") as f:
+                f.write(payload)
+        except OSError:
+            pass
+
+
+atexit.register(flush_logs)
+
+
+def _schedule_flush() -> None:
+    """Start the FLUSH_SECONDS timer unless one is pending. Caller holds _buffer_lock."""
+    global _flush_timer
+    if _flush_timer is not None:
+        return
+    _flush_timer = threading.Timer(FLUSH_SECONDS, flush_logs)
+    _flush_timer.daemon = True
+    _flush_timer.start()
+
+
+def install_signal_flush() -> None:
+    """
+    Flush buffered records on SIGTERM, then defer to the previous handler (default:
+    exit with status 128 + signum). Call from the main thread of long-lived processes.
+    """
+    import signal
+
+    prev = signal.getsignal(signal.SIGTERM)
+
+    def _handler(signum, frame):
+        flush_logs()
+        if callable(prev):
+            prev(signum, frame)
+        elif prev != signal.SIG_IGN:
+            raise SystemExit(128 + signum)
+
+    signal.signal(signal.SIGTERM, _handler)
+
+
+def _write_audit(level: str, msg: str, **extra) -> None:
+    global _buffer_pid, _buffer_lock, _flush_timer
+    if _buffer_pid != os.getpid():
+        # Forked child: records inherited in the buffer belong to the parent, and the
+        # parent's timer thread (and possibly its lock holder) did not survive the fork.
+        _buffer.clear()
+        _buffer_lock = threading.RLock()
+        _flush_timer = None
+        _buffer_pid = os.getpid()
+    record = {
+        "ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        "level": level,
+        "msg": msg,
+        **get_context(),
+        "pid": os.getpid(),
+    }
+    record.update({k: v for k, v in extra.items() if v is not None})
+    line = json.dumps(record, default=str) + "\n"
+    with _buffer_lock:
+        _buffer.append(line)
+        flush_now = level == "ERROR" or len(_buffer) >= FLUSH_RECORDS or _in_pool_worker()
+        if not flush_now:
+            _schedule_flush()
+    if flush_now:
+        flush_logs()
+
+
+# -----------------------------------------------------------------------------
+# Public logging API
+# -----------------------------------------------------------------------------
 
 def log_info(msg: str) -> None:
-    """Info: audit.log always; stdout only when not silent."""
+    """Info: audit.jsonl always; stdout only when not silent."""
     _write_audit("INFO", msg)
     if not _silent:
         print(msg)
 
 
 def log_debug(msg: str) -> None:
-    """Debug/detail: audit.log always; stdout only when not silent (same as info for visibility)."""
+    """Debug/detail: audit.jsonl always; stdout only when not silent (same as info for visibility)."""
     _write_audit("DEBUG", msg)
     if not _silent:
         print(msg)
 
 
 def log_error(msg: str) -> None:
-    """Critical error: always stdout and audit.log."""
+    """Critical error: always stdout and audit.jsonl (flushed immediately)."""
     _write_audit("ERROR", msg)
     print(msg)
+
+
+def log_event(
+    msg: str,
+    *,
+    counters: dict | None = None,
+    durations: dict | None = None,
+    level: str = "INFO",
+    echo: bool = False,
+    **fields,
+) -> None:
+    """
+    Structured record: counters (ints) and durations (seconds) are stored as dicts so
+    they can be aggregated without parsing msg. Printed only with echo=True and not silent.
+    """
+    _write_audit(level, msg, counters=counters, durations=durations, **fields)
+    if echo and not _silent:
+        print(msg)
+
+
+# -----------------------------------------------------------------------------
+# Query
+# -----------------------------------------------------------------------------
+
+def log_files(path: Path | None = None) -> list[Path]:
+    """audit.jsonl plus its rotated backups, oldest first."""
+    path = Path(path) if path else _AUDIT_LOG
+    backups = [path.with_name(f"{path.name}.{i}") for i in range(BACKUP_COUNT, 0, -1)]
+    return [p for p in (*backups, path) if p.exists()]
+
+
+def read_log_records(
+    path: Path | None = None,
+    *,
+    run_id: str | None = None,
+    step: str | None = None,
+    league: str | None = None,
+    level: str | None = None,
+    since: str | None = None,
+):
+    """
+    Yield records (dicts) from audit.jsonl and its backups in write order, filtered by
+    exact run_id / step / league / level and ts >= since (ISO prefix, e.g. "2026-03-14").
+    Lines that are not JSON (pre-structured audit text) are skipped.
+    """
+    if path is None:
+        flush_logs()
+    for p in log_files(path):
+        with open(p, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(rec, dict):
+                    continue
+                if run_id is not None and rec.get("run_id") != run_id:
+                    continue
+                if step is not None and rec.get("step") != step:
+                    continue
+                if league is not None and rec.get("league") != league:
+                    continue
+                if level is not None and rec.get("level") != level:
+                    continue
+                if since is not None and str(rec.get("ts") or "") < since:
+                    continue
+                yield rec
+
+
+def step_durations(records) -> dict[str, dict]:
+    """
+    Sum durations / counters per step over records (e.g. read_log_records(run_id=...)).
+    Returns {step: {"records": n, "durations": {...}, "counters": {...}}}.
+    """
+    out: dict[str, dict] = {}
+    for rec in records:
+        agg = out.setdefault(rec.get("step") or "", {"records": 0, "durations": {}, "counters": {}})
+        agg["records"] += 1
+        for key in ("durations", "counters"):
+            for k, v in (rec.get(key) or {}).items():
+                if isinstance(v, (int, float)):
+                    agg[key][k] = agg[key].get(k, 0) + v
+    return out
@@ -0,0 +1,632 @@
+"""
+utils/warehouse.py
+
+Embedded SQLite warehouse over the pipeline artifacts, one database per league
+(data/{league}/warehouse/bookiex.sqlite) so concurrent NBA + NCAAM runs stay inside
+their own data trees and never wait on each other's writer.
+
+The JSON/CSV artifacts stay the source of truth; the warehouse is a derived,
+indexed copy so ad-hoc and dashboard lookups do not re-parse whole files.
+
+Tables (rows keep a league column, so databases can be attached and unioned):
+- games           one row per game: date, season, teams, scores, closing lines, final flag
+- odds_snapshots  game-state odds_history points (game_id, captured_at, spread_home, total)
+- model_outputs   latest 0051 multi-model projections/picks per (game, model)
+- grades          backtest_games.json per (run, game, model): picks and results
+- pockets         {league}_model_pockets / _combo_pockets.json per run
+- sources         what was loaded from which file (size + mtime), for incremental loads
+
+Loading is incremental: a source file is re-read only when its size or mtime
+changed since the last load, and backtest runs (immutable once written) are
+loaded once. Run it as a pipeline step (eng/pipelines/shared/g_gen_090_load_warehouse.py)
+or call load_league(league).
+
+Query API (all return lists of dicts):
+  from utils.warehouse import games, odds_series, model_outputs, grade_rows, model_record, pockets, query
+  games("nba", date="2026-03-14")
+  games("ncaam", team="DUKE", season="2025-26")
+  odds_series("nba", game_id)
+  model_record("nba", market="spread", start="2026-01-01")
+  pockets("ncaam", state="hot")                 # latest run
+  query("SELECT ... WHERE league = ?", ("nba",), league="nba")
+
+Path: io_helpers.get_warehouse_path(league) (BOOKIEX_WAREHOUSE_DIR overrides).
+Connections wait up to BUSY_TIMEOUT_MS for a writer (the daemon's load can overlap
+a dashboard read or a manual run).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+SCHEMA_VERSION = 1
+LEAGUES = ("nba", "ncaam")
+BUSY_TIMEOUT_MS = 30_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS sources (
+    source TEXT PRIMARY KEY,
+    league TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    bytes INTEGER,
+    mtime_ns INTEGER,
+    rows INTEGER,
+    loaded_at TEXT
+);
+CREATE TABLE IF NOT EXISTS games (
+    league TEXT NOT NULL,
+    game_id TEXT NOT NULL,
+    game_date TEXT,
+    season TEXT,
+    home_team TEXT,
+    away_team TEXT,
+    home_score REAL,
+    away_score REAL,
+    spread_home REAL,
+    total REAL,
+    is_final INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (league, game_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS games_by_date ON games (league, game_date);
+CREATE INDEX IF NOT EXISTS games_by_season ON games (league, season, game_date);
+CREATE INDEX IF NOT EXISTS games_by_home ON games (league, home_team, game_date);
+CREATE INDEX IF NOT EXISTS games_by_away ON games (league, away_team, game_date);
+
+CREATE TABLE IF NOT EXISTS odds_snapshots (
+    league TEXT NOT NULL,
+    game_id TEXT NOT NULL,
+    captured_at TEXT NOT NULL,
+    spread_home REAL,
+    total REAL,
+    PRIMARY KEY (league, game_id, captured_at)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS model_outputs (
+    league TEXT NOT NULL,
+    game_id TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    game_date TEXT,
+    spread_pick TEXT,
+    total_pick TEXT,
+    home_line_proj REAL,
+    total_projection REAL,
+    spread_edge REAL,
+    total_edge REAL,
+    parlay_edge_score REAL,
+    PRIMARY KEY (league, game_id, model_name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS model_outputs_by_model ON model_outputs (league, model_name, game_date);
+
+CREATE TABLE IF NOT EXISTS grades (
+    league TEXT NOT NULL,
+    run TEXT NOT NULL,
+    game_id TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    game_date TEXT,
+    spread_pick TEXT,
+    spread_result TEXT,
+    spread_edge REAL,
+    total_pick TEXT,
+    total_result TEXT,
+    total_edge REAL,
+    parlay_result TEXT,
+    is_authority INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (league, run, game_id, model_name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS grades_by_model ON grades (league, run, model_name, game_date);
+CREATE INDEX IF NOT EXISTS grades_by_game ON grades (league, game_id);
+
+CREATE TABLE IF NOT EXISTS pockets (
+    league TEXT NOT NULL,
+    run TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    market_type TEXT NOT NULL,
+    pocket_key TEXT NOT NULL,
+    models TEXT,
+    edge_bucket TEXT,
+    combo_kind TEXT,
+    state TEXT,
+    games INTEGER,
+    graded_games INTEGER,
+    wins INTEGER,
+    losses INTEGER,
+    pushes INTEGER,
+    win_rate REAL,
+    roi REAL,
+    avg_edge REAL,
+    PRIMARY KEY (league, run, kind, market_type, pocket_key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS pockets_by_state ON pockets (league, run, market_type, state);
+"""
+
+
+def _check_league(league: str) -> str:
+    league = (league or "").strip().lower()
+    if league not in LEAGUES:
+        raise ValueError(f"Unknown league: {league!r}. Use 'nba' or 'ncaam'.")
+    return league
+
+
+def _safe_float(x) -> Optional[float]:
+    if x is None or x == "":
+        return None
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return None
+
+
+def _first_float(row: dict, *keys: str) -> Optional[float]:
+    for k in keys:
+        v = _safe_float(row.get(k))
+        if v is not None:
+            return v
+    return None
+
+
+def _game_id(game: dict, league: str) -> str:
+    if league == "ncaam":
+        return str(game.get("canonical_game_id") or game.get("game_id") or "").strip()
+    return str(game.get("game_id") or "").strip()
+
+
+def _game_date(game: dict) -> Optional[str]:
+    for k in ("game_date", "nba_game_day_local", "game_date_local", "slate_date_cst"):
+        v = str(game.get(k) or "").strip()
+        if v:
+            return v[:10]
+    return None
+
+
+def season_for_date(date_str: Optional[str]) -> Optional[str]:
+    """Season label for a game date: both leagues start in the autumn (2026-03-14 -> "2025-26")."""
+    if not date_str or len(date_str) < 7:
+        return None
+    try:
+        year, month = int(date_str[:4]), int(date_str[5:7])
+    except ValueError:
+        return None
+    start = year if month >= 8 else year - 1
+    return f"{start}-{(start + 1) % 100:02d}"
+
+
+# ------------------------------------------------------------
+# Connection
+# ------------------------------------------------------------
+
+def connect(
+    path: Path | str | None = None,
+    *,
+    league: str | None = None,
+    readonly: bool = False,
+) -> sqlite3.Connection:
+    """
+    Open a league's warehouse (or an explicit path; rows as sqlite3.Row). Writers create
+    the file and schema; readonly connections fail with FileNotFoundError when nothing
+    was loaded yet.
+    """
+    from utils.io_helpers import get_warehouse_path
+
+    if path is None and league is None:
+        raise ValueError("connect() needs a league or an explicit path.")
+    path = Path(path) if path else get_warehouse_path(_check_league(league))
+    timeout = BUSY_TIMEOUT_MS / 1000.0
+    if readonly:
+        if not path.exists():
+            raise FileNotFoundError(f"Warehouse not found: {path} (run g_gen_090_load_warehouse.py)")
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=timeout)
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=timeout)
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+        )
+        conn.commit()
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+# ------------------------------------------------------------
+# Incremental load bookkeeping
+# ------------------------------------------------------------
+
+def _source_key(path: Path) -> str:
+    try:
+        return str(path.resolve().relative_to(PROJECT_ROOT))
+    except ValueError:
+        return str(path.resolve())
+
+
+def _is_loaded(conn: sqlite3.Connection, path: Path) -> bool:
+    st = path.stat()
+    row = conn.execute(
+        "SELECT bytes, mtime_ns FROM sources WHERE source = ?", (_source_key(path),)
+    ).fetchone()
+    return row is not None and row["bytes"] == st.st_size and row["mtime_ns"] == st.st_mtime_ns
+
+
+def _mark_loaded(conn: sqlite3.Connection, path: Path, league: str, kind: str, rows: int) -> None:
+    st = path.stat()
+    conn.execute(
+        "INSERT OR REPLACE INTO sources (source, league, kind, bytes, mtime_ns, rows, loaded_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            _source_key(path), league, kind, st.st_size, st.st_mtime_ns, rows,
+            datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        ),
+    )
+
+
+# ------------------------------------------------------------
+# Loaders (one per source kind)
+# ------------------------------------------------------------
+
+def _load_game_state(conn: sqlite3.Connection, league: str, path: Path) -> int:
+    from utils.json_codec import read_json
+
+    data = read_json(path)
+    games_rows, odds_rows = [], []
+    for g in data if isinstance(data, list) else []:
+        if not isinstance(g, dict):
+            continue
+        gid = _game_id(g, league)
+        if not gid:
+            continue
+        gdate = _game_date(g)
+        home_score = _first_float(g, "home_score", "home_points", "box_home_score", "schedule_home_score")
+        away_score = _first_float(g, "away_score", "away_points", "box_away_score", "schedule_away_score")
+        games_rows.append((
+            league, gid, gdate, season_for_date(gdate),
+            str(g.get("home_team_display") or g.get("home_team") or "").strip().upper() or None,
+            str(g.get("away_team_display") or g.get("away_team") or "").strip().upper() or None,
+            home_score, away_score,
+            _first_float(g, "market_spread_home", "spread_home", "spread_home_last"),
+            _first_float(g, "market_total", "total", "total_last"),
+            int(home_score is not None and away_score is not None),
+        ))
+        for snap in g.get("odds_history") or []:
+            if not isinstance(snap, dict) or not snap.get("captured_at_utc"):
+                continue
+            spread = _first_float(snap, "market_spread_home", "spread_home_last")
+            total = _first_float(snap, "market_total", "total_last")
+            if spread is None and total is None:
+                continue
+            odds_rows.append((league, gid, str(snap["captured_at_utc"]), spread, total))
+    conn.executemany(
+        "INSERT OR REPLACE INTO games (league, game_id, game_date, season, home_team, away_team, "
+        "home_score, away_score, spread_home, total, is_final) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        games_rows,
+    )
+    # Snapshots are immutable once captured: only new (game, captured_at) pairs are inserted.
+    conn.executemany(
+        "INSERT OR IGNORE INTO odds_snapshots (league, game_id, captured_at, spread_home, total) "
+        "VALUES (?, ?, ?, ?, ?)",
+        odds_rows,
+    )
+    return len(games_rows)
+
+
+def _model_rows(league: str, game: dict) -> Iterable[tuple]:
+    gid = _game_id(game, league)
+    gdate = _game_date(game)
+    for model_name, m in (game.get("models") or {}).items():
+        if not isinstance(m, dict):
+            continue
+        yield (
+            league, gid, model_name, gdate,
+            m.get("spread_pick") or m.get("Line Bet") or None,
+            m.get("total_pick") or m.get("Total Bet") or None,
+            _first_float(m, "home_line_proj", "Home Line Projection"),
+            _first_float(m, "total_projection", "Total Projection"),
+            _first_float(m, "spread_edge", "Spread Edge"),
+            _first_float(m, "total_edge", "Total Edge"),
+            _first_float(m, "parlay_edge_score", "Parlay Edge Score"),
+        )
+
+
+def _load_model_outputs(conn: sqlite3.Connection, league: str, path: Path) -> int:
+    from utils.json_codec import read_json
+
+    data = read_json(path)
+    games_out = data.get("games") if isinstance(data, dict) else data
+    rows = [r for g in games_out or [] if isinstance(g, dict) for r in _model_rows(league, g) if r[1]]
+    conn.executemany(
+        "INSERT OR REPLACE INTO model_outputs (league, game_id, model_name, game_date, spread_pick, total_pick, "
+        "home_line_proj, total_projection, spread_edge, total_edge, parlay_edge_score) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    return len(rows)
+
+
+def _load_backtest_grades(conn: sqlite3.Connection, league: str, run: str, path: Path) -> int:
+    from utils.json_codec import read_json
+
+    data = read_json(path)
+    rows = []
+    for g in data if isinstance(data, list) else []:
+        if not isinstance(g, dict):
+            continue
+        gid = _game_id(g, league)
+        if not gid:
+            continue
+        gdate = _game_date(g)
+        authority = g.get("selection_authority")
+        for model_name, r in (g.get("model_results") or {}).items():
+            if not isinstance(r, dict):
+                continue
+            rows.append((
+                league, run, gid, model_name, gdate,
+                r.get("spread_pick") or None, r.get("spread_result") or None, _safe_float(r.get("spread_edge")),
+                r.get("total_pick") or None, r.get("total_result") or None, _safe_float(r.get("total_edge")),
+                r.get("parlay_result") or None,
+                int(model_name == authority),
+            ))
+    conn.execute("DELETE FROM grades WHERE league = ? AND run = ?", (league, run))
+    conn.executemany(
+        "INSERT OR REPLACE INTO grades (league, run, game_id, model_name, game_date, spread_pick, spread_result, "
+        "spread_edge, total_pick, total_result, total_edge, parlay_result, is_authority) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    return len(rows)
+
+
+def _load_pockets(conn: sqlite3.Connection, league: str, run: str, path: Path, kind: str) -> int:
+    from utils.json_codec import read_json
+
+    data = read_json(path)
+    items = (data.get("pockets") if kind == "single" else data.get("combo_pockets")) if isinstance(data, dict) else None
+    rows = []
+    for p in items or []:
+        if not isinstance(p, dict):
+            continue
+        if kind == "single":
+            models = p.get("model")
+            key = f"{models}|{p.get('edge_bucket')}"
+        else:
+            models = p.get("models_key")
+            key = p.get("state_signature") or models
+        if not key:
+            continue
+        rows.append((
+            league, run, kind, p.get("market_type") or "", key, models,
+            p.get("edge_bucket"), p.get("combo_kind"), p.get("state"),
+            p.get("games"), p.get("graded_games"), p.get("wins"), p.get("losses"), p.get("pushes"),
+            _safe_float(p.get("win_rate")), _safe_float(p.get("roi")), _safe_float(p.get("avg_edge")),
+        ))
+    conn.execute("DELETE FROM pockets WHERE league = ? AND run = ? AND kind = ?", (league, run, kind))
+    conn.executemany(
+        "INSERT OR REPLACE INTO pockets (league, run, kind, market_type, pocket_key, models, edge_bucket, "
+        "combo_kind, state, games, graded_games, wins, losses, pushes, win_rate, roi, avg_edge) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    return len(rows)
+
+
+def _sources(league: str) -> list[tuple[str, Path, Optional[str]]]:
+    """(kind, path, run) for every artifact the warehouse mirrors, cheapest first."""
+    from utils.io_helpers import get_backtest_output_root, get_game_state_path, get_model_runner_output_json_path
+    from utils.json_codec import find_json
+
+    out: list[tuple[str, Path, Optional[str]]] = []
+    for kind, path in (
+        ("game_state", get_game_state_path(league)),
+        ("model_outputs", get_model_runner_output_json_path(league)),
+    ):
+        found = find_json(path)
+        if found is not None:
+            out.append((kind, found, None))
+    root = get_backtest_output_root(league)
+    if root.exists():
+        for d in sorted(p for p in root.iterdir() if p.is_dir() and p.name.startswith("backtest_")):
+            games_path = find_json(d / "backtest_games.json")
+            if games_path is not None:
+                out.append(("grades", games_path, d.name))
+            for kind, name in (("pockets_single", f"{league}_model_pockets.json"),
+                               ("pockets_combo", f"{league}_model_combo_pockets.json")):
+                if (d / name).exists():
+                    out.append((kind, d / name, d.name))
+    return out
+
+
+def load_league(league: str, *, path: Path | str | None = None, full: bool = False) -> dict[str, int]:
+    """
+    Bring the warehouse up to date for one league. Only sources whose size/mtime
+    changed since the last load are read (full=True reloads everything).
+    Returns {kind: rows loaded} for the sources that were (re)loaded.
+    """
+    league = _check_league(league)
+    loaded: dict[str, int] = {}
+    conn = connect(path, league=league)
+    try:
+        for kind, src, run in _sources(league):
+            if not full and _is_loaded(conn, src):
+                continue
+            with conn:  # one transaction per source: a crash never leaves a half-loaded file marked done
+                if kind == "game_state":
+                    n = _load_game_state(conn, league, src)
+                elif kind == "model_outputs":
+                    n = _load_model_outputs(conn, league, src)
+                elif kind == "grades":
+                    n = _load_backtest_grades(conn, league, run, src)
+                else:
+                    n = _load_pockets(conn, league, run, src, "single" if kind == "pockets_single" else "combo")
+                _mark_loaded(conn, src, league, kind, n)
+            loaded[kind] = loaded.get(kind, 0) + n
+        if loaded:
+            # Without statistics the planner prefers the (league, ...) primary key over the
+            # team/date indexes; a sampled ANALYZE keeps this cheap on large tables.
+            conn.execute("PRAGMA analysis_limit=1000")
+            conn.execute("ANALYZE")
+            conn.commit()
+    finally:
+        conn.close()
+    return loaded
+
+
+# ------------------------------------------------------------
+# Query API
+# ------------------------------------------------------------
+
+def query(
+    sql: str,
+    params: Iterable[Any] = (),
+    *,
+    league: str | None = None,
+    path: Path | str | None = None,
+) -> list[dict]:
+    """Run a read-only SQL query against a league's warehouse (or path); rows as dicts."""
+    conn = connect(path, league=league, readonly=True)
+    try:
+        return [dict(r) for r in conn.execute(sql, tuple(params))]
+    finally:
+        conn.close()
+
+
+def _where(league: str, **filters) -> tuple[str, list]:
+    """WHERE clause for equality / range filters; None values are skipped."""
+    clauses, params = ["league = ?"], [_check_league(league)]
+    for key, value in filters.items():
+        if value is None:
+            continue
+        col, _, op = key.partition("__")
+        sql_op = {"": "=", "gte": ">=", "lte": "<="}[op]
+        clauses.append(f"{col} {sql_op} ?")
+        params.append(value)
+    return " WHERE " + " AND ".join(clauses), params
+
+
+def latest_run(league: str, *, path: Path | str | None = None) -> Optional[str]:
+    """Newest backtest run loaded into grades (run names sort by timestamp)."""
+    rows = query("SELECT MAX(run) AS run FROM grades WHERE league = ?", (_check_league(league),), league=league, path=path)
+    return rows[0]["run"] if rows else None
+
+
+def games(
+    league: str,
+    *,
+    date: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    season: Optional[str] = None,
+    team: Optional[str] = None,
+    final: Optional[bool] = None,
+    limit: Optional[int] = None,
+    path: Path | str | None = None,
+) -> list[dict]:
+    """Games by date / date range / season / team (home or away, case-insensitive)."""
+    where, params = _where(
+        league, game_date=date, game_date__gte=start, game_date__lte=end, season=season,
+        is_final=None if final is None else int(final),
+    )
+    if team:
+        # Two indexed lookups rather than one OR that would scan.
+        t = team.strip().upper()
+        sql = (
+            f"SELECT * FROM games{where} AND home_team = ? UNION ALL "
+            f"SELECT * FROM games{where} AND away_team = ? ORDER BY game_date, game_id"
+        )
+        params = [*params, t, *params, t]
+    else:
+        sql = f"SELECT * FROM games{where} ORDER BY game_date, game_id"
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    return query(sql, params, league=league, path=path)
+
+
+def odds_series(league: str, game_id: str, *, path: Path | str | None = None) -> list[dict]:
+    """Odds snapshots for one game in capture order."""
+    where, params = _where(league, game_id=game_id)
+    return query(f"SELECT captured_at, spread_home, total FROM odds_snapshots{where} ORDER BY captured_at", params, league=league, path=path)
+
+
+def model_outputs(
+    league: str,
+    *,
+    game_id: Optional[str] = None,
+    model: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    path: Path | str | None = None,
+) -> list[dict]:
+    where, params = _where(league, game_id=game_id, model_name=model, game_date__gte=start, game_date__lte=end)
+    return query(f"SELECT * FROM model_outputs{where} ORDER BY game_date, game_id, model_name", params, league=league, path=path)
+
+
+def grade_rows(
+    league: str,
+    *,
+    run: Optional[str] = None,
+    model: Optional[str] = None,
+    game_id: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    path: Path | str | None = None,
+) -> list[dict]:
+    """Graded rows of one backtest run (latest when run is None; every run for a game_id lookup)."""
+    if run is None and game_id is None:
+        run = latest_run(league, path=path)
+    where, params = _where(
+        league, run=run, model_name=model, game_id=game_id, game_date__gte=start, game_date__lte=end
+    )
+    return query(f"SELECT * FROM grades{where} ORDER BY run, game_date, game_id, model_name", params, league=league, path=path)
+
+
+def model_record(
+    league: str,
+    *,
+    market: str = "spread",
+    run: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    path: Path | str | None = None,
+) -> list[dict]:
+    """W/L/P and win rate per model for one market ("spread" | "total" | "parlay") in a run."""
+    if market not in ("spread", "total", "parlay"):
+        raise ValueError(f"Unknown market: {market!r}. Use 'spread', 'total' or 'parlay'.")
+    run = run or latest_run(league, path=path)
+    where, params = _where(league, run=run, game_date__gte=start, game_date__lte=end)
+    col = f"{market}_result"
+    sql = (
+        f"SELECT model_name, COUNT(*) AS picks, "
+        f"SUM({col} = 'WIN') AS wins, SUM({col} = 'LOSS') AS losses, SUM({col} = 'PUSH') AS pushes, "
+        f"ROUND(1.0 * SUM({col} = 'WIN') / NULLIF(SUM({col} IN ('WIN', 'LOSS')), 0), 4) AS win_rate "
+        f"FROM grades{where} AND {col} IS NOT NULL GROUP BY model_name ORDER BY win_rate DESC"
+    )
+    return query(sql, params, league=league, path=path)
+
+
+def pockets(
+    league: str,
+    *,
+    run: Optional[str] = None,
+    kind: Optional[str] = None,
+    market: Optional[str] = None,
+    state: Optional[str] = None,
+    path: Path | str | None = None,
+) -> list[dict]:
+    """Pockets of a backtest run (latest run with pockets when run is None), best ROI first."""
+    if run is None:
+        rows = query(
+            "SELECT MAX(run) AS run FROM pockets WHERE league = ?", (_check_league(league),),
+            league=league, path=path,
+        )
+        run = rows[0]["run"] if rows else None
+    where, params = _where(league, run=run, kind=kind, market_type=market, state=state)
+    return query(f"SELECT * FROM pockets{where} ORDER BY roi DESC", params, league=league, path=path)
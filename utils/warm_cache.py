@@ -0,0 +1,88 @@
+"""
+utils/warm_cache.py
+
+In-memory artifact cache for long-lived processes (scheduler daemon, dashboard). The
+daemon only holds the raw schedules here; see 000_BOOKIEX_DAEMON.py for scope.
+
+- Entries are keyed by path and invalidated by file signature (mtime_ns, size), so a
+  file is only re-parsed after a pipeline stage rewrites it.
+- JSON and CSV loaders; CSV rows are returned as list[dict] (csv.DictReader).
+- Cached objects are shared: callers must treat them as read-only.
+
+Usage:
+  from utils.warm_cache import WarmFileCache
+  cache = WarmFileCache()
+  rows = cache.get(path)            # parsed once, reused until the file changes
+  changed = cache.refresh()         # re-stat every tracked path; returns changed paths
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+
+def file_signature(path: Path) -> tuple[int, int] | None:
+    """(mtime_ns, size) for path, or None if it does not exist."""
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_path(path: Path) -> Any:
+    if path.suffix.lower() == ".csv":
+        import csv
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return list(csv.DictReader(f))
+    import json
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class WarmFileCache:
+    """Signature-checked cache of parsed JSON/CSV artifacts."""
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, tuple[tuple[int, int], Any]] = {}
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, path: Path, default: Any = None) -> Any:
+        """Parsed content of path; re-parsed only if the file changed. default if missing/unreadable."""
+        path = Path(path)
+        sig = file_signature(path)
+        if sig is None:
+            self._entries.pop(path, None)
+            return default
+        cached = self._entries.get(path)
+        if cached is not None and cached[0] == sig:
+            self.hits += 1
+            return cached[1]
+        try:
+            data = _load_path(path)
+        except (OSError, ValueError):
+            return default
+        self._entries[path] = (sig, data)
+        self.loads += 1
+        return data
+
+    def refresh(self) -> list[Path]:
+        """Reload every tracked path whose signature changed. Returns the changed paths."""
+        changed = []
+        for path, (sig, _) in list(self._entries.items()):
+            if file_signature(path) != sig:
+                changed.append(path)
+                self._entries.pop(path, None)
+                self.get(path)
+        return changed
+
+    def invalidate(self, path: Path | None = None) -> None:
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(Path(path), None)
+
+    def tracked(self) -> list[Path]:
+        return list(self._entries)